@@ -0,0 +1,92 @@
+using Adaplio.Api.Dev;
+using Adaplio.Api.Tests.Helpers;
+using FluentAssertions;
+using Microsoft.EntityFrameworkCore;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Dev;
+
+public class BulkSeederTests : DatabaseTestBase
+{
+    [Fact]
+    public async Task SeedAsync_ShouldCreateRequestedPopulation()
+    {
+        // Arrange
+        var request = new BulkSeedRequest(Seed: 7, Trainers: 2, ClientsPerTrainer: 3, Weeks: 2, CompletionRate: 1.0);
+
+        // Act
+        var result = await BulkSeeder.SeedAsync(Context, request);
+
+        // Assert
+        result.Should().NotBeNull();
+        result!.Clients.Should().Be(6);
+        result.PlanInstances.Should().Be(6);
+
+        (await Context.TrainerProfiles.CountAsync()).Should().Be(2);
+        (await Context.ClientProfiles.CountAsync()).Should().Be(6);
+        (await Context.ConsentGrants.CountAsync()).Should().Be(12);
+        (await Context.PlanInstances.CountAsync(p => p.Status == "active")).Should().Be(6);
+        (await Context.ExerciseInstances.CountAsync()).Should().Be(result.ExerciseInstances);
+        (await Context.PlanItemAcceptances.CountAsync()).Should().Be(result.ExerciseInstances);
+        (await Context.ProgressEvents.CountAsync()).Should().Be(result.ProgressEvents);
+        (await Context.XpAwards.CountAsync()).Should().Be(result.ProgressEvents);
+        (await Context.Gamifications.CountAsync()).Should().Be(6);
+    }
+
+    [Fact]
+    public async Task SeedAsync_ShouldOnlyCompleteExercisesUpToToday()
+    {
+        // Arrange
+        var request = new BulkSeedRequest(Seed: 3, Trainers: 1, ClientsPerTrainer: 2, Weeks: 3, CompletionRate: 1.0);
+
+        // Act
+        var result = await BulkSeeder.SeedAsync(Context, request);
+
+        // Assert
+        result!.ProgressEvents.Should().BeGreaterThan(0);
+        var today = DateOnly.FromDateTime(DateTime.UtcNow);
+        var loggedDates = await Context.ProgressEvents.Select(pe => pe.LoggedAt).ToListAsync();
+        loggedDates.Should().OnlyContain(d => DateOnly.FromDateTime(d.UtcDateTime) <= today);
+
+        var gamification = await Context.Gamifications.FirstAsync();
+        gamification.TotalXp.Should().Be(await Context.XpAwards
+            .Where(x => x.UserId == gamification.ClientProfileId)
+            .SumAsync(x => x.XpAwarded));
+    }
+
+    [Fact]
+    public async Task SeedAsync_ShouldBeDeterministic_ForSameSeedAndBatch()
+    {
+        // Arrange
+        var request = new BulkSeedRequest(Seed: 11, Trainers: 2, ClientsPerTrainer: 2, Weeks: 2);
+        using var otherContext = TestDbContextFactory.CreateInMemoryContext();
+
+        // Act
+        var first = await BulkSeeder.SeedAsync(Context, request);
+        var second = await BulkSeeder.SeedAsync(otherContext, request);
+
+        // Assert
+        second!.ExerciseInstances.Should().Be(first!.ExerciseInstances);
+        second.ProgressEvents.Should().Be(first.ProgressEvents);
+        (await otherContext.ClientProfiles.Select(c => c.Alias).OrderBy(a => a).ToListAsync())
+            .Should().Equal(await Context.ClientProfiles.Select(c => c.Alias).OrderBy(a => a).ToListAsync());
+    }
+
+    [Fact]
+    public async Task SeedAsync_ShouldReturnNull_WhenBatchAlreadySeeded()
+    {
+        // Arrange
+        var request = new BulkSeedRequest(Seed: 5, Trainers: 1, ClientsPerTrainer: 1, Weeks: 1);
+        await BulkSeeder.SeedAsync(Context, request);
+
+        // Act
+        var repeat = await BulkSeeder.SeedAsync(Context, request);
+        var nextBatch = await BulkSeeder.SeedAsync(Context, request with { Batch = 1 });
+
+        // Assert
+        repeat.Should().BeNull();
+        nextBatch.Should().NotBeNull();
+        (await Context.TrainerProfiles.CountAsync()).Should().Be(2);
+        (await Context.Exercises.CountAsync()).Should().BeGreaterThan(0);
+    }
+}
@@ -0,0 +1,138 @@
+using Adaplio.Api.Middleware;
+using FluentAssertions;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Http.HttpResults;
+using Microsoft.AspNetCore.Http.Json;
+using Microsoft.Extensions.Options;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Middleware;
+
+public class ETagEndpointFilterTests
+{
+    private readonly ETagEndpointFilter _filter = new(Options.Create(new JsonOptions()));
+
+    private int _handlerCalls;
+
+    private async Task<(object? Result, HttpContext Context)> InvokeAsync(
+        IResult handlerResult,
+        string? ifNoneMatch = null,
+        Func<HttpContext, object?, Task<string?>>? version = null)
+    {
+        var httpContext = new DefaultHttpContext();
+        httpContext.Request.Method = HttpMethods.Get;
+        if (ifNoneMatch != null)
+        {
+            httpContext.Request.Headers.IfNoneMatch = ifNoneMatch;
+        }
+        if (version != null)
+        {
+            httpContext.SetEndpoint(new Endpoint(null, new EndpointMetadataCollection(new ETagVersionSource(version)), "test"));
+        }
+
+        var result = await _filter.InvokeAsync(
+            new DefaultEndpointFilterInvocationContext(httpContext),
+            _ =>
+            {
+                _handlerCalls++;
+                return ValueTask.FromResult<object?>(handlerResult);
+            });
+
+        return (result, httpContext);
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldAddETag_ToOkResult()
+    {
+        // Act
+        var (result, context) = await InvokeAsync(Results.Ok(new { templates = new[] { "Knee Rehab" } }));
+
+        // Assert
+        result.Should().BeOfType<FileContentHttpResult>();
+        context.Response.Headers.ETag.ToString().Should().StartWith("\"").And.EndWith("\"");
+        context.Response.Headers.CacheControl.ToString().Should().Be("private, no-cache");
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldReturnNotModified_WhenETagMatches()
+    {
+        // Arrange
+        var payload = new { templates = new[] { "Knee Rehab" } };
+        var (_, first) = await InvokeAsync(Results.Ok(payload));
+        var etag = first.Response.Headers.ETag.ToString();
+
+        // Act
+        var (result, context) = await InvokeAsync(Results.Ok(payload), etag);
+
+        // Assert
+        result.Should().BeOfType<StatusCodeHttpResult>()
+            .Which.StatusCode.Should().Be(StatusCodes.Status304NotModified);
+        context.Response.Headers.ETag.ToString().Should().Be(etag);
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldReturnBody_WhenContentChanged()
+    {
+        // Arrange
+        var (_, first) = await InvokeAsync(Results.Ok(new { templates = new[] { "Knee Rehab" } }));
+        var etag = first.Response.Headers.ETag.ToString();
+
+        // Act
+        var (result, context) = await InvokeAsync(Results.Ok(new { templates = new[] { "Knee Rehab", "Shoulder" } }), etag);
+
+        // Assert
+        result.Should().BeOfType<FileContentHttpResult>();
+        context.Response.Headers.ETag.ToString().Should().NotBe(etag);
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldSkipHandler_WhenVersionTagMatches()
+    {
+        // Arrange
+        Task<string?> Version(HttpContext _, object? __) => Task.FromResult<string?>("v1");
+        var ok = Results.Ok(new { templates = new[] { "Knee Rehab" } });
+        var (firstResult, first) = await InvokeAsync(ok, version: Version);
+        var etag = first.Response.Headers.ETag.ToString();
+
+        // Act
+        var (result, context) = await InvokeAsync(Results.Ok(new { templates = new[] { "Knee Rehab" } }), etag, Version);
+
+        // Assert
+        firstResult.Should().BeSameAs(ok, "the handler's result goes out without being serialized for a hash");
+        etag.Should().StartWith("W/\"");
+        result.Should().BeOfType<StatusCodeHttpResult>()
+            .Which.StatusCode.Should().Be(StatusCodes.Status304NotModified);
+        context.Response.Headers.ETag.ToString().Should().Be(etag);
+        _handlerCalls.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldTagFromResponseValue_WhenNoVersionBeforeHandler()
+    {
+        // Arrange - nothing cached until the handler runs
+        var payload = new { board = "week 1" };
+        Task<string?> Version(HttpContext _, object? value) => Task.FromResult(ReferenceEquals(value, payload) ? "entry-1" : null);
+
+        // Act
+        var (_, first) = await InvokeAsync(Results.Ok(payload), version: Version);
+        var etag = first.Response.Headers.ETag.ToString();
+        var (result, _) = await InvokeAsync(Results.Ok(payload), etag, (_, _) => Task.FromResult<string?>("entry-1"));
+
+        // Assert
+        etag.Should().StartWith("W/\"");
+        result.Should().BeOfType<StatusCodeHttpResult>()
+            .Which.StatusCode.Should().Be(StatusCodes.Status304NotModified);
+        _handlerCalls.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldPassThrough_NonOkResults()
+    {
+        // Act
+        var (result, context) = await InvokeAsync(Results.NotFound("Trainer profile not found"), "*");
+
+        // Assert
+        result.Should().BeOfType<NotFound<string>>();
+        context.Response.Headers.ContainsKey("ETag").Should().BeFalse();
+    }
+}
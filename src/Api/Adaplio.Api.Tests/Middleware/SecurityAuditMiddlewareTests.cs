@@ -0,0 +1,175 @@
+using System.Text;
+using Adaplio.Api.Middleware;
+using Adaplio.Api.Services;
+using FluentAssertions;
+using Microsoft.AspNetCore.Http;
+using Microsoft.Extensions.Configuration;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Middleware;
+
+public class SecurityAuditMiddlewareTests
+{
+    private static IConfiguration CreateConfiguration(int maxCapturedBytes = 64, int queueCapacity = 10)
+    {
+        return new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"SecurityAudit:MaxCapturedBytes", maxCapturedBytes.ToString()},
+                {"SecurityAudit:QueueCapacity", queueCapacity.ToString()}
+            })
+            .Build();
+    }
+
+    private static DefaultHttpContext CreateContext(string path, string requestBody, Stream responseBody)
+    {
+        var context = new DefaultHttpContext();
+        context.Request.Method = HttpMethods.Post;
+        context.Request.Path = path;
+        context.Request.ContentType = "application/json";
+        context.Request.Body = new MemoryStream(Encoding.UTF8.GetBytes(requestBody));
+        context.Response.Body = responseBody;
+        return context;
+    }
+
+    private static async Task EchoFailedLogin(HttpContext context)
+    {
+        using var reader = new StreamReader(context.Request.Body);
+        await reader.ReadToEndAsync();
+        context.Response.StatusCode = 400;
+        await context.Response.WriteAsync("{\"message\":\"Invalid credentials\",\"token\":null}");
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldStreamResponse_AndQueueCappedRecord()
+    {
+        // Arrange
+        var configuration = CreateConfiguration(maxCapturedBytes: 64);
+        var queue = new SecurityAuditQueue(configuration);
+        var middleware = new SecurityAuditMiddleware(EchoFailedLogin, queue, configuration);
+        var requestBody = "{\"email\":\"jo@example.com\",\"password\":\"hunter22\",\"notes\":\"" + new string('x', 500) + "\"}";
+        var responseStream = new MemoryStream();
+        var context = CreateContext("/auth/trainer/login", requestBody, responseStream);
+
+        // Act
+        await middleware.InvokeAsync(context);
+
+        // Assert
+        Encoding.UTF8.GetString(responseStream.ToArray()).Should().Contain("Invalid credentials");
+        context.Response.Body.Should().BeSameAs(responseStream);
+
+        queue.Reader.TryRead(out var record).Should().BeTrue();
+        record!.EventType.Should().Be("auth_failed");
+        record.RequestBody.Length.Should().Be(64);
+        record.RequestBody.TotalBytes.Should().Be(Encoding.UTF8.GetByteCount(requestBody));
+        record.RequestBody.Truncated.Should().BeTrue();
+        record.ResponseBody.Truncated.Should().BeFalse();
+
+        var redacted = AuditBodyRedactor.Redact(record.RequestBody);
+        redacted.Should().NotContain("hunter22").And.NotContain("jo@example.com");
+        redacted.Should().EndWith(AuditBodyRedactor.TruncatedMarker);
+        record.RequestBody.Return();
+        record.ResponseBody.Return();
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldSkipNonSensitiveEndpoints()
+    {
+        // Arrange
+        var configuration = CreateConfiguration();
+        var queue = new SecurityAuditQueue(configuration);
+        var middleware = new SecurityAuditMiddleware(context => context.Response.WriteAsync("OK"), queue, configuration);
+        var context = CreateContext("/health", "", new MemoryStream());
+
+        // Act
+        await middleware.InvokeAsync(context);
+
+        // Assert
+        queue.GetStats().Enqueued.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldLeaveResponseBodyAlone_ForFileDownloads()
+    {
+        // Arrange
+        var configuration = CreateConfiguration();
+        var queue = new SecurityAuditQueue(configuration);
+        Stream? bodySeenByEndpoint = null;
+        var middleware = new SecurityAuditMiddleware(context =>
+        {
+            bodySeenByEndpoint = context.Response.Body;
+            return context.Response.Body.WriteAsync(new byte[] { 0x89, 0x50, 0x4E, 0x47 }).AsTask();
+        }, queue, configuration);
+        var responseStream = new MemoryStream();
+        var context = CreateContext("/api/uploads/files/avatars/a.png", "", responseStream);
+        context.Request.Method = HttpMethods.Get;
+
+        // Act
+        await middleware.InvokeAsync(context);
+
+        // Assert
+        bodySeenByEndpoint.Should().BeSameAs(responseStream);
+        responseStream.Length.Should().Be(4);
+
+        queue.Reader.TryRead(out var record).Should().BeTrue();
+        record!.Path.Should().Be("/api/uploads/files/avatars/a.png");
+        record.ResponseBody.Length.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldDropRecords_WhenQueueIsFull()
+    {
+        // Arrange
+        var configuration = CreateConfiguration(queueCapacity: 2);
+        var queue = new SecurityAuditQueue(configuration);
+        var middleware = new SecurityAuditMiddleware(EchoFailedLogin, queue, configuration);
+
+        // Act - nothing drains the queue
+        for (var i = 0; i < 5; i++)
+        {
+            await middleware.InvokeAsync(CreateContext("/auth/trainer/login", "{}", new MemoryStream()));
+        }
+
+        // Assert
+        var stats = queue.GetStats();
+        stats.Enqueued.Should().Be(2);
+        stats.Dropped.Should().Be(3);
+        stats.Pending.Should().Be(2);
+    }
+
+    [Fact]
+    public void Redact_ShouldRedactSensitiveFields_InCompleteJson()
+    {
+        // Arrange
+        var body = Encoding.UTF8.GetBytes("{\"fullName\":\"Sam\",\"auth\":{\"password\":\"p\"},\"age\":41,\"tags\":[\"call 555-123-4567\"]}");
+
+        // Act
+        var redacted = AuditBodyRedactor.Redact(body, truncated: false);
+
+        // Assert
+        redacted.Should().Be("{\"fullName\":\"Sam\",\"auth\":\"***REDACTED***\",\"age\":41,\"tags\":[\"call ***PHONE***\"]}");
+    }
+
+    [Fact]
+    public void Redact_ShouldNeverLeakSensitiveValue_CutMidToken()
+    {
+        // Arrange - prefix ends inside the password value
+        var body = Encoding.UTF8.GetBytes("{\"fullName\":\"Sam\",\"password\":\"correct horse");
+
+        // Act
+        var redacted = AuditBodyRedactor.Redact(body, truncated: true);
+
+        // Assert
+        redacted.Should().Be("{\"fullName\":\"Sam\",\"password\":\"***REDACTED***\"...");
+    }
+
+    [Fact]
+    public void Redact_ShouldMaskPatterns_WhenBodyIsNotJson()
+    {
+        // Act
+        var redacted = AuditBodyRedactor.Redact(Encoding.UTF8.GetBytes("contact jo@example.com"), truncated: false);
+
+        // Assert
+        redacted.Should().Be("contact ***EMAIL***");
+    }
+}
@@ -0,0 +1,74 @@
+using System.Security.Claims;
+using Adaplio.Api.Middleware;
+using Adaplio.Api.Services;
+using FluentAssertions;
+using Microsoft.AspNetCore.Http;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Moq;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Middleware;
+
+public class SecurityRateLimitingMiddlewareTests
+{
+    private static SecurityRateLimitingMiddleware CreateMiddleware(int uploadLimit)
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"RateLimiting:Rules:api_upload:MaxRequests", uploadLimit.ToString()}
+            })
+            .Build();
+
+        var services = new ServiceCollection()
+            .AddSingleton(new Mock<ISecurityMonitoringService>().Object)
+            .BuildServiceProvider();
+
+        return new SecurityRateLimitingMiddleware(
+            context => Task.CompletedTask,
+            NullLogger<SecurityRateLimitingMiddleware>.Instance,
+            services,
+            new InMemoryRateLimitStore(),
+            configuration);
+    }
+
+    private static DefaultHttpContext CreateContext(string method, string path)
+    {
+        var context = new DefaultHttpContext();
+        context.Request.Method = method;
+        context.Request.Path = path;
+        context.Request.Headers["X-Real-IP"] = "203.0.113.7";
+        context.Response.Body = new MemoryStream();
+        context.User = new ClaimsPrincipal(new ClaimsIdentity(new[] { new Claim(ClaimTypes.NameIdentifier, "7") }, "Test"));
+        return context;
+    }
+
+    [Fact]
+    public async Task InvokeAsync_ShouldCountUploadsOncePerSession_NotPerChunkOrDownload()
+    {
+        // Arrange
+        var middleware = CreateMiddleware(uploadLimit: 1);
+        var requests = new List<HttpContext> { CreateContext(HttpMethods.Post, "/api/uploads/presign") };
+        for (var i = 0; i < 20; i++)
+        {
+            requests.Add(CreateContext(HttpMethods.Put, "/api/uploads/upload"));
+            requests.Add(CreateContext(HttpMethods.Get, "/api/uploads/upload"));
+            requests.Add(CreateContext(HttpMethods.Get, "/api/uploads/files/avatars/a.png"));
+        }
+        var secondPresign = CreateContext(HttpMethods.Post, "/api/uploads/presign");
+
+        // Act
+        foreach (var request in requests)
+        {
+            await middleware.InvokeAsync(request);
+        }
+        await middleware.InvokeAsync(secondPresign);
+
+        // Assert
+        requests.Should().OnlyContain(r => r.Response.StatusCode == StatusCodes.Status200OK);
+        secondPresign.Response.StatusCode.Should().Be(StatusCodes.Status429TooManyRequests);
+        secondPresign.Response.Headers["X-Rate-Limit-Category"].ToString().Should().Be("api_upload");
+    }
+}
@@ -0,0 +1,84 @@
+using Adaplio.Api.Domain;
+using FluentAssertions;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+public class ActivityBitmapTests
+{
+    private static readonly DateOnly Today = new(2025, 3, 10);
+
+    [Fact]
+    public void Record_ShouldShiftWindow_WhenDayIsAfterAnchor()
+    {
+        // Arrange
+        var activity = new ActivityBitmap(null, 0).Record(Today.AddDays(-2)).Record(Today.AddDays(-1));
+
+        // Act
+        var result = activity.Record(Today);
+
+        // Assert
+        result.Anchor.Should().Be(Today);
+        result.TrailingRun.Should().Be(3);
+        result.ActiveDays.Should().Be(3);
+    }
+
+    [Fact]
+    public void Record_ShouldFillGap_WhenDayIsInsideWindow()
+    {
+        // Arrange - active today and 2 days ago
+        var activity = new ActivityBitmap(null, 0).Record(Today.AddDays(-2)).Record(Today);
+        activity.TrailingRun.Should().Be(1);
+
+        // Act
+        var result = activity.Record(Today.AddDays(-1));
+
+        // Assert
+        result.Anchor.Should().Be(Today);
+        result.IsActive(Today.AddDays(-1)).Should().BeTrue();
+        result.TrailingRun.Should().Be(3);
+    }
+
+    [Fact]
+    public void Record_ShouldIgnoreDays_OlderThanWindow()
+    {
+        // Arrange
+        var activity = new ActivityBitmap(null, 0).Record(Today);
+
+        // Act
+        var result = activity.Record(Today.AddDays(-ActivityBitmap.WindowDays));
+
+        // Assert
+        result.Should().Be(activity);
+    }
+
+    [Fact]
+    public void LongestRun_ShouldFindRunBeforeCurrentStreak()
+    {
+        // Arrange - five days in a row, a gap, then two days
+        var activity = new ActivityBitmap(null, 0);
+        for (var offset = 9; offset >= 5; offset--)
+        {
+            activity = activity.Record(Today.AddDays(-offset));
+        }
+        activity = activity.Record(Today.AddDays(-1)).Record(Today);
+
+        // Assert
+        activity.TrailingRun.Should().Be(2);
+        activity.LongestRun.Should().Be(5);
+    }
+
+    [Theory]
+    [InlineData(0, 0)]
+    [InlineData(5, 5)]
+    [InlineData(200, ActivityBitmap.WindowDays)]
+    public void FromStreak_ShouldMarkStreakDaysActive(int streak, int expectedRun)
+    {
+        // Act
+        var activity = ActivityBitmap.FromStreak(Today, streak);
+
+        // Assert
+        activity.TrailingRun.Should().Be(expectedRun);
+        activity.ActiveDays.Should().Be(expectedRun);
+    }
+}
@@ -0,0 +1,96 @@
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+using Adaplio.Api.Services;
+using FluentAssertions;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+public class AnalyticsIngestTests
+{
+    private static IConfiguration CreateConfiguration(int queueCapacity = 10, int flushBatchSize = 4, int flushIntervalMs = 50)
+    {
+        return new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"Analytics:QueueCapacity", queueCapacity.ToString()},
+                {"Analytics:FlushBatchSize", flushBatchSize.ToString()},
+                {"Analytics:FlushIntervalMs", flushIntervalMs.ToString()}
+            })
+            .Build();
+    }
+
+    private static AnalyticsEvent[] Events(int count, string name = "page_view")
+    {
+        var now = DateTimeOffset.UtcNow;
+        return Enumerable.Range(0, count)
+            .Select(_ => new AnalyticsEvent { Event = name, OccurredAt = now, ReceivedAt = now })
+            .ToArray();
+    }
+
+    [Fact]
+    public void TryEnqueue_ShouldRejectWholeBatch_WhenItDoesNotFit()
+    {
+        // Arrange
+        var queue = new AnalyticsIngestQueue(CreateConfiguration(queueCapacity: 10));
+
+        // Act
+        var first = queue.TryEnqueue(Events(6));
+        var second = queue.TryEnqueue(Events(5));
+        var third = queue.TryEnqueue(Events(4));
+
+        // Assert
+        first.Should().BeTrue();
+        second.Should().BeFalse();
+        third.Should().BeTrue();
+
+        var stats = queue.GetStats();
+        stats.Received.Should().Be(15);
+        stats.Accepted.Should().Be(10);
+        stats.Rejected.Should().Be(5);
+        stats.Pending.Should().Be(10);
+    }
+
+    [Fact]
+    public async Task Writer_ShouldFlushEveryAcceptedEvent_BySizeTimeAndOnShutdown()
+    {
+        // Arrange
+        var configuration = CreateConfiguration(queueCapacity: 100, flushBatchSize: 4, flushIntervalMs: 50);
+        var databaseName = $"Analytics_{Guid.NewGuid()}";
+        var services = new ServiceCollection()
+            .AddDbContext<AppDbContext>(options => options.UseInMemoryDatabase(databaseName))
+            .BuildServiceProvider();
+        var queue = new AnalyticsIngestQueue(configuration);
+        var writer = new AnalyticsIngestWriter(
+            queue,
+            services.GetRequiredService<IServiceScopeFactory>(),
+            configuration,
+            NullLogger<AnalyticsIngestWriter>.Instance);
+
+        // Act
+        await writer.StartAsync(CancellationToken.None);
+        queue.TryEnqueue(Events(9)); // Two full batches and a partial one flushed by the interval
+        await Task.Delay(500);
+        var flushedBeforeStop = queue.GetStats().Written;
+
+        queue.TryEnqueue(Events(3, "shutdown"));
+        await writer.StopAsync(CancellationToken.None);
+
+        // Assert
+        flushedBeforeStop.Should().Be(9);
+
+        var stats = queue.GetStats();
+        stats.Written.Should().Be(12);
+        stats.Dropped.Should().Be(0);
+        stats.Pending.Should().Be(0);
+
+        using var scope = services.CreateScope();
+        var context = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        (await context.AnalyticsEvents.CountAsync()).Should().Be(12);
+        (await context.AnalyticsEvents.CountAsync(ae => ae.Event == "shutdown")).Should().Be(3);
+    }
+}
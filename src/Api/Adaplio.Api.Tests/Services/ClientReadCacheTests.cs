@@ -0,0 +1,179 @@
+using Adaplio.Api.Services;
+using FluentAssertions;
+using Microsoft.Extensions.Configuration;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+public class ClientReadCacheTests
+{
+    private static readonly DateOnly Week = new(2025, 1, 6);
+
+    private static ClientReadCache CreateCache(int maxEntries = 100, bool enabled = true)
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"ClientCache:Enabled", enabled.ToString()},
+                {"ClientCache:MaxEntries", maxEntries.ToString()},
+                {"ClientCache:TtlSeconds", "300"}
+            })
+            .Build();
+
+        return new ClientReadCache(configuration);
+    }
+
+    [Fact]
+    public async Task GetOrAddAsync_ShouldReturnCachedValue_OnSecondCall()
+    {
+        // Arrange
+        var cache = CreateCache();
+        var calls = 0;
+        Task<string> Factory() => Task.FromResult($"board-{++calls}");
+
+        // Act
+        var first = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, Factory);
+        var second = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, Factory);
+
+        // Assert
+        first.Should().Be("board-1");
+        second.Should().Be("board-1");
+        calls.Should().Be(1);
+
+        var stats = cache.GetStats();
+        stats.Hits.Should().Be(1);
+        stats.Misses.Should().Be(1);
+        stats.HitRate.Should().Be(0.5);
+    }
+
+    [Fact]
+    public async Task GetOrAddAsync_ShouldKeyByWeek()
+    {
+        // Arrange
+        var cache = CreateCache();
+
+        // Act
+        var thisWeek = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("this"));
+        var nextWeek = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week.AddDays(7), () => Task.FromResult("next"));
+
+        // Assert
+        thisWeek.Should().Be("this");
+        nextWeek.Should().Be("next");
+        cache.GetStats().Entries.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task InvalidateClient_ShouldDropOnlyThatClientsEntries()
+    {
+        // Arrange
+        var cache = CreateCache();
+        await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("one"));
+        await cache.GetOrAddAsync(1, ClientReadCache.Gamification, null, () => Task.FromResult("one-xp"));
+        await cache.GetOrAddAsync(2, ClientReadCache.Board, Week, () => Task.FromResult("two"));
+
+        // Act
+        cache.InvalidateClient(1);
+        var refreshed = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("one-new"));
+        var other = await cache.GetOrAddAsync(2, ClientReadCache.Board, Week, () => Task.FromResult("two-new"));
+
+        // Assert
+        refreshed.Should().Be("one-new");
+        other.Should().Be("two");
+        cache.GetStats().Invalidations.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetOrAddAsync_ShouldNotCacheResult_WhenInvalidatedDuringRead()
+    {
+        // Arrange
+        var cache = CreateCache();
+
+        // Act - a write lands while the first read is still building its response
+        await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () =>
+        {
+            cache.InvalidateClient(1);
+            return Task.FromResult("stale");
+        });
+        var next = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("fresh"));
+
+        // Assert
+        next.Should().Be("fresh");
+    }
+
+    [Fact]
+    public async Task GetOrAddAsync_ShouldNotCacheResult_WhenInvalidatedAfterAnOverlappingReadFinished()
+    {
+        // Arrange
+        var cache = CreateCache();
+
+        // Act - a second read for the same client finishes first, then a write lands before the first read completes
+        await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, async () =>
+        {
+            await cache.GetOrAddAsync(1, ClientReadCache.Gamification, null, () => Task.FromResult("xp"));
+            cache.InvalidateClient(1);
+            return "stale";
+        });
+        var next = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("fresh"));
+
+        // Assert
+        next.Should().Be("fresh");
+    }
+
+    [Fact]
+    public async Task GetVersion_ShouldChange_WhenEntryIsReplaced()
+    {
+        // Arrange
+        var cache = CreateCache();
+        var board = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("board"));
+        var version = cache.GetVersion(1, ClientReadCache.Board, Week);
+        var sameValueVersion = cache.GetVersion(1, ClientReadCache.Board, Week, board);
+
+        // Act
+        cache.InvalidateClient(1);
+        var afterInvalidate = cache.GetVersion(1, ClientReadCache.Board, Week);
+        var refreshed = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("board-new"));
+
+        // Assert
+        version.Should().NotBeNull();
+        sameValueVersion.Should().Be(version);
+        afterInvalidate.Should().BeNull();
+        cache.GetVersion(1, ClientReadCache.Board, Week, board).Should().BeNull("the entry no longer holds that response");
+        cache.GetVersion(1, ClientReadCache.Board, Week, refreshed).Should().NotBeNull().And.NotBe(version);
+    }
+
+    [Fact]
+    public async Task GetOrAddAsync_ShouldEvictLeastRecentlyUsed_WhenOverCapacity()
+    {
+        // Arrange
+        var cache = CreateCache(maxEntries: 2);
+        await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("one"));
+        await cache.GetOrAddAsync(2, ClientReadCache.Board, Week, () => Task.FromResult("two"));
+        await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("unused")); // Touch client 1
+
+        // Act
+        await cache.GetOrAddAsync(3, ClientReadCache.Board, Week, () => Task.FromResult("three"));
+        var one = await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult("one-new"));
+        var two = await cache.GetOrAddAsync(2, ClientReadCache.Board, Week, () => Task.FromResult("two-new"));
+
+        // Assert
+        one.Should().Be("one");
+        two.Should().Be("two-new");
+        cache.GetStats().Evictions.Should().BeGreaterThan(0);
+    }
+
+    [Fact]
+    public async Task GetOrAddAsync_ShouldBypass_WhenDisabled()
+    {
+        // Arrange
+        var cache = CreateCache(enabled: false);
+        var calls = 0;
+
+        // Act
+        await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult((++calls).ToString()));
+        await cache.GetOrAddAsync(1, ClientReadCache.Board, Week, () => Task.FromResult((++calls).ToString()));
+
+        // Assert
+        calls.Should().Be(2);
+        cache.GetStats().Entries.Should().Be(0);
+    }
+}
@@ -0,0 +1,122 @@
+using Adaplio.Api.Exercises;
+using Adaplio.Api.Services;
+using Adaplio.Api.Tests.Helpers;
+using FluentAssertions;
+using Microsoft.Extensions.Configuration;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+public class ExerciseSearchIndexTests : DatabaseTestBase
+{
+    private sealed class ManualTimeProvider : TimeProvider
+    {
+        public DateTimeOffset Now { get; set; } = new(2025, 3, 10, 12, 0, 0, TimeSpan.Zero);
+
+        public override DateTimeOffset GetUtcNow() => Now;
+    }
+
+    private static ExerciseSearchIndex CreateIndex(ManualTimeProvider clock)
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"Exercises:SearchCheckSeconds", "5"}
+            })
+            .Build();
+
+        return new ExerciseSearchIndex(configuration, clock);
+    }
+
+    private async Task AddExercisesAsync(params (string Name, string Category)[] exercises)
+    {
+        var id = Context.Exercises.Count();
+        foreach (var (name, category) in exercises)
+        {
+            Context.Exercises.Add(TestDataBuilder.CreateExercise(id: ++id, name: name, category: category));
+        }
+        await SaveChangesAsync();
+    }
+
+    [Fact]
+    public async Task SearchAsync_ShouldRankNamePrefix_ThenWordPrefix_ThenTypos()
+    {
+        // Arrange
+        var index = CreateIndex(new ManualTimeProvider());
+        await AddExercisesAsync(
+            ("Single Leg Bridge", "strength"),
+            ("Bridge Hold", "strength"),
+            ("Bridge March", "strength"),
+            ("Brige", "core"),
+            ("Calf Raise", "strength"));
+
+        // Act
+        var bridge = await index.SearchAsync(Context, new ExerciseSearchQuery(Q: "bridge"));
+        var typo = await index.SearchAsync(Context, new ExerciseSearchQuery(Q: "calf rase"));
+        var core = await index.SearchAsync(Context, new ExerciseSearchQuery(Q: "bridge", Category: "Core"));
+
+        // Assert
+        bridge.Exercises.Select(e => e.Name).Should().Equal("Bridge Hold", "Bridge March", "Single Leg Bridge", "Brige");
+        typo.Exercises.Select(e => e.Name).Should().Equal("Calf Raise");
+        core.Exercises.Select(e => e.Name).Should().Equal("Brige");
+    }
+
+    [Fact]
+    public async Task SearchAsync_ShouldWalkEveryMatchOnce_ThroughCursors()
+    {
+        // Arrange
+        var index = CreateIndex(new ManualTimeProvider());
+        await AddExercisesAsync(Enumerable.Range(0, 25).Select(i => ($"Squat Variation {i:D2}", "strength")).ToArray());
+
+        // Act
+        var names = new List<string>();
+        string? cursor = null;
+        var pages = 0;
+        do
+        {
+            var page = await index.SearchAsync(Context, new ExerciseSearchQuery(Q: "squat", Limit: 10, Cursor: cursor));
+            names.AddRange(page.Exercises.Select(e => e.Name));
+            cursor = page.NextCursor;
+            pages++;
+        } while (cursor != null);
+
+        // Assert
+        pages.Should().Be(3);
+        names.Should().HaveCount(25).And.OnlyHaveUniqueItems().And.BeInAscendingOrder();
+        index.GetStats().CacheHits.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task SearchAsync_ShouldRejectMalformedCursor()
+    {
+        // Arrange
+        var index = CreateIndex(new ManualTimeProvider());
+
+        // Act
+        var act = () => index.SearchAsync(Context, new ExerciseSearchQuery(Cursor: "not-a-cursor"));
+
+        // Assert
+        await act.Should().ThrowAsync<ArgumentException>();
+    }
+
+    [Fact]
+    public async Task SearchAsync_ShouldPickUpNewExercises_AfterCheckInterval()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var index = CreateIndex(clock);
+        await AddExercisesAsync(("Plank", "core"));
+        await index.SearchAsync(Context, new ExerciseSearchQuery(Q: "plank"));
+        await AddExercisesAsync(("Plank Shoulder Tap", "core"));
+
+        // Act
+        var beforeCheck = await index.SearchAsync(Context, new ExerciseSearchQuery(Q: "plank"));
+        clock.Now = clock.Now.AddSeconds(5);
+        var afterCheck = await index.SearchAsync(Context, new ExerciseSearchQuery(Q: "plank"));
+
+        // Assert
+        beforeCheck.Exercises.Should().ContainSingle();
+        afterCheck.Exercises.Select(e => e.Name).Should().Equal("Plank", "Plank Shoulder Tap");
+        index.GetStats().Builds.Should().Be(2);
+    }
+}
@@ -2,6 +2,7 @@
 using Adaplio.Api.Domain;
 using Adaplio.Api.Services;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Configuration;
 using Xunit;
 
 namespace Adaplio.Api.Tests.Services;
@@ -18,7 +19,8 @@ public GamificationServiceTests()
             .Options;
 
         _context = new AppDbContext(options);
-        _gamificationService = new GamificationService(_context);
+        var configuration = new ConfigurationBuilder().AddInMemoryCollection().Build();
+        _gamificationService = new GamificationService(_context, new ClientReadCache(configuration));
     }
 
     [Fact]
@@ -83,6 +85,58 @@ public async Task AwardXpForProgressAsync_ShouldBeIdempotent_WhenCalledMultipleT
         Assert.Single(xpAwards);
     }
 
+    [Fact]
+    public async Task AwardXpForProgressBatchAsync_ShouldAwardAllEvents_InInputOrder()
+    {
+        // Arrange
+        var clientProfileId = 1;
+        var today = DateTimeOffset.UtcNow;
+        _context.ProgressEvents.AddRange(
+            new ProgressEvent { Id = 1, ClientProfileId = clientProfileId, EventType = "exercise_completed", LoggedAt = today },
+            new ProgressEvent { Id = 2, ClientProfileId = clientProfileId, EventType = "set_completed", LoggedAt = today.AddDays(-2) },
+            new ProgressEvent { Id = 3, ClientProfileId = clientProfileId, EventType = "session_completed", LoggedAt = today.AddDays(-1) });
+        await _context.SaveChangesAsync();
+
+        // Act
+        var results = await _gamificationService.AwardXpForProgressBatchAsync(new[] { 1, 2, 3 }, clientProfileId);
+
+        // Assert
+        Assert.Equal(new[] { 25, 10, 50 }, results.Select(r => r.XpAwarded));
+        Assert.Equal(85, results.Max(r => r.TotalXp));
+
+        var gamification = await _context.Gamifications.FirstAsync(g => g.ClientProfileId == clientProfileId);
+        Assert.Equal(85, gamification.TotalXp);
+        Assert.Equal(3, gamification.CurrentStreak); // Applied oldest first: three consecutive days
+        Assert.Contains(gamification.Badges, b => b.Id == "streak_3");
+        Assert.Equal(3, await _context.XpAwards.CountAsync());
+    }
+
+    [Fact]
+    public async Task AwardXpForProgressBatchAsync_ShouldSkipAlreadyAwardedEvents()
+    {
+        // Arrange
+        var clientProfileId = 1;
+        _context.ProgressEvents.AddRange(
+            new ProgressEvent { Id = 1, ClientProfileId = clientProfileId, EventType = "exercise_completed", LoggedAt = DateTimeOffset.UtcNow },
+            new ProgressEvent { Id = 2, ClientProfileId = clientProfileId, EventType = "exercise_completed", LoggedAt = DateTimeOffset.UtcNow });
+        await _context.SaveChangesAsync();
+        await _gamificationService.AwardXpForProgressAsync(1, clientProfileId);
+
+        // Act
+        var results = await _gamificationService.AwardXpForProgressBatchAsync(new[] { 1, 2 }, clientProfileId);
+        var repeat = await _gamificationService.AwardXpForProgressBatchAsync(new[] { 1, 2 }, clientProfileId);
+
+        // Assert
+        Assert.True(results[0].AlreadyAwarded);
+        Assert.Equal(0, results[0].XpAwarded);
+        Assert.Equal(25, results[1].XpAwarded);
+        Assert.All(repeat, r => Assert.True(r.AlreadyAwarded));
+
+        var gamification = await _context.Gamifications.FirstAsync(g => g.ClientProfileId == clientProfileId);
+        Assert.Equal(50, gamification.TotalXp);
+        Assert.Equal(2, await _context.XpAwards.CountAsync());
+    }
+
     [Theory]
     [InlineData("set_completed", 10)]
     [InlineData("exercise_completed", 25)]
@@ -136,6 +190,64 @@ public async Task AwardXpForProgressAsync_ShouldAwardFirstStepsBadge_WhenReachin
         Assert.Equal("Completed your first exercise", firstStepsBadge.Description);
     }
 
+    [Fact]
+    public async Task AwardXpForProgressAsync_ShouldJoinStreak_WhenBackdatedEventFillsGap()
+    {
+        // Arrange - active today and three days ago; the two days between arrive later from offline sync
+        var clientProfileId = 1;
+        var today = DateTimeOffset.UtcNow;
+        _context.ProgressEvents.AddRange(
+            new ProgressEvent { Id = 1, ClientProfileId = clientProfileId, EventType = "set_completed", LoggedAt = today.AddDays(-3) },
+            new ProgressEvent { Id = 2, ClientProfileId = clientProfileId, EventType = "set_completed", LoggedAt = today },
+            new ProgressEvent { Id = 3, ClientProfileId = clientProfileId, EventType = "set_completed", LoggedAt = today.AddDays(-1) },
+            new ProgressEvent { Id = 4, ClientProfileId = clientProfileId, EventType = "set_completed", LoggedAt = today.AddDays(-2) });
+        await _context.SaveChangesAsync();
+
+        // Act
+        for (var id = 1; id <= 4; id++)
+        {
+            await _gamificationService.AwardXpForProgressAsync(id, clientProfileId);
+        }
+
+        // Assert
+        var gamification = await _context.Gamifications.FirstAsync(g => g.ClientProfileId == clientProfileId);
+        Assert.Equal(4, gamification.CurrentStreak);
+        Assert.Equal(4, gamification.LongestStreak);
+        Assert.Equal(DateOnly.FromDateTime(today.UtcDateTime.Date), gamification.LastActivityDate);
+        Assert.Contains(gamification.Badges, b => b.Id == "streak_3");
+    }
+
+    [Fact]
+    public async Task AwardXpForProgressAsync_ShouldNotRewriteBadges_WhenNoBadgeEarned()
+    {
+        // Arrange - stored in a different JSON layout than the serializer writes (as jsonb returns it)
+        var clientProfileId = 1;
+        const string storedBadges = "[ {\"Id\": \"first_steps\", \"Name\": \"First Steps\"} ]";
+        _context.Gamifications.Add(new Domain.Gamification
+        {
+            ClientProfileId = clientProfileId,
+            TotalXp = 20,
+            BadgesEarned = storedBadges
+        });
+        _context.ProgressEvents.Add(new ProgressEvent
+        {
+            Id = 1,
+            ClientProfileId = clientProfileId,
+            EventType = "set_completed",
+            LoggedAt = DateTimeOffset.UtcNow
+        });
+        await _context.SaveChangesAsync();
+
+        // Act
+        var result = await _gamificationService.AwardXpForProgressAsync(1, clientProfileId);
+
+        // Assert
+        Assert.Empty(result.NewBadges);
+        var gamification = await _context.Gamifications.FirstAsync(g => g.ClientProfileId == clientProfileId);
+        Assert.Equal(storedBadges, gamification.BadgesEarned);
+        Assert.True(gamification.HasBadge("first_steps"));
+    }
+
     [Fact]
     public async Task GetWeeklyProgressAsync_ShouldReturnCorrectData_ForCurrentWeek()
     {
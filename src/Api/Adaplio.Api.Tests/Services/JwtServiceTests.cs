@@ -26,7 +26,7 @@ public JwtServiceTests()
             .AddInMemoryCollection(configValues)
             .Build();
 
-        _jwtService = new JwtService(_configuration);
+        _jwtService = new JwtService(_configuration, new JwtValidationCache(_configuration));
     }
 
     [Fact]
@@ -253,4 +253,45 @@ public void GenerateToken_ShouldProduceDifferentTokens_ForDifferentClaims()
         // Assert
         token1.Should().NotBe(token2);
     }
-}
+
+    [Fact]
+    public void ValidateToken_ShouldServeRepeatValidationsFromCache()
+    {
+        // Arrange
+        var cache = new JwtValidationCache(_configuration);
+        var jwtService = new JwtService(_configuration, cache);
+        var token = jwtService.GenerateToken(new JwtClaims(UserId: "123", Email: "test@test.com", UserType: "client"));
+
+        // Act
+        var first = jwtService.ValidateToken(token);
+        var second = jwtService.ValidateToken(token);
+
+        // Assert
+        first.Should().NotBeNull();
+        second.Should().NotBeNull();
+        second!.FindFirst(ClaimTypes.NameIdentifier)!.Value.Should().Be("123");
+        second.FindFirst("user_type")!.Value.Should().Be("client");
+
+        var stats = cache.GetStats();
+        stats.Hits.Should().Be(1);
+        stats.Misses.Should().Be(1);
+    }
+
+    [Fact]
+    public void ValidateToken_ShouldReturnNull_AfterUserTokensRevoked()
+    {
+        // Arrange
+        var cache = new JwtValidationCache(_configuration);
+        var jwtService = new JwtService(_configuration, cache);
+        var cachedToken = jwtService.GenerateToken(new JwtClaims(UserId: "123", Email: "test@test.com", UserType: "client"));
+        var uncachedToken = jwtService.GenerateToken(new JwtClaims(UserId: "123", Email: "test@test.com", UserType: "trainer"));
+        jwtService.ValidateToken(cachedToken);
+
+        // Act
+        cache.RevokeUser(123);
+
+        // Assert
+        jwtService.ValidateToken(cachedToken).Should().BeNull();
+        jwtService.ValidateToken(uncachedToken).Should().BeNull();
+    }
+}
\ No newline at end of file
@@ -0,0 +1,115 @@
+using Adaplio.Api.Services;
+using FluentAssertions;
+using Microsoft.Extensions.Configuration;
+using System.Security.Claims;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+public class JwtValidationCacheTests
+{
+    private sealed class ManualTimeProvider : TimeProvider
+    {
+        public DateTimeOffset Now { get; set; } = new(2025, 3, 10, 12, 0, 0, TimeSpan.Zero);
+
+        public override DateTimeOffset GetUtcNow() => Now;
+    }
+
+    private static JwtValidationCache CreateCache(ManualTimeProvider clock, int size = 100)
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"Jwt:ValidationCacheSize", size.ToString()}
+            })
+            .Build();
+
+        return new JwtValidationCache(configuration, clock);
+    }
+
+    private static ClaimsPrincipal Principal(string userId)
+    {
+        return new ClaimsPrincipal(new ClaimsIdentity(new[] { new Claim(ClaimTypes.NameIdentifier, userId) }, "test"));
+    }
+
+    [Fact]
+    public void TryGet_ShouldReturnCopyOfPrincipal_UntilTokenExpires()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var cache = CreateCache(clock);
+        var principal = Principal("1");
+        cache.Add("token-1", principal, 1, clock.Now, clock.Now.AddMinutes(60));
+
+        // Act
+        var hit = cache.TryGet("token-1", out var cached);
+        clock.Now = clock.Now.AddMinutes(60);
+        var afterExpiry = cache.TryGet("token-1", out _);
+
+        // Assert
+        hit.Should().BeTrue();
+        cached.Should().NotBeSameAs(principal);
+        cached.FindFirst(ClaimTypes.NameIdentifier)!.Value.Should().Be("1");
+        afterExpiry.Should().BeFalse();
+        cache.GetStats().Entries.Should().Be(0);
+    }
+
+    [Fact]
+    public void Add_ShouldEvictLeastRecentlyUsed_PastMaxEntries()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var cache = CreateCache(clock, size: 2);
+        var expiresAt = clock.Now.AddMinutes(60);
+        cache.Add("token-1", Principal("1"), 1, clock.Now, expiresAt);
+        cache.Add("token-2", Principal("2"), 2, clock.Now, expiresAt);
+
+        // Act
+        cache.TryGet("token-1", out _);
+        cache.Add("token-3", Principal("3"), 3, clock.Now, expiresAt);
+
+        // Assert
+        cache.TryGet("token-1", out _).Should().BeTrue();
+        cache.TryGet("token-2", out _).Should().BeFalse();
+        cache.TryGet("token-3", out _).Should().BeTrue();
+        cache.GetStats().Evictions.Should().Be(1);
+    }
+
+    [Fact]
+    public void RevokeUser_ShouldRejectTokensIssuedUntilRevocation_AndKeepLaterOnes()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var cache = CreateCache(clock);
+        var issuedBefore = clock.Now;
+        cache.Add("token-old", Principal("1"), 1, issuedBefore, issuedBefore.AddMinutes(60));
+        cache.Add("token-other", Principal("2"), 2, issuedBefore, issuedBefore.AddMinutes(60));
+
+        // Act
+        clock.Now = clock.Now.AddMinutes(5);
+        cache.RevokeUser(1);
+        clock.Now = clock.Now.AddSeconds(1);
+
+        // Assert
+        cache.TryGet("token-old", out _).Should().BeFalse();
+        cache.TryGet("token-other", out _).Should().BeTrue();
+        cache.IsRevoked(1, issuedBefore).Should().BeTrue();
+        cache.IsRevoked(1, clock.Now).Should().BeFalse();
+        cache.GetStats().Revocations.Should().Be(1);
+    }
+
+    [Fact]
+    public void TryGet_ShouldAlwaysMiss_WhenDisabled()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var cache = CreateCache(clock, size: 0);
+
+        // Act
+        cache.Add("token-1", Principal("1"), 1, clock.Now, clock.Now.AddMinutes(60));
+
+        // Assert
+        cache.TryGet("token-1", out _).Should().BeFalse();
+        cache.GetStats().Enabled.Should().BeFalse();
+    }
+}
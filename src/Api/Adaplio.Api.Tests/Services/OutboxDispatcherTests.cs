@@ -0,0 +1,312 @@
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+using Adaplio.Api.Services;
+using Adaplio.Api.Tests.Helpers;
+using FluentAssertions;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Moq;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+// Claims and outcomes use ExecuteUpdate, which the InMemory provider does not support
+public class OutboxDispatcherTests : IDisposable
+{
+    private sealed class ManualTimeProvider : TimeProvider
+    {
+        public DateTimeOffset Now { get; set; } = new(2025, 3, 10, 12, 0, 0, TimeSpan.Zero);
+
+        public override DateTimeOffset GetUtcNow() => Now;
+    }
+
+    private readonly string _databaseName = $"Outbox_{Guid.NewGuid()}.db";
+    private readonly AppDbContext _context;
+    private readonly Mock<IEmailService> _emailService = new();
+    private readonly Mock<ISMSService> _smsService = new();
+    private readonly ManualTimeProvider _clock = new();
+
+    public OutboxDispatcherTests()
+    {
+        // Keeps the shared in-memory database alive for the dispatcher's own contexts
+        _context = TestDbContextFactory.CreateSqliteContext(_databaseName);
+    }
+
+    public void Dispose()
+    {
+        _context.Dispose();
+    }
+
+    private OutboxDispatcher CreateDispatcher(int maxAttempts = 8, int emailConcurrency = 2)
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"Outbox:MaxAttempts", maxAttempts.ToString()},
+                {"Outbox:RetryBaseSeconds", "10"},
+                {"Outbox:RetryMaxSeconds", "600"},
+                {"Outbox:ClaimSeconds", "60"},
+                {"Outbox:Concurrency:resend", emailConcurrency.ToString()}
+            })
+            .Build();
+
+        var services = new ServiceCollection()
+            .AddDbContext<AppDbContext>(options => options.UseSqlite($"DataSource={_databaseName};Mode=Memory;Cache=Shared"))
+            .AddSingleton(_emailService.Object)
+            .AddSingleton(_smsService.Object)
+            .BuildServiceProvider();
+
+        return new OutboxDispatcher(
+            services.GetRequiredService<IServiceScopeFactory>(),
+            configuration,
+            NullLogger<OutboxDispatcher>.Instance,
+            _clock);
+    }
+
+    private async Task<List<OutboxMessage>> QueueAsync(int emails, int sms = 0, DateTimeOffset? notAfter = null)
+    {
+        var messages = Enumerable.Range(0, emails)
+            .Select(i => new OutboxMessage
+            {
+                Channel = OutboxMessage.EmailChannel,
+                Provider = "resend",
+                Recipient = $"client{i}@test.com",
+                Subject = "Your Adaplio Login Code",
+                Body = "Your login code is: 123456",
+                NextAttemptAt = _clock.Now,
+                NotAfter = notAfter
+            })
+            .Concat(Enumerable.Range(0, sms).Select(i => new OutboxMessage
+            {
+                Channel = OutboxMessage.SmsChannel,
+                Provider = "twilio",
+                Recipient = $"+1555000{i:D4}",
+                Body = "You've been invited",
+                NextAttemptAt = _clock.Now
+            }))
+            .ToList();
+
+        _context.OutboxMessages.AddRange(messages);
+        await _context.SaveChangesAsync();
+        _context.ChangeTracker.Clear();
+        return messages;
+    }
+
+    private Task<List<OutboxMessage>> ReloadAsync()
+    {
+        _context.ChangeTracker.Clear();
+        return _context.OutboxMessages.OrderBy(om => om.Id).ToListAsync();
+    }
+
+    [Fact]
+    public async Task DispatchDueAsync_ShouldSendInParallel_WithinEachProvidersConcurrency()
+    {
+        // Arrange
+        var dispatcher = CreateDispatcher(emailConcurrency: 2);
+        await QueueAsync(emails: 5, sms: 1);
+
+        var provider = new TaskCompletionSource();
+        var concurrent = 0;
+        var maxConcurrent = 0;
+        _emailService
+            .Setup(e => e.DeliverAsync(It.IsAny<EmailMessage>(), It.IsAny<CancellationToken>()))
+            .Returns(async () =>
+            {
+                var now = Interlocked.Increment(ref concurrent);
+                InterlockedMax(ref maxConcurrent, now);
+                await provider.Task;
+                Interlocked.Decrement(ref concurrent);
+            });
+        _smsService
+            .Setup(s => s.DeliverAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<CancellationToken>()))
+            .Returns(Task.CompletedTask);
+
+        // Act
+        var firstClaim = await dispatcher.DispatchDueAsync();
+        var claimWhileBusy = await dispatcher.DispatchDueAsync();
+        provider.SetResult();
+        await dispatcher.WhenIdleAsync();
+
+        var claimed = firstClaim + claimWhileBusy;
+        while (claimed < 6)
+        {
+            claimed += await dispatcher.DispatchDueAsync();
+            await dispatcher.WhenIdleAsync();
+        }
+
+        // Assert
+        firstClaim.Should().Be(3, "two emails fill resend's slots and the SMS goes to twilio alongside them");
+        claimWhileBusy.Should().Be(0);
+        maxConcurrent.Should().Be(2);
+
+        var messages = await ReloadAsync();
+        messages.Should().OnlyContain(om => om.Status == OutboxMessage.Sent && om.Attempts == 1 && om.SentAt != null);
+        _emailService.Verify(e => e.DeliverAsync(It.IsAny<EmailMessage>(), It.IsAny<CancellationToken>()), Times.Exactly(5));
+    }
+
+    [Fact]
+    public async Task DispatchDueAsync_ShouldRetryWithExponentialBackoff_ThenGiveUp()
+    {
+        // Arrange
+        var dispatcher = CreateDispatcher(maxAttempts: 3);
+        await QueueAsync(emails: 1);
+        _emailService
+            .Setup(e => e.DeliverAsync(It.IsAny<EmailMessage>(), It.IsAny<CancellationToken>()))
+            .ThrowsAsync(new InvalidOperationException("Failed to send email: 503 provider unavailable"));
+        var start = _clock.Now;
+
+        // Act
+        async Task<OutboxMessage> AttemptAsync()
+        {
+            (await dispatcher.DispatchDueAsync()).Should().Be(1);
+            await dispatcher.WhenIdleAsync();
+            return (await ReloadAsync()).Single();
+        }
+
+        var first = await AttemptAsync();
+        var notYetDue = await dispatcher.DispatchDueAsync();
+        _clock.Now = first.NextAttemptAt;
+        var second = await AttemptAsync();
+        _clock.Now = second.NextAttemptAt;
+        var third = await AttemptAsync();
+        _clock.Now = _clock.Now.AddHours(1);
+        var afterGivingUp = await dispatcher.DispatchDueAsync();
+
+        // Assert
+        first.Status.Should().Be(OutboxMessage.Pending);
+        first.NextAttemptAt.Should().Be(start.AddSeconds(10));
+        notYetDue.Should().Be(0);
+        second.NextAttemptAt.Should().Be(start.AddSeconds(10 + 20));
+        third.Status.Should().Be(OutboxMessage.Failed);
+        third.Attempts.Should().Be(3);
+        third.LastError.Should().Contain("503");
+        afterGivingUp.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task DispatchDueAsync_ShouldTakeOverExpiredClaims_AndIgnoreTheOldClaimsOutcome()
+    {
+        // Arrange
+        var dispatcher = CreateDispatcher();
+        var message = (await QueueAsync(emails: 1)).Single();
+        var stuck = new TaskCompletionSource();
+        _emailService
+            .SetupSequence(e => e.DeliverAsync(It.IsAny<EmailMessage>(), It.IsAny<CancellationToken>()))
+            .Returns(stuck.Task)
+            .Returns(Task.CompletedTask);
+
+        // Act
+        await dispatcher.DispatchDueAsync();
+        _clock.Now = _clock.Now.AddSeconds(59);
+        var beforeExpiry = await dispatcher.DispatchDueAsync();
+        _clock.Now = _clock.Now.AddSeconds(2);
+        var afterExpiry = await dispatcher.DispatchDueAsync();
+        stuck.SetException(new TimeoutException("provider never answered"));
+        await dispatcher.WhenIdleAsync();
+
+        // Assert
+        beforeExpiry.Should().Be(0);
+        afterExpiry.Should().Be(1);
+
+        var reloaded = (await ReloadAsync()).Single(om => om.Id == message.Id);
+        reloaded.Status.Should().Be(OutboxMessage.Sent, "the first attempt's late failure must not overwrite the takeover's success");
+        reloaded.Attempts.Should().Be(2);
+        reloaded.LastError.Should().BeNull();
+    }
+
+    [Fact]
+    public async Task DispatchDueAsync_ShouldFailExpiredMessages_WithoutSending()
+    {
+        // Arrange
+        var dispatcher = CreateDispatcher();
+        await QueueAsync(emails: 1, notAfter: _clock.Now.AddMinutes(15));
+        _clock.Now = _clock.Now.AddMinutes(16);
+
+        // Act
+        var claimed = await dispatcher.DispatchDueAsync();
+        await dispatcher.WhenIdleAsync();
+
+        // Assert
+        claimed.Should().Be(0);
+        var message = (await ReloadAsync()).Single();
+        message.Status.Should().Be(OutboxMessage.Failed);
+        message.Attempts.Should().Be(0);
+        message.LastError.Should().Be("Expired before delivery");
+        _emailService.Verify(e => e.DeliverAsync(It.IsAny<EmailMessage>(), It.IsAny<CancellationToken>()), Times.Never);
+    }
+
+    [Fact]
+    public async Task DispatchDueAsync_ShouldNotScheduleRetriesPastNotAfter()
+    {
+        // Arrange
+        var dispatcher = CreateDispatcher();
+        await QueueAsync(emails: 1, notAfter: _clock.Now.AddSeconds(25));
+        _emailService
+            .Setup(e => e.DeliverAsync(It.IsAny<EmailMessage>(), It.IsAny<CancellationToken>()))
+            .ThrowsAsync(new InvalidOperationException("Failed to send email: 503 provider unavailable"));
+
+        // Act
+        await dispatcher.DispatchDueAsync();
+        await dispatcher.WhenIdleAsync();
+        var first = (await ReloadAsync()).Single();
+        _clock.Now = first.NextAttemptAt;
+        await dispatcher.DispatchDueAsync();
+        await dispatcher.WhenIdleAsync();
+        var second = (await ReloadAsync()).Single();
+
+        // Assert
+        first.Status.Should().Be(OutboxMessage.Pending, "the retry 10s later is still before NotAfter");
+        second.Status.Should().Be(OutboxMessage.Failed, "the next retry, 20s later, would land after NotAfter");
+        second.Attempts.Should().Be(2);
+        second.LastError.Should().Contain("503");
+    }
+
+    [Fact]
+    public async Task CleanupFinishedAsync_ShouldDeleteInBatches_OnlyFinishedMessagesPastCutoff()
+    {
+        // Arrange
+        var now = _clock.Now;
+        OutboxMessage Message(string recipient, string status, int ageDays) => new()
+        {
+            Channel = OutboxMessage.EmailChannel,
+            Provider = "resend",
+            Recipient = recipient,
+            Body = "Your login code is: 123456",
+            Status = status,
+            CreatedAt = now.AddDays(-ageDays),
+            NextAttemptAt = now.AddDays(-ageDays)
+        };
+        _context.OutboxMessages.AddRange(
+            Message("sent-old", OutboxMessage.Sent, 30),
+            Message("failed-old", OutboxMessage.Failed, 30),
+            Message("sent-recent", OutboxMessage.Sent, 1),
+            Message("pending-old", OutboxMessage.Pending, 30));
+        await _context.SaveChangesAsync();
+        _context.ChangeTracker.Clear();
+
+        var outbox = new OutboxService(_context, _emailService.Object, _smsService.Object);
+        var cutoff = now.AddDays(-7);
+
+        // Act
+        var firstBatch = await outbox.CleanupFinishedAsync(cutoff, batchSize: 1);
+        var secondBatch = await outbox.CleanupFinishedAsync(cutoff, batchSize: 1);
+        var thirdBatch = await outbox.CleanupFinishedAsync(cutoff, batchSize: 1);
+
+        // Assert
+        firstBatch.Should().Be(1);
+        secondBatch.Should().Be(1);
+        thirdBatch.Should().Be(0);
+        (await ReloadAsync()).Select(om => om.Recipient).Should().BeEquivalentTo("sent-recent", "pending-old");
+    }
+
+    private static void InterlockedMax(ref int target, int value)
+    {
+        int current;
+        while ((current = Volatile.Read(ref target)) < value
+            && Interlocked.CompareExchange(ref target, value, current) != current)
+        {
+        }
+    }
+}
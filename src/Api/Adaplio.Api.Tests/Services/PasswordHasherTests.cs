@@ -0,0 +1,126 @@
+using Adaplio.Api.Services;
+using FluentAssertions;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Configuration;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+public class PasswordHasherTests
+{
+    private const string Password = "SecurePass123!";
+
+    private static PasswordHasher CreateHasher(int workFactor = 4, int workers = 2, int queueCapacity = 16, int verifiedCacheSeconds = 300)
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"PasswordHashing:WorkFactor", workFactor.ToString()},
+                {"PasswordHashing:Workers", workers.ToString()},
+                {"PasswordHashing:QueueCapacity", queueCapacity.ToString()},
+                {"PasswordHashing:VerifiedCacheSeconds", verifiedCacheSeconds.ToString()}
+            })
+            .Build();
+
+        return new PasswordHasher(configuration, new MemoryCache(new MemoryCacheOptions()));
+    }
+
+    [Fact]
+    public async Task HashAsync_ShouldProduceVerifiableHash_WithConfiguredWorkFactor()
+    {
+        // Arrange
+        using var hasher = CreateHasher(workFactor: 5);
+
+        // Act
+        var hash = await hasher.HashAsync(Password);
+
+        // Assert
+        BCrypt.Net.BCrypt.Verify(Password, hash).Should().BeTrue();
+        BCrypt.Net.BCrypt.PasswordNeedsRehash(hash, 5).Should().BeFalse();
+        hasher.GetStats().Completed.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task VerifyAsync_ShouldRejectWrongPassword()
+    {
+        // Arrange
+        using var hasher = CreateHasher();
+        var hash = await hasher.HashAsync(Password);
+
+        // Act
+        var result = await hasher.VerifyAsync("WrongPassword123!", hash);
+
+        // Assert
+        result.Verified.Should().BeFalse();
+        result.UpgradedHash.Should().BeNull();
+    }
+
+    [Fact]
+    public async Task VerifyAsync_ShouldUpgradeHash_WhenWorkFactorRaised()
+    {
+        // Arrange
+        using var hasher = CreateHasher(workFactor: 5);
+        var oldHash = BCrypt.Net.BCrypt.HashPassword(Password, 4);
+
+        // Act
+        var result = await hasher.VerifyAsync(Password, oldHash);
+
+        // Assert
+        result.Verified.Should().BeTrue();
+        result.UpgradedHash.Should().NotBeNull();
+        BCrypt.Net.BCrypt.Verify(Password, result.UpgradedHash).Should().BeTrue();
+        BCrypt.Net.BCrypt.PasswordNeedsRehash(result.UpgradedHash, 5).Should().BeFalse();
+        hasher.GetStats().Upgraded.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task VerifyAsync_ShouldSkipBCrypt_ForRecentlyVerifiedCredentials()
+    {
+        // Arrange
+        using var hasher = CreateHasher();
+        var hash = BCrypt.Net.BCrypt.HashPassword(Password, 4);
+
+        // Act
+        var first = await hasher.VerifyAsync(Password, hash);
+        var second = await hasher.VerifyAsync(Password, hash);
+        var wrong = await hasher.VerifyAsync("WrongPassword123!", hash);
+
+        // Assert
+        first.Verified.Should().BeTrue();
+        second.Verified.Should().BeTrue();
+        wrong.Verified.Should().BeFalse();
+
+        var stats = hasher.GetStats();
+        stats.FastPathHits.Should().Be(1);
+        stats.Completed.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task HashAsync_ShouldShedLoad_WhenQueueIsFull()
+    {
+        // Arrange
+        using var hasher = CreateHasher(workFactor: 12, workers: 1, queueCapacity: 1);
+        var accepted = new List<Task<string>>();
+        PasswordHasherBusyException? rejection = null;
+
+        // Act
+        for (var i = 0; i < 5; i++)
+        {
+            try
+            {
+                accepted.Add(hasher.HashAsync(Password));
+            }
+            catch (PasswordHasherBusyException ex)
+            {
+                rejection = ex;
+            }
+        }
+        await Task.WhenAll(accepted);
+
+        // Assert
+        rejection.Should().NotBeNull();
+        rejection!.RetryAfter.Should().BeGreaterOrEqualTo(TimeSpan.FromSeconds(1));
+        accepted.Count.Should().BeLessThanOrEqualTo(2);
+        hasher.GetStats().Rejected.Should().Be(5 - accepted.Count);
+    }
+}
@@ -4,6 +4,7 @@
 using Adaplio.Api.Tests.Helpers;
 using FluentAssertions;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Configuration;
 using Xunit;
 
 namespace Adaplio.Api.Tests.Services;
@@ -14,7 +15,8 @@ public class PlanServiceTests : DatabaseTestBase
 
     public PlanServiceTests()
     {
-        _planService = new PlanService(Context);
+        var configuration = new ConfigurationBuilder().AddInMemoryCollection().Build();
+        _planService = new PlanService(Context, new ClientReadCache(configuration), new ExerciseNameCache(configuration));
     }
 
     #region Template Tests
@@ -126,6 +128,64 @@ public async Task CreateTemplateAsync_ShouldCreateTemplate_WithExercises()
         savedTemplate!.PlanTemplateItems.Should().HaveCount(2);
     }
 
+    private static TemplateItemRequest ExerciseItem(string exerciseName)
+    {
+        return new TemplateItemRequest(exerciseName, null, "Strength", 3, 10, null, 3, null, null);
+    }
+
+    [Fact]
+    public async Task CreateTemplateAsync_ShouldMatchExercisesByNormalizedName_AndCreateEachNewOneOnce()
+    {
+        // Arrange
+        var trainer = TestDataBuilder.CreateTrainerProfile();
+        Context.TrainerProfiles.Add(trainer);
+        Context.Exercises.Add(TestDataBuilder.CreateExercise(id: 1, name: "Squat"));
+        await SaveChangesAsync();
+
+        var request = new CreateTemplateRequest("Lower Body", null, null, 4, false, new[]
+        {
+            ExerciseItem("  squat "),
+            ExerciseItem("Lunge"),
+            ExerciseItem("LUNGE"),
+            ExerciseItem("Bridge")
+        });
+
+        // Act
+        var result = await _planService.CreateTemplateAsync(trainer.Id, request);
+
+        // Assert
+        result.Items.Select(i => i.ExerciseName).Should().Equal("Squat", "Lunge", "Lunge", "Bridge");
+
+        var exercises = await Context.Exercises.ToListAsync();
+        exercises.Select(e => e.NormalizedName).Should().BeEquivalentTo("squat", "lunge", "bridge");
+    }
+
+    [Fact]
+    public async Task CreateTemplateAsync_ShouldResolveKnownNamesFromCache()
+    {
+        // Arrange
+        var trainer = TestDataBuilder.CreateTrainerProfile();
+        Context.TrainerProfiles.Add(trainer);
+        await SaveChangesAsync();
+
+        var configuration = new ConfigurationBuilder().AddInMemoryCollection().Build();
+        var exerciseNames = new ExerciseNameCache(configuration);
+        var planService = new PlanService(Context, new ClientReadCache(configuration), exerciseNames);
+        var request = new CreateTemplateRequest("Plan", null, null, 4, false, new[] { ExerciseItem("Squat"), ExerciseItem("Plank") });
+
+        // Act
+        var first = await planService.CreateTemplateAsync(trainer.Id, request);
+        var second = await planService.CreateTemplateAsync(trainer.Id, request);
+
+        // Assert
+        second.Items.Select(i => i.ExerciseName).Should().Equal(first.Items.Select(i => i.ExerciseName));
+        (await Context.Exercises.CountAsync()).Should().Be(2);
+
+        var stats = exerciseNames.GetStats();
+        stats.Hits.Should().Be(2);
+        stats.Entries.Should().Be(2);
+    }
+
     [Fact]
     public async Task UpdateTemplateAsync_ShouldUpdateTemplate()
     {
@@ -246,12 +306,51 @@ public async Task GetClientProposalsAsync_ShouldReturnPendingProposals()
         await SaveChangesAsync();
 
         // Act
-        var result = await _planService.GetClientProposalsAsync(client.Id);
+        var result = await _planService.GetClientProposalsAsync(client.Id, new ProposalListQuery());
 
         // Assert
-        result.Should().HaveCount(2);
-        result.Should().Contain(p => p.Status == "pending");
-        result.Should().Contain(p => p.Status == "accepted");
+        result.Proposals.Should().HaveCount(2);
+        result.Proposals.Should().Contain(p => p.Status == "pending");
+        result.Proposals.Should().Contain(p => p.Status == "accepted");
+    }
+
+    [Fact]
+    public async Task GetTrainerProposalsAsync_ShouldPageNewestFirst_AndFilterByStatus()
+    {
+        // Arrange
+        var trainer = TestDataBuilder.CreateTrainerProfile();
+        var client = TestDataBuilder.CreateClientProfile();
+        Context.TrainerProfiles.Add(trainer);
+        Context.ClientProfiles.Add(client);
+        for (int id = 1; id <= 5; id++)
+        {
+            Context.PlanProposals.Add(new PlanProposal
+            {
+                Id = id,
+                TrainerProfileId = trainer.Id,
+                ClientProfileId = client.Id,
+                ProposalName = $"Plan {id}",
+                Status = id % 2 == 0 ? "accepted" : "pending",
+                CustomPlanJson = ProposalSnapshot.Serialize(null, new[]
+                {
+                    new ProposalSnapshotItem(1, "Squat", null, 0, 3, 10, null, 1, "[\"Monday\"]", null)
+                })
+            });
+        }
+        await SaveChangesAsync();
+
+        // Act
+        var secondPage = await _planService.GetTrainerProposalsAsync(trainer.Id, new ProposalListQuery(Page: 2, PageSize: 2));
+        var pending = await _planService.GetTrainerProposalsAsync(trainer.Id, new ProposalListQuery(Status: "Pending"));
+
+        // Assert
+        secondPage.TotalCount.Should().Be(5);
+        secondPage.Proposals.Select(p => p.Id).Should().Equal(3, 2);
+        secondPage.Proposals[0].ClientAlias.Should().Be(client.Alias);
+        secondPage.Proposals[0].Items.Should().ContainSingle(i => i.ExerciseName == "Squat" && i.Days!.Single() == "Monday");
+
+        pending.TotalCount.Should().Be(3);
+        pending.Proposals.Select(p => p.Id).Should().Equal(5, 3, 1);
     }
 
     [Fact]
@@ -301,6 +400,81 @@ public async Task AcceptProposalAsync_ShouldCreatePlanInstance()
         updatedProposal!.Status.Should().Be("accepted");
     }
 
+    [Fact]
+    public async Task AcceptProposalAsync_ShouldExpandSelectedItemsAcrossEveryPlanWeek()
+    {
+        // Arrange
+        var trainer = TestDataBuilder.CreateTrainerProfile();
+        var client = TestDataBuilder.CreateClientProfile();
+        var squat = TestDataBuilder.CreateExercise(id: 1, name: "Squat");
+        var plank = TestDataBuilder.CreateExercise(id: 2, name: "Plank");
+        var template = TestDataBuilder.CreatePlanTemplate(trainerProfileId: trainer.Id);
+        template.DurationWeeks = 6; // Edited after the three-week proposal was sent
+
+        Context.TrainerProfiles.Add(trainer);
+        Context.ClientProfiles.Add(client);
+        Context.Exercises.AddRange(squat, plank);
+        Context.PlanTemplates.Add(template);
+        Context.PlanProposals.Add(new PlanProposal
+        {
+            Id = 1,
+            TrainerProfileId = trainer.Id,
+            ClientProfileId = client.Id,
+            PlanTemplateId = template.Id,
+            ProposalName = "Three Weeks",
+            Status = "pending",
+            StartsOn = new DateOnly(2025, 3, 10),
+            CustomPlanJson = ProposalSnapshot.Serialize(3, new[]
+            {
+                new ProposalSnapshotItem(squat.Id, "Squat", null, 0, 3, 10, null, 2, "[\"Monday\",\"Thursday\"]", null),
+                new ProposalSnapshotItem(plank.Id, "Plank", null, 1, 3, null, 30, 1, "[\"Friday\"]", null)
+            })
+        });
+        await SaveChangesAsync();
+
+        // Act
+        var result = await _planService.AcceptProposalAsync(client.Id, 1, new AcceptProposalRequest(null, new[] { 0 }));
+
+        // Assert
+        result.AcceptedItems.Should().Be(1);
+        result.TotalItems.Should().Be(2);
+
+        var instances = await Context.ExerciseInstances
+            .Where(ei => ei.PlanInstanceId == result.PlanInstanceId)
+            .ToListAsync();
+        instances.Should().HaveCount(6);
+        instances.Should().OnlyContain(ei => ei.ExerciseId == squat.Id && ei.TargetSets == 3 && ei.TargetReps == 10);
+        instances.GroupBy(ei => ei.WeekNumber).Select(g => g.Key).Should().BeEquivalentTo(new[] { 1, 2, 3 });
+        instances.Where(ei => ei.WeekNumber == 2).Select(ei => ei.DayOfWeek).Should().BeEquivalentTo(new[] { 1, 4 });
+
+        var acceptances = await Context.PlanItemAcceptances
+            .Where(pia => pia.PlanInstanceId == result.PlanInstanceId)
+            .Select(pia => pia.ExerciseInstanceId)
+            .ToListAsync();
+        acceptances.Should().BeEquivalentTo(instances.Select(ei => ei.Id));
+
+        var plan = await Context.PlanInstances.FindAsync(result.PlanInstanceId);
+        plan!.PlannedEndDate.Should().Be(new DateOnly(2025, 3, 31));
+    }
+
+    [Fact]
+    public void ProposalSnapshot_ShouldReadItemArraysStoredBeforeDurationWasFrozen()
+    {
+        // Arrange
+        var legacy = "[{\"ExerciseId\":1,\"ExerciseName\":\"Squat\",\"OrderIndex\":0,\"Sets\":3,\"DaysOfWeek\":\"[\\\"Monday\\\"]\"}]";
+        var current = ProposalSnapshot.Serialize(4, ProposalSnapshot.Parse(legacy));
+
+        // Act
+        var legacySnapshot = ProposalSnapshot.Read(legacy);
+        var currentSnapshot = ProposalSnapshot.Read(current);
+
+        // Assert
+        legacySnapshot.DurationWeeks.Should().BeNull();
+        legacySnapshot.Items.Should().ContainSingle(item => item.ExerciseName == "Squat" && item.Days.Single() == "Monday");
+        currentSnapshot.DurationWeeks.Should().Be(4);
+        currentSnapshot.Items.Should().BeEquivalentTo(legacySnapshot.Items);
+    }
+
     #endregion
 
     #region Client Board Tests
@@ -370,6 +544,69 @@ public async Task GetClientBoardAsync_ShouldIncludeCompletionStatus()
         result.Plans[0].ExerciseInstances.Should().HaveCount(1);
     }
 
+    [Fact]
+    public async Task GetClientBoardAsync_ShouldReturnOnlyCurrentPlanWeek_WithLatestProgress()
+    {
+        // Arrange
+        var client = TestDataBuilder.CreateClientProfile();
+        var exercise = TestDataBuilder.CreateExercise();
+        var weekStart = DateOnly.FromDateTime(DateTime.Today.AddDays(-(((int)DateTime.Today.DayOfWeek + 6) % 7)));
+        var plan = TestDataBuilder.CreatePlanInstance(clientProfileId: client.Id);
+        plan.StartDate = weekStart.AddDays(-7); // Plan is in its second week
+
+        var weekOne = new ExerciseInstance { Id = 1, PlanInstanceId = plan.Id, ExerciseId = exercise.Id, WeekNumber = 1, DayOfWeek = 1, Status = "done" };
+        var weekTwo = new ExerciseInstance { Id = 2, PlanInstanceId = plan.Id, ExerciseId = exercise.Id, WeekNumber = 2, DayOfWeek = 1, Status = "planned" };
+        var older = new ProgressEvent { Id = 1, ClientProfileId = client.Id, ExerciseInstanceId = 2, EventType = "set_completed", SetsCompleted = 1, LoggedAt = DateTimeOffset.UtcNow };
+        var newer = new ProgressEvent { Id = 2, ClientProfileId = client.Id, ExerciseInstanceId = 2, EventType = "set_completed", SetsCompleted = 2, LoggedAt = DateTimeOffset.UtcNow };
+
+        Context.ClientProfiles.Add(client);
+        Context.Exercises.Add(exercise);
+        Context.PlanInstances.Add(plan);
+        Context.ExerciseInstances.AddRange(weekOne, weekTwo);
+        Context.ProgressEvents.AddRange(older, newer);
+        await SaveChangesAsync();
+
+        // Act
+        var result = await _planService.GetClientBoardAsync(client.Id, weekStart);
+
+        // Assert
+        var cards = result.Days.SelectMany(d => d.Exercises).ToList();
+        cards.Should().ContainSingle();
+        cards[0].ExerciseInstanceId.Should().Be(2);
+        cards[0].CompletedSets.Should().Be(2);
+        result.Days.Single(d => d.DayOfWeek == 1).Exercises.Should().HaveCount(1);
+    }
+
+    [Fact]
+    public async Task GetClientBoardAsync_ShouldPickLatestProgressByLoggedAt_NotHighestId()
+    {
+        // Arrange
+        var client = TestDataBuilder.CreateClientProfile();
+        var exercise = TestDataBuilder.CreateExercise();
+        var weekStart = DateOnly.FromDateTime(DateTime.Today.AddDays(-(((int)DateTime.Today.DayOfWeek + 6) % 7)));
+        var plan = TestDataBuilder.CreatePlanInstance(clientProfileId: client.Id);
+        plan.StartDate = weekStart;
+
+        var instance = new ExerciseInstance { Id = 1, PlanInstanceId = plan.Id, ExerciseId = exercise.Id, WeekNumber = 1, DayOfWeek = 1, Status = "partial" };
+        var today = new ProgressEvent { Id = 1, ClientProfileId = client.Id, ExerciseInstanceId = 1, EventType = "set_completed", SetsCompleted = 3, LoggedAt = DateTimeOffset.UtcNow };
+        // Batch-inserted after today's log, so it has the higher id
+        var backdated = new ProgressEvent { Id = 2, ClientProfileId = client.Id, ExerciseInstanceId = 1, EventType = "set_completed", SetsCompleted = 1, LoggedAt = DateTimeOffset.UtcNow.AddDays(-2) };
+
+        Context.ClientProfiles.Add(client);
+        Context.Exercises.Add(exercise);
+        Context.PlanInstances.Add(plan);
+        Context.ExerciseInstances.Add(instance);
+        Context.ProgressEvents.AddRange(today, backdated);
+        await SaveChangesAsync();
+
+        // Act
+        var result = await _planService.GetClientBoardAsync(client.Id, weekStart);
+
+        // Assert
+        var card = result.Days.SelectMany(d => d.Exercises).Should().ContainSingle().Subject;
+        card.CompletedSets.Should().Be(3);
+    }
+
     #endregion
 
     #region Plan Instance Tests
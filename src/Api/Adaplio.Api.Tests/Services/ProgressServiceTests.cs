@@ -1,7 +1,9 @@
+using Adaplio.Api.Domain;
 using Adaplio.Api.Services;
 using Adaplio.Api.Tests.Helpers;
 using FluentAssertions;
 using Microsoft.EntityFrameworkCore;
+using System.Globalization;
 using Xunit;
 
 namespace Adaplio.Api.Tests.Services;
@@ -183,6 +185,77 @@ public async Task UpdateAdherenceWeekAsync_ShouldUpdateExistingWeek()
         updatedWeek!.CalculatedAt.Should().BeCloseTo(DateTimeOffset.UtcNow, TimeSpan.FromSeconds(5));
     }
 
+    [Fact]
+    public async Task ApplyProgressEventAsync_ShouldIncrementCompleted_OnlyOnFirstCompletion()
+    {
+        // Arrange
+        var client = TestDataBuilder.CreateClientProfile();
+        var plan = TestDataBuilder.CreatePlanInstance(clientProfileId: client.Id);
+        var weekStart = DateOnly.FromDateTime(DateTime.UtcNow.AddDays(-(((int)DateTime.UtcNow.DayOfWeek + 6) % 7)));
+        var weekNumber = CultureInfo.CurrentCulture.Calendar.GetWeekOfYear(
+            weekStart.ToDateTime(TimeOnly.MinValue), CalendarWeekRule.FirstFourDayWeek, DayOfWeek.Monday);
+        var instances = Enumerable.Range(1, 4).Select(id => new ExerciseInstance
+        {
+            Id = id,
+            PlanInstanceId = plan.Id,
+            ExerciseId = 1,
+            WeekNumber = weekNumber,
+            Status = "planned"
+        }).ToList();
+
+        Context.ClientProfiles.Add(client);
+        Context.PlanInstances.Add(plan);
+        Context.ExerciseInstances.AddRange(instances);
+        await SaveChangesAsync();
+
+        var first = TestDataBuilder.CreateProgressEvent(id: 1, clientProfileId: client.Id, exerciseInstanceId: 1);
+        Context.ProgressEvents.Add(first);
+        await SaveChangesAsync();
+        await _progressService.ApplyProgressEventAsync(first); // Materializes the week
+
+        // Act
+        var second = TestDataBuilder.CreateProgressEvent(id: 2, clientProfileId: client.Id, exerciseInstanceId: 2);
+        var repeat = TestDataBuilder.CreateProgressEvent(id: 3, clientProfileId: client.Id, exerciseInstanceId: 2);
+        var setOnly = TestDataBuilder.CreateProgressEvent(id: 4, clientProfileId: client.Id, exerciseInstanceId: 3, eventType: "set_completed");
+        Context.ProgressEvents.AddRange(second, repeat, setOnly);
+        await SaveChangesAsync();
+        await _progressService.ApplyProgressEventsAsync(new[] { second, repeat, setOnly });
+
+        // Assert
+        var adherenceWeek = await Context.AdherenceWeeks.SingleAsync(aw => aw.ClientProfileId == client.Id);
+        adherenceWeek.TotalExercisesPlanned.Should().Be(4);
+        adherenceWeek.TotalExercisesCompleted.Should().Be(2);
+        adherenceWeek.AdherencePercentage.Should().Be(50.0m);
+    }
+
+    [Fact]
+    public async Task RecomputeAdherenceWeeksAsync_ShouldCorrectDriftedCounters()
+    {
+        // Arrange
+        var client = TestDataBuilder.CreateClientProfile();
+        var weekStart = DateOnly.FromDateTime(DateTime.UtcNow.AddDays(-(((int)DateTime.UtcNow.DayOfWeek + 6) % 7)));
+        var drifted = TestDataBuilder.CreateAdherenceWeek(clientProfileId: client.Id, weekStartDate: weekStart);
+        drifted.WeekNumber = CultureInfo.CurrentCulture.Calendar.GetWeekOfYear(
+            weekStart.ToDateTime(TimeOnly.MinValue), CalendarWeekRule.FirstFourDayWeek, DayOfWeek.Monday);
+        drifted.TotalExercisesPlanned = 10;
+        drifted.TotalExercisesCompleted = 7;
+
+        Context.ClientProfiles.Add(client);
+        Context.AdherenceWeeks.Add(drifted);
+        await SaveChangesAsync();
+
+        // Act
+        var corrected = await _progressService.RecomputeAdherenceWeeksAsync(weekStart.AddDays(-7));
+        var correctedAgain = await _progressService.RecomputeAdherenceWeeksAsync(weekStart.AddDays(-7));
+
+        // Assert
+        corrected.Should().Be(1);
+        correctedAgain.Should().Be(0);
+        var week = await Context.AdherenceWeeks.SingleAsync();
+        week.TotalExercisesPlanned.Should().Be(0);
+        week.TotalExercisesCompleted.Should().Be(0);
+    }
+
     [Fact]
     public async Task GetClientAdherenceAsync_ShouldHandleDateOnlyProperly()
     {
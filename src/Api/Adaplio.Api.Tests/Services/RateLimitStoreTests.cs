@@ -0,0 +1,150 @@
+using Adaplio.Api.Services;
+using FluentAssertions;
+using Microsoft.Extensions.Configuration;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+public class RateLimitStoreTests
+{
+    private sealed class ManualTimeProvider : TimeProvider
+    {
+        public DateTimeOffset Now { get; set; } = new(2025, 3, 10, 12, 0, 0, TimeSpan.Zero);
+
+        public override DateTimeOffset GetUtcNow() => Now;
+    }
+
+    private static readonly RateLimitRule LoginRule = new(5, TimeSpan.FromMinutes(15), TimeSpan.FromMinutes(30));
+    private static readonly RateLimitRule ProfileRule = new(10, TimeSpan.FromMinutes(1), TimeSpan.Zero);
+
+    [Fact]
+    public void TryAcquire_ShouldAllowUpToLimit_ThenLockOut()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var store = new InMemoryRateLimitStore(clock);
+        var key = new RateLimitKey("auth_login", "42");
+
+        // Act
+        var allowed = Enumerable.Range(0, 5).Select(_ => store.TryAcquire(key, LoginRule).Allowed).ToList();
+        var blocked = store.TryAcquire(key, LoginRule);
+        clock.Now = clock.Now.AddMinutes(20); // Window has passed but lockout has not
+        var stillLocked = store.TryAcquire(key, LoginRule);
+        clock.Now = clock.Now.AddMinutes(11);
+        var afterLockout = store.TryAcquire(key, LoginRule);
+
+        // Assert
+        allowed.Should().AllSatisfy(a => a.Should().BeTrue());
+        blocked.Allowed.Should().BeFalse();
+        blocked.RetryAfter.Should().Be(TimeSpan.FromMinutes(30));
+        stillLocked.Allowed.Should().BeFalse();
+        stillLocked.RetryAfter.Should().Be(TimeSpan.FromMinutes(10));
+        afterLockout.Allowed.Should().BeTrue();
+    }
+
+    [Fact]
+    public void TryAcquire_ShouldSlideWindow_WhenNoLockout()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var store = new InMemoryRateLimitStore(clock);
+        var key = new RateLimitKey("profile_updates", "7");
+        for (var i = 0; i < 10; i++)
+        {
+            store.TryAcquire(key, ProfileRule);
+            clock.Now = clock.Now.AddSeconds(5);
+        }
+
+        // Act - the oldest request (50s ago) leaves the window after 10s
+        var blocked = store.TryAcquire(key, ProfileRule);
+        clock.Now = clock.Now.AddSeconds(11);
+        var allowed = store.TryAcquire(key, ProfileRule);
+        var blockedAgain = store.TryAcquire(key, ProfileRule);
+
+        // Assert
+        blocked.Allowed.Should().BeFalse();
+        blocked.RetryAfter.Should().Be(TimeSpan.FromSeconds(10));
+        allowed.Allowed.Should().BeTrue();
+        blockedAgain.Allowed.Should().BeFalse();
+    }
+
+    [Fact]
+    public void TryAcquire_ShouldTrackKeysIndependently()
+    {
+        // Arrange
+        var store = new InMemoryRateLimitStore(new ManualTimeProvider());
+        for (var i = 0; i < 5; i++)
+        {
+            store.TryAcquire(new RateLimitKey("auth_login", "1"), LoginRule);
+        }
+
+        // Act
+        var sameCategoryOtherUser = store.TryAcquire(new RateLimitKey("auth_login", "2"), LoginRule);
+        var sameUserOtherCategory = store.TryAcquire(new RateLimitKey("auth_register", "1"), LoginRule);
+        var exhausted = store.TryAcquire(new RateLimitKey("auth_login", "1"), LoginRule);
+
+        // Assert
+        sameCategoryOtherUser.Allowed.Should().BeTrue();
+        sameUserOtherCategory.Allowed.Should().BeTrue();
+        exhausted.Allowed.Should().BeFalse();
+    }
+
+    [Fact]
+    public void TryAcquire_ShouldEvictIdleKeys()
+    {
+        // Arrange
+        var clock = new ManualTimeProvider();
+        var store = new InMemoryRateLimitStore(clock);
+        for (var i = 0; i < 1000; i++)
+        {
+            store.TryAcquire(new RateLimitKey("global_ip", $"10.0.{i / 256}.{i % 256}"), ProfileRule);
+        }
+
+        // Act - every shard sweeps on its next access once the windows have expired
+        clock.Now = clock.Now.AddMinutes(5);
+        for (var i = 0; i < 1000; i++)
+        {
+            store.TryAcquire(new RateLimitKey("global_ip", $"10.1.{i / 256}.{i % 256}"), ProfileRule);
+        }
+
+        // Assert
+        store.Count.Should().Be(1000);
+    }
+
+    [Fact]
+    public async Task TryAcquireAsync_ShouldHoldLimit_UnderConcurrentCallers()
+    {
+        // Arrange
+        var store = new InMemoryRateLimitStore();
+        var rule = new RateLimitRule(500, TimeSpan.FromMinutes(1), TimeSpan.FromMinutes(60));
+        var key = new RateLimitKey("global_ip", "203.0.113.5");
+
+        // Act
+        var decisions = await Task.WhenAll(Enumerable.Range(0, 800)
+            .Select(_ => Task.Run(async () => await store.TryAcquireAsync(key, rule))));
+
+        // Assert
+        decisions.Count(d => d.Allowed).Should().Be(500);
+    }
+
+    [Fact]
+    public void FromConfiguration_ShouldOverrideConfiguredValues_AndKeepDefaultsForTheRest()
+    {
+        // Arrange
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"RateLimiting:Rules:auth_login:MaxRequests", "50"},
+                {"RateLimiting:Rules:auth_login:LockoutMinutes", "1"}
+            })
+            .Build();
+
+        // Act
+        var configured = RateLimitRule.FromConfiguration(configuration, "auth_login", LoginRule);
+        var unconfigured = RateLimitRule.FromConfiguration(configuration, "profile_updates", ProfileRule);
+
+        // Assert
+        configured.Should().Be(new RateLimitRule(50, TimeSpan.FromMinutes(15), TimeSpan.FromMinutes(1)));
+        unconfigured.Should().Be(ProfileRule);
+    }
+}
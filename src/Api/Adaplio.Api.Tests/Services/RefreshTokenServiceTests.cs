@@ -0,0 +1,128 @@
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+using Adaplio.Api.Services;
+using Adaplio.Api.Tests.Helpers;
+using FluentAssertions;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+// Rotation and cleanup use ExecuteUpdate/ExecuteDelete, which the InMemory provider does not support
+public class RefreshTokenServiceTests : IDisposable
+{
+    private readonly string _databaseName = $"RefreshTokens_{Guid.NewGuid()}.db";
+    private readonly List<AppDbContext> _contexts = new();
+    private readonly AppDbContext _context;
+
+    public RefreshTokenServiceTests()
+    {
+        _context = CreateContext();
+        _context.AppUsers.Add(new AppUser { Id = 1, Email = "user@test.com", UserType = "client" });
+        _context.SaveChanges();
+    }
+
+    public void Dispose()
+    {
+        foreach (var context in _contexts)
+        {
+            context.Dispose();
+        }
+    }
+
+    private AppDbContext CreateContext()
+    {
+        // Contexts share one in-memory SQLite database, like concurrent requests share the real one
+        var context = TestDbContextFactory.CreateSqliteContext(_databaseName);
+        _contexts.Add(context);
+        return context;
+    }
+
+    private static RefreshTokenService CreateService(AppDbContext context)
+    {
+        var configuration = new ConfigurationBuilder().AddInMemoryCollection().Build();
+        return new RefreshTokenService(
+            context,
+            NullLogger<RefreshTokenService>.Instance,
+            new JwtValidationCache(configuration),
+            new MemoryCache(new MemoryCacheOptions()));
+    }
+
+    [Fact]
+    public async Task RotateRefreshTokenAsync_ShouldIssueNewToken_AndRejectReuse()
+    {
+        // Arrange
+        var service = CreateService(_context);
+        var oldToken = await service.GenerateRefreshTokenAsync(1, "127.0.0.1", "test");
+
+        // Act
+        var rotation = await service.RotateRefreshTokenAsync(oldToken, "127.0.0.1", "test");
+        var replay = await service.RotateRefreshTokenAsync(oldToken, "127.0.0.1", "test");
+
+        // Assert
+        rotation.Should().NotBeNull();
+        rotation!.UserId.Should().Be(1);
+        rotation.Token.Should().NotBe(oldToken);
+        replay.Should().BeNull();
+        (await service.ValidateRefreshTokenAsync(oldToken)).Should().BeNull();
+        (await service.ValidateRefreshTokenAsync(rotation.Token)).Should().Be(1);
+    }
+
+    [Fact]
+    public async Task RotateRefreshTokenAsync_ShouldLetOnlyOneRequestClaimToken()
+    {
+        // Arrange
+        var token = await CreateService(_context).GenerateRefreshTokenAsync(1, null, null);
+
+        // Separate contexts and dead-token caches, like two API instances, so only the conditional update can stop the second rotation
+        var first = CreateService(CreateContext());
+        var second = CreateService(CreateContext());
+
+        // Act
+        var firstRotation = await first.RotateRefreshTokenAsync(token, null, null);
+        var secondRotation = await second.RotateRefreshTokenAsync(token, null, null);
+
+        // Assert
+        firstRotation.Should().NotBeNull();
+        secondRotation.Should().BeNull();
+
+        var tokens = await CreateContext().RefreshTokens.AsNoTracking().ToListAsync();
+        tokens.Should().HaveCount(2);
+        tokens.Count(t => t.RevokedAt == null).Should().Be(1);
+    }
+
+    [Fact]
+    public async Task CleanupExpiredTokensAsync_ShouldDeleteInBatches_OnlyTokensPastCutoff()
+    {
+        // Arrange
+        var now = DateTimeOffset.UtcNow;
+        for (var i = 0; i < 3; i++)
+        {
+            _context.RefreshTokens.Add(new RefreshToken { UserId = 1, TokenHash = $"expired-{i}", ExpiresAt = now.AddDays(-90) });
+        }
+        _context.RefreshTokens.AddRange(
+            new RefreshToken { UserId = 1, TokenHash = "revoked-old", ExpiresAt = now.AddDays(10), RevokedAt = now.AddDays(-70) },
+            new RefreshToken { UserId = 1, TokenHash = "revoked-recent", ExpiresAt = now.AddDays(10), RevokedAt = now.AddDays(-1) },
+            new RefreshToken { UserId = 1, TokenHash = "active", ExpiresAt = now.AddDays(10) });
+        await _context.SaveChangesAsync();
+
+        var service = CreateService(_context);
+        var cutoff = now.AddDays(-60);
+
+        // Act
+        var firstBatch = await service.CleanupExpiredTokensAsync(cutoff, batchSize: 3);
+        var secondBatch = await service.CleanupExpiredTokensAsync(cutoff, batchSize: 3);
+        var thirdBatch = await service.CleanupExpiredTokensAsync(cutoff, batchSize: 3);
+
+        // Assert
+        firstBatch.Should().Be(3);
+        secondBatch.Should().Be(1);
+        thirdBatch.Should().Be(0);
+
+        var remaining = await _context.RefreshTokens.AsNoTracking().Select(rt => rt.TokenHash).ToListAsync();
+        remaining.Should().BeEquivalentTo("revoked-recent", "active");
+    }
+}
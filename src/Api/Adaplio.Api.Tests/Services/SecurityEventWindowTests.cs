@@ -0,0 +1,134 @@
+using Adaplio.Api.Services;
+using FluentAssertions;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+public class SecurityEventWindowTests
+{
+    private static readonly DateTimeOffset Now = new(2025, 3, 10, 12, 30, 0, TimeSpan.Zero);
+
+    private static SecurityEvent Event(string eventType, string? ip, string? userId = null, DateTimeOffset? at = null) => new()
+    {
+        Id = Guid.NewGuid(),
+        EventType = eventType,
+        IpAddress = ip,
+        UserId = userId,
+        Timestamp = at ?? Now
+    };
+
+    [Fact]
+    public void GetMetrics_ShouldAggregateCountsAcrossMinutes()
+    {
+        // Arrange
+        var window = new SecurityEventWindow();
+        window.Record(Event("auth_failed", "10.0.0.1", at: Now.AddMinutes(-30)));
+        window.Record(Event("auth_failed", "10.0.0.1", at: Now.AddMinutes(-1)));
+        window.Record(Event("rate_limit_exceeded", "10.0.0.2", "7"));
+        window.Record(Event("audit_success", "10.0.0.2", "8"));
+
+        // Act
+        var metrics = window.GetMetrics(TimeSpan.FromHours(1), Now);
+
+        // Assert
+        metrics.TotalEvents.Should().Be(4);
+        metrics.FailedAuthAttempts.Should().Be(2);
+        metrics.RateLimitViolations.Should().Be(1);
+        metrics.EventsByType["auth_failed"].Should().Be(2);
+        metrics.UniqueIpAddresses.Should().Be(2);
+        metrics.UniqueUsers.Should().Be(2);
+        metrics.TopIpAddresses.Should().ContainKey("10.0.0.1").WhoseValue.Should().Be(2);
+    }
+
+    [Fact]
+    public void GetMetrics_ShouldExcludeEventsOutsidePeriod()
+    {
+        // Arrange
+        var window = new SecurityEventWindow();
+        window.Record(Event("auth_failed", "10.0.0.1", at: Now.AddHours(-2)));
+        window.Record(Event("auth_failed", "10.0.0.1"));
+
+        // Act
+        var lastHour = window.GetMetrics(TimeSpan.FromHours(1), Now);
+        var lastDay = window.GetMetrics(TimeSpan.FromHours(24), Now);
+
+        // Assert
+        lastHour.TotalEvents.Should().Be(1);
+        lastDay.TotalEvents.Should().Be(2);
+    }
+
+    [Fact]
+    public void Record_ShouldReuseBucket_AfterFullWindow()
+    {
+        // Arrange
+        var window = new SecurityEventWindow();
+        window.Record(Event("auth_failed", "10.0.0.1", at: Now.AddMinutes(-SecurityEventWindow.WindowMinutes)));
+
+        // Act - same ring slot one day later
+        window.Record(Event("audit_success", "10.0.0.2"));
+        var metrics = window.GetMetrics(TimeSpan.FromHours(24), Now);
+
+        // Assert
+        metrics.TotalEvents.Should().Be(1);
+        metrics.FailedAuthAttempts.Should().Be(0);
+    }
+
+    [Fact]
+    public void CountFailedAuth_ShouldTrackHeavyHitter_UnderManyDistinctIps()
+    {
+        // Arrange - one attacker hidden among thousands of single-attempt IPs
+        var window = new SecurityEventWindow();
+        for (var i = 0; i < 5000; i++)
+        {
+            window.Record(Event("auth_failed", $"192.168.{i / 256}.{i % 256}"));
+            if (i % 12 == 0)
+            {
+                window.Record(Event("auth_failed", "203.0.113.9"));
+            }
+        }
+
+        // Act
+        var attackerFailures = window.CountFailedAuth("203.0.113.9", TimeSpan.FromMinutes(5), Now);
+        var metrics = window.GetMetrics(TimeSpan.FromMinutes(5), Now);
+
+        // Assert
+        attackerFailures.Should().BeInRange(300, 417); // Space-Saving lower bound, 417 actual
+        metrics.UniqueIpAddresses.Should().BeInRange(4000, 6000); // HyperLogLog estimate (~6.5% std error)
+    }
+
+    [Fact]
+    public void DistinctUsersByIp_ShouldEstimateSharedIp()
+    {
+        // Arrange
+        var window = new SecurityEventWindow();
+        for (var user = 0; user < 80; user++)
+        {
+            window.Record(Event("audit_success", "198.51.100.7", user.ToString(), Now.AddMinutes(-(user % 30))));
+        }
+
+        // Act
+        var usersByIp = window.DistinctUsersByIp(TimeSpan.FromHours(1), Now);
+
+        // Assert
+        usersByIp["198.51.100.7"].Should().BeInRange(56, 104); // ~13% std error at precision 6
+    }
+
+    [Fact]
+    public async Task LogSecurityEventAsync_ShouldRaiseImmediateBruteForceAlert()
+    {
+        // Arrange
+        var service = new SecurityMonitoringService(NullLogger<SecurityMonitoringService>.Instance, new SecurityEventWindow());
+        var ip = $"203.0.113.{Random.Shared.Next(1, 255)}";
+
+        // Act
+        for (var i = 0; i < 5; i++)
+        {
+            await service.LogSecurityEventAsync("auth_failed", null, ip);
+        }
+        var alerts = await service.GetActiveAlertsAsync();
+
+        // Assert
+        alerts.Should().Contain(a => a.AlertType == "immediate_brute_force");
+    }
+}
@@ -0,0 +1,149 @@
+using Adaplio.Api.Domain;
+using Adaplio.Api.Plans;
+using Adaplio.Api.Services;
+using Adaplio.Api.Tests.Helpers;
+using FluentAssertions;
+using Xunit;
+
+namespace Adaplio.Api.Tests.Services;
+
+public class TrainerRosterServiceTests : DatabaseTestBase
+{
+    private readonly TrainerRosterService _rosterService;
+
+    public TrainerRosterServiceTests()
+    {
+        _rosterService = new TrainerRosterService(Context);
+    }
+
+    private static DateOnly CurrentWeekStart()
+    {
+        var today = DateOnly.FromDateTime(DateTime.UtcNow);
+        return today.AddDays(-(((int)today.DayOfWeek + 6) % 7));
+    }
+
+    private void AddClient(int id, string alias, int trainerProfileId = 1, DateTimeOffset? expiresAt = null, DateTimeOffset? revokedAt = null)
+    {
+        Context.AppUsers.Add(new AppUser { Id = 100 + id, Email = $"{alias.ToLower()}@test.com", UserType = "client" });
+        Context.ClientProfiles.Add(new ClientProfile { Id = id, UserId = 100 + id, Alias = alias });
+        Context.ConsentGrants.AddRange(
+            new ConsentGrant { Id = id * 10, TrainerProfileId = trainerProfileId, ClientProfileId = id, Scope = "view_summary", ExpiresAt = expiresAt, RevokedAt = revokedAt },
+            new ConsentGrant { Id = id * 10 + 1, TrainerProfileId = trainerProfileId, ClientProfileId = id, Scope = "propose_plan", ExpiresAt = expiresAt, RevokedAt = revokedAt });
+    }
+
+    [Fact]
+    public async Task GetClientsAsync_ShouldExcludeExpiredRevokedAndOtherTrainersGrants()
+    {
+        // Arrange
+        AddClient(1, "C-AAAA");
+        AddClient(2, "C-BBBB", expiresAt: DateTimeOffset.UtcNow.AddDays(-1));
+        AddClient(3, "C-CCCC", revokedAt: DateTimeOffset.UtcNow.AddDays(-1));
+        AddClient(4, "C-DDDD", trainerProfileId: 2);
+        AddClient(5, "C-EEEE", expiresAt: DateTimeOffset.UtcNow.AddDays(30));
+        await SaveChangesAsync();
+
+        // Act
+        var result = await _rosterService.GetClientsAsync(1, new TrainerRosterQuery());
+
+        // Assert
+        result.TotalCount.Should().Be(2);
+        result.Clients.Select(c => c.Alias).Should().Equal("C-AAAA", "C-EEEE");
+        result.Clients[0].Email.Should().Be("c-aaaa@test.com");
+        result.Clients[0].Scopes.Should().BeEquivalentTo("view_summary", "propose_plan");
+        result.Clients[0].Summary.Should().BeNull();
+    }
+
+    [Fact]
+    public async Task GetClientsAsync_ShouldPageSortAndSearch()
+    {
+        // Arrange
+        for (var id = 1; id <= 5; id++)
+        {
+            AddClient(id, $"C-{id:D4}");
+        }
+        await SaveChangesAsync();
+
+        // Act
+        var secondPage = await _rosterService.GetClientsAsync(1, new TrainerRosterQuery(Page: 2, PageSize: 2, Sort: "-alias"));
+        var search = await _rosterService.GetClientsAsync(1, new TrainerRosterQuery(Search: "0004"));
+
+        // Assert
+        secondPage.TotalCount.Should().Be(5);
+        secondPage.Clients.Select(c => c.Alias).Should().Equal("C-0003", "C-0002");
+        search.Clients.Should().ContainSingle().Which.Alias.Should().Be("C-0004");
+    }
+
+    [Fact]
+    public async Task GetClientsAsync_ShouldIncludeSummary_AndSortByAdherence()
+    {
+        // Arrange
+        var weekStart = CurrentWeekStart();
+        AddClient(1, "C-LOW");
+        AddClient(2, "C-HIGH");
+        AddClient(3, "C-NONE");
+        Context.AdherenceWeeks.AddRange(
+            new AdherenceWeek { Id = 1, ClientProfileId = 1, WeekStartDate = weekStart, TotalExercisesPlanned = 10, TotalExercisesCompleted = 2, AdherencePercentage = 20m },
+            new AdherenceWeek { Id = 2, ClientProfileId = 2, WeekStartDate = weekStart, TotalExercisesPlanned = 10, TotalExercisesCompleted = 9, AdherencePercentage = 90m },
+            new AdherenceWeek { Id = 3, ClientProfileId = 2, WeekStartDate = weekStart.AddDays(-7), TotalExercisesPlanned = 10, TotalExercisesCompleted = 0, AdherencePercentage = 0m });
+        Context.Gamifications.Add(new Domain.Gamification { Id = 1, ClientProfileId = 2, CurrentStreak = 4, LastActivityDate = weekStart });
+        await SaveChangesAsync();
+
+        // Act
+        var result = await _rosterService.GetClientsAsync(1, new TrainerRosterQuery(Sort: "-adherence", IncludeSummary: true));
+
+        // Assert
+        result.Clients.Select(c => c.Alias).Should().Equal("C-HIGH", "C-LOW", "C-NONE");
+        result.Clients[0].Summary.Should().Be(new TrainerClientSummary(weekStart, 90m, 4));
+        result.Clients[2].Summary.Should().Be(new TrainerClientSummary(null, 0m, 0));
+    }
+
+    [Fact]
+    public async Task GetDashboardAsync_ShouldAggregateAdherenceAndGamificationPerClient()
+    {
+        // Arrange
+        var weekStart = CurrentWeekStart();
+        AddClient(1, "C-AAAA");
+        AddClient(2, "C-BBBB");
+        Context.AdherenceWeeks.AddRange(
+            new AdherenceWeek { Id = 1, ClientProfileId = 1, WeekStartDate = weekStart, TotalExercisesPlanned = 10, TotalExercisesCompleted = 8, AdherencePercentage = 80m },
+            new AdherenceWeek { Id = 2, ClientProfileId = 1, WeekStartDate = weekStart.AddDays(-7), TotalExercisesPlanned = 10, TotalExercisesCompleted = 3, AdherencePercentage = 30m });
+        Context.Gamifications.Add(new Domain.Gamification { Id = 1, ClientProfileId = 1, TotalXp = 250, CurrentStreak = 3, LastActivityDate = weekStart });
+        await SaveChangesAsync();
+
+        // Act
+        var result = await _rosterService.GetDashboardAsync(1, new TrainerRosterQuery());
+
+        // Assert
+        result.TotalCount.Should().Be(2);
+        result.Clients[0].Should().Be(new TrainerDashboardClient(1, "C-AAAA", weekStart, 80m, 55m, 3, 6, 250));
+        result.Clients[1].Should().Be(new TrainerDashboardClient(2, "C-BBBB", null, 0m, 0m, 0, 1, 0));
+    }
+
+    [Fact]
+    public async Task GetDashboardAsync_ShouldOnlyIncludeClientsWithViewSummaryConsent()
+    {
+        // Arrange
+        AddClient(1, "C-AAAA");
+        Context.AppUsers.Add(new AppUser { Id = 102, Email = "c-bbbb@test.com", UserType = "client" });
+        Context.ClientProfiles.Add(new ClientProfile { Id = 2, UserId = 102, Alias = "C-BBBB" });
+        Context.ConsentGrants.Add(new ConsentGrant { Id = 20, TrainerProfileId = 1, ClientProfileId = 2, Scope = "propose_plan" });
+        await SaveChangesAsync();
+
+        // Act
+        var result = await _rosterService.GetDashboardAsync(1, new TrainerRosterQuery());
+
+        // Assert
+        result.TotalCount.Should().Be(1);
+        result.Clients.Should().ContainSingle().Which.Alias.Should().Be("C-AAAA");
+    }
+
+    [Fact]
+    public async Task GetClientsAsync_ShouldRejectUnknownSort()
+    {
+        // Act
+        var act = () => _rosterService.GetClientsAsync(1, new TrainerRosterQuery(Sort: "email"));
+
+        // Assert
+        await act.Should().ThrowAsync<ArgumentException>();
+    }
+}
@@ -1,5 +1,7 @@
+using System.Security.Cryptography;
 using Adaplio.Api.Services;
 using FluentAssertions;
+using Microsoft.AspNetCore.WebUtilities;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.Logging;
 using Moq;
@@ -7,17 +9,48 @@
 
 namespace Adaplio.Api.Tests.Services;
 
-public class UploadServiceTests
+public class UploadServiceTests : IDisposable
 {
     private readonly Mock<ILogger<UploadService>> _mockLogger;
     private readonly Mock<IConfiguration> _mockConfiguration;
     private readonly UploadService _uploadService;
+    private readonly string _root;
 
     public UploadServiceTests()
     {
         _mockLogger = new Mock<ILogger<UploadService>>();
         _mockConfiguration = new Mock<IConfiguration>();
-        _uploadService = new UploadService(_mockConfiguration.Object, _mockLogger.Object);
+        _root = Path.Combine(Path.GetTempPath(), $"adaplio-uploads-{Guid.NewGuid():N}");
+        _uploadService = new UploadService(_mockConfiguration.Object, _mockLogger.Object,
+            new LocalFileStorage(_root), new UploadSessionStore());
+    }
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_root))
+        {
+            Directory.Delete(_root, recursive: true);
+        }
+    }
+
+    private UploadService CreateStreamingService(LocalFileStorage storage, long maxBytes = 1024)
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"Upload:MaxBytes", maxBytes.ToString()},
+                {"Upload:StagingPath", Path.Combine(_root, ".staging")}
+            })
+            .Build();
+
+        return new UploadService(configuration, _mockLogger.Object, storage, new UploadSessionStore());
+    }
+
+    private static async Task<(string Key, string Token)> PresignAsync(UploadService service)
+    {
+        var result = await service.GeneratePresignedUploadUrlAsync("avatar_1", "image/png", "avatar");
+        var query = QueryHelpers.ParseQuery(new Uri(result.UploadUrl).Query);
+        return (query["key"].ToString(), query["token"].ToString());
     }
 
     [Fact]
@@ -118,4 +151,96 @@ public void UploadService_Constructor_ShouldInitializeCorrectly()
         // Assert
         _uploadService.Should().NotBeNull();
     }
+
+    [Fact]
+    public async Task AppendChunkAsync_ShouldResumeFromStagedOffset_AndStoreFileWithChecksum()
+    {
+        // Arrange
+        var storage = new LocalFileStorage(_root);
+        var service = CreateStreamingService(storage);
+        var (key, token) = await PresignAsync(service);
+        var content = RandomNumberGenerator.GetBytes(600);
+        var expectedSha256 = Convert.ToHexString(SHA256.HashData(content)).ToLowerInvariant();
+
+        // Act - first chunk, a chunk at the wrong offset, then the rest
+        var first = await service.AppendChunkAsync(key, token, new MemoryStream(content[..256]), 0, content.Length);
+        var misplaced = await service.AppendChunkAsync(key, token, new MemoryStream(content[300..]), 300, content.Length);
+        var status = await service.GetUploadStatusAsync(key, token);
+        var last = await service.AppendChunkAsync(key, token, new MemoryStream(content[256..]), 256, content.Length, expectedSha256);
+
+        // Assert
+        first.Status.Should().Be(UploadChunkStatus.InProgress);
+        first.ReceivedBytes.Should().Be(256);
+        misplaced.Status.Should().Be(UploadChunkStatus.OffsetMismatch);
+        misplaced.ReceivedBytes.Should().Be(256);
+        status.ReceivedBytes.Should().Be(256);
+
+        last.Status.Should().Be(UploadChunkStatus.Completed);
+        last.Sha256.Should().Be(expectedSha256);
+
+        var stored = await storage.GetAsync(key);
+        stored.Should().NotBeNull();
+        (await File.ReadAllBytesAsync(stored!.PhysicalPath!)).Should().Equal(content);
+    }
+
+    [Fact]
+    public async Task AppendChunkAsync_ShouldRejectUploadsOverTheLimit_WithoutStoringThem()
+    {
+        // Arrange
+        var storage = new LocalFileStorage(_root);
+        var service = CreateStreamingService(storage, maxBytes: 100);
+        var (key, token) = await PresignAsync(service);
+
+        // Act - no declared length, so the limit is enforced while streaming
+        var result = await service.AppendChunkAsync(key, token, new MemoryStream(new byte[101]), 0, totalBytes: null);
+
+        // Assert
+        result.Status.Should().Be(UploadChunkStatus.TooLarge);
+        (await storage.GetAsync(key)).Should().BeNull();
+        Directory.GetFiles(Path.Combine(_root, ".staging")).Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task AppendChunkAsync_ShouldDiscardUpload_WhenChecksumDoesNotMatch()
+    {
+        // Arrange
+        var storage = new LocalFileStorage(_root);
+        var service = CreateStreamingService(storage);
+        var (key, token) = await PresignAsync(service);
+
+        // Act
+        var result = await service.AppendChunkAsync(key, token, new MemoryStream(new byte[10]), 0, 10, expectedSha256: new string('0', 64));
+
+        // Assert
+        result.Status.Should().Be(UploadChunkStatus.ChecksumMismatch);
+        (await storage.GetAsync(key)).Should().BeNull();
+    }
+
+    [Fact]
+    public async Task AppendChunkAsync_ShouldRejectTokenForAnotherKey()
+    {
+        // Arrange
+        var service = CreateStreamingService(new LocalFileStorage(_root));
+        var (_, token) = await PresignAsync(service);
+
+        // Act
+        var result = await service.AppendChunkAsync("avatars/other.png", token, new MemoryStream(new byte[10]), 0, 10);
+
+        // Assert
+        result.Status.Should().Be(UploadChunkStatus.InvalidToken);
+    }
+
+    [Theory]
+    [InlineData("../outside.png")]
+    [InlineData("avatars/../../outside.png")]
+    [InlineData(".staging/abc.part")]
+    [InlineData("")]
+    public void LocalFileStorage_ResolvePath_ShouldRejectKeysOutsideStorage(string key)
+    {
+        // Arrange
+        var storage = new LocalFileStorage(_root);
+
+        // Act & Assert
+        storage.ResolvePath(key).Should().BeNull();
+    }
 }
\ No newline at end of file
@@ -1,9 +1,16 @@
 using System.ComponentModel.DataAnnotations;
+using System.Text.Json;
+using Adaplio.Api.Domain;
+using Adaplio.Api.Services;
 
 namespace Adaplio.Api.Analytics;
 
 public static class AnalyticsEndpoints
 {
+    public const int MaxEventNameLength = 100;
+    public const int MaxMethodLength = 50;
+    public const int MaxPropertiesLength = 4000;
+
     public static void MapAnalyticsEndpoints(this WebApplication app)
     {
         var analyticsGroup = app.MapGroup("/api/analytics").WithTags("Analytics");
@@ -11,24 +18,27 @@ public static void MapAnalyticsEndpoints(this WebApplication app)
         // Track events endpoint (public)
         analyticsGroup.MapPost("/events", TrackEvent)
             .WithName("TrackEvent");
+
+        // Batched ingestion (public); prefer this over one request per event
+        analyticsGroup.MapPost("/events/batch", TrackEvents)
+            .WithName("TrackEvents");
     }
 
-    private static async Task<IResult> TrackEvent(
+    private static IResult TrackEvent(
         AnalyticsEventRequest request,
-        ILogger<AnalyticsEventRequest> logger)
+        AnalyticsIngestQueue ingestQueue)
     {
         try
         {
-            // Log the analytics event
-            logger.LogInformation("Analytics Event: {Event} | Method: {Method} | Timestamp: {Timestamp}",
-                request.Event, request.Method, request.Timestamp);
+            if (!TryCreateEvent(request, DateTimeOffset.UtcNow, out var analyticsEvent, out var error))
+            {
+                return Results.BadRequest(new { message = error });
+            }
 
-            // In a real implementation, you would:
-            // 1. Store in analytics database
-            // 2. Send to analytics service (Google Analytics, Mixpanel, etc.)
-            // 3. Update metrics dashboards
-
-            return Results.Ok(new { message = "Event tracked successfully" });
+            // Don't let a backed-up analytics pipeline break the main application flow
+            return ingestQueue.TryEnqueue(new[] { analyticsEvent })
+                ? Results.Ok(new { message = "Event tracked successfully" })
+                : Results.Ok(new { message = "Event tracking skipped" });
         }
         catch (Exception ex)
         {
@@ -36,6 +46,79 @@ public static void MapAnalyticsEndpoints(this WebApplication app)
             return Results.Ok(new { message = "Event tracking skipped" });
         }
     }
+
+    private static IResult TrackEvents(
+        AnalyticsEventRequest[] requests,
+        HttpContext httpContext,
+        AnalyticsIngestQueue ingestQueue,
+        IConfiguration configuration)
+    {
+        try
+        {
+            var maxEvents = configuration.GetValue("Analytics:MaxEventsPerRequest", 500);
+            if (requests.Length == 0 || requests.Length > maxEvents)
+            {
+                return Results.BadRequest(new { message = $"Send between 1 and {maxEvents} events per request." });
+            }
+
+            var receivedAt = DateTimeOffset.UtcNow;
+            var events = new AnalyticsEvent[requests.Length];
+            for (var i = 0; i < requests.Length; i++)
+            {
+                if (!TryCreateEvent(requests[i], receivedAt, out events[i], out var error))
+                {
+                    return Results.BadRequest(new { message = $"Event {i}: {error}" });
+                }
+            }
+
+            if (!ingestQueue.TryEnqueue(events))
+            {
+                // Back-pressure: nothing from this batch was queued, so it is safe to resend as is
+                httpContext.Response.Headers.RetryAfter = "1";
+                return Results.Json(new AnalyticsBatchResponse(0, events.Length), statusCode: StatusCodes.Status503ServiceUnavailable);
+            }
+
+            return Results.Accepted(value: new AnalyticsBatchResponse(events.Length, 0));
+        }
+        catch (Exception ex)
+        {
+            return Results.Problem("Failed to queue analytics events.");
+        }
+    }
+
+    private static bool TryCreateEvent(
+        AnalyticsEventRequest request,
+        DateTimeOffset receivedAt,
+        out AnalyticsEvent analyticsEvent,
+        out string? error)
+    {
+        analyticsEvent = null!;
+        error = null;
+
+        if (string.IsNullOrWhiteSpace(request.Event) || request.Event.Length > MaxEventNameLength)
+        {
+            error = $"Event name is required and must be at most {MaxEventNameLength} characters.";
+            return false;
+        }
+
+        var properties = request.Properties is { Count: > 0 } ? JsonSerializer.Serialize(request.Properties) : null;
+        if (properties?.Length > MaxPropertiesLength)
+        {
+            error = $"Event properties must serialize to at most {MaxPropertiesLength} characters.";
+            return false;
+        }
+
+        var method = request.Method;
+        analyticsEvent = new AnalyticsEvent
+        {
+            Event = request.Event,
+            Method = method?.Length > MaxMethodLength ? method[..MaxMethodLength] : method,
+            OccurredAt = request.Timestamp ?? receivedAt,
+            ReceivedAt = receivedAt,
+            Properties = properties
+        };
+        return true;
+    }
 }
 
 // DTOs
@@ -44,4 +127,9 @@ public record AnalyticsEventRequest(
     string? Method = null,
     DateTimeOffset? Timestamp = null,
     Dictionary<string, object>? Properties = null
+);
+
+public record AnalyticsBatchResponse(
+    int Accepted,
+    int Rejected
 );
\ No newline at end of file
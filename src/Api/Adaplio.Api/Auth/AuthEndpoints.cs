@@ -4,7 +4,6 @@
 using Microsoft.EntityFrameworkCore;
 using System.Security.Cryptography;
 using System.Text;
-using BCrypt.Net;
 
 namespace Adaplio.Api.Auth;
 
@@ -38,12 +37,37 @@ public static void MapAuthEndpoints(this WebApplication app)
 
         // Logout endpoint
         authGroup.MapPost("/logout", Logout);
+
+        // Development endpoint: expose pending magic link codes so load tests can verify without email
+        if (app.Environment.IsDevelopment())
+        {
+            authGroup.MapGet("/dev/magic-link", GetDevMagicLinkCode)
+                .WithName("GetDevMagicLinkCode");
+        }
+    }
+
+    private static async Task<IResult> GetDevMagicLinkCode(
+        string email,
+        AppDbContext context)
+    {
+        var normalizedEmail = email.ToLowerInvariant();
+        var magicLink = await context.MagicLinks
+            .Where(ml => ml.Email == normalizedEmail && ml.UsedAt == null)
+            .OrderByDescending(ml => ml.Id)
+            .FirstOrDefaultAsync();
+
+        if (magicLink == null)
+        {
+            return Results.NotFound(new AuthResponse("No pending magic link for this email."));
+        }
+
+        return Results.Ok(new { Email = magicLink.Email, Code = magicLink.Code, magicLink.ExpiresAt });
     }
 
     private static async Task<IResult> SendMagicLink(
         ClientMagicLinkRequest request,
         AppDbContext context,
-        IEmailService emailService,
+        IOutboxService outbox,
         HttpContext httpContext,
         ILogger<Program> logger)
     {
@@ -86,10 +110,11 @@ public static void MapAuthEndpoints(this WebApplication app)
                     };
 
                     context.MagicLinks.Add(magicLink);
-                    await context.SaveChangesAsync();
 
-                    // Send email (will log code to console if email service not configured)
-                    await emailService.SendMagicLinkAsync(request.Email, code);
+                    // Queue the email in the same save as the link; OutboxDispatcher sends it
+                    // (or logs the code to the console if email service not configured). Not sent once the code has expired.
+                    outbox.EnqueueEmail(EmailService.MagicLinkEmail(request.Email, code), expiresAt);
+                    await context.SaveChangesAsync();
 
                     return Results.Ok(new ClientMagicLinkResponse(
                         "Magic link sent successfully. Please check your email.",
@@ -231,6 +256,7 @@ public static void MapAuthEndpoints(this WebApplication app)
         AppDbContext context,
         IJwtService jwtService,
         IRefreshTokenService refreshTokenService,
+        IPasswordHasher passwordHasher,
         HttpContext httpContext)
     {
         try
@@ -261,7 +287,7 @@ public static void MapAuthEndpoints(this WebApplication app)
             }
 
             // Hash password
-            var passwordHash = BCrypt.Net.BCrypt.HashPassword(request.Password);
+            var passwordHash = await passwordHasher.HashAsync(request.Password, httpContext.RequestAborted);
 
             // Create trainer user
             var user = new AppUser
@@ -330,6 +356,10 @@ public static void MapAuthEndpoints(this WebApplication app)
                 RefreshToken: refreshToken
             ));
         }
+        catch (PasswordHasherBusyException ex)
+        {
+            return HashingBusy(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Console.WriteLine($"Registration failed for email: {request.Email}. Error: {ex.Message}");
@@ -343,6 +373,7 @@ public static void MapAuthEndpoints(this WebApplication app)
         AppDbContext context,
         IJwtService jwtService,
         IRefreshTokenService refreshTokenService,
+        IPasswordHasher passwordHasher,
         HttpContext httpContext)
     {
         try
@@ -360,11 +391,20 @@ public static void MapAuthEndpoints(this WebApplication app)
             }
 
             // Verify password
-            if (!BCrypt.Net.BCrypt.Verify(request.Password, user.PasswordHash))
+            var verification = await passwordHasher.VerifyAsync(request.Password, user.PasswordHash, httpContext.RequestAborted);
+            if (!verification.Verified)
             {
                 return Results.BadRequest(new AuthResponse("Invalid email or password."));
             }
 
+            // Hash was made with an older work factor; store the stronger one
+            if (verification.UpgradedHash != null)
+            {
+                user.PasswordHash = verification.UpgradedHash;
+                user.UpdatedAt = DateTimeOffset.UtcNow;
+                await context.SaveChangesAsync();
+            }
+
             // Generate JWT
             var claims = new JwtClaims(
                 UserId: user.Id.ToString(),
@@ -405,6 +445,10 @@ public static void MapAuthEndpoints(this WebApplication app)
                 RefreshToken: refreshToken
             ));
         }
+        catch (PasswordHasherBusyException ex)
+        {
+            return HashingBusy(httpContext, ex);
+        }
         catch (Exception ex)
         {
             return Results.Problem("Login failed. Please try again.");
@@ -506,6 +550,8 @@ public static void MapAuthEndpoints(this WebApplication app)
         PasswordResetVerifyRequest request,
         AppDbContext context,
         IRefreshTokenService refreshTokenService,
+        IPasswordHasher passwordHasher,
+        HttpContext httpContext,
         ILogger<Program> logger)
     {
         try
@@ -531,28 +577,23 @@ public static void MapAuthEndpoints(this WebApplication app)
             }
 
             // Update user password
-            resetToken.User.PasswordHash = BCrypt.Net.BCrypt.HashPassword(request.NewPassword);
+            resetToken.User.PasswordHash = await passwordHasher.HashAsync(request.NewPassword, httpContext.RequestAborted);
             resetToken.User.UpdatedAt = DateTimeOffset.UtcNow;
 
             // Mark token as used
             resetToken.UsedAt = DateTimeOffset.UtcNow;
 
-            // Invalidate all existing refresh tokens for security
-            var existingTokens = await context.RefreshTokens
-                .Where(rt => rt.UserId == resetToken.UserId && rt.RevokedAt == null)
-                .ToListAsync();
-
-            foreach (var token in existingTokens)
-            {
-                token.RevokedAt = DateTimeOffset.UtcNow;
-            }
-
-            await context.SaveChangesAsync();
+            // Invalidate all existing refresh and access tokens for security (saves the changes above too)
+            await refreshTokenService.RevokeAllUserTokensAsync(resetToken.UserId);
 
             logger.LogInformation("Password successfully reset for user {UserId}", resetToken.UserId);
 
             return Results.Ok(new PasswordResetResponse("Password successfully reset. Please log in with your new password."));
         }
+        catch (PasswordHasherBusyException ex)
+        {
+            return HashingBusy(httpContext, ex);
+        }
         catch (Exception ex)
         {
             logger.LogError(ex, "Error resetting password");
@@ -560,6 +601,13 @@ public static void MapAuthEndpoints(this WebApplication app)
         }
     }
 
+    // Login storm: shed the request with a hint instead of letting the hashing queue grow without bound
+    private static IResult HashingBusy(HttpContext httpContext, PasswordHasherBusyException ex)
+    {
+        httpContext.Response.Headers.RetryAfter = ((int)ex.RetryAfter.TotalSeconds).ToString();
+        return Results.Problem("Too many sign-in attempts in progress. Please try again shortly.", statusCode: StatusCodes.Status503ServiceUnavailable);
+    }
+
     private static async Task<IResult> GetCurrentUser(
         HttpContext httpContext,
         AppDbContext context)
@@ -738,29 +786,23 @@ public static void MapAuthEndpoints(this WebApplication app)
             var userAgent = httpContext.Request.Headers.UserAgent.ToString();
 
             // Rotate the refresh token (invalidate old, generate new)
-            var newRefreshToken = await refreshTokenService.RotateRefreshTokenAsync(refreshToken, ipAddress, userAgent);
+            var rotation = await refreshTokenService.RotateRefreshTokenAsync(refreshToken, ipAddress, userAgent);
 
-            if (newRefreshToken == null)
+            if (rotation == null)
             {
-                // Invalid or expired refresh token
+                // Invalid, expired or already rotated refresh token
                 httpContext.Response.Cookies.Delete("auth_token");
                 httpContext.Response.Cookies.Delete("refresh_token");
                 return Results.Unauthorized();
             }
 
-            // Get user ID from old token to generate new access token
-            var userId = await refreshTokenService.ValidateRefreshTokenAsync(refreshToken);
-            if (userId == null)
-            {
-                // This shouldn't happen as RotateRefreshTokenAsync already validated it
-                return Results.Unauthorized();
-            }
+            var newRefreshToken = rotation.Token;
 
             // Get user info to generate JWT
             var user = await context.AppUsers
                 .Include(u => u.ClientProfile)
                 .Include(u => u.TrainerProfile)
-                .FirstOrDefaultAsync(u => u.Id == userId.Value);
+                .FirstOrDefaultAsync(u => u.Id == rotation.UserId);
 
             if (user == null)
             {
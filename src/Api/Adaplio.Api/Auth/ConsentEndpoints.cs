@@ -135,6 +135,7 @@ public static void MapConsentEndpoints(this WebApplication app)
         AcceptGrantRequest request,
         AppDbContext context,
         IAliasService aliasService,
+        IClientReadCache cache,
         HttpContext httpContext)
     {
         try
@@ -208,6 +209,7 @@ public static void MapConsentEndpoints(this WebApplication app)
 
             context.ConsentGrants.AddRange(consentGrants);
             await context.SaveChangesAsync();
+            cache.InvalidateClient(clientProfile.Id);
 
             var trainerName = grantCode.TrainerProfile.User.Email; // Use email as display name for now
 
@@ -226,7 +228,9 @@ public static void MapConsentEndpoints(this WebApplication app)
 
     private static async Task<IResult> SeedGrant(
         AppDbContext context,
-        IAliasService aliasService)
+        IAliasService aliasService,
+        IPasswordHasher passwordHasher,
+        IClientReadCache cache)
     {
         try
         {
@@ -244,7 +248,7 @@ public static void MapConsentEndpoints(this WebApplication app)
                 {
                     Email = "demo-trainer@adaplio.local",
                     UserType = "trainer",
-                    PasswordHash = BCrypt.Net.BCrypt.HashPassword("DemoPass123"),
+                    PasswordHash = await passwordHasher.HashAsync("DemoPass123"),
                     IsVerified = true
                 };
 
@@ -297,6 +301,7 @@ public static void MapConsentEndpoints(this WebApplication app)
                 // Generate alias using the actual profile ID
                 clientProfile.Alias = aliasService.GenerateClientAlias(clientProfile.Id, trainerProfile.Id);
                 await context.SaveChangesAsync();
+                cache.InvalidateClient(clientProfile.Id);
             }
             else
             {
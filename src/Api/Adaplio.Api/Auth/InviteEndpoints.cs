@@ -34,13 +34,20 @@ public static void MapInviteEndpoints(this WebApplication app)
         SMSInviteRequest request,
         AppDbContext context,
         ISMSService smsService,
+        IOutboxService outbox,
         IAliasService aliasService)
     {
         try
         {
+            if (smsService.Provider == null)
+            {
+                return Results.Problem("Failed to send SMS. Please try again.");
+            }
+
             // Generate or validate invite token
             string inviteToken;
             string? trainerName = null;
+            var expiresAt = DateTimeOffset.UtcNow.AddHours(24);
 
             if (!string.IsNullOrEmpty(request.InviteCode))
             {
@@ -68,12 +75,11 @@ public static void MapInviteEndpoints(this WebApplication app)
                     Token = inviteToken,
                     GrantCodeId = grantCode.Id,
                     PhoneNumber = request.PhoneNumber,
-                    ExpiresAt = DateTimeOffset.UtcNow.AddHours(24),
+                    ExpiresAt = expiresAt,
                     CreatedAt = DateTimeOffset.UtcNow
                 };
 
                 context.InviteTokens.Add(inviteTokenRecord);
-                await context.SaveChangesAsync();
             }
             else
             {
@@ -84,25 +90,18 @@ public static void MapInviteEndpoints(this WebApplication app)
                 {
                     Token = inviteToken,
                     PhoneNumber = request.PhoneNumber,
-                    ExpiresAt = DateTimeOffset.UtcNow.AddHours(24),
+                    ExpiresAt = expiresAt,
                     CreatedAt = DateTimeOffset.UtcNow
                 };
 
                 context.InviteTokens.Add(inviteTokenRecord);
-                await context.SaveChangesAsync();
             }
 
-            // Send SMS
-            var success = await smsService.SendInviteLinkAsync(request.PhoneNumber, inviteToken, trainerName);
+            // Queue the SMS in the same save as the token; OutboxDispatcher sends it while the token is still valid
+            outbox.EnqueueSms(request.PhoneNumber, smsService.BuildInviteMessage(inviteToken, trainerName), expiresAt);
+            await context.SaveChangesAsync();
 
-            if (success)
-            {
-                return Results.Ok(new { message = "Invite link sent successfully!" });
-            }
-            else
-            {
-                return Results.Problem("Failed to send SMS. Please try again.");
-            }
+            return Results.Ok(new { message = "Invite link sent successfully!" });
         }
         catch (Exception ex)
         {
@@ -113,7 +112,7 @@ public static void MapInviteEndpoints(this WebApplication app)
     private static async Task<IResult> SendEmailInvite(
         EmailInviteRequest request,
         AppDbContext context,
-        IEmailService emailService,
+        IOutboxService outbox,
         IAliasService aliasService,
         HttpContext httpContext)
     {
@@ -162,15 +161,15 @@ public static void MapInviteEndpoints(this WebApplication app)
             };
 
             context.InviteTokens.Add(inviteTokenRecord);
-            await context.SaveChangesAsync();
 
             // Build invite URL
             var baseUrl = $"{httpContext.Request.Scheme}://{httpContext.Request.Host}";
             var inviteUrl = $"{baseUrl}/?invite={inviteToken}";
 
-            // Send email
+            // Queue the email in the same save as the token; OutboxDispatcher sends it while the token is still valid
             var trainerName = trainerProfile.FullName ?? "Your Physical Therapist";
-            await emailService.SendInviteEmailAsync(request.Email, inviteUrl, trainerName);
+            outbox.EnqueueEmail(EmailService.InviteEmail(request.Email, inviteUrl, trainerName), inviteTokenRecord.ExpiresAt);
+            await context.SaveChangesAsync();
 
             return Results.Ok(new { message = "Invite email sent successfully!" });
         }
@@ -33,6 +33,8 @@ public AppDbContext(DbContextOptions<AppDbContext> options) : base(options)
     public DbSet<Domain.Gamification> Gamifications { get; set; }
     public DbSet<XpAward> XpAwards { get; set; }
     public DbSet<PasswordResetToken> PasswordResetTokens { get; set; }
+    public DbSet<AnalyticsEvent> AnalyticsEvents { get; set; }
+    public DbSet<OutboxMessage> OutboxMessages { get; set; }
 
     protected override void OnModelCreating(ModelBuilder modelBuilder)
     {
@@ -135,6 +137,14 @@ protected override void OnModelCreating(ModelBuilder modelBuilder)
                 .Property(prt => prt.Id)
                 .UseIdentityColumn();
 
+            modelBuilder.Entity<AnalyticsEvent>()
+                .Property(ae => ae.Id)
+                .UseIdentityColumn();
+
+            modelBuilder.Entity<OutboxMessage>()
+                .Property(om => om.Id)
+                .UseIdentityColumn();
+
             // Boolean to integer conversions for all boolean columns
             modelBuilder.Entity<AppUser>()
                 .Property(u => u.IsVerified)
@@ -341,6 +351,31 @@ protected override void OnModelCreating(ModelBuilder modelBuilder)
                 .Property(prt => prt.CreatedAt)
                 .HasColumnType("timestamp with time zone");
 
+            // AnalyticsEvent
+            modelBuilder.Entity<AnalyticsEvent>()
+                .Property(ae => ae.OccurredAt)
+                .HasColumnType("timestamp with time zone");
+            modelBuilder.Entity<AnalyticsEvent>()
+                .Property(ae => ae.ReceivedAt)
+                .HasColumnType("timestamp with time zone");
+
+            // OutboxMessage
+            modelBuilder.Entity<OutboxMessage>()
+                .Property(om => om.NextAttemptAt)
+                .HasColumnType("timestamp with time zone");
+            modelBuilder.Entity<OutboxMessage>()
+                .Property(om => om.LockedUntil)
+                .HasColumnType("timestamp with time zone");
+            modelBuilder.Entity<OutboxMessage>()
+                .Property(om => om.CreatedAt)
+                .HasColumnType("timestamp with time zone");
+            modelBuilder.Entity<OutboxMessage>()
+                .Property(om => om.SentAt)
+                .HasColumnType("timestamp with time zone");
+            modelBuilder.Entity<OutboxMessage>()
+                .Property(om => om.NotAfter)
+                .HasColumnType("timestamp with time zone");
+
             // PlanItemAcceptance
             modelBuilder.Entity<PlanItemAcceptance>()
                 .Property(pia => pia.AcceptedAt)
@@ -449,6 +484,21 @@ protected override void OnModelCreating(ModelBuilder modelBuilder)
         modelBuilder.Entity<PasswordResetToken>()
             .HasIndex(prt => new { prt.Email, prt.CreatedAt });
 
+        modelBuilder.Entity<Exercise>()
+            .HasIndex(e => e.NormalizedName)
+            .IsUnique();
+
+        modelBuilder.Entity<AnalyticsEvent>()
+            .HasIndex(ae => new { ae.Event, ae.OccurredAt });
+
+        // The dispatcher only ever looks for pending and in-flight messages
+        modelBuilder.Entity<OutboxMessage>()
+            .HasIndex(om => new { om.Status, om.NextAttemptAt });
+
+        // Retention cleanup deletes finished messages oldest first
+        modelBuilder.Entity<OutboxMessage>()
+            .HasIndex(om => new { om.Status, om.CreatedAt });
+
         // Configure decimal precision for PostgreSQL compatibility
         modelBuilder.Entity<Transcript>()
             .Property(t => t.ConfidenceScore)
@@ -572,6 +622,11 @@ private void UpdateTimestamps()
 
         foreach (var entry in entries)
         {
+            if (entry.Entity is Exercise exercise)
+            {
+                exercise.NormalizedName = Exercise.NormalizeName(exercise.Name);
+            }
+
             try
             {
                 // Check if the entity has an UpdatedAt property
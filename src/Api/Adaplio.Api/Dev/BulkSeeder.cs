@@ -0,0 +1,451 @@
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+using Adaplio.Api.Plans;
+using Microsoft.EntityFrameworkCore;
+using System.Diagnostics;
+using System.Globalization;
+using System.Text.Json;
+
+namespace Adaplio.Api.Dev;
+
+/// <summary>
+/// Builds production-sized trainer/client populations in one unit of work.
+/// The same (Seed, Batch) pair always produces the same emails, aliases, plans and
+/// completion pattern; dates are laid out so the last seeded week is the current week.
+/// </summary>
+public static class BulkSeeder
+{
+    public const string DefaultPassword = "BulkSeed123!";
+
+    private static readonly (string Name, string Category, int Sets, int Reps, int? HoldSeconds)[] ExerciseLibrary =
+    {
+        ("Quad Sets", "strength", 3, 15, 5),
+        ("Heel Slides", "mobility", 2, 10, null),
+        ("Straight Leg Raises", "strength", 3, 10, null),
+        ("Clamshells", "strength", 3, 12, null),
+        ("Glute Bridges", "strength", 3, 12, 3),
+        ("Hamstring Stretch", "mobility", 2, 3, 30),
+        ("Calf Raises", "strength", 3, 15, null),
+        ("Wall Sits", "strength", 3, 1, 30),
+        ("Single Leg Balance", "balance", 3, 1, 30),
+        ("Shoulder Rolls", "mobility", 2, 15, null),
+        ("Wall Push-ups", "strength", 3, 10, null),
+        ("Neck Stretches", "mobility", 1, 5, 10)
+    };
+
+    private static readonly string[][] DaySchedules =
+    {
+        new[] { "Monday", "Wednesday", "Friday" },
+        new[] { "Tuesday", "Thursday" },
+        new[] { "Monday", "Tuesday", "Wednesday", "Thursday", "Friday" },
+        new[] { "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday" }
+    };
+
+    public static string TrainerEmail(int seed, int batch, int trainer) =>
+        $"bulk-s{seed}-b{batch}-t{trainer}@bulk.adaplio.local";
+
+    public static string ClientEmail(int seed, int batch, int trainer, int client) =>
+        $"bulk-s{seed}-b{batch}-t{trainer}-c{client}@bulk.adaplio.local";
+
+    public static string ClientAlias(int seed, int batch, int trainer, int client) =>
+        $"C-S{seed}B{batch}T{trainer}C{client}";
+
+    /// <summary>
+    /// Seeds one batch. Returns null when the batch already exists.
+    /// </summary>
+    public static async Task<BulkSeedResponse?> SeedAsync(AppDbContext context, BulkSeedRequest request)
+    {
+        var firstTrainerEmail = TrainerEmail(request.Seed, request.Batch, 0);
+        if (await context.AppUsers.AnyAsync(u => u.Email == firstTrainerEmail))
+        {
+            return null;
+        }
+
+        var stopwatch = Stopwatch.StartNew();
+        var random = new Random(unchecked(request.Seed * 1_000_003 + request.Batch));
+        var now = DateTimeOffset.UtcNow;
+        var today = DateOnly.FromDateTime(DateTime.UtcNow);
+        var planStart = GetWeekStart(today).AddDays(-7 * (request.Weeks - 1));
+
+        // One hash per batch - hashing per user would dominate the seeding time
+        var passwordHash = BCrypt.Net.BCrypt.HashPassword(request.Password ?? DefaultPassword);
+        var exercises = await EnsureExerciseLibraryAsync(context);
+
+        var clients = 0;
+        var planInstances = 0;
+        var exerciseInstances = 0;
+        var progressEvents = 0;
+
+        var autoDetectChanges = context.ChangeTracker.AutoDetectChangesEnabled;
+        context.ChangeTracker.AutoDetectChangesEnabled = false;
+
+        try
+        {
+            for (int t = 0; t < request.Trainers; t++)
+            {
+                var trainerUser = new AppUser
+                {
+                    Email = TrainerEmail(request.Seed, request.Batch, t),
+                    PasswordHash = passwordHash,
+                    UserType = "trainer",
+                    IsVerified = true,
+                    CreatedAt = now,
+                    UpdatedAt = now
+                };
+                var trainerProfile = new TrainerProfile
+                {
+                    User = trainerUser,
+                    FullName = $"Bulk Trainer {request.Seed}-{request.Batch}-{t}",
+                    PracticeName = $"Bulk Clinic {request.Seed}",
+                    CreatedAt = now,
+                    UpdatedAt = now
+                };
+                context.AppUsers.Add(trainerUser);
+                context.TrainerProfiles.Add(trainerProfile);
+
+                var items = PickTemplateItems(random, exercises);
+                var template = new PlanTemplate
+                {
+                    TrainerProfile = trainerProfile,
+                    Name = $"Bulk Plan {t}",
+                    Description = "Seeded by the bulk fixture seeder",
+                    Category = "recovery",
+                    DurationWeeks = request.Weeks,
+                    IsPublic = false,
+                    CreatedAt = now,
+                    UpdatedAt = now
+                };
+                context.PlanTemplates.Add(template);
+
+                for (int i = 0; i < items.Count; i++)
+                {
+                    var item = items[i];
+                    context.PlanTemplateItems.Add(new PlanTemplateItem
+                    {
+                        PlanTemplate = template,
+                        ExerciseId = item.Exercise.Id,
+                        OrderIndex = i,
+                        Sets = item.Sets,
+                        Reps = item.Reps,
+                        HoldSeconds = item.HoldSeconds,
+                        FrequencyPerWeek = item.Days.Length,
+                        DaysOfWeek = JsonSerializer.Serialize(item.Days),
+                        CreatedAt = now
+                    });
+                }
+
+                var snapshot = ProposalSnapshot.Serialize(template.DurationWeeks, items.Select((item, i) => new ProposalSnapshotItem(
+                    item.Exercise.Id,
+                    item.Exercise.Name,
+                    item.Exercise.Description,
+                    i,
+                    item.Sets,
+                    item.Reps,
+                    item.HoldSeconds,
+                    item.Days.Length,
+                    JsonSerializer.Serialize(item.Days),
+                    null
+                )));
+
+                for (int c = 0; c < request.ClientsPerTrainer; c++)
+                {
+                    var clientUser = new AppUser
+                    {
+                        Email = ClientEmail(request.Seed, request.Batch, t, c),
+                        UserType = "client",
+                        IsVerified = true,
+                        CreatedAt = now,
+                        UpdatedAt = now
+                    };
+                    var clientProfile = new ClientProfile
+                    {
+                        User = clientUser,
+                        Alias = ClientAlias(request.Seed, request.Batch, t, c),
+                        CreatedAt = now,
+                        UpdatedAt = now
+                    };
+                    context.AppUsers.Add(clientUser);
+                    context.ClientProfiles.Add(clientProfile);
+                    clients++;
+
+                    foreach (var scope in new[] { "propose_plan", "view_summary" })
+                    {
+                        context.ConsentGrants.Add(new ConsentGrant
+                        {
+                            ClientProfile = clientProfile,
+                            TrainerProfile = trainerProfile,
+                            Scope = scope,
+                            GrantedAt = now,
+                            ExpiresAt = now.AddDays(365),
+                            CreatedAt = now
+                        });
+                    }
+
+                    var proposal = new PlanProposal
+                    {
+                        TrainerProfile = trainerProfile,
+                        ClientProfile = clientProfile,
+                        PlanTemplate = template,
+                        ProposalName = template.Name,
+                        Message = "Seeded plan",
+                        Status = "accepted",
+                        ProposedAt = now,
+                        RespondedAt = now,
+                        ExpiresAt = now.AddDays(30),
+                        StartsOn = planStart,
+                        CustomPlanJson = snapshot
+                    };
+                    var plan = new PlanInstance
+                    {
+                        ClientProfile = clientProfile,
+                        PlanProposal = proposal,
+                        Name = template.Name,
+                        Status = "active",
+                        StartDate = planStart,
+                        PlannedEndDate = planStart.AddDays(request.Weeks * 7),
+                        CreatedAt = now,
+                        UpdatedAt = now
+                    };
+                    context.PlanProposals.Add(proposal);
+                    context.PlanInstances.Add(plan);
+                    planInstances++;
+
+                    var activityDates = new SortedSet<DateOnly>();
+                    var adherenceKeys = new HashSet<(int Year, int Week)>();
+                    var totalXp = 0;
+
+                    for (int week = 1; week <= request.Weeks; week++)
+                    {
+                        var weekStart = planStart.AddDays(7 * (week - 1));
+                        var planned = 0;
+                        var completed = 0;
+
+                        for (int i = 0; i < items.Count; i++)
+                        {
+                            var item = items[i];
+                            foreach (var day in item.Days)
+                            {
+                                var dayOfWeek = GetDayOfWeekNumber(day);
+                                var date = weekStart.AddDays((dayOfWeek + 6) % 7);
+                                var done = date <= today && random.NextDouble() < request.CompletionRate;
+
+                                var exerciseInstance = new ExerciseInstance
+                                {
+                                    PlanInstance = plan,
+                                    ExerciseId = item.Exercise.Id,
+                                    WeekNumber = week,
+                                    OrderIndex = i,
+                                    TargetSets = item.Sets,
+                                    TargetReps = item.Reps,
+                                    TargetHoldSeconds = item.HoldSeconds,
+                                    FrequencyPerWeek = item.Days.Length,
+                                    DayOfWeek = dayOfWeek,
+                                    Status = done ? "done" : "planned",
+                                    CreatedAt = now,
+                                    UpdatedAt = now
+                                };
+                                context.ExerciseInstances.Add(exerciseInstance);
+                                context.PlanItemAcceptances.Add(new PlanItemAcceptance
+                                {
+                                    PlanInstance = plan,
+                                    ExerciseInstance = exerciseInstance,
+                                    Accepted = true,
+                                    AcceptedAt = now
+                                });
+                                exerciseInstances++;
+                                planned++;
+
+                                if (!done)
+                                    continue;
+
+                                var loggedAt = new DateTimeOffset(
+                                    date.ToDateTime(new TimeOnly(random.Next(6, 21), random.Next(0, 60))),
+                                    TimeSpan.Zero);
+                                var progressEvent = new ProgressEvent
+                                {
+                                    ClientProfile = clientProfile,
+                                    ExerciseInstance = exerciseInstance,
+                                    EventType = "exercise_completed",
+                                    SetsCompleted = item.Sets,
+                                    RepsCompleted = item.Reps,
+                                    HoldSecondsCompleted = item.HoldSeconds,
+                                    DifficultyRating = random.Next(2, 9),
+                                    PainLevel = random.Next(1, 6),
+                                    LoggedAt = loggedAt
+                                };
+                                context.ProgressEvents.Add(progressEvent);
+                                context.XpAwards.Add(new XpAward
+                                {
+                                    ProgressEvent = progressEvent,
+                                    ClientProfile = clientProfile,
+                                    XpAwarded = 25,
+                                    CreatedAt = loggedAt
+                                });
+
+                                progressEvents++;
+                                completed++;
+                                totalXp += 25;
+                                activityDates.Add(date);
+                            }
+                        }
+
+                        var weekKey = (weekStart.Year, GetWeekNumber(weekStart));
+                        if (adherenceKeys.Add(weekKey))
+                        {
+                            context.AdherenceWeeks.Add(new AdherenceWeek
+                            {
+                                ClientProfile = clientProfile,
+                                PlanInstance = plan,
+                                Year = weekKey.Year,
+                                WeekNumber = weekKey.Item2,
+                                WeekStartDate = weekStart,
+                                TotalExercisesPlanned = planned,
+                                TotalExercisesCompleted = completed,
+                                AdherencePercentage = planned > 0 ? Math.Round((decimal)completed / planned * 100, 1) : 0,
+                                CalculatedAt = now,
+                                UpdatedAt = now
+                            });
+                        }
+                    }
+
+                    context.Gamifications.Add(BuildGamification(clientProfile, totalXp, activityDates, now));
+                }
+            }
+
+            await context.SaveChangesAsync();
+        }
+        finally
+        {
+            context.ChangeTracker.AutoDetectChangesEnabled = autoDetectChanges;
+            context.ChangeTracker.Clear();
+        }
+
+        stopwatch.Stop();
+
+        return new BulkSeedResponse(
+            "Bulk population seeded successfully",
+            request.Seed,
+            request.Batch,
+            request.Trainers,
+            clients,
+            planInstances,
+            exerciseInstances,
+            progressEvents,
+            stopwatch.ElapsedMilliseconds,
+            firstTrainerEmail,
+            clients > 0 ? ClientEmail(request.Seed, request.Batch, 0, 0) : null,
+            clients > 0 ? ClientAlias(request.Seed, request.Batch, 0, 0) : null
+        );
+    }
+
+    private static async Task<List<Exercise>> EnsureExerciseLibraryAsync(AppDbContext context)
+    {
+        var names = ExerciseLibrary.Select(e => e.Name).ToArray();
+        var normalizedNames = names.Select(Exercise.NormalizeName).ToArray();
+        var existing = await context.Exercises
+            .Where(e => normalizedNames.Contains(e.NormalizedName))
+            .ToListAsync();
+
+        var existingNames = existing.Select(e => e.NormalizedName).ToHashSet();
+        var missing = ExerciseLibrary
+            .Where(e => !existingNames.Contains(Exercise.NormalizeName(e.Name)))
+            .Select(e => new Exercise
+            {
+                Name = e.Name,
+                Category = e.Category,
+                DefaultSets = e.Sets,
+                DefaultReps = e.Reps,
+                DefaultHoldSeconds = e.HoldSeconds,
+                CreatedAt = DateTimeOffset.UtcNow,
+                UpdatedAt = DateTimeOffset.UtcNow
+            })
+            .ToList();
+
+        if (missing.Count > 0)
+        {
+            context.Exercises.AddRange(missing);
+            await context.SaveChangesAsync();
+            existing.AddRange(missing);
+        }
+
+        // Stable order so the same seed always picks the same exercises
+        return existing.OrderBy(e => Array.IndexOf(normalizedNames, e.NormalizedName)).ToList();
+    }
+
+    private static List<(Exercise Exercise, int Sets, int Reps, int? HoldSeconds, string[] Days)> PickTemplateItems(
+        Random random, List<Exercise> exercises)
+    {
+        var count = random.Next(2, 6);
+        return exercises
+            .OrderBy(_ => random.Next())
+            .Take(count)
+            .Select(e => (
+                e,
+                e.DefaultSets ?? 3,
+                e.DefaultReps ?? 10,
+                e.DefaultHoldSeconds,
+                DaySchedules[random.Next(DaySchedules.Length)]))
+            .ToList();
+    }
+
+    private static Domain.Gamification BuildGamification(
+        ClientProfile clientProfile, int totalXp, SortedSet<DateOnly> activityDates, DateTimeOffset now)
+    {
+        var currentStreak = 0;
+        var longestStreak = 0;
+        DateOnly? previous = null;
+        var activity = new ActivityBitmap(null, 0);
+
+        foreach (var date in activityDates)
+        {
+            activity = activity.Record(date);
+            currentStreak = previous.HasValue && date.DayNumber - previous.Value.DayNumber == 1
+                ? currentStreak + 1
+                : 1;
+            longestStreak = Math.Max(longestStreak, currentStreak);
+            previous = date;
+        }
+
+        return new Domain.Gamification
+        {
+            ClientProfile = clientProfile,
+            TotalXp = totalXp,
+            CurrentStreak = currentStreak,
+            LongestStreak = longestStreak,
+            LastActivityDate = previous,
+            ActivityBits = unchecked((long)activity.Bits),
+            CreatedAt = now,
+            UpdatedAt = now
+        };
+    }
+
+    private static DateOnly GetWeekStart(DateOnly date)
+    {
+        var daysToSubtract = (int)date.DayOfWeek - (int)DayOfWeek.Monday;
+        if (daysToSubtract < 0)
+            daysToSubtract += 7;
+        return date.AddDays(-daysToSubtract);
+    }
+
+    private static int GetWeekNumber(DateOnly weekStart)
+    {
+        // Matches ProgressService.UpdateAdherenceWeekAsync
+        return CultureInfo.CurrentCulture.Calendar.GetWeekOfYear(weekStart.ToDateTime(TimeOnly.MinValue),
+            CalendarWeekRule.FirstFourDayWeek, DayOfWeek.Monday);
+    }
+
+    private static int GetDayOfWeekNumber(string dayName)
+    {
+        return dayName.ToLower() switch
+        {
+            "sunday" => 0,
+            "monday" => 1,
+            "tuesday" => 2,
+            "wednesday" => 3,
+            "thursday" => 4,
+            "friday" => 5,
+            "saturday" => 6,
+            _ => 1
+        };
+    }
+}
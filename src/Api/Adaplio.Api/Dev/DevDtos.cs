@@ -0,0 +1,79 @@
+using System.ComponentModel.DataAnnotations;
+using Adaplio.Api.Services;
+
+namespace Adaplio.Api.Dev;
+
+// Bulk seeding DTOs
+public record BulkSeedRequest(
+    [Required] int Seed,
+    int Batch = 0,
+    [Range(1, 500)] int Trainers = 10,
+    [Range(0, 200)] int ClientsPerTrainer = 10,
+    [Range(1, 52)] int Weeks = 4,
+    [Range(0, 1)] double CompletionRate = 0.7,
+    string? Password = null
+);
+
+public record BulkSeedResponse(
+    string Message,
+    int Seed,
+    int Batch,
+    int Trainers,
+    int Clients,
+    int PlanInstances,
+    int ExerciseInstances,
+    int ProgressEvents,
+    long ElapsedMs,
+    string? SampleTrainerEmail,
+    string? SampleClientEmail,
+    string? SampleClientAlias
+);
+
+// Synthetic exercise library growth for search benchmarks
+public record ExerciseSeedRequest(
+    [Required] int Seed,
+    [Range(1, 200000)] int Count = 10000
+);
+
+public record ExerciseSeedResponse(
+    string Message,
+    int Seed,
+    int Created,
+    int TotalExercises,
+    long ElapsedMs
+);
+
+// Search index counters next to the library's row count
+public record ExerciseSearchDiagnosticsResponse(
+    ExerciseSearchStats Index,
+    int LibraryCount
+);
+
+// JWT validation microbenchmark (validations per second for each strategy)
+public record JwtValidationBenchmarkResponse(
+    int Iterations,
+    double PerCallParametersPerSec,
+    double PrecomputedParametersPerSec,
+    double CachedPerSec
+);
+
+// Analytics pipeline counters; StoredCount is set when an event name was given
+public record AnalyticsDiagnosticsResponse(
+    AnalyticsIngestStats Pipeline,
+    string? Event,
+    int? StoredCount
+);
+
+
+// Outbox rows grouped by channel, provider and status, with the delivery attempts they took
+public record OutboxStatusCount(
+    string Channel,
+    string Provider,
+    string Status,
+    int Count,
+    int Attempts
+);
+
+public record OutboxDiagnosticsResponse(
+    OutboxStatusCount[] Counts
+);
\ No newline at end of file
@@ -1,7 +1,10 @@
+using Adaplio.Api.Auth;
 using Adaplio.Api.Data;
 using Adaplio.Api.Domain;
 using Adaplio.Api.Services;
 using Microsoft.EntityFrameworkCore;
+using System.Diagnostics;
+using System.IdentityModel.Tokens.Jwt;
 using System.Text.Json;
 
 namespace Adaplio.Api.Dev;
@@ -15,11 +18,53 @@ public static void MapDevEndpoints(this WebApplication app)
         // Seed template and proposal endpoint
         devGroup.MapPost("/templates/seed", SeedTemplatesAndProposal)
             .WithName("SeedTemplatesAndProposal");
+
+        // Bulk population seeding for load tests and benchmarks
+        devGroup.MapPost("/seed/bulk", SeedBulkPopulation)
+            .WithName("SeedBulkPopulation");
+
+        devGroup.MapPost("/seed/exercises", SeedExerciseLibrary)
+            .WithName("SeedExerciseLibrary");
+
+        // Client read cache diagnostics
+        devGroup.MapGet("/diagnostics/cache", GetClientCacheStats)
+            .WithName("GetClientCacheStats");
+
+        devGroup.MapPost("/diagnostics/cache/reset", ResetClientCacheStats)
+            .WithName("ResetClientCacheStats");
+
+        // Security audit queue diagnostics
+        devGroup.MapGet("/diagnostics/audit", GetSecurityAuditStats)
+            .WithName("GetSecurityAuditStats");
+
+        // Password hashing pool diagnostics
+        devGroup.MapGet("/diagnostics/password-hashing", GetPasswordHasherStats)
+            .WithName("GetPasswordHasherStats");
+
+        // JWT validation cache diagnostics
+        devGroup.MapGet("/diagnostics/jwt", GetJwtValidationCacheStats)
+            .WithName("GetJwtValidationCacheStats");
+
+        devGroup.MapPost("/diagnostics/jwt/benchmark", RunJwtValidationBenchmark)
+            .WithName("RunJwtValidationBenchmark");
+
+        // Exercise search index diagnostics
+        devGroup.MapGet("/diagnostics/exercises", GetExerciseSearchStats)
+            .WithName("GetExerciseSearchStats");
+
+        // Analytics ingestion pipeline diagnostics
+        devGroup.MapGet("/diagnostics/analytics", GetAnalyticsIngestStats)
+            .WithName("GetAnalyticsIngestStats");
+
+        // Email/SMS outbox diagnostics
+        devGroup.MapGet("/diagnostics/outbox", GetOutboxStats)
+            .WithName("GetOutboxStats");
     }
 
     private static async Task<IResult> SeedTemplatesAndProposal(
         AppDbContext context,
-        IPlanService planService)
+        IPlanService planService,
+        IPasswordHasher passwordHasher)
     {
         try
         {
@@ -36,7 +81,7 @@ public static void MapDevEndpoints(this WebApplication app)
             var trainerUser = new AppUser
             {
                 Email = "demo-trainer@adaplio.local",
-                PasswordHash = BCrypt.Net.BCrypt.HashPassword("DemoPass123"),
+                PasswordHash = await passwordHasher.HashAsync("DemoPass123"),
                 UserType = "trainer",
                 CreatedAt = DateTimeOffset.UtcNow
             };
@@ -140,7 +185,14 @@ public static void MapDevEndpoints(this WebApplication app)
                 }
             };
 
-            context.Exercises.AddRange(exercises);
+            // Exercise names are unique; skip any a trainer has already created
+            var normalizedNames = exercises.Select(e => Exercise.NormalizeName(e.Name)).ToArray();
+            var existingNames = await context.Exercises
+                .Where(e => normalizedNames.Contains(e.NormalizedName))
+                .Select(e => e.NormalizedName)
+                .ToListAsync();
+
+            context.Exercises.AddRange(exercises.Where(e => !existingNames.Contains(Exercise.NormalizeName(e.Name))));
             await context.SaveChangesAsync();
 
             // Create demo template using the service
@@ -197,4 +249,153 @@ public static void MapDevEndpoints(this WebApplication app)
             return Results.Problem($"Failed to seed demo data: {ex.Message}");
         }
     }
+
+    private static async Task<IResult> SeedBulkPopulation(
+        BulkSeedRequest request,
+        AppDbContext context)
+    {
+        if (request.Trainers is < 1 or > 500 || request.ClientsPerTrainer is < 0 or > 200 ||
+            request.Weeks is < 1 or > 52 || request.CompletionRate is < 0 or > 1)
+        {
+            return Results.BadRequest("Trainers must be 1-500, ClientsPerTrainer 0-200, Weeks 1-52 and CompletionRate 0-1.");
+        }
+
+        try
+        {
+            var result = await BulkSeeder.SeedAsync(context, request);
+            if (result == null)
+            {
+                return Results.Conflict($"Batch {request.Batch} for seed {request.Seed} already exists.");
+            }
+
+            return Results.Ok(result);
+        }
+        catch (Exception ex)
+        {
+            return Results.Problem($"Failed to seed bulk data: {ex.Message}");
+        }
+    }
+
+    private static async Task<IResult> SeedExerciseLibrary(
+        ExerciseSeedRequest request,
+        AppDbContext context,
+        ExerciseSearchIndex searchIndex)
+    {
+        if (request.Count is < 1 or > 200000)
+        {
+            return Results.BadRequest("Count must be 1-200000.");
+        }
+
+        try
+        {
+            var result = await ExerciseLibrarySeeder.SeedAsync(context, request);
+            if (result == null)
+            {
+                return Results.Conflict($"Exercises for seed {request.Seed} already exist.");
+            }
+
+            searchIndex.Invalidate();
+            return Results.Ok(result);
+        }
+        catch (Exception ex)
+        {
+            return Results.Problem($"Failed to seed exercises: {ex.Message}");
+        }
+    }
+
+    private static IResult GetClientCacheStats(IClientReadCache cache)
+    {
+        return Results.Ok(cache.GetStats());
+    }
+
+    private static IResult ResetClientCacheStats(IClientReadCache cache)
+    {
+        cache.ResetStats();
+        return Results.Ok(cache.GetStats());
+    }
+
+    private static IResult GetSecurityAuditStats(SecurityAuditQueue auditQueue)
+    {
+        return Results.Ok(auditQueue.GetStats());
+    }
+
+    private static IResult GetPasswordHasherStats(IPasswordHasher passwordHasher)
+    {
+        return Results.Ok(passwordHasher.GetStats());
+    }
+
+    private static IResult GetJwtValidationCacheStats(JwtValidationCache validationCache)
+    {
+        return Results.Ok(validationCache.GetStats());
+    }
+
+    /// <summary>Index counters next to the library's row count, which the index catches up to on its next check</summary>
+    private static async Task<IResult> GetExerciseSearchStats(
+        ExerciseSearchIndex searchIndex,
+        AppDbContext context)
+    {
+        return Results.Ok(new ExerciseSearchDiagnosticsResponse(searchIndex.GetStats(), await context.Exercises.CountAsync()));
+    }
+
+    /// <summary>Pipeline counters, plus how many rows are stored for one event name when asked</summary>
+    private static async Task<IResult> GetAnalyticsIngestStats(
+        AnalyticsIngestQueue ingestQueue,
+        AppDbContext context,
+        string? eventName)
+    {
+        int? stored = eventName == null
+            ? null
+            : await context.AnalyticsEvents.CountAsync(ae => ae.Event == eventName);
+
+        return Results.Ok(new AnalyticsDiagnosticsResponse(ingestQueue.GetStats(), eventName, stored));
+    }
+
+    /// <summary>Outbox messages and the delivery attempts they took, per channel, provider and status</summary>
+    private static async Task<IResult> GetOutboxStats(AppDbContext context)
+    {
+        var counts = await context.OutboxMessages
+            .GroupBy(om => new { om.Channel, om.Provider, om.Status })
+            .Select(g => new OutboxStatusCount(g.Key.Channel, g.Key.Provider, g.Key.Status, g.Count(), g.Sum(om => om.Attempts)))
+            .ToArrayAsync();
+
+        return Results.Ok(new OutboxDiagnosticsResponse(counts));
+    }
+
+    /// <summary>
+    /// Validates one token repeatedly in-process: building TokenValidationParameters and the signing key
+    /// per call (the old JwtService), with parameters built once, and through the validation cache.
+    /// Uses private JwtService instances so the shared cache stats are untouched.
+    /// </summary>
+    private static IResult RunJwtValidationBenchmark(IConfiguration configuration, int? iterations)
+    {
+        var count = Math.Clamp(iterations ?? 20000, 1, 1_000_000);
+        var uncachedConfiguration = new ConfigurationBuilder()
+            .AddConfiguration(configuration)
+            .AddInMemoryCollection(new Dictionary<string, string?> { ["Jwt:ValidationCacheSize"] = "0" })
+            .Build();
+
+        var precomputed = new JwtService(uncachedConfiguration, new JwtValidationCache(uncachedConfiguration));
+        var cached = new JwtService(configuration, new JwtValidationCache(configuration));
+        var token = precomputed.GenerateToken(new JwtClaims("0", "benchmark@adaplio.local", "client"));
+
+        double Measure(Action validate)
+        {
+            validate(); // Warm up
+            var stopwatch = Stopwatch.StartNew();
+            for (var i = 0; i < count; i++)
+            {
+                validate();
+            }
+            return Math.Round(count / stopwatch.Elapsed.TotalSeconds, 1);
+        }
+
+        var perCall = Measure(() => new JwtSecurityTokenHandler()
+            .ValidateToken(token, JwtService.CreateValidationParameters(configuration), out _));
+
+        return Results.Ok(new JwtValidationBenchmarkResponse(
+            count,
+            perCall,
+            Measure(() => precomputed.ValidateToken(token)),
+            Measure(() => cached.ValidateToken(token))));
+    }
 }
\ No newline at end of file
@@ -0,0 +1,95 @@
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+using Microsoft.EntityFrameworkCore;
+using System.Diagnostics;
+
+namespace Adaplio.Api.Dev;
+
+/// <summary>
+/// Grows the exercise library with synthetic but realistic names ("Banded Single Leg Glute Bridge S7-00042")
+/// so search can be measured at library sizes the curated seed never reaches. The same seed always
+/// produces the same names, so a seed can only be applied once.
+/// </summary>
+public static class ExerciseLibrarySeeder
+{
+    private const int SaveBatchSize = 5000;
+
+    private static readonly string[] Modifiers =
+    {
+        "Banded", "Weighted", "Assisted", "Isometric", "Eccentric", "Seated", "Standing", "Supine",
+        "Prone", "Side-Lying", "Kneeling", "Tempo", "Paused", "Alternating", "Reverse", "Partial"
+    };
+
+    private static readonly string[] Sides = { "", "Single Leg", "Single Arm", "Bilateral" };
+
+    private static readonly (string Movement, string Category)[] Movements =
+    {
+        ("Glute Bridge", "strength"), ("Hamstring Curl", "strength"), ("Calf Raise", "strength"),
+        ("Squat", "strength"), ("Lunge", "strength"), ("Step Up", "strength"), ("Clamshell", "strength"),
+        ("Hip Abduction", "strength"), ("Shoulder External Rotation", "strength"), ("Row", "strength"),
+        ("Quad Stretch", "mobility"), ("Hamstring Stretch", "mobility"), ("Hip Flexor Stretch", "mobility"),
+        ("Thoracic Rotation", "mobility"), ("Ankle Circles", "mobility"), ("Heel Slide", "mobility"),
+        ("Tandem Stance", "balance"), ("Single Leg Balance", "balance"), ("Star Excursion Reach", "balance"),
+        ("Dead Bug", "core"), ("Bird Dog", "core"), ("Plank", "core"), ("Pallof Press", "core")
+    };
+
+    public static async Task<ExerciseSeedResponse?> SeedAsync(AppDbContext context, ExerciseSeedRequest request)
+    {
+        var firstName = Exercise.NormalizeName(Name(request.Seed, 0));
+        if (await context.Exercises.AnyAsync(e => e.NormalizedName == firstName))
+        {
+            return null;
+        }
+
+        var stopwatch = Stopwatch.StartNew();
+        var now = DateTimeOffset.UtcNow;
+
+        context.ChangeTracker.AutoDetectChangesEnabled = false;
+        try
+        {
+            for (var start = 0; start < request.Count; start += SaveBatchSize)
+            {
+                var end = Math.Min(start + SaveBatchSize, request.Count);
+                for (var n = start; n < end; n++)
+                {
+                    var movement = Movements[n % Movements.Length];
+                    context.Exercises.Add(new Exercise
+                    {
+                        Name = Name(request.Seed, n),
+                        Category = movement.Category,
+                        Description = $"Synthetic {movement.Category} exercise for search benchmarks",
+                        DefaultSets = 3,
+                        DefaultReps = 10,
+                        CreatedAt = now,
+                        UpdatedAt = now
+                    });
+                }
+
+                await context.SaveChangesAsync();
+                context.ChangeTracker.Clear();
+            }
+        }
+        finally
+        {
+            context.ChangeTracker.AutoDetectChangesEnabled = true;
+        }
+
+        return new ExerciseSeedResponse(
+            $"Seeded {request.Count} exercises",
+            request.Seed,
+            request.Count,
+            await context.Exercises.CountAsync(),
+            stopwatch.ElapsedMilliseconds
+        );
+    }
+
+    private static string Name(int seed, int n)
+    {
+        // Walk the combinations so neighbouring numbers differ in every part
+        var movement = Movements[n % Movements.Length].Movement;
+        var modifier = Modifiers[n / Movements.Length % Modifiers.Length];
+        var side = Sides[n / (Movements.Length * Modifiers.Length) % Sides.Length];
+        var prefix = side.Length > 0 ? $"{modifier} {side}" : modifier;
+        return $"{prefix} {movement} S{seed}-{n:D5}";
+    }
+}
\ No newline at end of file
@@ -0,0 +1,84 @@
+using System.Numerics;
+
+namespace Adaplio.Api.Domain;
+
+/// <summary>
+/// Sliding window of the last 64 active days, anchored at the most recent activity date.
+/// Bit 0 is the anchor day, bit n is n days before it.
+/// </summary>
+public readonly record struct ActivityBitmap(DateOnly? Anchor, ulong Bits)
+{
+    public const int WindowDays = 64;
+
+    /// <summary>
+    /// Rebuilds a window from a streak alone (rows written before the bitmap existed):
+    /// the streak's days are known active, everything before them is treated as inactive.
+    /// </summary>
+    public static ActivityBitmap FromStreak(DateOnly? lastActivityDate, int currentStreak)
+    {
+        if (lastActivityDate == null || currentStreak <= 0)
+        {
+            return new ActivityBitmap(lastActivityDate, 0);
+        }
+
+        var bits = currentStreak >= WindowDays ? ulong.MaxValue : (1UL << currentStreak) - 1;
+        return new ActivityBitmap(lastActivityDate, bits);
+    }
+
+    public bool IsActive(DateOnly day)
+    {
+        if (Anchor == null)
+        {
+            return false;
+        }
+
+        var offset = Anchor.Value.DayNumber - day.DayNumber;
+        return offset is >= 0 and < WindowDays && (Bits & (1UL << offset)) != 0;
+    }
+
+    /// <summary>
+    /// Marks a day active. Later days move the anchor forward; earlier days inside the window
+    /// fill their bit; days older than the window are dropped.
+    /// </summary>
+    public ActivityBitmap Record(DateOnly day)
+    {
+        if (Anchor == null)
+        {
+            return new ActivityBitmap(day, 1);
+        }
+
+        var offset = Anchor.Value.DayNumber - day.DayNumber;
+        if (offset < 0)
+        {
+            var shift = -offset;
+            var shifted = shift >= WindowDays ? 0 : Bits << shift;
+            return new ActivityBitmap(day, shifted | 1);
+        }
+
+        return offset < WindowDays
+            ? this with { Bits = Bits | (1UL << offset) }
+            : this;
+    }
+
+    /// <summary>Consecutive active days ending at the anchor (capped at the window size)</summary>
+    public int TrailingRun => BitOperations.TrailingZeroCount(~Bits);
+
+    /// <summary>Longest run of consecutive active days inside the window</summary>
+    public int LongestRun
+    {
+        get
+        {
+            // Each step shortens every run by one day, so the step count is the longest run
+            var runs = Bits;
+            var length = 0;
+            while (runs != 0)
+            {
+                runs &= runs << 1;
+                length++;
+            }
+            return length;
+        }
+    }
+
+    public int ActiveDays => BitOperations.PopCount(Bits);
+}
@@ -0,0 +1,39 @@
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+
+namespace Adaplio.Api.Domain;
+
+/// <summary>
+/// Append-only analytics event. Rows are only ever inserted, in batches, by AnalyticsIngestWriter.
+/// </summary>
+[Table("analytics_event")]
+public class AnalyticsEvent
+{
+    [Key]
+    [Column("id")]
+    public long Id { get; set; }
+
+    [Required]
+    [Column("event")]
+    [MaxLength(100)]
+    public string Event { get; set; } = string.Empty;
+
+    [Column("method")]
+    [MaxLength(50)]
+    public string? Method { get; set; }
+
+    /// <summary>
+    /// When the client says the event happened; the receive time when it didn't say
+    /// </summary>
+    [Column("occurred_at")]
+    public DateTimeOffset OccurredAt { get; set; }
+
+    [Column("received_at")]
+    public DateTimeOffset ReceivedAt { get; set; }
+
+    /// <summary>
+    /// Event properties as a JSON object
+    /// </summary>
+    [Column("properties")]
+    public string? Properties { get; set; }
+}
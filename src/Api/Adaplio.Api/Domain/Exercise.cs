@@ -15,6 +15,14 @@ public class Exercise
     [MaxLength(200)]
     public string Name { get; set; } = string.Empty;
 
+    /// <summary>
+    /// Trimmed, lower-cased Name; unique, so name lookups are index seeks. Kept in sync by AppDbContext on save.
+    /// </summary>
+    [Required]
+    [Column("normalized_name")]
+    [MaxLength(200)]
+    public string NormalizedName { get; set; } = string.Empty;
+
     [Column("description")]
     public string? Description { get; set; }
 
@@ -43,4 +51,6 @@ public class Exercise
     // Navigation properties
     public ICollection<PlanTemplateItem> PlanTemplateItems { get; set; } = [];
     public ICollection<ExerciseInstance> ExerciseInstances { get; set; } = [];
+
+    public static string NormalizeName(string name) => name.Trim().ToLowerInvariant();
 }
\ No newline at end of file
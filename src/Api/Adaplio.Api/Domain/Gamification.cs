@@ -36,7 +36,19 @@ public class Gamification
     public DateOnly? LastActivityDate { get; set; }
 
     [Column("badges_earned")]
-    public string BadgesEarned { get; set; } = "[]";
+    public string BadgesEarned
+    {
+        get => _badgesEarned;
+        set
+        {
+            _badgesEarned = value;
+            _parsedBadges = null;
+        }
+    }
+
+    // Active days of the last 64 days ending at LastActivityDate (see ActivityBitmap)
+    [Column("activity_bitmap")]
+    public long ActivityBits { get; set; } = 0;
 
     [Column("created_at")]
     public DateTimeOffset CreatedAt { get; set; } = DateTimeOffset.UtcNow;
@@ -48,29 +60,79 @@ public class Gamification
     [ForeignKey(nameof(ClientProfileId))]
     public ClientProfile ClientProfile { get; set; } = null!;
 
-    // Convenience property for working with badges
+    private string _badgesEarned = "[]";
+    private List<Badge>? _parsedBadges;
+
+    // Convenience property for working with badges (returns a copy; BadgesEarned is parsed once)
     [NotMapped]
     public List<Badge> Badges
+    {
+        get => new(ParsedBadges);
+        set => BadgesEarned = JsonSerializer.Serialize(value);
+    }
+
+    public bool HasBadge(string badgeId)
+    {
+        return ParsedBadges.Exists(b => b.Id == badgeId);
+    }
+
+    // Appends earned badges and serializes once; no-op (and no column change) when nothing was earned
+    public void AddBadges(IReadOnlyCollection<Badge> badges)
+    {
+        if (badges.Count == 0)
+        {
+            return;
+        }
+
+        var all = new List<Badge>(ParsedBadges);
+        all.AddRange(badges);
+        Badges = all;
+        _parsedBadges = all;
+    }
+
+    private List<Badge> ParsedBadges
     {
         get
         {
+            if (_parsedBadges != null)
+            {
+                return _parsedBadges;
+            }
+
             try
             {
-                return string.IsNullOrEmpty(BadgesEarned) || BadgesEarned == "[]"
+                _parsedBadges = string.IsNullOrEmpty(_badgesEarned) || _badgesEarned == "[]"
                     ? new List<Badge>()
-                    : JsonSerializer.Deserialize<List<Badge>>(BadgesEarned) ?? new List<Badge>();
+                    : JsonSerializer.Deserialize<List<Badge>>(_badgesEarned) ?? new List<Badge>();
             }
             catch (JsonException)
             {
-                return new List<Badge>();
+                _parsedBadges = new List<Badge>();
             }
+
+            return _parsedBadges;
+        }
+    }
+
+    // Day bitmap view of the activity columns; legacy rows without a bitmap are rebuilt from the current streak
+    [NotMapped]
+    public ActivityBitmap Activity
+    {
+        get => ActivityBits == 0
+            ? ActivityBitmap.FromStreak(LastActivityDate, CurrentStreak)
+            : new ActivityBitmap(LastActivityDate, unchecked((ulong)ActivityBits));
+        set
+        {
+            LastActivityDate = value.Anchor;
+            ActivityBits = unchecked((long)value.Bits);
         }
-        set => BadgesEarned = JsonSerializer.Serialize(value);
     }
 
     // Calculated level based on XP (1 + floor(sqrt(xp_total / 10)))
     [NotMapped]
-    public int Level => 1 + (int)Math.Floor(Math.Sqrt(TotalXp / 10.0));
+    public int Level => LevelForXp(TotalXp);
+
+    public static int LevelForXp(int totalXp) => 1 + (int)Math.Floor(Math.Sqrt(totalXp / 10.0));
 
     // XP needed for next level (additional XP, not total)
     [NotMapped]
@@ -0,0 +1,98 @@
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+
+namespace Adaplio.Api.Domain;
+
+/// <summary>
+/// An email or SMS waiting to be handed to its provider. Rows are added in the same SaveChanges as the
+/// record they announce (magic link, invite token) and delivered by OutboxDispatcher.
+/// </summary>
+[Table("outbox_message")]
+public class OutboxMessage
+{
+    public const string EmailChannel = "email";
+    public const string SmsChannel = "sms";
+
+    public const string Pending = "pending";
+    public const string Sending = "sending";
+    public const string Sent = "sent";
+    public const string Failed = "failed";
+
+    [Key]
+    [Column("id")]
+    public long Id { get; set; }
+
+    /// <summary>
+    /// "email" or "sms"
+    /// </summary>
+    [Required]
+    [Column("channel")]
+    [MaxLength(10)]
+    public string Channel { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Provider the channel was configured with when the message was queued; concurrency is limited per provider
+    /// </summary>
+    [Required]
+    [Column("provider")]
+    [MaxLength(50)]
+    public string Provider { get; set; } = string.Empty;
+
+    [Required]
+    [Column("recipient")]
+    [MaxLength(255)]
+    public string Recipient { get; set; } = string.Empty;
+
+    [Column("subject")]
+    [MaxLength(255)]
+    public string? Subject { get; set; }
+
+    /// <summary>
+    /// Plain-text email body, or the SMS text
+    /// </summary>
+    [Required]
+    [Column("body")]
+    public string Body { get; set; } = string.Empty;
+
+    [Column("html_body")]
+    public string? HtmlBody { get; set; }
+
+    /// <summary>
+    /// "pending", "sending", "sent" or "failed"
+    /// </summary>
+    [Required]
+    [Column("status")]
+    [MaxLength(20)]
+    public string Status { get; set; } = Pending;
+
+    /// <summary>
+    /// Delivery attempts started; also fences a claim, so a dispatcher whose lease ran out cannot record an outcome
+    /// </summary>
+    [Column("attempts")]
+    public int Attempts { get; set; }
+
+    [Column("next_attempt_at")]
+    public DateTimeOffset NextAttemptAt { get; set; } = DateTimeOffset.UtcNow;
+
+    /// <summary>
+    /// While sending, when the claim expires and another dispatcher may take the message over
+    /// </summary>
+    [Column("locked_until")]
+    public DateTimeOffset? LockedUntil { get; set; }
+
+    /// <summary>
+    /// When the message stops being worth sending (the code or link it carries has expired); it is failed instead
+    /// </summary>
+    [Column("not_after")]
+    public DateTimeOffset? NotAfter { get; set; }
+
+    [Column("last_error")]
+    [MaxLength(1000)]
+    public string? LastError { get; set; }
+
+    [Column("created_at")]
+    public DateTimeOffset CreatedAt { get; set; } = DateTimeOffset.UtcNow;
+
+    [Column("sent_at")]
+    public DateTimeOffset? SentAt { get; set; }
+}
@@ -0,0 +1,25 @@
+namespace Adaplio.Api.Exercises;
+
+// Exercise library search
+public record ExerciseSearchQuery(
+    string? Q = null, // Prefix or approximate name/category; browses the library by name when empty
+    string? Category = null, // Exact category filter
+    int Limit = 20,
+    string? Cursor = null // NextCursor of the previous page
+);
+
+public record ExerciseSearchResult(
+    int Id,
+    string Name,
+    string? Category,
+    string? Description,
+    int? DefaultSets,
+    int? DefaultReps,
+    int? DefaultHoldSeconds,
+    double Score
+);
+
+public record ExerciseSearchResponse(
+    ExerciseSearchResult[] Exercises,
+    string? NextCursor
+);
\ No newline at end of file
@@ -0,0 +1,57 @@
+using Adaplio.Api.Data;
+using Adaplio.Api.Middleware;
+using Adaplio.Api.Services;
+
+namespace Adaplio.Api.Exercises;
+
+public static class ExerciseEndpoints
+{
+    public static void MapExerciseEndpoints(this WebApplication app)
+    {
+        var exerciseGroup = app.MapGroup("/api/exercises").WithTags("Exercises");
+
+        // Library search for type-ahead; browses by name when q is empty
+        exerciseGroup.MapGet("", SearchExercises)
+            .RequireAuthorization()
+            .WithETag(GetSearchVersion)
+            .WithName("SearchExercises");
+    }
+
+    private static async Task<string?> GetSearchVersion(HttpContext httpContext, object? results)
+    {
+        var searchIndex = httpContext.RequestServices.GetRequiredService<ExerciseSearchIndex>();
+        var context = httpContext.RequestServices.GetRequiredService<AppDbContext>();
+        return await searchIndex.GetVersionAsync(context, httpContext.RequestAborted);
+    }
+
+    private static async Task<IResult> SearchExercises(
+        ExerciseSearchIndex searchIndex,
+        AppDbContext context,
+        HttpContext httpContext,
+        string? q,
+        string? category,
+        int? limit,
+        string? cursor)
+    {
+        try
+        {
+            var defaults = new ExerciseSearchQuery();
+            var results = await searchIndex.SearchAsync(context, new ExerciseSearchQuery(
+                q,
+                category,
+                limit ?? defaults.Limit,
+                cursor
+            ), httpContext.RequestAborted);
+
+            return Results.Ok(results);
+        }
+        catch (ArgumentException ex)
+        {
+            return Results.BadRequest(ex.Message);
+        }
+        catch (Exception ex)
+        {
+            return Results.Problem($"Failed to search exercises: {ex.Message}");
+        }
+    }
+}
\ No newline at end of file
@@ -27,6 +27,7 @@ public static void MapGamificationEndpoints(this WebApplication app)
     private static async Task<IResult> GetClientGamification(
         AppDbContext context,
         IGamificationService gamificationService,
+        IClientReadCache cache,
         HttpContext httpContext)
     {
         try
@@ -53,44 +54,10 @@ public static void MapGamificationEndpoints(this WebApplication app)
                 return Results.NotFound("Client profile not found");
             }
 
-            // Get gamification data
-            var gamification = await gamificationService.GetGamificationAsync(clientProfile.Id);
-
-            if (gamification == null)
-            {
-                // Return default values for new users
-                return Results.Ok(new ClientGamificationResponse(
-                    clientProfile.Alias ?? "Unknown",
-                    0,
-                    1,
-                    10,
-                    0.0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    Array.Empty<BadgeDto>()
-                ));
-            }
-
-            // Convert badges to DTOs
-            var badgeDtos = gamification.Badges
-                .OrderByDescending(b => b.EarnedAt)
-                .Select(b => new BadgeDto(b.Id, b.Name, b.Description, b.Icon, b.Color, b.Rarity, b.EarnedAt))
-                .ToArray();
+            var response = await cache.GetOrAddAsync(clientProfile.Id, ClientReadCache.Gamification, null,
+                () => BuildClientGamificationAsync(clientProfile, gamificationService));
 
-            return Results.Ok(new ClientGamificationResponse(
-                clientProfile.Alias ?? "Unknown",
-                gamification.XpTotal,
-                gamification.Level,
-                gamification.XpForNextLevel,
-                gamification.LevelProgress,
-                gamification.CurrentStreakDays,
-                gamification.LongestStreakDays,
-                gamification.WeeklyStreakWeeks,
-                gamification.LongestWeeklyStreak,
-                badgeDtos
-            ));
+            return Results.Ok(response);
         }
         catch (Exception)
         {
@@ -98,6 +65,50 @@ public static void MapGamificationEndpoints(this WebApplication app)
         }
     }
 
+    private static async Task<ClientGamificationResponse> BuildClientGamificationAsync(
+        ClientProfile clientProfile,
+        IGamificationService gamificationService)
+    {
+        // Get gamification data
+        var gamification = await gamificationService.GetGamificationAsync(clientProfile.Id);
+
+        if (gamification == null)
+        {
+            // Return default values for new users
+            return new ClientGamificationResponse(
+                clientProfile.Alias ?? "Unknown",
+                0,
+                1,
+                10,
+                0.0,
+                0,
+                0,
+                0,
+                0,
+                Array.Empty<BadgeDto>()
+            );
+        }
+
+        // Convert badges to DTOs
+        var badgeDtos = gamification.Badges
+            .OrderByDescending(b => b.EarnedAt)
+            .Select(b => new BadgeDto(b.Id, b.Name, b.Description, b.Icon, b.Color, b.Rarity, b.EarnedAt))
+            .ToArray();
+
+        return new ClientGamificationResponse(
+            clientProfile.Alias ?? "Unknown",
+            gamification.XpTotal,
+            gamification.Level,
+            gamification.XpForNextLevel,
+            gamification.LevelProgress,
+            gamification.CurrentStreakDays,
+            gamification.LongestStreakDays,
+            gamification.WeeklyStreakWeeks,
+            gamification.LongestWeeklyStreak,
+            badgeDtos
+        );
+    }
+
     private static async Task<IResult> GetTrainerClientGamification(
         string clientAlias,
         AppDbContext context,
@@ -0,0 +1,128 @@
+using System.Buffers;
+using Adaplio.Api.Services;
+
+namespace Adaplio.Api.Middleware;
+
+/// <summary>
+/// Pass-through stream that copies the first <c>capacity</c> bytes read from or written to the inner
+/// stream into a pooled buffer. Data flows straight through, so nothing beyond the prefix is buffered.
+/// Disposing does not close the inner stream or release the capture; DetachCapture hands the buffer over.
+/// </summary>
+public sealed class CappedTeeStream : Stream
+{
+    private readonly Stream _inner;
+    private readonly int _capacity;
+    private byte[]? _buffer;
+    private int _captured;
+    private long _totalBytes;
+
+    public CappedTeeStream(Stream inner, int capacity)
+    {
+        _inner = inner;
+        _capacity = capacity;
+    }
+
+    public long TotalBytes => _totalBytes;
+
+    /// <summary>Hands the captured prefix to the caller, who must Return() it; the stream keeps streaming without capturing</summary>
+    public AuditCapture DetachCapture()
+    {
+        var capture = new AuditCapture(_buffer, _captured, _totalBytes);
+        _buffer = null;
+        _captured = _capacity;
+        return capture;
+    }
+
+    public override bool CanRead => _inner.CanRead;
+    public override bool CanSeek => false;
+    public override bool CanWrite => _inner.CanWrite;
+    public override long Length => throw new NotSupportedException();
+
+    public override long Position
+    {
+        get => throw new NotSupportedException();
+        set => throw new NotSupportedException();
+    }
+
+    public override int Read(byte[] buffer, int offset, int count)
+    {
+        return Read(buffer.AsSpan(offset, count));
+    }
+
+    public override int Read(Span<byte> buffer)
+    {
+        var read = _inner.Read(buffer);
+        Capture(buffer[..read]);
+        return read;
+    }
+
+    public override Task<int> ReadAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken)
+    {
+        return ReadAsync(buffer.AsMemory(offset, count), cancellationToken).AsTask();
+    }
+
+    public override async ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default)
+    {
+        var read = await _inner.ReadAsync(buffer, cancellationToken);
+        Capture(buffer.Span[..read]);
+        return read;
+    }
+
+    public override void Write(byte[] buffer, int offset, int count)
+    {
+        Write(buffer.AsSpan(offset, count));
+    }
+
+    public override void Write(ReadOnlySpan<byte> buffer)
+    {
+        _inner.Write(buffer);
+        Capture(buffer);
+    }
+
+    public override Task WriteAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken)
+    {
+        return WriteAsync(buffer.AsMemory(offset, count), cancellationToken).AsTask();
+    }
+
+    public override async ValueTask WriteAsync(ReadOnlyMemory<byte> buffer, CancellationToken cancellationToken = default)
+    {
+        await _inner.WriteAsync(buffer, cancellationToken);
+        Capture(buffer.Span);
+    }
+
+    public override void Flush()
+    {
+        _inner.Flush();
+    }
+
+    public override Task FlushAsync(CancellationToken cancellationToken)
+    {
+        return _inner.FlushAsync(cancellationToken);
+    }
+
+    public override long Seek(long offset, SeekOrigin origin)
+    {
+        throw new NotSupportedException();
+    }
+
+    public override void SetLength(long value)
+    {
+        throw new NotSupportedException();
+    }
+
+    private void Capture(ReadOnlySpan<byte> data)
+    {
+        _totalBytes += data.Length;
+
+        var room = _capacity - _captured;
+        if (room <= 0 || data.IsEmpty)
+        {
+            return;
+        }
+
+        _buffer ??= ArrayPool<byte>.Shared.Rent(_capacity);
+        var count = Math.Min(room, data.Length);
+        data[..count].CopyTo(_buffer.AsSpan(_captured));
+        _captured += count;
+    }
+}
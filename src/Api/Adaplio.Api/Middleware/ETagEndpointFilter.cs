@@ -0,0 +1,133 @@
+using System.Security.Claims;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using Microsoft.AspNetCore.Http.Json;
+using Microsoft.Extensions.Options;
+using Microsoft.Net.Http.Headers;
+
+namespace Adaplio.Api.Middleware;
+
+/// <summary>
+/// Adds an ETag to successful JSON GET responses and answers 304 Not Modified when the request's
+/// If-None-Match already holds it. Endpoints with an <see cref="ETagVersionSource"/> get a weak tag
+/// built from that version, checked before the handler runs so a matching poll skips the query and
+/// serialization. Otherwise the tag is a strong hash of the exact response bytes, so it changes
+/// whenever anything the endpoint reads changes (including deletes and acceptance state).
+/// </summary>
+public class ETagEndpointFilter : IEndpointFilter
+{
+    private readonly JsonSerializerOptions _jsonOptions;
+
+    public ETagEndpointFilter(IOptions<JsonOptions> jsonOptions)
+    {
+        _jsonOptions = jsonOptions.Value.SerializerOptions;
+    }
+
+    public async ValueTask<object?> InvokeAsync(EndpointFilterInvocationContext context, EndpointFilterDelegate next)
+    {
+        var httpContext = context.HttpContext;
+        var versionSource = httpContext.GetEndpoint()?.Metadata.GetMetadata<ETagVersionSource>();
+        EntityTagHeaderValue? etag = null;
+
+        // Read before the handler, so a write racing its query can only leave the tag older than the body
+        if (versionSource != null && await versionSource.GetVersion(httpContext, null) is { } version)
+        {
+            etag = VersionTag(httpContext, version);
+            if (IsNotModified(httpContext.Request, etag))
+            {
+                SetTagHeaders(httpContext.Response, etag);
+                return Results.StatusCode(StatusCodes.Status304NotModified);
+            }
+        }
+
+        var result = await next(context);
+
+        // Only 200 responses with a body get a tag; errors, 403s and 404s pass through untouched
+        if (result is not IValueHttpResult { Value: { } value } ||
+            result is IStatusCodeHttpResult { StatusCode: not (null or StatusCodes.Status200OK) })
+        {
+            return result;
+        }
+
+        if (etag == null && versionSource != null && await versionSource.GetVersion(httpContext, value) is { } valueVersion)
+        {
+            etag = VersionTag(httpContext, valueVersion);
+        }
+
+        if (etag != null)
+        {
+            SetTagHeaders(httpContext.Response, etag);
+            return IsNotModified(httpContext.Request, etag) ? Results.StatusCode(StatusCodes.Status304NotModified) : result;
+        }
+
+        var body = JsonSerializer.SerializeToUtf8Bytes(value, value.GetType(), _jsonOptions);
+        etag = new EntityTagHeaderValue($"\"{Convert.ToBase64String(SHA256.HashData(body), 0, 16)}\"");
+        SetTagHeaders(httpContext.Response, etag);
+
+        if (IsNotModified(httpContext.Request, etag))
+        {
+            return Results.StatusCode(StatusCodes.Status304NotModified);
+        }
+
+        return Results.Bytes(body, "application/json; charset=utf-8");
+    }
+
+    // The version covers the data, not the request, so the user and query go into the tag too
+    private static EntityTagHeaderValue VersionTag(HttpContext httpContext, string version)
+    {
+        var request = httpContext.Request;
+        var userId = httpContext.User.FindFirst(ClaimTypes.NameIdentifier)?.Value;
+        var hash = SHA256.HashData(Encoding.UTF8.GetBytes($"{version}\n{userId}\n{request.Path}{request.QueryString}"));
+        return new EntityTagHeaderValue($"\"{Convert.ToBase64String(hash, 0, 16)}\"", isWeak: true);
+    }
+
+    private static void SetTagHeaders(HttpResponse response, EntityTagHeaderValue etag)
+    {
+        response.Headers.ETag = etag.ToString();
+        // Clients may keep the response but must revalidate before reusing it
+        response.Headers.CacheControl = "private, no-cache";
+    }
+
+    private static bool IsNotModified(HttpRequest request, EntityTagHeaderValue etag)
+    {
+        var ifNoneMatch = request.GetTypedHeaders().IfNoneMatch;
+        if (ifNoneMatch == null || ifNoneMatch.Count == 0)
+        {
+            return false;
+        }
+
+        // If-None-Match uses weak comparison (RFC 9110 13.1.2)
+        return ifNoneMatch.Any(tag => tag.Equals(EntityTagHeaderValue.Any) || tag.Compare(etag, useStrongComparison: false));
+    }
+}
+
+/// <summary>
+/// Endpoint metadata giving a cheap version of what the endpoint returns, for <see cref="ETagEndpointFilter"/>.
+/// The delegate is called with a null value before the handler runs and, if that finds no version, again with
+/// the handler's response value; it returns null when it cannot vouch for the data, and the body is hashed instead.
+/// </summary>
+public sealed class ETagVersionSource
+{
+    public ETagVersionSource(Func<HttpContext, object?, Task<string?>> getVersion)
+    {
+        GetVersion = getVersion;
+    }
+
+    public Func<HttpContext, object?, Task<string?>> GetVersion { get; }
+}
+
+public static class ETagEndpointFilterExtensions
+{
+    public static RouteHandlerBuilder WithETag(this RouteHandlerBuilder builder)
+    {
+        return builder.AddEndpointFilter<ETagEndpointFilter>();
+    }
+
+    public static RouteHandlerBuilder WithETag(this RouteHandlerBuilder builder, Func<HttpContext, object?, Task<string?>> version)
+    {
+        return builder
+            .WithMetadata(new ETagVersionSource(version))
+            .AddEndpointFilter<ETagEndpointFilter>();
+    }
+}
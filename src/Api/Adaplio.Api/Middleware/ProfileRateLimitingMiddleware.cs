@@ -1,5 +1,5 @@
-using System.Collections.Concurrent;
 using System.Security.Claims;
+using Adaplio.Api.Services;
 
 namespace Adaplio.Api.Middleware;
 
@@ -7,18 +7,24 @@ public class ProfileRateLimitingMiddleware
 {
     private readonly RequestDelegate _next;
     private readonly ILogger<ProfileRateLimitingMiddleware> _logger;
+    private readonly IRateLimitStore _rateLimitStore;
 
-    // In-memory storage for rate limiting (in production, use Redis or similar)
-    private static readonly ConcurrentDictionary<string, UserRateLimit> _userLimits = new();
-
-    // Rate limits: 10 profile updates per minute per user
+    // Rate limits: 10 profile updates per minute per user, unless RateLimiting:Rules:profile_updates says otherwise
     private const int MaxProfileUpdatesPerMinute = 10;
     private const int WindowSizeMinutes = 1;
+    private const string Category = "profile_updates";
+
+    private static readonly RateLimitRule DefaultProfileUpdateRule =
+        new(MaxProfileUpdatesPerMinute, TimeSpan.FromMinutes(WindowSizeMinutes), TimeSpan.Zero);
 
-    public ProfileRateLimitingMiddleware(RequestDelegate next, ILogger<ProfileRateLimitingMiddleware> logger)
+    private readonly RateLimitRule _profileUpdateRule;
+
+    public ProfileRateLimitingMiddleware(RequestDelegate next, ILogger<ProfileRateLimitingMiddleware> logger, IRateLimitStore rateLimitStore, IConfiguration configuration)
     {
         _next = next;
         _logger = logger;
+        _rateLimitStore = rateLimitStore;
+        _profileUpdateRule = RateLimitRule.FromConfiguration(configuration, Category, DefaultProfileUpdateRule);
     }
 
     public async Task InvokeAsync(HttpContext context)
@@ -37,20 +43,18 @@ public async Task InvokeAsync(HttpContext context)
             return;
         }
 
-        var userKey = $"profile_updates_{userId}";
-        var userLimit = _userLimits.GetOrAdd(userKey, _ => new UserRateLimit());
+        var decision = await _rateLimitStore.TryAcquireAsync(new RateLimitKey(Category, userId), _profileUpdateRule, context.RequestAborted);
 
-        if (!userLimit.CanMakeRequest())
+        if (!decision.Allowed)
         {
             _logger.LogWarning("Rate limit exceeded for user {UserId} on profile updates", userId);
 
             context.Response.StatusCode = 429; // Too Many Requests
-            context.Response.Headers.Add("Retry-After", "60");
-            await context.Response.WriteAsync("Rate limit exceeded. Maximum 10 profile updates per minute.");
+            context.Response.Headers.Add("Retry-After", ((int)Math.Ceiling(decision.RetryAfter.TotalSeconds)).ToString());
+            await context.Response.WriteAsync($"Rate limit exceeded. Maximum {_profileUpdateRule.MaxRequests} profile updates per {(int)_profileUpdateRule.Window.TotalMinutes} minutes.");
             return;
         }
 
-        userLimit.RegisterRequest();
         await _next(context);
     }
 
@@ -67,37 +71,4 @@ private bool IsProfileUpdateEndpoint(PathString path)
     {
         return context.User.FindFirst(ClaimTypes.NameIdentifier)?.Value;
     }
-
-    private class UserRateLimit
-    {
-        private readonly Queue<DateTime> _requests = new();
-        private readonly object _lock = new();
-
-        public bool CanMakeRequest()
-        {
-            lock (_lock)
-            {
-                CleanOldRequests();
-                return _requests.Count < MaxProfileUpdatesPerMinute;
-            }
-        }
-
-        public void RegisterRequest()
-        {
-            lock (_lock)
-            {
-                CleanOldRequests();
-                _requests.Enqueue(DateTime.UtcNow);
-            }
-        }
-
-        private void CleanOldRequests()
-        {
-            var cutoff = DateTime.UtcNow.AddMinutes(-WindowSizeMinutes);
-            while (_requests.Count > 0 && _requests.Peek() < cutoff)
-            {
-                _requests.Dequeue();
-            }
-        }
-    }
 }
\ No newline at end of file
@@ -12,33 +12,59 @@ public class SecurityRateLimitingMiddleware
     private readonly ILogger<SecurityRateLimitingMiddleware> _logger;
     private readonly IServiceProvider _serviceProvider;
 
-    // In-memory storage for rate limiting (in production, use Redis or similar)
-    private static readonly ConcurrentDictionary<string, EndpointRateLimit> _rateLimits = new();
-    private static readonly ConcurrentDictionary<string, SuspiciousActivity> _suspiciousActivity = new();
+    private readonly IRateLimitStore _rateLimitStore;
 
-    // Rate limit configurations per endpoint type
-    private static readonly Dictionary<string, RateLimitConfig> _rateLimitConfigs = new()
+    // Activity heuristics only feed alerts, so they stay per-instance; entries with no events in the last hour are swept
+    private static readonly TimeSpan ActivitySweepInterval = TimeSpan.FromMinutes(1);
+    private readonly ConcurrentDictionary<string, SuspiciousActivity> _suspiciousActivity = new();
+    private long _nextActivitySweep;
+
+    // Default limits per endpoint type; each can be overridden under RateLimiting:Rules:{category}
+    private static readonly Dictionary<string, RateLimitRule> DefaultRateLimits = new()
     {
         // Authentication endpoints
-        { "auth_login", new RateLimitConfig(5, 15, 30) },        // 5 attempts per 15 min, lockout 30 min
-        { "auth_register", new RateLimitConfig(3, 60, 120) },    // 3 attempts per hour, lockout 2 hours
-        { "auth_password_reset", new RateLimitConfig(3, 60, 60) }, // 3 attempts per hour
+        { "auth_login", Limit(5, 15, 30) },        // 5 attempts per 15 min, lockout 30 min
+        { "auth_register", Limit(3, 60, 120) },    // 3 attempts per hour, lockout 2 hours
+        { "auth_password_reset", Limit(3, 60, 60) }, // 3 attempts per hour
 
         // API endpoints
-        { "api_general", new RateLimitConfig(100, 1, 5) },       // 100 requests per minute
-        { "api_upload", new RateLimitConfig(10, 5, 15) },        // 10 uploads per 5 minutes
-        { "api_invite", new RateLimitConfig(20, 60, 60) },       // 20 invites per hour
-        { "api_profile", new RateLimitConfig(30, 10, 10) },      // 30 profile ops per 10 minutes
+        { "api_general", Limit(100, 1, 5) },       // 100 requests per minute
+        { "api_upload", Limit(10, 5, 15) },        // 10 uploads (presigned sessions) per 5 minutes
+        { "api_upload_transfer", Limit(600, 1, 1) }, // 600 chunk PUTs / status GETs per minute
+        { "api_invite", Limit(20, 60, 60) },       // 20 invites per hour
+        { "api_profile", Limit(30, 10, 10) },      // 30 profile ops per 10 minutes
 
         // Global IP-based limits
-        { "global_ip", new RateLimitConfig(500, 1, 60) }         // 500 requests per minute per IP
+        { "global_ip", Limit(500, 1, 60) }         // 500 requests per minute per IP
     };
 
-    public SecurityRateLimitingMiddleware(RequestDelegate next, ILogger<SecurityRateLimitingMiddleware> logger, IServiceProvider serviceProvider)
+    // Route prefixes per category, matched by whole path segments in order; anything else is api_general.
+    // An upload counts against api_upload once, when it is presigned: its chunks and status checks have their
+    // own budget and file downloads are ordinary reads.
+    private static readonly (PathString Prefix, string Category)[] EndpointCategories =
+    {
+        ("/auth/trainer/login", "auth_login"),
+        ("/auth/trainer/register", "auth_register"),
+        ("/auth/trainer/forgot-password", "auth_password_reset"),
+        ("/auth/trainer/reset-password", "auth_password_reset"),
+        ("/api/uploads/upload", "api_upload_transfer"),
+        ("/api/uploads/files", "api_general"),
+        ("/api/uploads", "api_upload"),
+        ("/api/invites", "api_invite"),
+        ("/api/me", "api_profile")
+    };
+
+    private readonly Dictionary<string, RateLimitRule> _rateLimitConfigs;
+
+    public SecurityRateLimitingMiddleware(RequestDelegate next, ILogger<SecurityRateLimitingMiddleware> logger, IServiceProvider serviceProvider, IRateLimitStore rateLimitStore, IConfiguration configuration)
     {
         _next = next;
         _logger = logger;
         _serviceProvider = serviceProvider;
+        _rateLimitStore = rateLimitStore;
+        _rateLimitConfigs = DefaultRateLimits.ToDictionary(
+            rule => rule.Key,
+            rule => RateLimitRule.FromConfiguration(configuration, rule.Key, rule.Value));
     }
 
     public async Task InvokeAsync(HttpContext context)
@@ -48,7 +74,7 @@ public async Task InvokeAsync(HttpContext context)
         var ipAddress = GetClientIpAddress(context);
 
         // Check IP-based rate limits first
-        if (!await CheckRateLimit(context, "global_ip", ipAddress, endpoint))
+        if (!await CheckRateLimit(context, "global_ip", ipAddress ?? "unknown", endpoint))
             return;
 
         // Check user-specific rate limits if authenticated
@@ -66,46 +92,49 @@ public async Task InvokeAsync(HttpContext context)
 
     private async Task<bool> CheckRateLimit(HttpContext context, string category, string identifier, string endpoint)
     {
-        if (!_rateLimitConfigs.TryGetValue(category, out var config))
+        if (!_rateLimitConfigs.TryGetValue(category, out var rule))
         {
-            config = _rateLimitConfigs["api_general"];
+            rule = _rateLimitConfigs["api_general"];
         }
 
-        var key = $"{category}_{identifier}";
-        var rateLimit = _rateLimits.GetOrAdd(key, _ => new EndpointRateLimit());
+        var decision = await _rateLimitStore.TryAcquireAsync(new RateLimitKey(category, identifier), rule, context.RequestAborted);
 
-        if (!rateLimit.CanMakeRequest(config))
+        if (!decision.Allowed)
         {
+            var windowMinutes = (int)rule.Window.TotalMinutes;
+            var retryAfter = (int)Math.Ceiling(decision.RetryAfter.TotalSeconds);
+
             await LogSecurityEvent(context, "rate_limit_exceeded", new
             {
                 category,
                 identifier,
                 endpoint,
-                limit = config.MaxRequests,
-                window = config.WindowMinutes
+                limit = rule.MaxRequests,
+                window = windowMinutes
             });
 
             context.Response.StatusCode = 429;
-            context.Response.Headers.Add("Retry-After", (config.LockoutMinutes * 60).ToString());
+            context.Response.Headers.Add("Retry-After", retryAfter.ToString());
             context.Response.Headers.Add("X-Rate-Limit-Category", category);
 
             await context.Response.WriteAsync(JsonSerializer.Serialize(new
             {
                 error = "Rate limit exceeded",
                 category,
-                retryAfter = config.LockoutMinutes * 60,
-                message = $"Too many requests. Limit: {config.MaxRequests} per {config.WindowMinutes} minutes."
+                retryAfter,
+                message = $"Too many requests. Limit: {rule.MaxRequests} per {windowMinutes} minutes."
             }));
 
             return false;
         }
 
-        rateLimit.RegisterRequest(config);
         return true;
     }
 
     private async Task CheckSuspiciousActivity(HttpContext context, string? userId, string? ipAddress, string endpoint)
     {
+        SweepIdleActivity();
+
         var key = userId ?? ipAddress ?? "unknown";
         var activity = _suspiciousActivity.GetOrAdd(key, _ => new SuspiciousActivity());
 
@@ -151,25 +180,30 @@ private async Task CheckSuspiciousActivity(HttpContext context, string? userId,
         activity.RegisterRequest(endpoint, context.Response.StatusCode >= 400);
     }
 
-    private string GetEndpointCategory(PathString path, string method)
+    private void SweepIdleActivity()
     {
-        var pathValue = path.Value?.ToLower() ?? "";
+        var now = DateTime.UtcNow;
+        var due = Interlocked.Read(ref _nextActivitySweep);
+        if (now.Ticks < due || Interlocked.CompareExchange(ref _nextActivitySweep, now.Add(ActivitySweepInterval).Ticks, due) != due)
+        {
+            return;
+        }
 
-        // Authentication endpoints
-        if (pathValue.Contains("/auth/"))
+        foreach (var (key, activity) in _suspiciousActivity)
         {
-            if (pathValue.Contains("login")) return "auth_login";
-            if (pathValue.Contains("register")) return "auth_register";
-            if (pathValue.Contains("password") || pathValue.Contains("reset")) return "auth_password_reset";
+            if (activity.IsIdle())
+            {
+                _suspiciousActivity.TryRemove(key, out _);
+            }
         }
+    }
 
-        // API endpoints
-        if (pathValue.StartsWith("/api/"))
+    private static string GetEndpointCategory(PathString path, string method)
+    {
+        foreach (var (prefix, category) in EndpointCategories)
         {
-            if (pathValue.Contains("upload")) return "api_upload";
-            if (pathValue.Contains("invite")) return "api_invite";
-            if (pathValue.Contains("profile") || pathValue.Contains("/me/")) return "api_profile";
-            return "api_general";
+            if (path.StartsWithSegments(prefix, StringComparison.OrdinalIgnoreCase))
+                return category;
         }
 
         return "api_general";
@@ -228,66 +262,9 @@ private async Task LogSecurityEvent(HttpContext context, string eventType, objec
         );
     }
 
-    private class RateLimitConfig
+    private static RateLimitRule Limit(int maxRequests, int windowMinutes, int lockoutMinutes)
     {
-        public int MaxRequests { get; }
-        public int WindowMinutes { get; }
-        public int LockoutMinutes { get; }
-
-        public RateLimitConfig(int maxRequests, int windowMinutes, int lockoutMinutes)
-        {
-            MaxRequests = maxRequests;
-            WindowMinutes = windowMinutes;
-            LockoutMinutes = lockoutMinutes;
-        }
-    }
-
-    private class EndpointRateLimit
-    {
-        private readonly Queue<DateTime> _requests = new();
-        private DateTime? _lockoutUntil = null;
-        private readonly object _lock = new();
-
-        public bool CanMakeRequest(RateLimitConfig config)
-        {
-            lock (_lock)
-            {
-                // Check if still in lockout period
-                if (_lockoutUntil.HasValue && DateTime.UtcNow < _lockoutUntil.Value)
-                {
-                    return false;
-                }
-
-                CleanOldRequests(config.WindowMinutes);
-
-                if (_requests.Count >= config.MaxRequests)
-                {
-                    // Trigger lockout
-                    _lockoutUntil = DateTime.UtcNow.AddMinutes(config.LockoutMinutes);
-                    return false;
-                }
-
-                return true;
-            }
-        }
-
-        public void RegisterRequest(RateLimitConfig config)
-        {
-            lock (_lock)
-            {
-                CleanOldRequests(config.WindowMinutes);
-                _requests.Enqueue(DateTime.UtcNow);
-            }
-        }
-
-        private void CleanOldRequests(int windowMinutes)
-        {
-            var cutoff = DateTime.UtcNow.AddMinutes(-windowMinutes);
-            while (_requests.Count > 0 && _requests.Peek() < cutoff)
-            {
-                _requests.Dequeue();
-            }
-        }
+        return new RateLimitRule(maxRequests, TimeSpan.FromMinutes(windowMinutes), TimeSpan.FromMinutes(lockoutMinutes));
     }
 
     private class SuspiciousActivity
@@ -342,6 +319,15 @@ public int GetUniqueEndpointCount(TimeSpan window)
             }
         }
 
+        public bool IsIdle()
+        {
+            lock (_lock)
+            {
+                CleanOldEvents();
+                return _events.Count == 0;
+            }
+        }
+
         private void CleanOldEvents()
         {
             var cutoff = DateTime.UtcNow.AddHours(-1); // Keep 1 hour of history
@@ -0,0 +1,44 @@
+﻿using System;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace Adaplio.Api.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddAnalyticsEvents : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateTable(
+                name: "analytics_event",
+                columns: table => new
+                {
+                    id = table.Column<long>(type: "INTEGER", nullable: false)
+                        .Annotation("Sqlite:Autoincrement", true),
+                    @event = table.Column<string>(name: "event", type: "TEXT", maxLength: 100, nullable: false),
+                    method = table.Column<string>(type: "TEXT", maxLength: 50, nullable: true),
+                    occurred_at = table.Column<DateTimeOffset>(type: "TEXT", nullable: false),
+                    received_at = table.Column<DateTimeOffset>(type: "TEXT", nullable: false),
+                    properties = table.Column<string>(type: "TEXT", nullable: true)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_analytics_event", x => x.id);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_analytics_event_event_occurred_at",
+                table: "analytics_event",
+                columns: new[] { "event", "occurred_at" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropTable(
+                name: "analytics_event");
+        }
+    }
+}
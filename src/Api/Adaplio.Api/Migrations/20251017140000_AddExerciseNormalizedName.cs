@@ -0,0 +1,53 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace Adaplio.Api.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddExerciseNormalizedName : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.AddColumn<string>(
+                name: "normalized_name",
+                table: "exercise",
+                type: "TEXT",
+                maxLength: 200,
+                nullable: false,
+                defaultValue: "");
+
+            migrationBuilder.Sql("UPDATE exercise SET normalized_name = lower(trim(name));");
+
+            // Merge exercises whose names only differed by case or surrounding spaces into the oldest row
+            migrationBuilder.Sql(@"
+                UPDATE plan_template_item SET exercise_id = (
+                    SELECT MIN(keep.id) FROM exercise keep
+                    WHERE keep.normalized_name = (SELECT e.normalized_name FROM exercise e WHERE e.id = plan_template_item.exercise_id));");
+            migrationBuilder.Sql(@"
+                UPDATE exercise_instance SET exercise_id = (
+                    SELECT MIN(keep.id) FROM exercise keep
+                    WHERE keep.normalized_name = (SELECT e.normalized_name FROM exercise e WHERE e.id = exercise_instance.exercise_id));");
+            migrationBuilder.Sql("DELETE FROM exercise WHERE id NOT IN (SELECT MIN(id) FROM exercise GROUP BY normalized_name);");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_exercise_normalized_name",
+                table: "exercise",
+                column: "normalized_name",
+                unique: true);
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_exercise_normalized_name",
+                table: "exercise");
+
+            migrationBuilder.DropColumn(
+                name: "normalized_name",
+                table: "exercise");
+        }
+    }
+}
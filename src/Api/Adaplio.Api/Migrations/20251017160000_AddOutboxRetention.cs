@@ -0,0 +1,38 @@
+﻿using System;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace Adaplio.Api.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddOutboxRetention : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.AddColumn<DateTimeOffset>(
+                name: "not_after",
+                table: "outbox_message",
+                type: "TEXT",
+                nullable: true);
+
+            migrationBuilder.CreateIndex(
+                name: "IX_outbox_message_status_created_at",
+                table: "outbox_message",
+                columns: new[] { "status", "created_at" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_outbox_message_status_created_at",
+                table: "outbox_message");
+
+            migrationBuilder.DropColumn(
+                name: "not_after",
+                table: "outbox_message");
+        }
+    }
+}
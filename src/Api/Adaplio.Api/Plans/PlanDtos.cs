@@ -95,8 +95,17 @@ public record ProposalItemResponse(
     string? Notes
 );
 
+public record ProposalListQuery(
+    int Page = 1,
+    int PageSize = 50,
+    string? Status = null // pending, accepted, declined, expired; all when omitted
+);
+
 public record ProposalListResponse(
-    ProposalResponse[] Proposals
+    ProposalResponse[] Proposals,
+    int Page,
+    int PageSize,
+    int TotalCount
 );
 
 // Acceptance DTOs
@@ -172,4 +181,53 @@ public record QuickLogRequest(
 public record QuickLogResponse(
     string Message,
     int ProgressEventId
+);
+// Trainer roster DTOs
+public record TrainerRosterQuery(
+    int Page = 1,
+    int PageSize = 100,
+    string? Sort = null, // alias (default), lastActivity, streak, adherence; prefix "-" for descending
+    string? Search = null,
+    bool IncludeSummary = false
+);
+
+public record TrainerClientResponse(
+    int Id,
+    string? Alias,
+    string Email,
+    DateTimeOffset CreatedAt,
+    IReadOnlyList<string> Scopes,
+    TrainerClientSummary? Summary
+);
+
+public record TrainerClientSummary(
+    DateOnly? LastActivityDate,
+    decimal CurrentWeekAdherence,
+    int CurrentStreak
+);
+
+public record TrainerClientsResponse(
+    TrainerClientResponse[] Clients,
+    int Page,
+    int PageSize,
+    int TotalCount
+);
+
+// Trainer dashboard DTOs (one row per client with view_summary consent)
+public record TrainerDashboardClient(
+    int Id,
+    string? Alias,
+    DateOnly? LastActivityDate,
+    decimal CurrentWeekAdherence,
+    decimal OverallAdherence,
+    int CurrentStreak,
+    int Level,
+    int TotalXp
+);
+
+public record TrainerDashboardResponse(
+    TrainerDashboardClient[] Clients,
+    int Page,
+    int PageSize,
+    int TotalCount
 );
\ No newline at end of file
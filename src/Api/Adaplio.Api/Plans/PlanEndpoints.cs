@@ -1,4 +1,5 @@
 using Adaplio.Api.Data;
+using Adaplio.Api.Middleware;
 using Adaplio.Api.Services;
 using Microsoft.AspNetCore.Authorization;
 using Microsoft.EntityFrameworkCore;
@@ -19,6 +20,7 @@ public static void MapPlanEndpoints(this WebApplication app)
 
         planGroup.MapGet("/trainer/templates", GetTrainerTemplates)
             .RequireAuthorization()
+            .WithETag(GetTrainerTemplatesVersion)
             .WithName("GetTrainerTemplates");
 
         planGroup.MapPut("/trainer/templates/{id}", UpdateTemplate)
@@ -36,14 +38,23 @@ public static void MapPlanEndpoints(this WebApplication app)
 
         planGroup.MapGet("/trainer/proposals", GetTrainerProposals)
             .RequireAuthorization()
+            .WithETag()
             .WithName("GetTrainerProposals");
 
         planGroup.MapGet("/trainer/clients", GetTrainerClients)
             .RequireAuthorization()
+            .WithETag()
             .WithName("GetTrainerClients");
 
+        // Adherence, streak and level for every client in one request
+        planGroup.MapGet("/trainer/dashboard", GetTrainerDashboard)
+            .RequireAuthorization()
+            .WithETag()
+            .WithName("GetTrainerDashboard");
+
         planGroup.MapGet("/client/proposals", GetClientProposals)
             .RequireAuthorization()
+            .WithETag()
             .WithName("GetClientProposals");
 
         planGroup.MapGet("/client/proposals/{id}", GetClientProposal)
@@ -62,6 +73,7 @@ public static void MapPlanEndpoints(this WebApplication app)
         // Board endpoints (client)
         planGroup.MapGet("/client/board", GetClientBoard)
             .RequireAuthorization()
+            .WithETag(GetClientBoardVersion)
             .WithName("GetClientBoard");
 
         planGroup.MapPost("/client/board/quick-log", QuickLogProgress)
@@ -136,6 +148,31 @@ public static void MapPlanEndpoints(this WebApplication app)
         }
     }
 
+    private static async Task<string?> GetTrainerTemplatesVersion(HttpContext httpContext, object? templates)
+    {
+        var userId = httpContext.User.FindFirst(ClaimTypes.NameIdentifier)?.Value;
+        var userType = httpContext.User.FindFirst("user_type")?.Value;
+
+        if (!int.TryParse(userId, out var parsedUserId) || userType != "trainer")
+        {
+            return null;
+        }
+
+        var context = httpContext.RequestServices.GetRequiredService<AppDbContext>();
+        var trainerProfileId = await context.TrainerProfiles
+            .Where(tp => tp.UserId == parsedUserId)
+            .Select(tp => (int?)tp.Id)
+            .FirstOrDefaultAsync();
+
+        if (trainerProfileId == null)
+        {
+            return null;
+        }
+
+        var planService = httpContext.RequestServices.GetRequiredService<IPlanService>();
+        return await planService.GetTrainerTemplatesVersionAsync(trainerProfileId.Value);
+    }
+
     private static async Task<IResult> UpdateTemplate(
         int id,
         UpdateTemplateRequest request,
@@ -259,7 +296,10 @@ public static void MapPlanEndpoints(this WebApplication app)
     private static async Task<IResult> GetTrainerProposals(
         IPlanService planService,
         AppDbContext context,
-        HttpContext httpContext)
+        HttpContext httpContext,
+        int? page,
+        int? pageSize,
+        string? status)
     {
         try
         {
@@ -279,9 +319,14 @@ public static void MapPlanEndpoints(this WebApplication app)
                 return Results.NotFound("Trainer profile not found");
             }
 
-            var proposals = await planService.GetTrainerProposalsAsync(trainerProfile.Id);
+            var defaults = new ProposalListQuery();
+            var proposals = await planService.GetTrainerProposalsAsync(trainerProfile.Id, new ProposalListQuery(
+                page ?? defaults.Page,
+                pageSize ?? defaults.PageSize,
+                status
+            ), httpContext.RequestAborted);
 
-            return Results.Ok(new ProposalListResponse(proposals));
+            return Results.Ok(proposals);
         }
         catch (Exception ex)
         {
@@ -292,7 +337,10 @@ public static void MapPlanEndpoints(this WebApplication app)
     private static async Task<IResult> GetClientProposals(
         IPlanService planService,
         AppDbContext context,
-        HttpContext httpContext)
+        HttpContext httpContext,
+        int? page,
+        int? pageSize,
+        string? status)
     {
         try
         {
@@ -312,9 +360,14 @@ public static void MapPlanEndpoints(this WebApplication app)
                 return Results.NotFound("Client profile not found");
             }
 
-            var proposals = await planService.GetClientProposalsAsync(clientProfile.Id);
+            var defaults = new ProposalListQuery();
+            var proposals = await planService.GetClientProposalsAsync(clientProfile.Id, new ProposalListQuery(
+                page ?? defaults.Page,
+                pageSize ?? defaults.PageSize,
+                status
+            ), httpContext.RequestAborted);
 
-            return Results.Ok(new ProposalListResponse(proposals));
+            return Results.Ok(proposals);
         }
         catch (Exception ex)
         {
@@ -346,7 +399,7 @@ public static void MapPlanEndpoints(this WebApplication app)
                 return Results.NotFound("Client profile not found");
             }
 
-            var proposal = await planService.GetClientProposalAsync(clientProfile.Id, id);
+            var proposal = await planService.GetClientProposalAsync(clientProfile.Id, id, httpContext.RequestAborted);
 
             if (proposal == null)
             {
@@ -436,6 +489,7 @@ public static void MapPlanEndpoints(this WebApplication app)
     private static async Task<IResult> GetClientBoard(
         string? weekStart,
         IPlanService planService,
+        IClientReadCache cache,
         AppDbContext context,
         HttpContext httpContext)
     {
@@ -457,28 +511,9 @@ public static void MapPlanEndpoints(this WebApplication app)
                 return Results.NotFound("Client profile not found");
             }
 
-            // Parse week start or default to current week's Monday
-            DateOnly parsedWeekStart;
-            if (!string.IsNullOrEmpty(weekStart) && DateOnly.TryParse(weekStart, out parsedWeekStart))
-            {
-                // Ensure it's a Monday
-                var dayOfWeek = (int)parsedWeekStart.DayOfWeek;
-                if (dayOfWeek != 1) // Not Monday
-                {
-                    var daysToSubtract = dayOfWeek == 0 ? 6 : dayOfWeek - 1; // Sunday = 6 days back
-                    parsedWeekStart = parsedWeekStart.AddDays(-daysToSubtract);
-                }
-            }
-            else
-            {
-                // Default to current week's Monday
-                var today = DateOnly.FromDateTime(DateTime.Today);
-                var dayOfWeek = (int)today.DayOfWeek;
-                var daysToSubtract = dayOfWeek == 0 ? 6 : dayOfWeek - 1; // Sunday = 6 days back
-                parsedWeekStart = today.AddDays(-daysToSubtract);
-            }
-
-            var board = await planService.GetClientBoardAsync(clientProfile.Id, parsedWeekStart);
+            var parsedWeekStart = ResolveWeekStart(weekStart);
+            var board = await cache.GetOrAddAsync(clientProfile.Id, ClientReadCache.Board, parsedWeekStart,
+                () => planService.GetClientBoardAsync(clientProfile.Id, parsedWeekStart));
 
             return Results.Ok(board);
         }
@@ -488,10 +523,64 @@ public static void MapPlanEndpoints(this WebApplication app)
         }
     }
 
+    // The board's ETag follows the cached board it serves, so an unchanged poll is answered from the cache entry
+    private static async Task<string?> GetClientBoardVersion(HttpContext httpContext, object? board)
+    {
+        var userId = httpContext.User.FindFirst(ClaimTypes.NameIdentifier)?.Value;
+        var userType = httpContext.User.FindFirst("user_type")?.Value;
+
+        if (!int.TryParse(userId, out var parsedUserId) || userType != "client")
+        {
+            return null;
+        }
+
+        var context = httpContext.RequestServices.GetRequiredService<AppDbContext>();
+        var clientProfileId = await context.ClientProfiles
+            .Where(cp => cp.UserId == parsedUserId)
+            .Select(cp => (int?)cp.Id)
+            .FirstOrDefaultAsync();
+
+        if (clientProfileId == null)
+        {
+            return null;
+        }
+
+        var cache = httpContext.RequestServices.GetRequiredService<IClientReadCache>();
+        var weekStart = ResolveWeekStart(httpContext.Request.Query["weekStart"].ToString());
+        return cache.GetVersion(clientProfileId.Value, ClientReadCache.Board, weekStart, board);
+    }
+
+    private static DateOnly ResolveWeekStart(string? weekStart)
+    {
+        // Parse week start or default to current week's Monday
+        DateOnly parsedWeekStart;
+        if (!string.IsNullOrEmpty(weekStart) && DateOnly.TryParse(weekStart, out parsedWeekStart))
+        {
+            // Ensure it's a Monday
+            var dayOfWeek = (int)parsedWeekStart.DayOfWeek;
+            if (dayOfWeek != 1) // Not Monday
+            {
+                var daysToSubtract = dayOfWeek == 0 ? 6 : dayOfWeek - 1; // Sunday = 6 days back
+                parsedWeekStart = parsedWeekStart.AddDays(-daysToSubtract);
+            }
+        }
+        else
+        {
+            // Default to current week's Monday
+            var today = DateOnly.FromDateTime(DateTime.Today);
+            var dayOfWeek = (int)today.DayOfWeek;
+            var daysToSubtract = dayOfWeek == 0 ? 6 : dayOfWeek - 1; // Sunday = 6 days back
+            parsedWeekStart = today.AddDays(-daysToSubtract);
+        }
+
+        return parsedWeekStart;
+    }
+
     private static async Task<IResult> QuickLogProgress(
         QuickLogRequest request,
         AppDbContext context,
         IGamificationService gamificationService,
+        IClientReadCache cache,
         HttpContext httpContext)
     {
         try
@@ -545,6 +634,7 @@ public static void MapPlanEndpoints(this WebApplication app)
 
             // Award XP for this progress event
             await gamificationService.AwardXpForProgressAsync(progressEvent.Id, clientProfile.Id);
+            cache.InvalidateClient(clientProfile.Id);
 
             return Results.Ok(new QuickLogResponse(
                 request.Completed ? "Exercise marked as completed!" : "Progress logged!",
@@ -559,7 +649,13 @@ public static void MapPlanEndpoints(this WebApplication app)
 
     private static async Task<IResult> GetTrainerClients(
         AppDbContext context,
-        HttpContext httpContext)
+        ITrainerRosterService rosterService,
+        HttpContext httpContext,
+        int? page,
+        int? pageSize,
+        string? sort,
+        string? search,
+        bool? includeSummary)
     {
         try
         {
@@ -571,42 +667,83 @@ public static void MapPlanEndpoints(this WebApplication app)
                 return Results.Forbid();
             }
 
-            var trainerProfile = await context.TrainerProfiles
-                .FirstOrDefaultAsync(tp => tp.UserId == int.Parse(userId));
+            var trainerProfileId = await context.TrainerProfiles
+                .Where(tp => tp.UserId == int.Parse(userId))
+                .Select(tp => (int?)tp.Id)
+                .FirstOrDefaultAsync();
 
-            if (trainerProfile == null)
+            if (trainerProfileId == null)
             {
                 return Results.NotFound("Trainer profile not found");
             }
 
-            // Get clients that have granted consent to this trainer (client-side date evaluation)
-            var now = DateTimeOffset.UtcNow;
-            var allGrants = await context.ConsentGrants
-                .Where(cg => cg.TrainerProfileId == trainerProfile.Id)
-                .Include(cg => cg.ClientProfile)
-                .ThenInclude(cp => cp.User)
-                .ToListAsync();
+            var defaults = new TrainerRosterQuery();
+            var roster = await rosterService.GetClientsAsync(trainerProfileId.Value, new TrainerRosterQuery(
+                page ?? defaults.Page,
+                pageSize ?? defaults.PageSize,
+                sort,
+                search,
+                includeSummary ?? false
+            ), httpContext.RequestAborted);
+
+            return Results.Ok(roster);
+        }
+        catch (ArgumentException ex)
+        {
+            return Results.BadRequest(ex.Message);
+        }
+        catch (Exception ex)
+        {
+            return Results.Problem($"Failed to get clients: {ex.Message}");
+        }
+    }
+
+    private static async Task<IResult> GetTrainerDashboard(
+        AppDbContext context,
+        ITrainerRosterService rosterService,
+        HttpContext httpContext,
+        int? page,
+        int? pageSize,
+        string? sort,
+        string? search)
+    {
+        try
+        {
+            var userId = httpContext.User.FindFirst(ClaimTypes.NameIdentifier)?.Value;
+            var userType = httpContext.User.FindFirst("user_type")?.Value;
+
+            if (string.IsNullOrEmpty(userId) || userType != "trainer")
+            {
+                return Results.Forbid();
+            }
+
+            var trainerProfileId = await context.TrainerProfiles
+                .Where(tp => tp.UserId == int.Parse(userId))
+                .Select(tp => (int?)tp.Id)
+                .FirstOrDefaultAsync();
 
-            var activeGrants = allGrants.Where(cg => cg.ExpiresAt == null || cg.ExpiresAt > now).ToList();
+            if (trainerProfileId == null)
+            {
+                return Results.NotFound("Trainer profile not found");
+            }
 
-            var clients = activeGrants
-                .GroupBy(cg => cg.ClientProfile.Id)
-                .Select(g => new
-                {
-                    id = g.First().ClientProfile.Id,
-                    alias = g.First().ClientProfile.Alias,
-                    email = g.First().ClientProfile.User.Email,
-                    createdAt = g.First().ClientProfile.CreatedAt,
-                    scopes = g.Select(cg => cg.Scope).ToList()
-                })
-                .OrderBy(c => c.alias)
-                .ToList();
+            var defaults = new TrainerRosterQuery();
+            var dashboard = await rosterService.GetDashboardAsync(trainerProfileId.Value, new TrainerRosterQuery(
+                page ?? defaults.Page,
+                pageSize ?? defaults.PageSize,
+                sort,
+                search
+            ), httpContext.RequestAborted);
 
-            return Results.Ok(new { clients });
+            return Results.Ok(dashboard);
+        }
+        catch (ArgumentException ex)
+        {
+            return Results.BadRequest(ex.Message);
         }
         catch (Exception ex)
         {
-            return Results.Problem($"Failed to get clients: {ex.Message}");
+            return Results.Problem($"Failed to get dashboard: {ex.Message}");
         }
     }
 }
\ No newline at end of file
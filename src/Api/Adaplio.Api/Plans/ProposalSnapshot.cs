@@ -0,0 +1,62 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace Adaplio.Api.Plans;
+
+/// <summary>
+/// One template item as frozen into PlanProposal.CustomPlanJson. Property names and the
+/// JSON-encoded DaysOfWeek string match the snapshots already stored, so old rows still parse.
+/// </summary>
+public record ProposalSnapshotItem(
+    int ExerciseId,
+    string ExerciseName,
+    string? ExerciseDescription,
+    int OrderIndex,
+    int? Sets,
+    int? Reps,
+    int? HoldSeconds,
+    int? FrequencyPerWeek,
+    string? DaysOfWeek,
+    string? Notes
+)
+{
+    [JsonIgnore]
+    public string[] Days => string.IsNullOrEmpty(DaysOfWeek)
+        ? Array.Empty<string>()
+        : JsonSerializer.Deserialize<string[]>(DaysOfWeek) ?? Array.Empty<string>();
+}
+
+/// <summary>
+/// A whole proposal as frozen into PlanProposal.CustomPlanJson: the plan length and its items.
+/// </summary>
+public record ProposalSnapshotContent(int? DurationWeeks, ProposalSnapshotItem[] Items);
+
+public static class ProposalSnapshot
+{
+    private static readonly ProposalSnapshotContent Empty = new(null, Array.Empty<ProposalSnapshotItem>());
+
+    public static string Serialize(int? durationWeeks, IEnumerable<ProposalSnapshotItem> items)
+    {
+        return JsonSerializer.Serialize(new ProposalSnapshotContent(durationWeeks, items.ToArray()));
+    }
+
+    /// <summary>
+    /// Snapshots stored before the plan length was frozen are a bare item array; they read with DurationWeeks null
+    /// </summary>
+    public static ProposalSnapshotContent Read(string? json)
+    {
+        if (string.IsNullOrEmpty(json))
+            return Empty;
+
+        if (json.TrimStart().StartsWith('['))
+            return new ProposalSnapshotContent(null, JsonSerializer.Deserialize<ProposalSnapshotItem[]>(json) ?? Array.Empty<ProposalSnapshotItem>());
+
+        var content = JsonSerializer.Deserialize<ProposalSnapshotContent>(json);
+        return content == null ? Empty : content with { Items = content.Items ?? Array.Empty<ProposalSnapshotItem>() };
+    }
+
+    public static ProposalSnapshotItem[] Parse(string? json)
+    {
+        return Read(json).Items;
+    }
+}
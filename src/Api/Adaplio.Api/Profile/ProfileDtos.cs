@@ -133,6 +133,14 @@ public record PresignUploadResponse(
     string PublicUrl
 );
 
+public record UploadStatusResponse(
+    string Key,
+    long ReceivedBytes,
+    long? TotalBytes,
+    bool Complete,
+    string? Sha256
+);
+
 // Validation attributes
 public class PhoneAttribute : ValidationAttribute
 {
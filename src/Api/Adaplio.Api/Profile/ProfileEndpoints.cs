@@ -1,7 +1,10 @@
 using Adaplio.Api.Data;
 using Adaplio.Api.Domain;
 using Adaplio.Api.Services;
+using Microsoft.AspNetCore.WebUtilities;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Primitives;
+using Microsoft.Net.Http.Headers;
 using System.Security.Claims;
 using System.Text.Json;
 
@@ -26,6 +29,8 @@ public static void MapProfileEndpoints(this WebApplication app)
         var uploadGroup = app.MapGroup("/api/uploads").WithTags("Uploads").RequireAuthorization();
         uploadGroup.MapPost("/presign", GetPresignedUploadUrl);
         uploadGroup.MapPost("/upload", HandleFileUpload).AllowAnonymous(); // Allow anonymous for pre-signed uploads
+        uploadGroup.MapPut("/upload", HandleChunkUpload).AllowAnonymous(); // Raw body, optionally in Content-Range chunks
+        uploadGroup.MapGet("/upload", GetUploadStatus).AllowAnonymous(); // Resume point for chunked uploads
         uploadGroup.MapGet("/files/{*filePath}", ServeFile).AllowAnonymous(); // Allow anonymous for serving files
     }
 
@@ -283,32 +288,35 @@ public static void MapProfileEndpoints(this WebApplication app)
             if (string.IsNullOrEmpty(uploadKey) || string.IsNullOrEmpty(token))
                 return Results.BadRequest("Missing upload key or token");
 
-            if (!context.Request.HasFormContentType)
-                return Results.BadRequest("Request must be multipart/form-data");
-
-            var form = await context.Request.ReadFormAsync();
-            var file = form.Files.FirstOrDefault();
+            var boundary = context.Request.HasFormContentType
+                ? HeaderUtilities.RemoveQuotes(MediaTypeHeaderValue.Parse(context.Request.ContentType).Boundary).Value
+                : null;
 
-            if (file == null || file.Length == 0)
-                return Results.BadRequest("No file provided");
+            if (string.IsNullOrEmpty(boundary))
+                return Results.BadRequest("Request must be multipart/form-data");
 
-            // Cast to UploadService to access the HandleFileUploadAsync method
-            if (uploadService is UploadService concreteUploadService)
+            // Stream the first file section to storage instead of buffering the whole form
+            var reader = new MultipartReader(boundary, context.Request.Body);
+            MultipartSection? section;
+            while ((section = await reader.ReadNextSectionAsync(context.RequestAborted)) != null)
             {
-                var success = await concreteUploadService.HandleFileUploadAsync(
+                if (!ContentDispositionHeaderValue.TryParse(section.ContentDisposition, out var disposition) ||
+                    (StringSegment.IsNullOrEmpty(disposition.FileName) && StringSegment.IsNullOrEmpty(disposition.FileNameStar)))
+                    continue;
+
+                var result = await uploadService.AppendChunkAsync(
                     uploadKey,
                     token,
-                    file.OpenReadStream(),
-                    file.ContentType
+                    section.Body,
+                    offset: 0,
+                    totalBytes: null,
+                    cancellationToken: context.RequestAborted
                 );
 
-                if (success)
-                    return Results.Ok(new { message = "File uploaded successfully" });
-                else
-                    return Results.BadRequest("Upload failed");
+                return ToUploadResult(uploadKey, result);
             }
 
-            return Results.Problem("Upload service not available");
+            return Results.BadRequest("No file provided");
         }
         catch (Exception ex)
         {
@@ -316,29 +324,111 @@ public static void MapProfileEndpoints(this WebApplication app)
         }
     }
 
-    private static async Task<IResult> ServeFile(
-        string filePath,
-        HttpContext context)
+    private static async Task<IResult> HandleChunkUpload(
+        HttpContext context,
+        IUploadService uploadService)
     {
         try
         {
-            var uploadsPath = Path.Combine(Directory.GetCurrentDirectory(), "uploads");
-            var fullPath = Path.Combine(uploadsPath, filePath);
+            var uploadKey = context.Request.Query["key"].ToString();
+            var token = context.Request.Query["token"].ToString();
 
-            // Security check: ensure the path is within the uploads directory
-            var uploadsFullPath = Path.GetFullPath(uploadsPath);
-            var requestedFullPath = Path.GetFullPath(fullPath);
+            if (string.IsNullOrEmpty(uploadKey) || string.IsNullOrEmpty(token))
+                return Results.BadRequest("Missing upload key or token");
 
-            if (!requestedFullPath.StartsWith(uploadsFullPath))
-                return Results.NotFound();
+            // Without Content-Range the body is the whole file
+            long offset = 0;
+            var totalBytes = context.Request.ContentLength;
 
-            if (!File.Exists(fullPath))
-                return Results.NotFound();
+            var contentRange = context.Request.Headers.ContentRange.ToString();
+            if (!string.IsNullOrEmpty(contentRange))
+            {
+                if (!ContentRangeHeaderValue.TryParse(contentRange, out var range) || !range.HasRange || !range.HasLength ||
+                    (context.Request.ContentLength is long length && length != range.To - range.From + 1))
+                    return Results.BadRequest("Content-Range must be 'bytes start-end/total' and match the body length");
+
+                offset = range.From!.Value;
+                totalBytes = range.Length;
+            }
+
+            var checksum = context.Request.Headers["X-Upload-Sha256"].ToString();
+
+            var result = await uploadService.AppendChunkAsync(
+                uploadKey,
+                token,
+                context.Request.Body,
+                offset,
+                totalBytes,
+                string.IsNullOrEmpty(checksum) ? null : checksum,
+                context.RequestAborted
+            );
+
+            return ToUploadResult(uploadKey, result);
+        }
+        catch (Exception ex)
+        {
+            return Results.Problem("Upload failed");
+        }
+    }
 
-            var contentType = GetContentTypeFromExtension(Path.GetExtension(fullPath));
-            var fileStream = new FileStream(fullPath, FileMode.Open, FileAccess.Read);
+    private static async Task<IResult> GetUploadStatus(
+        HttpContext context,
+        IUploadService uploadService)
+    {
+        var uploadKey = context.Request.Query["key"].ToString();
+        var token = context.Request.Query["token"].ToString();
+
+        if (string.IsNullOrEmpty(uploadKey) || string.IsNullOrEmpty(token))
+            return Results.BadRequest("Missing upload key or token");
 
-            return Results.File(fileStream, contentType);
+        var result = await uploadService.GetUploadStatusAsync(uploadKey, token, context.RequestAborted);
+        return ToUploadResult(uploadKey, result);
+    }
+
+    private static IResult ToUploadResult(string uploadKey, UploadChunkResult result)
+    {
+        var response = new UploadStatusResponse(
+            Key: uploadKey,
+            ReceivedBytes: result.ReceivedBytes,
+            TotalBytes: result.TotalBytes,
+            Complete: result.Status == UploadChunkStatus.Completed,
+            Sha256: result.Sha256
+        );
+
+        return result.Status switch
+        {
+            UploadChunkStatus.InvalidToken => Results.BadRequest("Invalid or expired upload token"),
+            UploadChunkStatus.OffsetMismatch => Results.Conflict(response), // Client resumes from ReceivedBytes
+            UploadChunkStatus.TooLarge => Results.StatusCode(StatusCodes.Status413PayloadTooLarge),
+            UploadChunkStatus.ChecksumMismatch => Results.UnprocessableEntity(response),
+            _ => Results.Ok(response)
+        };
+    }
+
+    private static async Task<IResult> ServeFile(
+        string filePath,
+        HttpContext context,
+        IUploadService uploadService)
+    {
+        try
+        {
+            // Keys are published escaped as a single segment (avatars%2F2025%2F...)
+            var file = await uploadService.GetFileAsync(Uri.UnescapeDataString(filePath), context.RequestAborted);
+            if (file == null)
+                return Results.NotFound();
+
+            if (file.RedirectUrl != null)
+                return Results.Redirect(file.RedirectUrl);
+
+            // A physical path lets Kestrel use sendfile (SecurityAuditMiddleware leaves downloads unwrapped), and the
+            // result handles Range, If-Range, If-None-Match and If-Modified-Since (206 / 304) from the validators given here
+            return Results.File(
+                file.PhysicalPath!,
+                GetContentTypeFromExtension(Path.GetExtension(file.Key)),
+                lastModified: file.LastModified,
+                entityTag: EntityTagHeaderValue.Parse(file.ETag),
+                enableRangeProcessing: true
+            );
         }
         catch
         {
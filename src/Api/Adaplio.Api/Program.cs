@@ -2,17 +2,19 @@
 using Adaplio.Api.Auth;
 using Adaplio.Api.Data;
 using Adaplio.Api.Dev;
+using Adaplio.Api.Exercises;
 using Adaplio.Api.Gamification;
 using Adaplio.Api.Middleware;
 using Adaplio.Api.Plans;
 using Adaplio.Api.Profile;
 using Adaplio.Api.Progress;
 using Adaplio.Api.Services;
+using Amazon.Runtime;
+using Amazon.S3;
 using AspNetCoreRateLimit;
 using Microsoft.AspNetCore.Authentication.JwtBearer;
 using Microsoft.EntityFrameworkCore;
-using Microsoft.IdentityModel.Tokens;
-using System.Text;
+using StackExchange.Redis;
 using System.Net;
 using System.Net.Sockets;
 
@@ -57,25 +59,42 @@
 });
 
 // Add authentication services
-builder.Services.AddScoped<IJwtService, JwtService>();
+builder.Services.AddSingleton<JwtValidationCache>();
+builder.Services.AddSingleton<IJwtService, JwtService>();
 builder.Services.AddScoped<IRefreshTokenService, RefreshTokenService>();
+builder.Services.AddSingleton<IPasswordHasher, PasswordHasher>();
 
 // Add HTTP clients with proper service registration
 builder.Services.AddHttpClient<IEmailService, EmailService>();
 builder.Services.AddHttpClient<ISMSService, SMSService>();
+builder.Services.AddScoped<IOutboxService, OutboxService>();
 builder.Services.AddScoped<IAliasService, AliasService>();
 builder.Services.AddScoped<IProgressService, ProgressService>();
 builder.Services.AddScoped<IPlanService, PlanService>();
+builder.Services.AddScoped<ITrainerRosterService, TrainerRosterService>();
 builder.Services.AddScoped<IGamificationService, GamificationService>();
 builder.Services.AddScoped<IUploadService, UploadService>();
+builder.Services.AddSingleton<UploadSessionStore>();
 builder.Services.AddScoped<IAuditService, AuditService>();
 builder.Services.AddScoped<IInputSanitizer, InputSanitizer>();
+builder.Services.AddSingleton<SecurityEventWindow>();
 builder.Services.AddScoped<ISecurityMonitoringService, SecurityMonitoringService>();
 builder.Services.AddScoped<IInviteService, MockInviteService>();
+builder.Services.AddSingleton<IClientReadCache, ClientReadCache>();
+builder.Services.AddSingleton<ExerciseNameCache>();
+builder.Services.AddSingleton<ExerciseSearchIndex>();
+builder.Services.AddSingleton<SecurityAuditQueue>();
+builder.Services.AddSingleton<AnalyticsIngestQueue>();
+
+// Background jobs
+builder.Services.AddHostedService<AdherenceRecomputeService>();
+builder.Services.AddHostedService<RefreshTokenCleanupService>();
+builder.Services.AddHostedService<SecurityAuditWriter>();
+builder.Services.AddHostedService<AnalyticsIngestWriter>();
+builder.Services.AddHostedService<OutboxDispatcher>();
+builder.Services.AddHostedService<OutboxCleanupService>();
 
 // Add JWT authentication
-var jwtSecret = builder.Configuration["Jwt:Secret"] ?? "your-256-bit-secret-key-here-make-it-long-enough-for-security";
-var key = Encoding.ASCII.GetBytes(jwtSecret);
 
 builder.Services.AddAuthentication(options =>
 {
@@ -84,17 +103,7 @@
 })
 .AddJwtBearer(options =>
 {
-    options.TokenValidationParameters = new TokenValidationParameters
-    {
-        ValidateIssuerSigningKey = true,
-        IssuerSigningKey = new SymmetricSecurityKey(key),
-        ValidateIssuer = true,
-        ValidIssuer = builder.Configuration["Jwt:Issuer"] ?? "adaplio-api",
-        ValidateAudience = true,
-        ValidAudience = builder.Configuration["Jwt:Audience"] ?? "adaplio-frontend",
-        ValidateLifetime = true,
-        ClockSkew = TimeSpan.Zero
-    };
+    options.TokenValidationParameters = JwtService.CreateValidationParameters(builder.Configuration);
 
     // Read token from Authorization header or HttpOnly cookie
     options.Events = new JwtBearerEvents
@@ -113,6 +122,21 @@
                 context.Token = context.Request.Cookies["auth_token"];
             }
 
+            // Validate through JwtService so repeat requests hit its cache and revoked users are rejected
+            if (!string.IsNullOrEmpty(context.Token))
+            {
+                var principal = context.HttpContext.RequestServices.GetRequiredService<IJwtService>().ValidateToken(context.Token);
+                if (principal == null)
+                {
+                    context.Fail("Invalid, expired or revoked token");
+                }
+                else
+                {
+                    context.Principal = principal;
+                    context.Success();
+                }
+            }
+
             return Task.CompletedTask;
         }
     };
@@ -136,6 +160,7 @@
               .AllowAnyMethod()
               .AllowAnyHeader()
               .AllowCredentials()
+              .WithExposedHeaders("ETag")
               .SetPreflightMaxAge(TimeSpan.FromMinutes(10));
     });
 });
@@ -146,6 +171,37 @@
 builder.Services.AddInMemoryRateLimiting();
 builder.Services.AddSingleton<IRateLimitConfiguration, RateLimitConfiguration>();
 
+// Security rate limits: share counters through Redis when configured so limits hold across instances
+var rateLimitRedis = Environment.GetEnvironmentVariable("RATE_LIMIT_REDIS") ?? builder.Configuration["RateLimiting:Redis"];
+if (!string.IsNullOrEmpty(rateLimitRedis))
+{
+    var redisOptions = ConfigurationOptions.Parse(rateLimitRedis);
+    redisOptions.AbortOnConnectFail = false;
+    builder.Services.AddSingleton<IConnectionMultiplexer>(_ => ConnectionMultiplexer.Connect(redisOptions));
+    builder.Services.AddSingleton<IRateLimitStore, RedisRateLimitStore>();
+}
+else
+{
+    builder.Services.AddSingleton<IRateLimitStore, InMemoryRateLimitStore>();
+}
+
+// Upload storage: an S3-compatible bucket (AWS, MinIO) when configured, otherwise local disk
+if (builder.Configuration["Upload:Storage"]?.Equals("s3", StringComparison.OrdinalIgnoreCase) == true)
+{
+    builder.Services.AddSingleton<IAmazonS3>(_ => new AmazonS3Client(
+        new BasicAWSCredentials(builder.Configuration["Upload:S3:AccessKey"], builder.Configuration["Upload:S3:SecretKey"]),
+        new AmazonS3Config
+        {
+            ServiceURL = builder.Configuration["Upload:S3:ServiceUrl"] ?? "https://s3.amazonaws.com",
+            ForcePathStyle = true // Required by MinIO and most self-hosted S3 stand-ins
+        }));
+    builder.Services.AddSingleton<IFileStorage, S3FileStorage>();
+}
+else
+{
+    builder.Services.AddSingleton<IFileStorage, LocalFileStorage>();
+}
+
 // Add HttpContextAccessor for audit logging
 builder.Services.AddHttpContextAccessor();
 
@@ -421,6 +477,9 @@
 // Map plan endpoints
 app.MapPlanEndpoints();
 
+// Map exercise library endpoints
+app.MapExerciseEndpoints();
+
 // Map gamification endpoints
 app.MapGamificationEndpoints();
 
@@ -430,6 +489,12 @@
 // Map profile endpoints
 app.MapProfileEndpoints();
 
+// Map development-only seeding endpoints
+if (app.Environment.IsDevelopment())
+{
+    app.MapDevEndpoints();
+}
+
 // Map controller routes
 app.MapControllers();
 
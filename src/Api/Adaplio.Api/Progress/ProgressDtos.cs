@@ -21,6 +21,36 @@ public record LogProgressResponse(
     CelebrationData? Celebration
 );
 
+// Batch progress logging (offline sync)
+public record LogProgressBatchItem(
+    [Required] int ExerciseInstanceId,
+    [Required] string EventType,
+    int? SetsCompleted,
+    int? RepsCompleted,
+    int? HoldSecondsCompleted,
+    int? DifficultyRating,
+    int? PainLevel,
+    string? Notes,
+    DateTimeOffset? LoggedAt // When the client logged it offline; defaults to now, clamped to Progress:MaxBackdateDays and the plan start
+);
+
+public record LogProgressBatchRequest(
+    [Required] LogProgressBatchItem[] Events
+);
+
+public record LogProgressBatchResult(
+    int Index,
+    int ProgressEventId,
+    CelebrationData? Celebration
+);
+
+public record LogProgressBatchResponse(
+    string Message,
+    int LoggedCount,
+    int TotalXpAwarded,
+    LogProgressBatchResult[] Results
+);
+
 // Adherence summary responses
 public record WeeklyAdherence(
     int Year,
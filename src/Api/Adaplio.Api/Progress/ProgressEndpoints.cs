@@ -11,6 +11,8 @@ namespace Adaplio.Api.Progress;
 
 public static class ProgressEndpoints
 {
+    private const int MaxProgressBatchSize = 200;
+
     public static void MapProgressEndpoints(this WebApplication app)
     {
         var progressGroup = app.MapGroup("/api").WithTags("Progress & Adherence");
@@ -20,6 +22,10 @@ public static void MapProgressEndpoints(this WebApplication app)
             .RequireAuthorization()
             .WithName("LogProgress");
 
+        progressGroup.MapPost("/client/progress/batch", LogProgressBatch)
+            .RequireAuthorization()
+            .WithName("LogProgressBatch");
+
         progressGroup.MapGet("/client/progress/summary", GetClientAdherenceSummary)
             .RequireAuthorization()
             .WithName("GetClientAdherenceSummary");
@@ -39,6 +45,7 @@ public static void MapProgressEndpoints(this WebApplication app)
         AppDbContext context,
         IProgressService progressService,
         IGamificationService gamificationService,
+        IClientReadCache cache,
         HttpContext httpContext)
     {
         try
@@ -96,31 +103,19 @@ public static void MapProgressEndpoints(this WebApplication app)
             context.ProgressEvents.Add(progressEvent);
             await context.SaveChangesAsync();
 
-            // Update adherence for the week this exercise belongs to
-            var currentDate = DateOnly.FromDateTime(DateTime.Now);
-            var weekStart = GetWeekStart(currentDate);
-            await progressService.UpdateAdherenceWeekAsync(clientProfile.Id, weekStart);
+            // Apply this event to the week's adherence counters
+            await progressService.ApplyProgressEventAsync(progressEvent);
 
             // Award XP and check for celebrations (idempotent)
             var gamificationResult = await gamificationService.AwardXpForProgressAsync(progressEvent.Id, clientProfile.Id);
 
-            // Create celebration data if there are rewards
-            CelebrationData? celebration = null;
-            if (gamificationResult.XpAwarded > 0 || gamificationResult.NewBadges.Count > 0)
-            {
-                celebration = new CelebrationData(
-                    gamificationResult.XpAwarded,
-                    gamificationResult.LeveledUp,
-                    gamificationResult.LeveledUp ? gamificationResult.CurrentLevel : null,
-                    gamificationResult.NewBadges.Select(b => new BadgeDto(b.Id, b.Name, b.Description, b.Icon, b.Color, b.Rarity, b.EarnedAt)).ToArray(),
-                    gamificationResult.CurrentStreak
-                );
-            }
+            // Board and gamification reads are stale now
+            cache.InvalidateClient(clientProfile.Id);
 
             return Results.Ok(new LogProgressResponse(
                 "Progress logged successfully",
                 progressEvent.Id,
-                celebration
+                BuildCelebration(gamificationResult)
             ));
         }
         catch (Exception)
@@ -129,6 +124,153 @@ public static void MapProgressEndpoints(this WebApplication app)
         }
     }
 
+    private static async Task<IResult> LogProgressBatch(
+        LogProgressBatchRequest request,
+        AppDbContext context,
+        IProgressService progressService,
+        IGamificationService gamificationService,
+        IClientReadCache cache,
+        IConfiguration configuration,
+        HttpContext httpContext)
+    {
+        try
+        {
+            var userId = httpContext.User.FindFirst(ClaimTypes.NameIdentifier)?.Value;
+            var userType = httpContext.User.FindFirst("user_type")?.Value;
+
+            if (string.IsNullOrEmpty(userId) || userType != "client")
+            {
+                return Results.Forbid();
+            }
+
+            if (request.Events == null || request.Events.Length == 0)
+            {
+                return Results.BadRequest("Events must contain at least one progress event");
+            }
+
+            if (request.Events.Length > MaxProgressBatchSize)
+            {
+                return Results.BadRequest($"A batch may contain at most {MaxProgressBatchSize} progress events");
+            }
+
+            var validEventTypes = new[] { "exercise_completed", "set_completed", "session_completed" };
+            var invalidIndex = Array.FindIndex(request.Events, e => !validEventTypes.Contains(e.EventType));
+            if (invalidIndex >= 0)
+            {
+                return Results.BadRequest($"Events[{invalidIndex}]: EventType must be 'exercise_completed', 'set_completed', or 'session_completed'");
+            }
+
+            // Get client profile
+            var clientProfile = await context.ClientProfiles
+                .FirstOrDefaultAsync(cp => cp.UserId == int.Parse(userId));
+
+            if (clientProfile == null)
+            {
+                return Results.NotFound("Client profile not found");
+            }
+
+            // Verify every exercise instance belongs to this client in one query
+            var requestedIds = request.Events.Select(e => e.ExerciseInstanceId).Distinct().ToList();
+            var planStarts = await context.ExerciseInstances
+                .Where(ei => requestedIds.Contains(ei.Id) &&
+                             ei.PlanInstance.ClientProfileId == clientProfile.Id)
+                .Select(ei => new { ei.Id, ei.PlanInstance.StartDate })
+                .ToDictionaryAsync(ei => ei.Id, ei => ei.StartDate);
+
+            if (planStarts.Count != requestedIds.Count)
+            {
+                var inaccessibleId = requestedIds.First(id => !planStarts.ContainsKey(id));
+                return Results.NotFound($"Exercise instance {inaccessibleId} not found or not accessible");
+            }
+
+            // Offline logs keep their original time, but never a future one, nothing older than the sync
+            // window and nothing before the plan started, so a batch cannot rewrite past streaks or weeks
+            var now = DateTimeOffset.UtcNow;
+            var syncWindowStart = now.AddDays(-configuration.GetValue("Progress:MaxBackdateDays", 3));
+            var progressEvents = request.Events.Select(e => new ProgressEvent
+            {
+                ExerciseInstanceId = e.ExerciseInstanceId,
+                ClientProfileId = clientProfile.Id,
+                EventType = e.EventType,
+                SetsCompleted = e.SetsCompleted,
+                RepsCompleted = e.RepsCompleted,
+                HoldSecondsCompleted = e.HoldSecondsCompleted,
+                DifficultyRating = e.DifficultyRating,
+                PainLevel = e.PainLevel,
+                Notes = e.Notes,
+                LoggedAt = ClampLoggedAt(e.LoggedAt, now, syncWindowStart, planStarts[e.ExerciseInstanceId])
+            }).ToList();
+
+            IReadOnlyList<GamificationResult> gamificationResults;
+
+            using (var transaction = await context.Database.BeginTransactionAsync())
+            {
+                context.ProgressEvents.AddRange(progressEvents);
+                await context.SaveChangesAsync();
+
+                // Apply the events to the affected weeks' adherence counters
+                await progressService.ApplyProgressEventsAsync(progressEvents);
+
+                // Award XP, streaks and badges in one pass (idempotent per progress event)
+                gamificationResults = await gamificationService.AwardXpForProgressBatchAsync(
+                    progressEvents.Select(pe => pe.Id).ToList(), clientProfile.Id);
+
+                await transaction.CommitAsync();
+            }
+
+            cache.InvalidateClient(clientProfile.Id);
+
+            var results = progressEvents
+                .Select((pe, index) => new LogProgressBatchResult(index, pe.Id, BuildCelebration(gamificationResults[index])))
+                .ToArray();
+
+            return Results.Ok(new LogProgressBatchResponse(
+                "Progress logged successfully",
+                results.Length,
+                gamificationResults.Sum(r => r.XpAwarded),
+                results
+            ));
+        }
+        catch (Exception)
+        {
+            return Results.Problem("Failed to log progress. Please try again.");
+        }
+    }
+
+    private static DateTimeOffset ClampLoggedAt(DateTimeOffset? loggedAt, DateTimeOffset now, DateTimeOffset syncWindowStart, DateOnly planStart)
+    {
+        if (!loggedAt.HasValue || loggedAt.Value > now)
+        {
+            return now;
+        }
+
+        var planStartedAt = new DateTimeOffset(planStart.ToDateTime(TimeOnly.MinValue), TimeSpan.Zero);
+        var earliest = planStartedAt > syncWindowStart ? planStartedAt : syncWindowStart;
+        if (earliest > now)
+        {
+            return now;
+        }
+
+        return loggedAt.Value < earliest ? earliest : loggedAt.Value;
+    }
+
+    private static CelebrationData? BuildCelebration(GamificationResult gamificationResult)
+    {
+        // Only celebrate when there are rewards
+        if (gamificationResult.XpAwarded == 0 && gamificationResult.NewBadges.Count == 0)
+        {
+            return null;
+        }
+
+        return new CelebrationData(
+            gamificationResult.XpAwarded,
+            gamificationResult.LeveledUp,
+            gamificationResult.LeveledUp ? gamificationResult.CurrentLevel : null,
+            gamificationResult.NewBadges.Select(b => new BadgeDto(b.Id, b.Name, b.Description, b.Icon, b.Color, b.Rarity, b.EarnedAt)).ToArray(),
+            gamificationResult.CurrentStreak
+        );
+    }
+
     private static async Task<IResult> GetClientAdherenceSummary(
         AppDbContext context,
         IProgressService progressService,
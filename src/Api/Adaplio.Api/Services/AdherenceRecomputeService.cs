@@ -0,0 +1,54 @@
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Periodically recounts recent adherence weeks from source data. Progress logging only
+/// applies deltas, so this corrects drift from concurrent writes or plan changes.
+/// </summary>
+public class AdherenceRecomputeService : BackgroundService
+{
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly ILogger<AdherenceRecomputeService> _logger;
+    private readonly TimeSpan _interval;
+    private readonly int _lookbackWeeks;
+
+    public AdherenceRecomputeService(
+        IServiceScopeFactory scopeFactory,
+        IConfiguration configuration,
+        ILogger<AdherenceRecomputeService> logger)
+    {
+        _scopeFactory = scopeFactory;
+        _logger = logger;
+        _interval = TimeSpan.FromMinutes(configuration.GetValue("Adherence:RecomputeIntervalMinutes", 60));
+        _lookbackWeeks = configuration.GetValue("Adherence:RecomputeLookbackWeeks", 4);
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        using var timer = new PeriodicTimer(_interval);
+
+        while (await timer.WaitForNextTickAsync(stoppingToken))
+        {
+            try
+            {
+                using var scope = _scopeFactory.CreateScope();
+                var progressService = scope.ServiceProvider.GetRequiredService<IProgressService>();
+
+                var since = DateOnly.FromDateTime(DateTime.UtcNow.AddDays(-7 * _lookbackWeeks));
+                var corrected = await progressService.RecomputeAdherenceWeeksAsync(since, stoppingToken);
+
+                if (corrected > 0)
+                {
+                    _logger.LogWarning("Adherence recompute corrected {Count} drifted weeks since {Since}", corrected, since);
+                }
+            }
+            catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+            {
+                break;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Adherence recompute failed");
+            }
+        }
+    }
+}
@@ -0,0 +1,90 @@
+using System.Threading.Channels;
+using Adaplio.Api.Domain;
+
+namespace Adaplio.Api.Services;
+
+public record AnalyticsIngestStats(
+    long Received,
+    long Accepted,
+    long Rejected,
+    long Written,
+    long Dropped,
+    long Flushes,
+    int Pending,
+    int Capacity
+);
+
+/// <summary>
+/// Hand-off between the analytics endpoints and AnalyticsIngestWriter. Batches are admitted whole or not at
+/// all: when fewer than the batch's worth of slots are free out of Analytics:QueueCapacity the batch is
+/// rejected and counted, and the caller is told to back off. Accepted events that later fail to persist
+/// are counted as dropped.
+/// </summary>
+public sealed class AnalyticsIngestQueue
+{
+    private readonly Channel<AnalyticsEvent> _channel;
+    private readonly int _capacity;
+    private readonly object _admissionLock = new();
+
+    private long _received;
+    private long _accepted;
+    private long _rejected;
+    private long _written;
+    private long _dropped;
+    private long _flushes;
+
+    public AnalyticsIngestQueue(IConfiguration configuration)
+    {
+        _capacity = Math.Max(1, configuration.GetValue("Analytics:QueueCapacity", 50000));
+        _channel = Channel.CreateBounded<AnalyticsEvent>(new BoundedChannelOptions(_capacity)
+        {
+            SingleReader = true,
+            FullMode = BoundedChannelFullMode.Wait // TryWrite fails instead of waiting
+        });
+    }
+
+    public ChannelReader<AnalyticsEvent> Reader => _channel.Reader;
+
+    public bool TryEnqueue(IReadOnlyList<AnalyticsEvent> events)
+    {
+        Interlocked.Add(ref _received, events.Count);
+
+        // The reader only ever frees slots, so a batch that fits while the lock is held is written in full
+        lock (_admissionLock)
+        {
+            if (_capacity - _channel.Reader.Count < events.Count)
+            {
+                Interlocked.Add(ref _rejected, events.Count);
+                return false;
+            }
+
+            foreach (var analyticsEvent in events)
+            {
+                _channel.Writer.TryWrite(analyticsEvent);
+            }
+        }
+
+        Interlocked.Add(ref _accepted, events.Count);
+        return true;
+    }
+
+    public void MarkFlushed(int written, int dropped)
+    {
+        Interlocked.Add(ref _written, written);
+        Interlocked.Add(ref _dropped, dropped);
+        Interlocked.Increment(ref _flushes);
+    }
+
+    public AnalyticsIngestStats GetStats()
+    {
+        return new AnalyticsIngestStats(
+            Interlocked.Read(ref _received),
+            Interlocked.Read(ref _accepted),
+            Interlocked.Read(ref _rejected),
+            Interlocked.Read(ref _written),
+            Interlocked.Read(ref _dropped),
+            Interlocked.Read(ref _flushes),
+            _channel.Reader.Count,
+            _capacity);
+    }
+}
@@ -0,0 +1,131 @@
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Drains AnalyticsIngestQueue into the append-only analytics_event table. A batch is flushed once it holds
+/// Analytics:FlushBatchSize events or Analytics:FlushIntervalMs after its first event arrived, whichever
+/// comes first. Failed inserts are retried before the batch is counted as dropped; events still queued at
+/// shutdown are flushed before the service stops.
+/// </summary>
+public class AnalyticsIngestWriter : BackgroundService
+{
+    private const int MaxWriteAttempts = 3;
+
+    private readonly AnalyticsIngestQueue _queue;
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly ILogger<AnalyticsIngestWriter> _logger;
+    private readonly int _batchSize;
+    private readonly TimeSpan _flushInterval;
+
+    public AnalyticsIngestWriter(
+        AnalyticsIngestQueue queue,
+        IServiceScopeFactory scopeFactory,
+        IConfiguration configuration,
+        ILogger<AnalyticsIngestWriter> logger)
+    {
+        _queue = queue;
+        _scopeFactory = scopeFactory;
+        _logger = logger;
+        _batchSize = Math.Max(1, configuration.GetValue("Analytics:FlushBatchSize", 1000));
+        _flushInterval = TimeSpan.FromMilliseconds(Math.Max(1, configuration.GetValue("Analytics:FlushIntervalMs", 1000)));
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        var batch = new List<AnalyticsEvent>(_batchSize);
+
+        try
+        {
+            while (await _queue.Reader.WaitToReadAsync(stoppingToken))
+            {
+                await FillBatchAsync(batch, stoppingToken);
+                await FlushAsync(batch);
+            }
+        }
+        catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+        {
+            // Shutting down: flush the partial batch and whatever is already queued
+            do
+            {
+                while (batch.Count < _batchSize && _queue.Reader.TryRead(out var analyticsEvent))
+                {
+                    batch.Add(analyticsEvent);
+                }
+                await FlushAsync(batch);
+            }
+            while (_queue.Reader.Count > 0);
+        }
+    }
+
+    private async Task FillBatchAsync(List<AnalyticsEvent> batch, CancellationToken stoppingToken)
+    {
+        using var deadline = CancellationTokenSource.CreateLinkedTokenSource(stoppingToken);
+        deadline.CancelAfter(_flushInterval);
+
+        while (true)
+        {
+            while (batch.Count < _batchSize && _queue.Reader.TryRead(out var analyticsEvent))
+            {
+                batch.Add(analyticsEvent);
+            }
+
+            if (batch.Count >= _batchSize)
+            {
+                return;
+            }
+
+            try
+            {
+                if (!await _queue.Reader.WaitToReadAsync(deadline.Token))
+                {
+                    return;
+                }
+            }
+            catch (OperationCanceledException) when (!stoppingToken.IsCancellationRequested)
+            {
+                return; // Flush interval elapsed
+            }
+        }
+    }
+
+    private async Task FlushAsync(List<AnalyticsEvent> batch)
+    {
+        if (batch.Count == 0)
+        {
+            return;
+        }
+
+        for (var attempt = 1; ; attempt++)
+        {
+            try
+            {
+                // Fresh scope per attempt so a failed insert leaves nothing tracked behind
+                using var scope = _scopeFactory.CreateScope();
+                var context = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+                context.ChangeTracker.AutoDetectChangesEnabled = false;
+
+                context.AnalyticsEvents.AddRange(batch);
+                // Not cancellable: a batch that has left the queue is written even during shutdown
+                await context.SaveChangesAsync();
+
+                _queue.MarkFlushed(batch.Count, 0);
+                break;
+            }
+            catch (Exception ex) when (attempt < MaxWriteAttempts)
+            {
+                _logger.LogWarning(ex, "Analytics flush of {Count} events failed (attempt {Attempt}), retrying", batch.Count, attempt);
+                await Task.Delay(TimeSpan.FromMilliseconds(200 * attempt));
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Dropping {Count} analytics events after {Attempts} failed flushes", batch.Count, attempt);
+                _queue.MarkFlushed(0, batch.Count);
+                break;
+            }
+        }
+
+        batch.Clear();
+    }
+}
@@ -0,0 +1,145 @@
+using System.Buffers;
+using System.Text;
+using System.Text.Json;
+using System.Text.RegularExpressions;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Redacts captured body prefixes for the security audit log. JSON is rewritten token by token,
+/// so a prefix cut off mid-document is still redacted up to the cut; anything else has
+/// email/phone/SSN patterns masked.
+/// </summary>
+public static class AuditBodyRedactor
+{
+    public const string Redacted = "***REDACTED***";
+    public const string TruncatedMarker = "...";
+
+    private static readonly string[] SensitiveFields =
+    {
+        "password", "token", "secret", "key", "auth", "credential",
+        "ssn", "social", "dob", "dateofbirth", "birthdate",
+        "medicalrecord", "diagnosis", "medication", "allergy",
+        "phonenumber", "phone", "email", "address", "zip", "postal",
+        "creditcard", "payment", "bank", "account"
+    };
+
+    private static readonly Regex EmailPattern = new(@"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", RegexOptions.Compiled);
+    private static readonly Regex PhonePattern = new(@"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b", RegexOptions.Compiled);
+    private static readonly Regex SsnPattern = new(@"\b\d{3}-?\d{2}-?\d{4}\b", RegexOptions.Compiled);
+
+    public static string? Redact(AuditCapture capture)
+    {
+        return capture.TotalBytes == 0 ? null : Redact(capture.Span, capture.Truncated);
+    }
+
+    public static string Redact(ReadOnlySpan<byte> body, bool truncated)
+    {
+        if (body.IsEmpty)
+        {
+            return truncated ? TruncatedMarker : "";
+        }
+
+        string redacted;
+        try
+        {
+            redacted = RedactJson(body, truncated);
+        }
+        catch (JsonException)
+        {
+            // Not JSON, just mask potential sensitive patterns
+            redacted = MaskSensitivePatterns(Encoding.UTF8.GetString(body));
+        }
+
+        return truncated ? redacted + TruncatedMarker : redacted;
+    }
+
+    public static bool IsSensitiveField(string fieldName)
+    {
+        foreach (var field in SensitiveFields)
+        {
+            if (fieldName.Contains(field, StringComparison.OrdinalIgnoreCase))
+            {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    public static string MaskSensitivePatterns(string input)
+    {
+        if (string.IsNullOrEmpty(input))
+            return input;
+
+        input = EmailPattern.Replace(input, "***EMAIL***");
+        input = PhonePattern.Replace(input, "***PHONE***");
+        input = SsnPattern.Replace(input, "***SSN***");
+        return input;
+    }
+
+    private static string RedactJson(ReadOnlySpan<byte> body, bool truncated)
+    {
+        // A truncated prefix is not a final block: the reader stops at the cut instead of throwing
+        var reader = new Utf8JsonReader(body, isFinalBlock: !truncated, state: default);
+        var output = new ArrayBufferWriter<byte>(body.Length + 64);
+        var skipDepth = -1; // Depth of a redacted object/array value whose tokens are being skipped
+
+        using (var writer = new Utf8JsonWriter(output, new JsonWriterOptions { SkipValidation = true }))
+        {
+            while (reader.Read())
+            {
+                if (skipDepth >= 0)
+                {
+                    if ((reader.TokenType is JsonTokenType.EndObject or JsonTokenType.EndArray) && reader.CurrentDepth == skipDepth)
+                    {
+                        skipDepth = -1;
+                    }
+                    continue;
+                }
+
+                switch (reader.TokenType)
+                {
+                    case JsonTokenType.PropertyName:
+                        var name = reader.GetString()!;
+                        writer.WritePropertyName(name);
+                        if (IsSensitiveField(name))
+                        {
+                            writer.WriteStringValue(Redacted);
+                            if (reader.Read() && (reader.TokenType is JsonTokenType.StartObject or JsonTokenType.StartArray))
+                            {
+                                skipDepth = reader.CurrentDepth;
+                            }
+                        }
+                        break;
+                    case JsonTokenType.StartObject:
+                        writer.WriteStartObject();
+                        break;
+                    case JsonTokenType.EndObject:
+                        writer.WriteEndObject();
+                        break;
+                    case JsonTokenType.StartArray:
+                        writer.WriteStartArray();
+                        break;
+                    case JsonTokenType.EndArray:
+                        writer.WriteEndArray();
+                        break;
+                    case JsonTokenType.String:
+                        writer.WriteStringValue(MaskSensitivePatterns(reader.GetString()!));
+                        break;
+                    case JsonTokenType.Number:
+                        writer.WriteRawValue(reader.ValueSpan, skipInputValidation: true);
+                        break;
+                    case JsonTokenType.True:
+                    case JsonTokenType.False:
+                        writer.WriteBooleanValue(reader.GetBoolean());
+                        break;
+                    case JsonTokenType.Null:
+                        writer.WriteNullValue();
+                        break;
+                }
+            }
+        }
+
+        return Encoding.UTF8.GetString(output.WrittenSpan);
+    }
+}
@@ -0,0 +1,268 @@
+namespace Adaplio.Api.Services;
+
+public interface IClientReadCache
+{
+    Task<T> GetOrAddAsync<T>(int clientProfileId, string kind, DateOnly? week, Func<Task<T>> factory) where T : class;
+    void InvalidateClient(int clientProfileId);
+    string? GetVersion(int clientProfileId, string kind, DateOnly? week, object? value = null);
+    ClientReadCacheStats GetStats();
+    void ResetStats();
+}
+
+public record ClientReadCacheStats(
+    bool Enabled,
+    long Hits,
+    long Misses,
+    long Evictions,
+    long Invalidations,
+    int Entries,
+    int MaxEntries,
+    double HitRate
+);
+
+/// <summary>
+/// Response cache for per-client reads (board, gamification) keyed by client profile, kind and week.
+/// Writers invalidate a client explicitly; entries also expire after a TTL as a safety net.
+/// When ClientCache:MaxEntries is positive the least recently used entry is evicted past that size.
+/// Every stored entry gets a new version, so a response's ETag can be checked without rebuilding it.
+/// </summary>
+public class ClientReadCache : IClientReadCache
+{
+    public const string Board = "board";
+    public const string Gamification = "gamification";
+
+    private readonly record struct CacheKey(int ClientProfileId, string Kind, DateOnly? Week);
+
+    private sealed class CacheEntry
+    {
+        public required CacheKey Key { get; init; }
+        public required object Value { get; init; }
+        public required DateTimeOffset ExpiresAt { get; init; }
+        public required long Version { get; init; }
+    }
+
+    // Only clients with reads in flight need an invalidation counter, so it lives no longer than those reads
+    private sealed class PendingReads
+    {
+        public int Count;
+        public long Version;
+    }
+
+    private readonly object _lock = new();
+    private readonly Dictionary<CacheKey, LinkedListNode<CacheEntry>> _entries = new();
+    private readonly LinkedList<CacheEntry> _recency = new(); // Most recently used first
+    private readonly Dictionary<int, HashSet<CacheKey>> _keysByClient = new();
+    private readonly Dictionary<int, PendingReads> _pendingReads = new();
+
+    // Versions only mean something within this process; the prefix keeps another instance's from matching
+    private readonly string _instanceId = Guid.NewGuid().ToString("N");
+    private long _lastVersion;
+
+    private readonly bool _enabled;
+    private readonly int _maxEntries;
+    private readonly TimeSpan _ttl;
+
+    private long _hits;
+    private long _misses;
+    private long _evictions;
+    private long _invalidations;
+
+    public ClientReadCache(IConfiguration configuration)
+    {
+        _enabled = configuration.GetValue("ClientCache:Enabled", true);
+        _maxEntries = configuration.GetValue("ClientCache:MaxEntries", 10000);
+        _ttl = TimeSpan.FromSeconds(configuration.GetValue("ClientCache:TtlSeconds", 300));
+    }
+
+    public async Task<T> GetOrAddAsync<T>(int clientProfileId, string kind, DateOnly? week, Func<Task<T>> factory) where T : class
+    {
+        if (!_enabled)
+        {
+            return await factory();
+        }
+
+        var key = new CacheKey(clientProfileId, kind, week);
+        PendingReads pending;
+        long version;
+
+        lock (_lock)
+        {
+            if (_entries.TryGetValue(key, out var node))
+            {
+                if (node.Value.ExpiresAt > DateTimeOffset.UtcNow && node.Value.Value is T cached)
+                {
+                    _recency.Remove(node);
+                    _recency.AddFirst(node);
+                    _hits++;
+                    return cached;
+                }
+
+                RemoveNode(node);
+            }
+
+            _misses++;
+
+            if (!_pendingReads.TryGetValue(clientProfileId, out pending))
+            {
+                pending = new PendingReads();
+                _pendingReads[clientProfileId] = pending;
+            }
+            pending.Count++;
+            version = pending.Version;
+        }
+
+        T value;
+        try
+        {
+            value = await factory();
+        }
+        catch
+        {
+            lock (_lock)
+            {
+                EndRead(clientProfileId, pending);
+            }
+            throw;
+        }
+
+        lock (_lock)
+        {
+            EndRead(clientProfileId, pending);
+
+            // A write invalidated this client while we were reading - don't cache a stale response
+            if (pending.Version != version || _entries.ContainsKey(key))
+            {
+                return value;
+            }
+
+            var node = _recency.AddFirst(new CacheEntry
+            {
+                Key = key,
+                Value = value,
+                ExpiresAt = DateTimeOffset.UtcNow.Add(_ttl),
+                Version = ++_lastVersion
+            });
+            _entries[key] = node;
+
+            if (!_keysByClient.TryGetValue(clientProfileId, out var keys))
+            {
+                keys = new HashSet<CacheKey>();
+                _keysByClient[clientProfileId] = keys;
+            }
+            keys.Add(key);
+
+            while (_maxEntries > 0 && _entries.Count > _maxEntries && _recency.Last != null)
+            {
+                RemoveNode(_recency.Last);
+                _evictions++;
+            }
+        }
+
+        return value;
+    }
+
+    public void InvalidateClient(int clientProfileId)
+    {
+        if (!_enabled)
+        {
+            return;
+        }
+
+        lock (_lock)
+        {
+            if (_pendingReads.TryGetValue(clientProfileId, out var pending))
+            {
+                pending.Version++;
+            }
+            _invalidations++;
+
+            if (_keysByClient.TryGetValue(clientProfileId, out var keys))
+            {
+                foreach (var key in keys.ToList())
+                {
+                    if (_entries.TryGetValue(key, out var node))
+                    {
+                        RemoveNode(node);
+                    }
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    /// Version of the live entry, or null when nothing is cached. With a value, only if the entry still holds
+    /// that exact object, so a version is never paired with a response an invalidation has since replaced.
+    /// </summary>
+    public string? GetVersion(int clientProfileId, string kind, DateOnly? week, object? value = null)
+    {
+        if (!_enabled)
+        {
+            return null;
+        }
+
+        lock (_lock)
+        {
+            if (!_entries.TryGetValue(new CacheKey(clientProfileId, kind, week), out var node) ||
+                node.Value.ExpiresAt <= DateTimeOffset.UtcNow ||
+                (value != null && !ReferenceEquals(node.Value.Value, value)))
+            {
+                return null;
+            }
+
+            return $"{_instanceId}:{node.Value.Version}";
+        }
+    }
+
+    public ClientReadCacheStats GetStats()
+    {
+        lock (_lock)
+        {
+            var lookups = _hits + _misses;
+            return new ClientReadCacheStats(
+                _enabled,
+                _hits,
+                _misses,
+                _evictions,
+                _invalidations,
+                _entries.Count,
+                _maxEntries,
+                lookups > 0 ? Math.Round((double)_hits / lookups, 4) : 0
+            );
+        }
+    }
+
+    public void ResetStats()
+    {
+        lock (_lock)
+        {
+            _hits = 0;
+            _misses = 0;
+            _evictions = 0;
+            _invalidations = 0;
+        }
+    }
+
+    private void EndRead(int clientProfileId, PendingReads pending)
+    {
+        if (--pending.Count == 0)
+        {
+            _pendingReads.Remove(clientProfileId);
+        }
+    }
+
+    private void RemoveNode(LinkedListNode<CacheEntry> node)
+    {
+        var key = node.Value.Key;
+        _recency.Remove(node);
+        _entries.Remove(key);
+
+        if (_keysByClient.TryGetValue(key.ClientProfileId, out var keys))
+        {
+            keys.Remove(key);
+            if (keys.Count == 0)
+            {
+                _keysByClient.Remove(key.ClientProfileId);
+            }
+        }
+    }
+}
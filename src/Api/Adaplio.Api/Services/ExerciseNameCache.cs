@@ -0,0 +1,80 @@
+using System.Collections.Concurrent;
+
+namespace Adaplio.Api.Services;
+
+public record ExerciseNameCacheStats(
+    long Hits,
+    long Misses,
+    long Invalidations,
+    int Entries,
+    int MaxEntries
+);
+
+/// <summary>
+/// Normalized exercise name to id, so template writes only query the database for names they have not seen.
+/// Exercises are never renamed or deleted, so entries stay correct; names are invalidated whenever they are
+/// inserted so a failed or raced insert is re-read rather than trusted. Exercises:NameCacheSize bounds the
+/// map (0 disables it); it is cleared wholesale when full.
+/// </summary>
+public class ExerciseNameCache
+{
+    private readonly ConcurrentDictionary<string, int> _ids = new(StringComparer.Ordinal);
+    private readonly int _maxEntries;
+
+    private long _hits;
+    private long _misses;
+    private long _invalidations;
+
+    public ExerciseNameCache(IConfiguration configuration)
+    {
+        _maxEntries = configuration.GetValue("Exercises:NameCacheSize", 5000);
+    }
+
+    public bool TryGet(string normalizedName, out int exerciseId)
+    {
+        if (_ids.TryGetValue(normalizedName, out exerciseId))
+        {
+            Interlocked.Increment(ref _hits);
+            return true;
+        }
+
+        Interlocked.Increment(ref _misses);
+        return false;
+    }
+
+    public void Set(string normalizedName, int exerciseId)
+    {
+        if (_maxEntries <= 0)
+        {
+            return;
+        }
+
+        if (_ids.Count >= _maxEntries && !_ids.ContainsKey(normalizedName))
+        {
+            _ids.Clear();
+        }
+
+        _ids[normalizedName] = exerciseId;
+    }
+
+    public void Invalidate(IEnumerable<string> normalizedNames)
+    {
+        foreach (var name in normalizedNames)
+        {
+            if (_ids.TryRemove(name, out _))
+            {
+                Interlocked.Increment(ref _invalidations);
+            }
+        }
+    }
+
+    public ExerciseNameCacheStats GetStats()
+    {
+        return new ExerciseNameCacheStats(
+            Interlocked.Read(ref _hits),
+            Interlocked.Read(ref _misses),
+            Interlocked.Read(ref _invalidations),
+            _ids.Count,
+            _maxEntries);
+    }
+}
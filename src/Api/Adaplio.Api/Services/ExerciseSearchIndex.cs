@@ -0,0 +1,556 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Globalization;
+using System.Text;
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+using Adaplio.Api.Exercises;
+using Microsoft.EntityFrameworkCore;
+
+namespace Adaplio.Api.Services;
+
+public record ExerciseSearchStats(
+    bool Loaded,
+    int Exercises,
+    int Trigrams,
+    long Builds,
+    long Searches,
+    long CacheHits,
+    int CachedQueries,
+    double LastBuildMs,
+    DateTimeOffset? BuiltAt
+);
+
+/// <summary>
+/// In-memory index over the exercise library for type-ahead search. A query matches a whole-name prefix,
+/// the prefix of any later word, a category prefix, or, from three characters on, a pg_trgm-style trigram
+/// similarity of at least MinSimilarity so typos still match; results rank in that order, then by name.
+/// The index is rebuilt when the row count or highest id changes, checked at most every
+/// Exercises:SearchCheckSeconds so writes from other instances are picked up; exercises are never renamed
+/// or deleted, so that is enough to detect change. Requests keep using the current index while another
+/// rebuilds it. Ranked matches are cached per query for the life of an index, up to Exercises:SearchCacheSize
+/// queries (0 disables the cache).
+/// </summary>
+public class ExerciseSearchIndex
+{
+    public const int MaxLimit = 100;
+    public const int MaxRankedResults = 1000;
+    public const double MinSimilarity = 0.3;
+
+    private const double NamePrefixScore = 3;
+    private const double WordPrefixScore = 2;
+    private const double CategoryPrefixScore = 1;
+
+    private record ExerciseRow(
+        int Id,
+        string Name,
+        string NormalizedName,
+        string? Category,
+        string? Description,
+        int? DefaultSets,
+        int? DefaultReps,
+        int? DefaultHoldSeconds
+    );
+
+    private sealed class IndexedExercise
+    {
+        public required ExerciseRow Row { get; init; }
+        public required string? NormalizedCategory { get; init; }
+        public required int TrigramCount { get; init; }
+    }
+
+    private readonly record struct Match(int Position, double Score);
+
+    private readonly record struct Cursor(double Score, string Name, int Id);
+
+    private sealed class Snapshot
+    {
+        public required IndexedExercise[] Exercises { get; init; } // Ordered by normalized name, then id
+        public required int[] NameOrder { get; init; } // 0..n-1, the browse order
+        public required (string Word, int Position)[] Words { get; init; } // Every word after the first, ordered
+        public required Dictionary<string, int[]> Postings { get; init; } // Trigram to positions
+        public required Dictionary<string, int[]> Categories { get; init; } // Normalized category to positions
+        public required int MaxId { get; init; }
+        public required DateTimeOffset BuiltAt { get; init; }
+        public ConcurrentDictionary<string, Match[]> Results { get; } = new(StringComparer.Ordinal);
+        public long CheckedAtTicks;
+    }
+
+    private readonly SemaphoreSlim _buildLock = new(1, 1);
+    private readonly TimeSpan _checkInterval;
+    private readonly int _cacheSize;
+    private readonly TimeProvider _timeProvider;
+
+    private volatile Snapshot? _snapshot;
+    private volatile bool _stale;
+
+    private long _builds;
+    private long _searches;
+    private long _cacheHits;
+    private double _lastBuildMs;
+
+    public ExerciseSearchIndex(IConfiguration configuration) : this(configuration, TimeProvider.System)
+    {
+    }
+
+    public ExerciseSearchIndex(IConfiguration configuration, TimeProvider timeProvider)
+    {
+        _checkInterval = TimeSpan.FromSeconds(configuration.GetValue("Exercises:SearchCheckSeconds", 5));
+        _cacheSize = configuration.GetValue("Exercises:SearchCacheSize", 1000);
+        _timeProvider = timeProvider;
+    }
+
+    public async Task<ExerciseSearchResponse> SearchAsync(
+        AppDbContext context,
+        ExerciseSearchQuery query,
+        CancellationToken cancellationToken = default)
+    {
+        var limit = Math.Clamp(query.Limit, 1, MaxLimit);
+        var after = query.Cursor != null ? DecodeCursor(query.Cursor) : (Cursor?)null;
+        var text = Exercise.NormalizeName(query.Q ?? string.Empty);
+        var category = string.IsNullOrWhiteSpace(query.Category) ? null : Exercise.NormalizeName(query.Category);
+
+        var snapshot = await GetSnapshotAsync(context, cancellationToken);
+        Interlocked.Increment(ref _searches);
+
+        // Browsing walks the name order directly; searching pages through the cached ranking
+        IReadOnlyList<Match> matches = text.Length == 0
+            ? Browse(snapshot, category)
+            : GetRanked(snapshot, text, category);
+
+        var start = after is { } cursor
+            ? FirstAfter(matches.Count, k => IsAfter(snapshot.Exercises[matches[k].Position], matches[k].Score, cursor))
+            : 0;
+
+        var page = new List<ExerciseSearchResult>(limit);
+        Match last = default;
+        for (var i = start; i < matches.Count && page.Count < limit; i++)
+        {
+            last = matches[i];
+            var row = snapshot.Exercises[last.Position].Row;
+            page.Add(new ExerciseSearchResult(
+                row.Id,
+                row.Name,
+                row.Category,
+                row.Description,
+                row.DefaultSets,
+                row.DefaultReps,
+                row.DefaultHoldSeconds,
+                last.Score));
+        }
+
+        var nextCursor = page.Count == limit && start + limit < matches.Count
+            ? EncodeCursor(last.Score, snapshot.Exercises[last.Position].Row)
+            : null;
+
+        return new ExerciseSearchResponse(page.ToArray(), nextCursor);
+    }
+
+    /// <summary>
+    /// Version of the library the next search reads, for ETags. Exercises are never renamed or deleted, so the
+    /// row count and highest id identify the content and agree across instances.
+    /// </summary>
+    public async Task<string> GetVersionAsync(AppDbContext context, CancellationToken cancellationToken = default)
+    {
+        var snapshot = await GetSnapshotAsync(context, cancellationToken);
+        return $"{snapshot.Exercises.Length}:{snapshot.MaxId}";
+    }
+
+    /// <summary>Forces a rebuild on the next search, for writers on this instance that cannot wait for the check</summary>
+    public void Invalidate()
+    {
+        _stale = true;
+    }
+
+    public ExerciseSearchStats GetStats()
+    {
+        var snapshot = _snapshot;
+        return new ExerciseSearchStats(
+            snapshot != null,
+            snapshot?.Exercises.Length ?? 0,
+            snapshot?.Postings.Count ?? 0,
+            Interlocked.Read(ref _builds),
+            Interlocked.Read(ref _searches),
+            Interlocked.Read(ref _cacheHits),
+            snapshot?.Results.Count ?? 0,
+            Volatile.Read(ref _lastBuildMs),
+            snapshot?.BuiltAt);
+    }
+
+    private async Task<Snapshot> GetSnapshotAsync(AppDbContext context, CancellationToken cancellationToken)
+    {
+        var snapshot = _snapshot;
+        if (snapshot != null && IsFresh(snapshot))
+        {
+            return snapshot;
+        }
+
+        if (snapshot == null)
+        {
+            await _buildLock.WaitAsync(cancellationToken);
+        }
+        else if (!await _buildLock.WaitAsync(0, cancellationToken))
+        {
+            // Another request is checking or rebuilding; the current index is good enough meanwhile
+            return snapshot;
+        }
+
+        try
+        {
+            snapshot = _snapshot;
+            if (snapshot != null && IsFresh(snapshot))
+            {
+                return snapshot;
+            }
+
+            var now = _timeProvider.GetUtcNow();
+            var count = await context.Exercises.CountAsync(cancellationToken);
+            var maxId = await context.Exercises.MaxAsync(e => (int?)e.Id, cancellationToken) ?? 0;
+            if (snapshot != null && !_stale && snapshot.Exercises.Length == count && snapshot.MaxId == maxId)
+            {
+                Volatile.Write(ref snapshot.CheckedAtTicks, now.UtcTicks);
+                return snapshot;
+            }
+
+            // Cleared before loading so an invalidation during the load triggers another rebuild
+            _stale = false;
+            var stopwatch = Stopwatch.StartNew();
+            var rows = await context.Exercises
+                .AsNoTracking()
+                .Select(e => new ExerciseRow(
+                    e.Id,
+                    e.Name,
+                    e.NormalizedName,
+                    e.Category,
+                    e.Description,
+                    e.DefaultSets,
+                    e.DefaultReps,
+                    e.DefaultHoldSeconds))
+                .ToListAsync(cancellationToken);
+
+            snapshot = Build(rows, now);
+            _snapshot = snapshot;
+
+            Interlocked.Increment(ref _builds);
+            Volatile.Write(ref _lastBuildMs, Math.Round(stopwatch.Elapsed.TotalMilliseconds, 1));
+            return snapshot;
+        }
+        finally
+        {
+            _buildLock.Release();
+        }
+    }
+
+    private bool IsFresh(Snapshot snapshot)
+    {
+        return !_stale &&
+               _timeProvider.GetUtcNow().UtcTicks - Volatile.Read(ref snapshot.CheckedAtTicks) < _checkInterval.Ticks;
+    }
+
+    private static Snapshot Build(List<ExerciseRow> rows, DateTimeOffset now)
+    {
+        rows.Sort((a, b) =>
+        {
+            var byName = string.CompareOrdinal(a.NormalizedName, b.NormalizedName);
+            return byName != 0 ? byName : a.Id.CompareTo(b.Id);
+        });
+
+        var exercises = new IndexedExercise[rows.Count];
+        var words = new List<(string Word, int Position)>();
+        var postings = new Dictionary<string, List<int>>(StringComparer.Ordinal);
+        var categories = new Dictionary<string, List<int>>(StringComparer.Ordinal);
+
+        for (var position = 0; position < rows.Count; position++)
+        {
+            var row = rows[position];
+            var trigrams = Trigrams(row.NormalizedName);
+            foreach (var trigram in trigrams)
+            {
+                if (!postings.TryGetValue(trigram, out var list))
+                {
+                    postings[trigram] = list = new List<int>();
+                }
+                list.Add(position);
+            }
+
+            var nameWords = SplitWords(row.NormalizedName);
+            for (var w = 1; w < nameWords.Length; w++)
+            {
+                words.Add((nameWords[w], position));
+            }
+
+            var category = string.IsNullOrWhiteSpace(row.Category) ? null : Exercise.NormalizeName(row.Category);
+            if (category != null)
+            {
+                if (!categories.TryGetValue(category, out var list))
+                {
+                    categories[category] = list = new List<int>();
+                }
+                list.Add(position);
+            }
+
+            exercises[position] = new IndexedExercise
+            {
+                Row = row,
+                NormalizedCategory = category,
+                TrigramCount = trigrams.Count
+            };
+        }
+
+        words.Sort((a, b) =>
+        {
+            var byWord = string.CompareOrdinal(a.Word, b.Word);
+            return byWord != 0 ? byWord : a.Position.CompareTo(b.Position);
+        });
+
+        return new Snapshot
+        {
+            Exercises = exercises,
+            NameOrder = Enumerable.Range(0, exercises.Length).ToArray(),
+            Words = words.ToArray(),
+            Postings = postings.ToDictionary(p => p.Key, p => p.Value.ToArray(), StringComparer.Ordinal),
+            Categories = categories.ToDictionary(c => c.Key, c => c.Value.ToArray(), StringComparer.Ordinal),
+            MaxId = rows.Count > 0 ? rows.Max(r => r.Id) : 0,
+            BuiltAt = now,
+            CheckedAtTicks = now.UtcTicks
+        };
+    }
+
+    private static IReadOnlyList<Match> Browse(Snapshot snapshot, string? category)
+    {
+        if (category == null)
+        {
+            return new BrowseList(snapshot.NameOrder);
+        }
+
+        return new BrowseList(snapshot.Categories.TryGetValue(category, out var positions) ? positions : Array.Empty<int>());
+    }
+
+    private Match[] GetRanked(Snapshot snapshot, string text, string? category)
+    {
+        var key = $"{category}\u001f{text}";
+        if (_cacheSize > 0 && snapshot.Results.TryGetValue(key, out var cached))
+        {
+            Interlocked.Increment(ref _cacheHits);
+            return cached;
+        }
+
+        var ranked = Rank(snapshot, text, category);
+        if (_cacheSize > 0)
+        {
+            if (snapshot.Results.Count >= _cacheSize)
+            {
+                snapshot.Results.Clear();
+            }
+            snapshot.Results[key] = ranked;
+        }
+
+        return ranked;
+    }
+
+    private static Match[] Rank(Snapshot snapshot, string text, string? category)
+    {
+        var scores = new Dictionary<int, double>();
+        void Raise(int position, double score)
+        {
+            if (!scores.TryGetValue(position, out var current) || current < score)
+            {
+                scores[position] = score;
+            }
+        }
+
+        var exercises = snapshot.Exercises;
+        for (var i = LowerBound(exercises.Length, k => exercises[k].Row.NormalizedName, text);
+             i < exercises.Length && exercises[i].Row.NormalizedName.StartsWith(text, StringComparison.Ordinal);
+             i++)
+        {
+            Raise(i, NamePrefixScore);
+        }
+
+        var words = snapshot.Words;
+        for (var i = LowerBound(words.Length, k => words[k].Word, text);
+             i < words.Length && words[i].Word.StartsWith(text, StringComparison.Ordinal);
+             i++)
+        {
+            Raise(words[i].Position, WordPrefixScore);
+        }
+
+        foreach (var (name, positions) in snapshot.Categories)
+        {
+            if (name.StartsWith(text, StringComparison.Ordinal))
+            {
+                foreach (var position in positions)
+                {
+                    Raise(position, CategoryPrefixScore);
+                }
+            }
+        }
+
+        // Trigram similarity |shared| / |union|, as pg_trgm computes it
+        if (text.Length >= 3)
+        {
+            var queryTrigrams = Trigrams(text);
+            var shared = new Dictionary<int, int>();
+            foreach (var trigram in queryTrigrams)
+            {
+                if (snapshot.Postings.TryGetValue(trigram, out var positions))
+                {
+                    foreach (var position in positions)
+                    {
+                        shared[position] = shared.GetValueOrDefault(position) + 1;
+                    }
+                }
+            }
+
+            foreach (var (position, count) in shared)
+            {
+                var similarity = (double)count / (queryTrigrams.Count + exercises[position].TrigramCount - count);
+                if (similarity >= MinSimilarity)
+                {
+                    Raise(position, Math.Round(similarity, 4));
+                }
+            }
+        }
+
+        // Positions follow name order, so ordering by position breaks score ties by name, then id
+        return scores
+            .Where(s => category == null || exercises[s.Key].NormalizedCategory == category)
+            .Select(s => new Match(s.Key, s.Value))
+            .OrderByDescending(m => m.Score)
+            .ThenBy(m => m.Position)
+            .Take(MaxRankedResults)
+            .ToArray();
+    }
+
+    private static HashSet<string> Trigrams(string normalized)
+    {
+        var trigrams = new HashSet<string>(StringComparer.Ordinal);
+        foreach (var word in SplitWords(normalized))
+        {
+            var padded = $"  {word} ";
+            for (var i = 0; i + 3 <= padded.Length; i++)
+            {
+                trigrams.Add(padded.Substring(i, 3));
+            }
+        }
+        return trigrams;
+    }
+
+    private static string[] SplitWords(string normalized)
+    {
+        var words = new List<string>();
+        var word = new StringBuilder();
+        foreach (var c in normalized)
+        {
+            if (char.IsLetterOrDigit(c))
+            {
+                word.Append(c);
+            }
+            else if (word.Length > 0)
+            {
+                words.Add(word.ToString());
+                word.Clear();
+            }
+        }
+        if (word.Length > 0)
+        {
+            words.Add(word.ToString());
+        }
+        return words.ToArray();
+    }
+
+    private static int LowerBound(int count, Func<int, string> keyAt, string value)
+    {
+        var low = 0;
+        var high = count;
+        while (low < high)
+        {
+            var mid = low + (high - low) / 2;
+            if (string.CompareOrdinal(keyAt(mid), value) < 0)
+            {
+                low = mid + 1;
+            }
+            else
+            {
+                high = mid;
+            }
+        }
+        return low;
+    }
+
+    private static int FirstAfter(int count, Func<int, bool> isAfter)
+    {
+        var low = 0;
+        var high = count;
+        while (low < high)
+        {
+            var mid = low + (high - low) / 2;
+            if (isAfter(mid))
+            {
+                high = mid;
+            }
+            else
+            {
+                low = mid + 1;
+            }
+        }
+        return low;
+    }
+
+    private static bool IsAfter(IndexedExercise exercise, double score, Cursor cursor)
+    {
+        if (score != cursor.Score)
+        {
+            return score < cursor.Score;
+        }
+
+        var byName = string.CompareOrdinal(exercise.Row.NormalizedName, cursor.Name);
+        return byName != 0 ? byName > 0 : exercise.Row.Id > cursor.Id;
+    }
+
+    private static string EncodeCursor(double score, ExerciseRow row)
+    {
+        var value = $"{score.ToString("R", CultureInfo.InvariantCulture)}|{row.Id}|{row.NormalizedName}";
+        return Convert.ToBase64String(Encoding.UTF8.GetBytes(value)).TrimEnd('=').Replace('+', '-').Replace('/', '_');
+    }
+
+    private static Cursor DecodeCursor(string cursor)
+    {
+        try
+        {
+            var base64 = cursor.Replace('-', '+').Replace('_', '/');
+            base64 = base64.PadRight(base64.Length + (4 - base64.Length % 4) % 4, '=');
+            var parts = Encoding.UTF8.GetString(Convert.FromBase64String(base64)).Split('|', 3);
+            if (parts.Length == 3 &&
+                double.TryParse(parts[0], NumberStyles.Float, CultureInfo.InvariantCulture, out var score) &&
+                int.TryParse(parts[1], NumberStyles.Integer, CultureInfo.InvariantCulture, out var id))
+            {
+                return new Cursor(score, parts[2], id);
+            }
+        }
+        catch (FormatException)
+        {
+        }
+
+        throw new ArgumentException("Invalid cursor.");
+    }
+
+    /// <summary>Positions in name order, all scored 0</summary>
+    private sealed class BrowseList : IReadOnlyList<Match>
+    {
+        private readonly int[] _positions;
+
+        public BrowseList(int[] positions)
+        {
+            _positions = positions;
+        }
+
+        public Match this[int index] => new(_positions[index], 0);
+
+        public int Count => _positions.Length;
+
+        public IEnumerator<Match> GetEnumerator() => _positions.Select(p => new Match(p, 0)).GetEnumerator();
+
+        System.Collections.IEnumerator System.Collections.IEnumerable.GetEnumerator() => GetEnumerator();
+    }
+}
@@ -0,0 +1,102 @@
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Backend that holds finished uploads. Uploads are staged on local disk while chunks arrive and
+/// are handed over in one piece once complete, so backends only need whole-object operations.
+/// </summary>
+public interface IFileStorage
+{
+    /// <summary>Moves a fully staged file into storage under the key; the staged file is consumed</summary>
+    Task SaveAsync(string key, string stagedPath, string contentType, CancellationToken cancellationToken = default);
+
+    /// <summary>Returns what is needed to serve the file, or null when the key does not exist</summary>
+    Task<StoredFile?> GetAsync(string key, CancellationToken cancellationToken = default);
+
+    Task<bool> DeleteAsync(string key, CancellationToken cancellationToken = default);
+}
+
+/// <summary>
+/// A stored file. Local files carry a PhysicalPath so they can be sent with range processing and
+/// sendfile; remote backends carry a RedirectUrl the client fetches directly instead.
+/// </summary>
+public record StoredFile(
+    string Key,
+    long Length,
+    DateTimeOffset LastModified,
+    string ETag,
+    string? PhysicalPath = null,
+    string? RedirectUrl = null
+);
+
+/// <summary>
+/// Stores uploads under a directory on local disk (uploads/ under the working directory by default).
+/// </summary>
+public class LocalFileStorage : IFileStorage
+{
+    private readonly string _root;
+
+    public LocalFileStorage(IConfiguration configuration)
+        : this(Path.Combine(Directory.GetCurrentDirectory(), configuration["Upload:LocalPath"] ?? "uploads"))
+    {
+    }
+
+    public LocalFileStorage(string root)
+    {
+        _root = Path.GetFullPath(root);
+        Directory.CreateDirectory(_root);
+    }
+
+    public Task SaveAsync(string key, string stagedPath, string contentType, CancellationToken cancellationToken = default)
+    {
+        var path = ResolvePath(key) ?? throw new ArgumentException($"Invalid storage key: {key}", nameof(key));
+        Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+
+        // Staging lives on the same volume by default, so this is a rename rather than a copy
+        File.Move(stagedPath, path, overwrite: true);
+        return Task.CompletedTask;
+    }
+
+    public Task<StoredFile?> GetAsync(string key, CancellationToken cancellationToken = default)
+    {
+        var path = ResolvePath(key);
+        if (path == null)
+            return Task.FromResult<StoredFile?>(null);
+
+        var info = new FileInfo(path);
+        if (!info.Exists)
+            return Task.FromResult<StoredFile?>(null);
+
+        // Same weak validator shape as the static file middleware: last write time plus length
+        var lastModified = new DateTimeOffset(info.LastWriteTimeUtc);
+        var etag = $"\"{lastModified.UtcTicks:x}{info.Length:x}\"";
+
+        return Task.FromResult<StoredFile?>(new StoredFile(key, info.Length, lastModified, etag, PhysicalPath: path));
+    }
+
+    public Task<bool> DeleteAsync(string key, CancellationToken cancellationToken = default)
+    {
+        var path = ResolvePath(key);
+        if (path == null || !File.Exists(path))
+            return Task.FromResult(false);
+
+        File.Delete(path);
+        return Task.FromResult(true);
+    }
+
+    /// <summary>
+    /// Maps a key to a path under the root. Returns null for keys that escape the root or touch
+    /// dot-prefixed segments (the upload staging area lives in uploads/.staging).
+    /// </summary>
+    public string? ResolvePath(string key)
+    {
+        if (string.IsNullOrWhiteSpace(key))
+            return null;
+
+        var segments = key.Split('/', '\\');
+        if (segments.Any(segment => segment.Length == 0 || segment.StartsWith('.')))
+            return null;
+
+        var path = Path.GetFullPath(Path.Combine(_root, key));
+        return path.StartsWith(_root + Path.DirectorySeparatorChar, StringComparison.Ordinal) ? path : null;
+    }
+}
@@ -1,12 +1,14 @@
 using Adaplio.Api.Data;
 using Adaplio.Api.Domain;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Storage;
 
 namespace Adaplio.Api.Services;
 
 public interface IGamificationService
 {
     Task<GamificationResult> AwardXpForProgressAsync(int progressEventId, int clientProfileId);
+    Task<IReadOnlyList<GamificationResult>> AwardXpForProgressBatchAsync(IReadOnlyList<int> progressEventIds, int clientProfileId);
     Task<Domain.Gamification> GetOrCreateGamificationAsync(int clientProfileId);
     Task<Domain.Gamification?> GetGamificationAsync(int clientProfileId);
     Task<WeeklyProgressData> GetWeeklyProgressAsync(int clientProfileId, DateTime? weekStart = null);
@@ -15,10 +17,12 @@ public interface IGamificationService
 public class GamificationService : IGamificationService
 {
     private readonly AppDbContext _context;
+    private readonly IClientReadCache _cache;
 
-    public GamificationService(AppDbContext context)
+    public GamificationService(AppDbContext context, IClientReadCache cache)
     {
         _context = context;
+        _cache = cache;
     }
 
     public async Task<GamificationResult> AwardXpForProgressAsync(int progressEventId, int clientProfileId)
@@ -79,13 +83,8 @@ public async Task<GamificationResult> AwardXpForProgressAsync(int progressEventI
             // Check for new badges
             var newBadges = CheckForNewBadges(gamification, progressEvent);
 
-            // Add new badges to the collection
-            var allBadges = gamification.Badges;
-            foreach (var newBadge in newBadges)
-            {
-                allBadges.Add(newBadge);
-            }
-            gamification.Badges = allBadges;
+            // Add new badges to the collection (BadgesEarned is only rewritten when one was earned)
+            gamification.AddBadges(newBadges);
 
             // Record the XP award
             var xpAward = new XpAward
@@ -98,6 +97,7 @@ public async Task<GamificationResult> AwardXpForProgressAsync(int progressEventI
 
             await _context.SaveChangesAsync();
             await transaction.CommitAsync();
+            _cache.InvalidateClient(clientProfileId);
 
             return new GamificationResult
             {
@@ -117,6 +117,118 @@ public async Task<GamificationResult> AwardXpForProgressAsync(int progressEventI
         }
     }
 
+    public async Task<IReadOnlyList<GamificationResult>> AwardXpForProgressBatchAsync(IReadOnlyList<int> progressEventIds, int clientProfileId)
+    {
+        if (clientProfileId <= 0 || progressEventIds.Any(id => id <= 0))
+        {
+            throw new ArgumentException("Invalid progressEventIds or clientProfileId");
+        }
+
+        if (progressEventIds.Count == 0)
+        {
+            return Array.Empty<GamificationResult>();
+        }
+
+        // Join the caller's transaction when the events were inserted in one
+        using IDbContextTransaction? transaction = _context.Database.CurrentTransaction == null
+            ? await _context.Database.BeginTransactionAsync()
+            : null;
+
+        try
+        {
+            // Same idempotency check as the single-event path, one query for the whole batch
+            var awardedEventIds = (await _context.XpAwards
+                .Where(xa => progressEventIds.Contains(xa.ProgressEventId))
+                .Select(xa => xa.ProgressEventId)
+                .ToListAsync())
+                .ToHashSet();
+
+            var progressEvents = await _context.ProgressEvents
+                .Where(pe => progressEventIds.Contains(pe.Id))
+                .ToDictionaryAsync(pe => pe.Id);
+
+            var missingId = progressEventIds.FirstOrDefault(id => !progressEvents.ContainsKey(id));
+            if (missingId != 0)
+            {
+                throw new ArgumentException($"Progress event {missingId} not found");
+            }
+
+            var gamification = await GetOrCreateGamificationAsync(clientProfileId);
+            var results = new Dictionary<int, GamificationResult>();
+
+            // Streaks only move forward, so apply events in the order they happened
+            var orderedEvents = progressEventIds
+                .Distinct()
+                .Select(id => progressEvents[id])
+                .OrderBy(pe => pe.LoggedAt)
+                .ThenBy(pe => pe.Id);
+
+            foreach (var progressEvent in orderedEvents)
+            {
+                if (awardedEventIds.Contains(progressEvent.Id))
+                {
+                    results[progressEvent.Id] = new GamificationResult
+                    {
+                        XpAwarded = 0,
+                        NewBadges = new List<Badge>(),
+                        LeveledUp = false,
+                        CurrentLevel = gamification.Level,
+                        TotalXp = gamification.TotalXp,
+                        CurrentStreak = gamification.CurrentStreak,
+                        AlreadyAwarded = true
+                    };
+                    continue;
+                }
+
+                var previousLevel = gamification.Level;
+                var xpAwarded = CalculateXpForEvent(progressEvent);
+
+                UpdateStreaks(gamification, DateOnly.FromDateTime(progressEvent.LoggedAt.Date));
+                gamification.TotalXp += xpAwarded;
+
+                var newBadges = CheckForNewBadges(gamification, progressEvent);
+                gamification.AddBadges(newBadges);
+
+                _context.XpAwards.Add(new XpAward
+                {
+                    ProgressEventId = progressEvent.Id,
+                    UserId = clientProfileId,
+                    XpAwarded = xpAwarded
+                });
+
+                results[progressEvent.Id] = new GamificationResult
+                {
+                    XpAwarded = xpAwarded,
+                    NewBadges = newBadges,
+                    LeveledUp = gamification.Level > previousLevel,
+                    CurrentLevel = gamification.Level,
+                    TotalXp = gamification.TotalXp,
+                    CurrentStreak = gamification.CurrentStreak,
+                    AlreadyAwarded = false
+                };
+            }
+
+            gamification.UpdatedAt = DateTimeOffset.UtcNow;
+            await _context.SaveChangesAsync();
+
+            if (transaction != null)
+            {
+                await transaction.CommitAsync();
+            }
+            _cache.InvalidateClient(clientProfileId);
+
+            return progressEventIds.Select(id => results[id]).ToList();
+        }
+        catch
+        {
+            if (transaction != null)
+            {
+                await transaction.RollbackAsync();
+            }
+            throw;
+        }
+    }
+
     public async Task<Domain.Gamification> GetOrCreateGamificationAsync(int clientProfileId)
     {
         var gamification = await _context.Gamifications
@@ -154,41 +266,49 @@ private static int CalculateXpForEvent(ProgressEvent progressEvent)
 
     private static void UpdateStreaks(Domain.Gamification gamification, DateOnly eventDate)
     {
-        var today = DateOnly.FromDateTime(DateTime.UtcNow.Date);
+        var activity = gamification.Activity;
 
-        if (gamification.LastActivityDate == null)
+        if (activity.IsActive(eventDate))
         {
-            // First activity
-            gamification.CurrentStreak = 1;
-            gamification.WeeklyStreaks = IsStartOfWeek(eventDate) ? 1 : 0;
+            // Day already counted, no streak change
+            return;
         }
-        else
+
+        if (activity.Anchor == null || eventDate > activity.Anchor.Value)
         {
-            var lastActivity = gamification.LastActivityDate.Value;
-            var daysDiff = eventDate.DayNumber - lastActivity.DayNumber;
+            var daysDiff = activity.Anchor == null ? 0 : eventDate.DayNumber - activity.Anchor.Value.DayNumber;
 
-            if (daysDiff == 1)
-            {
-                // Consecutive day
-                gamification.CurrentStreak++;
-            }
-            else if (daysDiff == 0)
+            if (activity.Anchor == null)
             {
-                // Same day, no streak change
-                return;
+                // First activity
+                gamification.CurrentStreak = 1;
+                gamification.WeeklyStreaks = IsStartOfWeek(eventDate) ? 1 : 0;
             }
             else
             {
-                // Streak broken
-                gamification.CurrentStreak = 1;
-            }
+                // Consecutive day extends the streak, any gap breaks it
+                gamification.CurrentStreak = daysDiff == 1 ? gamification.CurrentStreak + 1 : 1;
 
-            // Update weekly streak
-            if (IsStartOfWeek(eventDate) && gamification.CurrentStreak >= 7)
-            {
-                gamification.WeeklyStreaks++;
+                // Update weekly streak
+                if (IsStartOfWeek(eventDate) && gamification.CurrentStreak >= 7)
+                {
+                    gamification.WeeklyStreaks++;
+                }
             }
         }
+        else
+        {
+            // Backdated event (offline sync): filling a gap can join runs inside the window.
+            // A run that reaches the window edge continues past it, which the stored streak already counts.
+            var filled = activity.Record(eventDate);
+            var run = filled.TrailingRun;
+            gamification.CurrentStreak = run < ActivityBitmap.WindowDays
+                ? run
+                : Math.Max(gamification.CurrentStreak, run);
+            gamification.LongestStreak = Math.Max(gamification.LongestStreak, filled.LongestRun);
+        }
+
+        gamification.Activity = activity.Record(eventDate);
 
         // Update longest streaks
         if (gamification.CurrentStreak > gamification.LongestStreak)
@@ -200,8 +320,6 @@ private static void UpdateStreaks(Domain.Gamification gamification, DateOnly eve
         {
             gamification.LongestWeeklyStreak = gamification.WeeklyStreaks;
         }
-
-        gamification.LastActivityDate = eventDate;
     }
 
     private static bool IsStartOfWeek(DateOnly date)
@@ -212,10 +330,9 @@ private static bool IsStartOfWeek(DateOnly date)
     private static List<Badge> CheckForNewBadges(Domain.Gamification gamification, ProgressEvent progressEvent)
     {
         var newBadges = new List<Badge>();
-        var existingBadgeIds = gamification.Badges.Select(b => b.Id).ToHashSet();
 
         // First Steps Badge
-        if (gamification.TotalXp >= 10 && !existingBadgeIds.Contains("first_steps"))
+        if (gamification.TotalXp >= 10 && !gamification.HasBadge("first_steps"))
         {
             newBadges.Add(new Badge
             {
@@ -229,7 +346,7 @@ private static List<Badge> CheckForNewBadges(Domain.Gamification gamification, P
         }
 
         // Streak Badges
-        if (gamification.CurrentStreak >= 3 && !existingBadgeIds.Contains("streak_3"))
+        if (gamification.CurrentStreak >= 3 && !gamification.HasBadge("streak_3"))
         {
             newBadges.Add(new Badge
             {
@@ -242,7 +359,7 @@ private static List<Badge> CheckForNewBadges(Domain.Gamification gamification, P
             });
         }
 
-        if (gamification.CurrentStreak >= 7 && !existingBadgeIds.Contains("streak_7"))
+        if (gamification.CurrentStreak >= 7 && !gamification.HasBadge("streak_7"))
         {
             newBadges.Add(new Badge
             {
@@ -255,7 +372,7 @@ private static List<Badge> CheckForNewBadges(Domain.Gamification gamification, P
             });
         }
 
-        if (gamification.CurrentStreak >= 30 && !existingBadgeIds.Contains("streak_30"))
+        if (gamification.CurrentStreak >= 30 && !gamification.HasBadge("streak_30"))
         {
             newBadges.Add(new Badge
             {
@@ -269,7 +386,7 @@ private static List<Badge> CheckForNewBadges(Domain.Gamification gamification, P
         }
 
         // Level Badges
-        if (gamification.Level >= 5 && !existingBadgeIds.Contains("level_5"))
+        if (gamification.Level >= 5 && !gamification.HasBadge("level_5"))
         {
             newBadges.Add(new Badge
             {
@@ -282,7 +399,7 @@ private static List<Badge> CheckForNewBadges(Domain.Gamification gamification, P
             });
         }
 
-        if (gamification.Level >= 10 && !existingBadgeIds.Contains("level_10"))
+        if (gamification.Level >= 10 && !gamification.HasBadge("level_10"))
         {
             newBadges.Add(new Badge
             {
@@ -298,7 +415,7 @@ private static List<Badge> CheckForNewBadges(Domain.Gamification gamification, P
         // Pain Management Badge (shows user is managing pain well)
         if (progressEvent.PainLevel.HasValue && progressEvent.PainLevel <= 3 &&
             progressEvent.DifficultyRating.HasValue && progressEvent.DifficultyRating >= 7 &&
-            !existingBadgeIds.Contains("pain_manager"))
+            !gamification.HasBadge("pain_manager"))
         {
             newBadges.Add(new Badge
             {
@@ -2,6 +2,15 @@ namespace Adaplio.Api.Services;
 
 public interface ISMSService
 {
-    Task<bool> SendInviteLinkAsync(string phoneNumber, string inviteToken, string? trainerName = null);
-    Task<bool> SendMessageAsync(string phoneNumber, string message);
+    /// <summary>
+    /// Provider SMS goes through ("development", "twilio" or "aws"), or null when none is configured
+    /// </summary>
+    string? Provider { get; }
+
+    string BuildInviteMessage(string inviteToken, string? trainerName = null);
+
+    /// <summary>
+    /// Sends one message through the configured provider and throws when it is not accepted
+    /// </summary>
+    Task DeliverAsync(string phoneNumber, string message, CancellationToken cancellationToken = default);
 }
\ No newline at end of file
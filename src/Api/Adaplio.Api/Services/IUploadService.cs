@@ -5,10 +5,43 @@ public interface IUploadService
     Task<PresignedUploadResult> GeneratePresignedUploadUrlAsync(string fileName, string contentType, string uploadType);
     Task<bool> ValidateUploadedFileAsync(string publicUrl);
     Task<bool> DeleteFileAsync(string publicUrl);
+    Task<StoredFile?> GetFileAsync(string uploadKey, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Appends a chunk at the given offset. Offset 0 (re)starts the upload; a null total means the
+    /// content runs to the end of the file. The expected SHA-256 (hex) is checked once the file completes.
+    /// </summary>
+    Task<UploadChunkResult> AppendChunkAsync(
+        string uploadKey,
+        string token,
+        Stream content,
+        long offset,
+        long? totalBytes,
+        string? expectedSha256 = null,
+        CancellationToken cancellationToken = default);
+
+    Task<UploadChunkResult> GetUploadStatusAsync(string uploadKey, string token, CancellationToken cancellationToken = default);
 }
 
 public record PresignedUploadResult(
     string UploadUrl,
     string PublicUrl,
     Dictionary<string, string> Fields
+);
+
+public enum UploadChunkStatus
+{
+    InProgress,
+    Completed,
+    InvalidToken,
+    OffsetMismatch,
+    TooLarge,
+    ChecksumMismatch
+}
+
+public record UploadChunkResult(
+    UploadChunkStatus Status,
+    long ReceivedBytes,
+    long? TotalBytes = null,
+    string? Sha256 = null
 );
\ No newline at end of file
@@ -12,26 +12,50 @@ public interface IJwtService
     ClaimsPrincipal? ValidateToken(string token);
 }
 
+/// <summary>
+/// Issues and validates access tokens. Signing credentials and validation parameters are built once,
+/// and validated tokens are remembered in JwtValidationCache until they expire or their user is revoked.
+/// </summary>
 public class JwtService : IJwtService
 {
-    private readonly IConfiguration _configuration;
-    private readonly string _secret;
+    public static readonly TimeSpan AccessTokenLifetime = TimeSpan.FromMinutes(60);
+
+    private readonly JwtSecurityTokenHandler _tokenHandler = new();
     private readonly string _issuer;
     private readonly string _audience;
+    private readonly SigningCredentials _signingCredentials;
+    private readonly TokenValidationParameters _validationParameters;
+    private readonly JwtValidationCache _validationCache;
 
-    public JwtService(IConfiguration configuration)
+    public JwtService(IConfiguration configuration, JwtValidationCache validationCache)
     {
-        _configuration = configuration;
-        _secret = _configuration["Jwt:Secret"] ?? "your-256-bit-secret-key-here-make-it-long-enough-for-security";
-        _issuer = _configuration["Jwt:Issuer"] ?? "adaplio-api";
-        _audience = _configuration["Jwt:Audience"] ?? "adaplio-frontend";
+        _issuer = configuration["Jwt:Issuer"] ?? "adaplio-api";
+        _audience = configuration["Jwt:Audience"] ?? "adaplio-frontend";
+        _validationParameters = CreateValidationParameters(configuration);
+        _signingCredentials = new SigningCredentials(_validationParameters.IssuerSigningKey, SecurityAlgorithms.HmacSha256Signature);
+        _validationCache = validationCache;
     }
 
-    public string GenerateToken(JwtClaims claims)
+    /// <summary>Validation rules shared by ValidateToken and the JwtBearer handler</summary>
+    public static TokenValidationParameters CreateValidationParameters(IConfiguration configuration)
     {
-        var tokenHandler = new JwtSecurityTokenHandler();
-        var key = Encoding.ASCII.GetBytes(_secret);
+        var secret = configuration["Jwt:Secret"] ?? "your-256-bit-secret-key-here-make-it-long-enough-for-security";
 
+        return new TokenValidationParameters
+        {
+            ValidateIssuerSigningKey = true,
+            IssuerSigningKey = new SymmetricSecurityKey(Encoding.ASCII.GetBytes(secret)),
+            ValidateIssuer = true,
+            ValidIssuer = configuration["Jwt:Issuer"] ?? "adaplio-api",
+            ValidateAudience = true,
+            ValidAudience = configuration["Jwt:Audience"] ?? "adaplio-frontend",
+            ValidateLifetime = true,
+            ClockSkew = TimeSpan.Zero
+        };
+    }
+
+    public string GenerateToken(JwtClaims claims)
+    {
         var tokenClaims = new List<Claim>
         {
             new(ClaimTypes.NameIdentifier, claims.UserId),
@@ -48,36 +72,38 @@ public string GenerateToken(JwtClaims claims)
         var tokenDescriptor = new SecurityTokenDescriptor
         {
             Subject = new ClaimsIdentity(tokenClaims),
-            Expires = DateTime.UtcNow.AddMinutes(60), // Short-lived access token (1 hour)
+            Expires = DateTime.UtcNow.Add(AccessTokenLifetime), // Short-lived access token (1 hour)
             Issuer = _issuer,
             Audience = _audience,
-            SigningCredentials = new SigningCredentials(new SymmetricSecurityKey(key), SecurityAlgorithms.HmacSha256Signature)
+            SigningCredentials = _signingCredentials
         };
 
-        var token = tokenHandler.CreateToken(tokenDescriptor);
-        return tokenHandler.WriteToken(token);
+        var token = _tokenHandler.CreateToken(tokenDescriptor);
+        return _tokenHandler.WriteToken(token);
     }
 
     public ClaimsPrincipal? ValidateToken(string token)
     {
+        if (_validationCache.TryGet(token, out var cached))
+        {
+            return cached;
+        }
+
         try
         {
-            var tokenHandler = new JwtSecurityTokenHandler();
-            var key = Encoding.ASCII.GetBytes(_secret);
+            var principal = _tokenHandler.ValidateToken(token, _validationParameters, out var validatedToken);
+
+            var userId = int.TryParse(principal.FindFirst(ClaimTypes.NameIdentifier)?.Value, out var parsedUserId)
+                ? parsedUserId
+                : (int?)null;
+            var issuedAt = validatedToken is JwtSecurityToken jwt ? new DateTimeOffset(jwt.IssuedAt, TimeSpan.Zero) : DateTimeOffset.MinValue;
 
-            var validationParameters = new TokenValidationParameters
+            if (_validationCache.IsRevoked(userId, issuedAt))
             {
-                ValidateIssuerSigningKey = true,
-                IssuerSigningKey = new SymmetricSecurityKey(key),
-                ValidateIssuer = true,
-                ValidIssuer = _issuer,
-                ValidateAudience = true,
-                ValidAudience = _audience,
-                ValidateLifetime = true,
-                ClockSkew = TimeSpan.Zero
-            };
-
-            var principal = tokenHandler.ValidateToken(token, validationParameters, out var validatedToken);
+                return null;
+            }
+
+            _validationCache.Add(token, principal, userId, issuedAt, new DateTimeOffset(validatedToken.ValidTo, TimeSpan.Zero));
             return principal;
         }
         catch
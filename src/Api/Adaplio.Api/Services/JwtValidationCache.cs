@@ -0,0 +1,187 @@
+using System.Security.Claims;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace Adaplio.Api.Services;
+
+public record JwtValidationCacheStats(
+    bool Enabled,
+    long Hits,
+    long Misses,
+    long Evictions,
+    long Revocations,
+    int Entries,
+    int MaxEntries,
+    double HitRate
+);
+
+/// <summary>
+/// Principals of recently validated access tokens, keyed by the SHA-256 of the token so raw tokens
+/// are never held. Entries expire at the token's exp and the least recently used entry is evicted past
+/// Jwt:ValidationCacheSize (0 disables caching). Also holds per-user revocations: tokens issued at or
+/// before a user's revocation are rejected, cached or not, until they would have expired anyway.
+/// </summary>
+public class JwtValidationCache
+{
+    private sealed class CacheEntry
+    {
+        public required string Key { get; init; }
+        public required ClaimsPrincipal Principal { get; init; }
+        public required int? UserId { get; init; }
+        public required DateTimeOffset IssuedAt { get; init; }
+        public required DateTimeOffset ExpiresAt { get; init; }
+    }
+
+    private readonly object _lock = new();
+    private readonly Dictionary<string, LinkedListNode<CacheEntry>> _entries = new(StringComparer.Ordinal);
+    private readonly LinkedList<CacheEntry> _recency = new(); // Most recently used first
+    private readonly Dictionary<int, DateTimeOffset> _revokedAt = new();
+
+    private readonly int _maxEntries;
+    private readonly TimeProvider _timeProvider;
+
+    private long _hits;
+    private long _misses;
+    private long _evictions;
+    private long _revocations;
+
+    public JwtValidationCache(IConfiguration configuration) : this(configuration, TimeProvider.System)
+    {
+    }
+
+    public JwtValidationCache(IConfiguration configuration, TimeProvider timeProvider)
+    {
+        _maxEntries = configuration.GetValue("Jwt:ValidationCacheSize", 10000);
+        _timeProvider = timeProvider;
+    }
+
+    public bool TryGet(string token, out ClaimsPrincipal principal)
+    {
+        principal = null!;
+        if (_maxEntries <= 0)
+        {
+            return false;
+        }
+
+        var key = HashToken(token);
+        lock (_lock)
+        {
+            if (_entries.TryGetValue(key, out var node))
+            {
+                var entry = node.Value;
+                if (entry.ExpiresAt > _timeProvider.GetUtcNow() && !IsRevokedLocked(entry.UserId, entry.IssuedAt))
+                {
+                    _recency.Remove(node);
+                    _recency.AddFirst(node);
+                    _hits++;
+
+                    // Callers may add identities or claims; keep the cached principal pristine
+                    principal = entry.Principal.Clone();
+                    return true;
+                }
+
+                RemoveNode(node);
+            }
+
+            _misses++;
+            return false;
+        }
+    }
+
+    public void Add(string token, ClaimsPrincipal principal, int? userId, DateTimeOffset issuedAt, DateTimeOffset expiresAt)
+    {
+        if (_maxEntries <= 0)
+        {
+            return;
+        }
+
+        var key = HashToken(token);
+        lock (_lock)
+        {
+            if (_entries.ContainsKey(key) || IsRevokedLocked(userId, issuedAt))
+            {
+                return;
+            }
+
+            _entries[key] = _recency.AddFirst(new CacheEntry
+            {
+                Key = key,
+                Principal = principal.Clone(),
+                UserId = userId,
+                IssuedAt = issuedAt,
+                ExpiresAt = expiresAt
+            });
+
+            while (_entries.Count > _maxEntries && _recency.Last != null)
+            {
+                RemoveNode(_recency.Last);
+                _evictions++;
+            }
+        }
+    }
+
+    public bool IsRevoked(int? userId, DateTimeOffset issuedAt)
+    {
+        lock (_lock)
+        {
+            return IsRevokedLocked(userId, issuedAt);
+        }
+    }
+
+    /// <summary>Rejects every token issued to the user up to now</summary>
+    public void RevokeUser(int userId)
+    {
+        var now = _timeProvider.GetUtcNow();
+        lock (_lock)
+        {
+            _revokedAt[userId] = now;
+            _revocations++;
+
+            // Revocations outlive every token they can match by at most one token lifetime
+            foreach (var (revokedUserId, revokedAt) in _revokedAt.ToList())
+            {
+                if (now - revokedAt > JwtService.AccessTokenLifetime)
+                {
+                    _revokedAt.Remove(revokedUserId);
+                }
+            }
+        }
+    }
+
+    public JwtValidationCacheStats GetStats()
+    {
+        lock (_lock)
+        {
+            var lookups = _hits + _misses;
+            return new JwtValidationCacheStats(
+                _maxEntries > 0,
+                _hits,
+                _misses,
+                _evictions,
+                _revocations,
+                _entries.Count,
+                _maxEntries,
+                lookups > 0 ? Math.Round((double)_hits / lookups, 4) : 0
+            );
+        }
+    }
+
+    private bool IsRevokedLocked(int? userId, DateTimeOffset issuedAt)
+    {
+        // iat has whole-second precision, so a token issued in the same second as the revocation is rejected too
+        return userId != null
+            && _revokedAt.TryGetValue(userId.Value, out var revokedAt)
+            && issuedAt.ToUnixTimeSeconds() <= revokedAt.ToUnixTimeSeconds();
+    }
+
+    private void RemoveNode(LinkedListNode<CacheEntry> node)
+    {
+        _recency.Remove(node);
+        _entries.Remove(node.Value.Key);
+    }
+
+    private static string HashToken(string token)
+    {
+        return Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(token)));
+    }
+}
@@ -0,0 +1,64 @@
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Periodically deletes sent and failed outbox messages created more than Outbox:RetentionDays ago. Every magic
+/// link and invite adds a row, so without this the table only grows. Deletes run in bounded batches to keep each
+/// statement's locks short.
+/// </summary>
+public class OutboxCleanupService : BackgroundService
+{
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly ILogger<OutboxCleanupService> _logger;
+    private readonly TimeSpan _interval;
+    private readonly TimeSpan _retention;
+    private readonly int _batchSize;
+
+    public OutboxCleanupService(
+        IServiceScopeFactory scopeFactory,
+        IConfiguration configuration,
+        ILogger<OutboxCleanupService> logger)
+    {
+        _scopeFactory = scopeFactory;
+        _logger = logger;
+        _interval = TimeSpan.FromMinutes(configuration.GetValue("Outbox:CleanupIntervalMinutes", 60));
+        _retention = TimeSpan.FromDays(configuration.GetValue("Outbox:RetentionDays", 7));
+        _batchSize = Math.Max(1, configuration.GetValue("Outbox:CleanupBatchSize", 1000));
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        using var timer = new PeriodicTimer(_interval);
+
+        while (await timer.WaitForNextTickAsync(stoppingToken))
+        {
+            try
+            {
+                using var scope = _scopeFactory.CreateScope();
+                var outbox = scope.ServiceProvider.GetRequiredService<IOutboxService>();
+
+                var cutoff = DateTimeOffset.UtcNow - _retention;
+                var total = 0;
+                int deleted;
+                do
+                {
+                    deleted = await outbox.CleanupFinishedAsync(cutoff, _batchSize, stoppingToken);
+                    total += deleted;
+                }
+                while (deleted == _batchSize && !stoppingToken.IsCancellationRequested);
+
+                if (total > 0)
+                {
+                    _logger.LogInformation("Outbox cleanup deleted {Count} finished messages older than {Cutoff}", total, cutoff);
+                }
+            }
+            catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+            {
+                break;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Outbox cleanup failed");
+            }
+        }
+    }
+}
@@ -0,0 +1,366 @@
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Query;
+using System.Collections.Concurrent;
+using System.Linq.Expressions;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Delivers queued OutboxMessage rows. Every Outbox:PollIntervalMs it claims due messages for providers with
+/// free slots and starts sending them without waiting for the batch, so a slow provider only ever holds its own
+/// Outbox:Concurrency:{provider} slots. Failed sends are retried with exponential backoff until Outbox:MaxAttempts.
+/// A claim is a conditional UPDATE fenced by the attempt number, so concurrent dispatchers never send the same
+/// attempt; a claim that outlives Outbox:ClaimSeconds (the instance died mid-send) is taken over, which makes
+/// delivery at-least-once. A message past its NotAfter (the code or link it carries has expired) is failed
+/// instead of sent, and is not retried beyond it.
+/// </summary>
+public class OutboxDispatcher : BackgroundService
+{
+    private const string SqliteProvider = "Microsoft.EntityFrameworkCore.Sqlite";
+    private const int MaxErrorLength = 1000;
+    private const string ExpiredError = "Expired before delivery";
+
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly IConfiguration _configuration;
+    private readonly ILogger<OutboxDispatcher> _logger;
+    private readonly TimeProvider _timeProvider;
+    private readonly TimeSpan _pollInterval;
+    private readonly int _batchSize;
+    private readonly int _maxAttempts;
+    private readonly TimeSpan _retryBaseDelay;
+    private readonly TimeSpan _retryMaxDelay;
+    private readonly TimeSpan _claimDuration;
+    private readonly ConcurrentDictionary<string, SemaphoreSlim> _providerSlots = new();
+    private readonly ConcurrentDictionary<Task, byte> _inFlight = new();
+
+    public OutboxDispatcher(
+        IServiceScopeFactory scopeFactory,
+        IConfiguration configuration,
+        ILogger<OutboxDispatcher> logger)
+        : this(scopeFactory, configuration, logger, TimeProvider.System)
+    {
+    }
+
+    public OutboxDispatcher(
+        IServiceScopeFactory scopeFactory,
+        IConfiguration configuration,
+        ILogger<OutboxDispatcher> logger,
+        TimeProvider timeProvider)
+    {
+        _scopeFactory = scopeFactory;
+        _configuration = configuration;
+        _logger = logger;
+        _timeProvider = timeProvider;
+        _pollInterval = TimeSpan.FromMilliseconds(Math.Max(10, configuration.GetValue("Outbox:PollIntervalMs", 1000)));
+        _batchSize = Math.Max(1, configuration.GetValue("Outbox:BatchSize", 100));
+        _maxAttempts = Math.Max(1, configuration.GetValue("Outbox:MaxAttempts", 8));
+        _retryBaseDelay = TimeSpan.FromSeconds(Math.Max(0, configuration.GetValue("Outbox:RetryBaseSeconds", 5)));
+        _retryMaxDelay = TimeSpan.FromSeconds(Math.Max(0, configuration.GetValue("Outbox:RetryMaxSeconds", 900)));
+        _claimDuration = TimeSpan.FromSeconds(Math.Max(1, configuration.GetValue("Outbox:ClaimSeconds", 120)));
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        using var timer = new PeriodicTimer(_pollInterval);
+
+        try
+        {
+            do
+            {
+                try
+                {
+                    await DispatchDueAsync(stoppingToken);
+                }
+                catch (Exception ex) when (!stoppingToken.IsCancellationRequested)
+                {
+                    _logger.LogError(ex, "Outbox dispatch failed");
+                }
+            }
+            while (await timer.WaitForNextTickAsync(stoppingToken));
+        }
+        catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+        {
+            // Shutting down; sends still running are cancelled and hand their messages back below
+        }
+
+        await WhenIdleAsync();
+    }
+
+    /// <summary>
+    /// Claims the messages that are due and starts sending them. Returns how many were claimed; the sends
+    /// themselves finish in the background (see WhenIdleAsync).
+    /// </summary>
+    public async Task<int> DispatchDueAsync(CancellationToken cancellationToken = default)
+    {
+        using var scope = _scopeFactory.CreateScope();
+        var context = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        var now = _timeProvider.GetUtcNow();
+
+        // Providers with every slot taken are left out, so their backlog cannot crowd the others out of the batch
+        var busyProviders = _providerSlots
+            .Where(p => p.Value.CurrentCount == 0)
+            .Select(p => p.Key)
+            .ToList();
+
+        var claimed = 0;
+        foreach (var message in await FindDueAsync(context, now, busyProviders, cancellationToken))
+        {
+            if (message.NotAfter <= now)
+            {
+                await ExpireAsync(context, message, cancellationToken);
+                continue;
+            }
+
+            var slots = ProviderSlots(message.Provider);
+            if (!slots.Wait(0))
+            {
+                continue; // Provider filled up during this batch; the message stays due
+            }
+
+            try
+            {
+                var attempt = message.Attempts + 1;
+                var lockedUntil = now + _claimDuration;
+                var won = await context.OutboxMessages
+                    .Where(om => om.Id == message.Id && om.Status == message.Status && om.Attempts == message.Attempts)
+                    .ExecuteUpdateAsync(setters => setters
+                        .SetProperty(om => om.Status, OutboxMessage.Sending)
+                        .SetProperty(om => om.Attempts, attempt)
+                        .SetProperty(om => om.LockedUntil, lockedUntil), cancellationToken);
+
+                if (won == 0)
+                {
+                    slots.Release(); // Another dispatcher claimed it first
+                    continue;
+                }
+
+                message.Status = OutboxMessage.Sending;
+                message.Attempts = attempt;
+            }
+            catch
+            {
+                slots.Release();
+                throw;
+            }
+
+            // Tracked by task rather than id: a taken-over message can have two attempts in flight
+            var send = SendAsync(message, slots, cancellationToken);
+            _inFlight[send] = 0;
+            _ = send.ContinueWith(completed => _inFlight.TryRemove(completed, out _), TaskScheduler.Default);
+            claimed++;
+        }
+
+        return claimed;
+    }
+
+    /// <summary>
+    /// Completes once every send started so far has recorded its outcome
+    /// </summary>
+    public Task WhenIdleAsync()
+    {
+        return Task.WhenAll(_inFlight.Keys);
+    }
+
+    private async Task<List<OutboxMessage>> FindDueAsync(
+        AppDbContext context,
+        DateTimeOffset now,
+        List<string> busyProviders,
+        CancellationToken cancellationToken)
+    {
+        var open = context.OutboxMessages
+            .AsNoTracking()
+            .Where(om => om.Status == OutboxMessage.Pending || om.Status == OutboxMessage.Sending)
+            .Where(om => !busyProviders.Contains(om.Provider));
+
+        if (context.Database.ProviderName != SqliteProvider)
+        {
+            return await open
+                .Where(om => (om.Status == OutboxMessage.Pending && om.NextAttemptAt <= now)
+                    || (om.Status == OutboxMessage.Sending && om.LockedUntil < now))
+                .OrderBy(om => om.Id)
+                .Take(_batchSize)
+                .ToListAsync(cancellationToken);
+        }
+
+        // SQLite cannot compare DateTimeOffset server-side; pick the due ids from a narrow projection of the open rows
+        var schedule = await open
+            .Select(om => new { om.Id, om.Status, om.NextAttemptAt, om.LockedUntil })
+            .ToListAsync(cancellationToken);
+
+        var dueIds = schedule
+            .Where(om => om.Status == OutboxMessage.Pending ? om.NextAttemptAt <= now : om.LockedUntil < now)
+            .OrderBy(om => om.Id)
+            .Take(_batchSize)
+            .Select(om => om.Id)
+            .ToList();
+
+        if (dueIds.Count == 0)
+        {
+            return new List<OutboxMessage>();
+        }
+
+        return await context.OutboxMessages
+            .AsNoTracking()
+            .Where(om => dueIds.Contains(om.Id))
+            .OrderBy(om => om.Id)
+            .ToListAsync(cancellationToken);
+    }
+
+    private async Task ExpireAsync(AppDbContext context, OutboxMessage message, CancellationToken cancellationToken)
+    {
+        var lastError = message.LastError == null ? ExpiredError : $"{ExpiredError}: {message.LastError}";
+        if (lastError.Length > MaxErrorLength)
+        {
+            lastError = lastError[..MaxErrorLength];
+        }
+
+        // Same fence as a claim, so a message another dispatcher just claimed is left to it
+        var expired = await context.OutboxMessages
+            .Where(om => om.Id == message.Id && om.Status == message.Status && om.Attempts == message.Attempts)
+            .ExecuteUpdateAsync(setters => setters
+                .SetProperty(om => om.Status, OutboxMessage.Failed)
+                .SetProperty(om => om.LockedUntil, (DateTimeOffset?)null)
+                .SetProperty(om => om.LastError, lastError), cancellationToken);
+
+        if (expired > 0)
+        {
+            _logger.LogWarning("Dropping {Channel} to {Recipient} via {Provider}: expired at {NotAfter} after {Attempts} attempts",
+                message.Channel, message.Recipient, message.Provider, message.NotAfter, message.Attempts);
+        }
+    }
+
+    private SemaphoreSlim ProviderSlots(string provider)
+    {
+        return _providerSlots.GetOrAdd(provider, name =>
+        {
+            var limit = Math.Max(1, _configuration.GetValue($"Outbox:Concurrency:{name}",
+                _configuration.GetValue("Outbox:DefaultConcurrency", 4)));
+            return new SemaphoreSlim(limit, limit);
+        });
+    }
+
+    private async Task SendAsync(OutboxMessage message, SemaphoreSlim slots, CancellationToken stoppingToken)
+    {
+        try
+        {
+            try
+            {
+                using var scope = _scopeFactory.CreateScope();
+                switch (message.Channel)
+                {
+                    case OutboxMessage.EmailChannel:
+                        await scope.ServiceProvider.GetRequiredService<IEmailService>().DeliverAsync(
+                            new EmailMessage(message.Recipient, message.Subject ?? string.Empty, message.HtmlBody ?? string.Empty, message.Body),
+                            stoppingToken);
+                        break;
+                    case OutboxMessage.SmsChannel:
+                        await scope.ServiceProvider.GetRequiredService<ISMSService>().DeliverAsync(
+                            message.Recipient, message.Body, stoppingToken);
+                        break;
+                    default:
+                        throw new InvalidOperationException($"Unknown outbox channel '{message.Channel}'");
+                }
+            }
+            catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+            {
+                // Interrupted by shutdown: hand the message back without counting the attempt
+                var releasedAttempts = message.Attempts - 1;
+                var retryAt = _timeProvider.GetUtcNow();
+                await RecordAsync(message, setters => setters
+                    .SetProperty(om => om.Status, OutboxMessage.Pending)
+                    .SetProperty(om => om.Attempts, releasedAttempts)
+                    .SetProperty(om => om.NextAttemptAt, retryAt)
+                    .SetProperty(om => om.LockedUntil, (DateTimeOffset?)null));
+                return;
+            }
+            catch (Exception ex)
+            {
+                await RecordFailureAsync(message, ex);
+                return;
+            }
+
+            var sentAt = _timeProvider.GetUtcNow();
+            await RecordAsync(message, setters => setters
+                .SetProperty(om => om.Status, OutboxMessage.Sent)
+                .SetProperty(om => om.SentAt, sentAt)
+                .SetProperty(om => om.LockedUntil, (DateTimeOffset?)null)
+                .SetProperty(om => om.LastError, (string?)null));
+        }
+        catch (Exception ex)
+        {
+            // The claim expires and the message is picked up again
+            _logger.LogError(ex, "Could not record the outcome of outbox message {MessageId}", message.Id);
+        }
+        finally
+        {
+            slots.Release();
+        }
+    }
+
+    private async Task RecordFailureAsync(OutboxMessage message, Exception error)
+    {
+        var lastError = error.Message.Length > MaxErrorLength ? error.Message[..MaxErrorLength] : error.Message;
+
+        if (message.Attempts >= _maxAttempts)
+        {
+            _logger.LogError(error, "Giving up on {Channel} to {Recipient} via {Provider} after {Attempts} attempts",
+                message.Channel, message.Recipient, message.Provider, message.Attempts);
+            await RecordAsync(message, setters => setters
+                .SetProperty(om => om.Status, OutboxMessage.Failed)
+                .SetProperty(om => om.LockedUntil, (DateTimeOffset?)null)
+                .SetProperty(om => om.LastError, lastError));
+            return;
+        }
+
+        var retryAt = _timeProvider.GetUtcNow() + RetryDelay(message.Attempts);
+        if (retryAt >= message.NotAfter)
+        {
+            _logger.LogWarning(error, "Giving up on {Channel} to {Recipient} via {Provider}: the next attempt would be after it expires at {NotAfter}",
+                message.Channel, message.Recipient, message.Provider, message.NotAfter);
+            await RecordAsync(message, setters => setters
+                .SetProperty(om => om.Status, OutboxMessage.Failed)
+                .SetProperty(om => om.LockedUntil, (DateTimeOffset?)null)
+                .SetProperty(om => om.LastError, lastError));
+            return;
+        }
+
+        _logger.LogWarning(error, "{Channel} to {Recipient} via {Provider} failed (attempt {Attempt}), retrying at {RetryAt}",
+            message.Channel, message.Recipient, message.Provider, message.Attempts, retryAt);
+        await RecordAsync(message, setters => setters
+            .SetProperty(om => om.Status, OutboxMessage.Pending)
+            .SetProperty(om => om.NextAttemptAt, retryAt)
+            .SetProperty(om => om.LockedUntil, (DateTimeOffset?)null)
+            .SetProperty(om => om.LastError, lastError));
+    }
+
+    /// <summary>
+    /// Outbox:RetryBaseSeconds doubled for every attempt after the first, capped at Outbox:RetryMaxSeconds
+    /// </summary>
+    private TimeSpan RetryDelay(int attempts)
+    {
+        var factor = Math.Pow(2, Math.Min(attempts - 1, 30));
+        return TimeSpan.FromSeconds(Math.Min(_retryBaseDelay.TotalSeconds * factor, _retryMaxDelay.TotalSeconds));
+    }
+
+    private async Task RecordAsync(
+        OutboxMessage message,
+        Expression<Func<SetPropertyCalls<OutboxMessage>, SetPropertyCalls<OutboxMessage>>> setters)
+    {
+        using var scope = _scopeFactory.CreateScope();
+        var context = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        // Fenced by the attempt: if this claim expired and another dispatcher took the message over, its outcome stands.
+        // Not cancellable, so outcomes are still recorded during shutdown.
+        var updated = await context.OutboxMessages
+            .Where(om => om.Id == message.Id && om.Status == OutboxMessage.Sending && om.Attempts == message.Attempts)
+            .ExecuteUpdateAsync(setters);
+
+        if (updated == 0)
+        {
+            _logger.LogWarning("Outbox message {MessageId} was taken over before attempt {Attempt} finished",
+                message.Id, message.Attempts);
+        }
+    }
+}
\ No newline at end of file
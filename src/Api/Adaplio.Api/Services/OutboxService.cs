@@ -0,0 +1,126 @@
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+using Microsoft.EntityFrameworkCore;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Queues email and SMS on the request's DbContext. Nothing is written until the caller's SaveChanges,
+/// so a message is committed together with the magic link or invite it announces, or not at all.
+/// OutboxDispatcher delivers it afterwards. A message given notAfter is failed rather than sent once that passes.
+/// </summary>
+public interface IOutboxService
+{
+    OutboxMessage EnqueueEmail(EmailMessage message, DateTimeOffset? notAfter = null);
+    OutboxMessage EnqueueSms(string phoneNumber, string message, DateTimeOffset? notAfter = null);
+
+    /// <summary>
+    /// Deletes up to batchSize sent or failed messages created before cutoff. Returns how many were deleted.
+    /// </summary>
+    Task<int> CleanupFinishedAsync(DateTimeOffset cutoff, int batchSize, CancellationToken cancellationToken = default);
+}
+
+public class OutboxService : IOutboxService
+{
+    private const string SqliteProvider = "Microsoft.EntityFrameworkCore.Sqlite";
+
+    private readonly AppDbContext _context;
+    private readonly IEmailService _emailService;
+    private readonly ISMSService _smsService;
+
+    public OutboxService(AppDbContext context, IEmailService emailService, ISMSService smsService)
+    {
+        _context = context;
+        _emailService = emailService;
+        _smsService = smsService;
+    }
+
+    public OutboxMessage EnqueueEmail(EmailMessage message, DateTimeOffset? notAfter = null)
+    {
+        return Add(new OutboxMessage
+        {
+            Channel = OutboxMessage.EmailChannel,
+            Provider = _emailService.Provider,
+            Recipient = message.To,
+            Subject = message.Subject,
+            Body = message.Text,
+            HtmlBody = message.Html,
+            NotAfter = notAfter
+        });
+    }
+
+    public OutboxMessage EnqueueSms(string phoneNumber, string message, DateTimeOffset? notAfter = null)
+    {
+        return Add(new OutboxMessage
+        {
+            Channel = OutboxMessage.SmsChannel,
+            Provider = _smsService.Provider ?? throw new InvalidOperationException("No SMS provider configured"),
+            Recipient = phoneNumber,
+            Body = message,
+            NotAfter = notAfter
+        });
+    }
+
+    private OutboxMessage Add(OutboxMessage message)
+    {
+        var now = DateTimeOffset.UtcNow;
+        message.Status = OutboxMessage.Pending;
+        message.CreatedAt = now;
+        message.NextAttemptAt = now;
+
+        _context.OutboxMessages.Add(message);
+        return message;
+    }
+
+    public async Task<int> CleanupFinishedAsync(DateTimeOffset cutoff, int batchSize, CancellationToken cancellationToken = default)
+    {
+        var ids = await FindFinishedIdsAsync(cutoff, batchSize, cancellationToken);
+        if (ids.Count == 0)
+        {
+            return 0;
+        }
+
+        return await _context.OutboxMessages
+            .Where(om => ids.Contains(om.Id))
+            .ExecuteDeleteAsync(cancellationToken);
+    }
+
+    private async Task<List<long>> FindFinishedIdsAsync(DateTimeOffset cutoff, int batchSize, CancellationToken cancellationToken)
+    {
+        var finished = _context.OutboxMessages
+            .Where(om => om.Status == OutboxMessage.Sent || om.Status == OutboxMessage.Failed);
+
+        if (_context.Database.ProviderName != SqliteProvider)
+        {
+            return await finished
+                .Where(om => om.CreatedAt < cutoff)
+                .OrderBy(om => om.Id)
+                .Select(om => om.Id)
+                .Take(batchSize)
+                .ToListAsync(cancellationToken);
+        }
+
+        // SQLite cannot compare DateTimeOffset server-side; walk the key in pages of narrow rows instead
+        var ids = new List<long>();
+        var afterId = 0L;
+        while (ids.Count < batchSize)
+        {
+            var rows = await finished
+                .Where(om => om.Id > afterId)
+                .OrderBy(om => om.Id)
+                .Take(batchSize)
+                .Select(om => new { om.Id, om.CreatedAt })
+                .ToListAsync(cancellationToken);
+
+            if (rows.Count == 0)
+            {
+                break;
+            }
+
+            ids.AddRange(rows.Where(r => r.CreatedAt < cutoff).Select(r => r.Id));
+            afterId = rows[^1].Id;
+        }
+
+        return ids.Take(batchSize).ToList();
+    }
+}
\ No newline at end of file
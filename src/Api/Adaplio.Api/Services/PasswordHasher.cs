@@ -0,0 +1,229 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Security.Cryptography;
+using System.Text;
+using Microsoft.Extensions.Caching.Memory;
+
+namespace Adaplio.Api.Services;
+
+public interface IPasswordHasher
+{
+    /// <summary>Hashes with the configured work factor; throws PasswordHasherBusyException when saturated</summary>
+    Task<string> HashAsync(string password, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Verifies a password. When the hash was made with a lower work factor than configured, the result
+    /// carries a rehash the caller should store. Throws PasswordHasherBusyException when saturated.
+    /// </summary>
+    Task<PasswordVerification> VerifyAsync(string password, string passwordHash, CancellationToken cancellationToken = default);
+
+    PasswordHasherStats GetStats();
+}
+
+public readonly record struct PasswordVerification(bool Verified, string? UpgradedHash = null);
+
+public record PasswordHasherStats(
+    int Workers,
+    int Pending,
+    int Capacity,
+    long Completed,
+    long Rejected,
+    long Upgraded,
+    long FastPathHits,
+    double AverageWorkMs
+);
+
+/// <summary>Thrown when the hashing queue is full; the request should be retried after RetryAfter</summary>
+public class PasswordHasherBusyException : Exception
+{
+    public PasswordHasherBusyException(TimeSpan retryAfter)
+        : base("Password hashing queue is full")
+    {
+        RetryAfter = retryAfter;
+    }
+
+    public TimeSpan RetryAfter { get; }
+}
+
+/// <summary>
+/// Runs BCrypt on a fixed set of dedicated threads fed by a bounded queue, so a login storm waits in
+/// the queue instead of pinning thread-pool threads, and is shed once PasswordHashing:QueueCapacity
+/// requests are waiting. Successful verifications are remembered for PasswordHashing:VerifiedCacheSeconds
+/// under an HMAC of (hash, password) with a per-process key, so repeat logins skip BCrypt; changing the
+/// password changes the hash and with it the key.
+/// </summary>
+public sealed class PasswordHasher : IPasswordHasher, IDisposable
+{
+    private interface IWorkItem
+    {
+        void Execute();
+    }
+
+    private sealed class WorkItem<T> : IWorkItem
+    {
+        private readonly Func<T> _work;
+        private readonly CancellationToken _cancellationToken;
+
+        public WorkItem(Func<T> work, CancellationToken cancellationToken)
+        {
+            _work = work;
+            _cancellationToken = cancellationToken;
+        }
+
+        // Continuations must not run on the hashing thread
+        public TaskCompletionSource<T> Completion { get; } = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        public void Execute()
+        {
+            if (_cancellationToken.IsCancellationRequested)
+            {
+                Completion.TrySetCanceled(_cancellationToken);
+                return;
+            }
+
+            try
+            {
+                Completion.TrySetResult(_work());
+            }
+            catch (Exception ex)
+            {
+                Completion.TrySetException(ex);
+            }
+        }
+    }
+
+    private readonly BlockingCollection<IWorkItem> _queue;
+    private readonly Thread[] _workers;
+    private readonly IMemoryCache _cache;
+    private readonly byte[] _cacheKey = RandomNumberGenerator.GetBytes(32);
+    private readonly TimeSpan _verifiedCacheLifetime;
+    private readonly int _capacity;
+
+    private long _completed;
+    private long _rejected;
+    private long _upgraded;
+    private long _fastPathHits;
+    private long _workTicks;
+
+    public PasswordHasher(IConfiguration configuration, IMemoryCache cache)
+    {
+        WorkFactor = configuration.GetValue("PasswordHashing:WorkFactor", 11);
+        _capacity = configuration.GetValue("PasswordHashing:QueueCapacity", 256);
+        _verifiedCacheLifetime = TimeSpan.FromSeconds(configuration.GetValue("PasswordHashing:VerifiedCacheSeconds", 300));
+        _cache = cache;
+        _queue = new BlockingCollection<IWorkItem>(new ConcurrentQueue<IWorkItem>(), _capacity);
+
+        var workers = configuration.GetValue("PasswordHashing:Workers", 0);
+        _workers = new Thread[workers > 0 ? workers : Environment.ProcessorCount];
+        for (var i = 0; i < _workers.Length; i++)
+        {
+            _workers[i] = new Thread(Work) { IsBackground = true, Name = $"password-hasher-{i}" };
+            _workers[i].Start();
+        }
+    }
+
+    public int WorkFactor { get; }
+
+    public Task<string> HashAsync(string password, CancellationToken cancellationToken = default)
+    {
+        return Enqueue(() => BCrypt.Net.BCrypt.HashPassword(password, WorkFactor), cancellationToken);
+    }
+
+    public async Task<PasswordVerification> VerifyAsync(string password, string passwordHash, CancellationToken cancellationToken = default)
+    {
+        var cacheKey = _verifiedCacheLifetime > TimeSpan.Zero ? VerifiedCacheKey(password, passwordHash) : null;
+        if (cacheKey != null && _cache.TryGetValue(cacheKey, out _))
+        {
+            Interlocked.Increment(ref _fastPathHits);
+            return new PasswordVerification(true);
+        }
+
+        var result = await Enqueue(() =>
+        {
+            if (!BCrypt.Net.BCrypt.Verify(password, passwordHash))
+            {
+                return new PasswordVerification(false);
+            }
+
+            // Cost upgrade while the plaintext is at hand; costs one extra hash per account
+            return BCrypt.Net.BCrypt.PasswordNeedsRehash(passwordHash, WorkFactor)
+                ? new PasswordVerification(true, BCrypt.Net.BCrypt.HashPassword(password, WorkFactor))
+                : new PasswordVerification(true);
+        }, cancellationToken);
+
+        if (result.UpgradedHash != null)
+        {
+            Interlocked.Increment(ref _upgraded);
+        }
+
+        if (result.Verified && cacheKey != null)
+        {
+            _cache.Set(VerifiedCacheKey(password, result.UpgradedHash ?? passwordHash), true, _verifiedCacheLifetime);
+        }
+
+        return result;
+    }
+
+    public PasswordHasherStats GetStats()
+    {
+        var completed = Interlocked.Read(ref _completed);
+        var workTicks = Interlocked.Read(ref _workTicks);
+
+        return new PasswordHasherStats(
+            _workers.Length,
+            _queue.Count,
+            _capacity,
+            completed,
+            Interlocked.Read(ref _rejected),
+            Interlocked.Read(ref _upgraded),
+            Interlocked.Read(ref _fastPathHits),
+            completed > 0 ? Math.Round(TimeSpan.FromTicks(workTicks / completed).TotalMilliseconds, 1) : 0);
+    }
+
+    public void Dispose()
+    {
+        _queue.CompleteAdding();
+        foreach (var worker in _workers)
+        {
+            worker.Join(TimeSpan.FromSeconds(5));
+        }
+        _queue.Dispose();
+    }
+
+    private Task<T> Enqueue<T>(Func<T> work, CancellationToken cancellationToken)
+    {
+        var item = new WorkItem<T>(work, cancellationToken);
+        if (!_queue.TryAdd(item))
+        {
+            Interlocked.Increment(ref _rejected);
+            throw new PasswordHasherBusyException(EstimateDrainTime());
+        }
+
+        return item.Completion.Task;
+    }
+
+    private void Work()
+    {
+        foreach (var item in _queue.GetConsumingEnumerable())
+        {
+            var started = Stopwatch.GetTimestamp();
+            item.Execute();
+            Interlocked.Add(ref _workTicks, Stopwatch.GetElapsedTime(started).Ticks);
+            Interlocked.Increment(ref _completed);
+        }
+    }
+
+    private TimeSpan EstimateDrainTime()
+    {
+        var completed = Interlocked.Read(ref _completed);
+        var averageTicks = completed > 0 ? Interlocked.Read(ref _workTicks) / completed : TimeSpan.TicksPerMillisecond * 100;
+        var seconds = Math.Ceiling(TimeSpan.FromTicks(averageTicks * _capacity / _workers.Length).TotalSeconds);
+        return TimeSpan.FromSeconds(Math.Max(1, seconds));
+    }
+
+    private string VerifiedCacheKey(string password, string passwordHash)
+    {
+        var mac = HMACSHA256.HashData(_cacheKey, Encoding.UTF8.GetBytes(passwordHash + "\n" + password));
+        return "pwd-verified:" + Convert.ToBase64String(mac);
+    }
+}
@@ -10,14 +10,15 @@ namespace Adaplio.Api.Services;
 public interface IPlanService
 {
     Task<TemplateResponse[]> GetTrainerTemplatesAsync(int trainerProfileId);
+    Task<string> GetTrainerTemplatesVersionAsync(int trainerProfileId);
     Task<TemplateResponse> CreateTemplateAsync(int trainerProfileId, CreateTemplateRequest request);
     Task<TemplateResponse> UpdateTemplateAsync(int trainerProfileId, int templateId, UpdateTemplateRequest request);
     Task<bool> DeleteTemplateAsync(int trainerProfileId, int templateId);
 
     Task<ProposalResponse> CreateProposalAsync(int trainerProfileId, CreateProposalRequest request);
-    Task<ProposalResponse[]> GetTrainerProposalsAsync(int trainerProfileId);
-    Task<ProposalResponse[]> GetClientProposalsAsync(int clientProfileId);
-    Task<ProposalResponse?> GetClientProposalAsync(int clientProfileId, int proposalId);
+    Task<ProposalListResponse> GetTrainerProposalsAsync(int trainerProfileId, ProposalListQuery query, CancellationToken cancellationToken = default);
+    Task<ProposalListResponse> GetClientProposalsAsync(int clientProfileId, ProposalListQuery query, CancellationToken cancellationToken = default);
+    Task<ProposalResponse?> GetClientProposalAsync(int clientProfileId, int proposalId, CancellationToken cancellationToken = default);
 
     Task<AcceptProposalResponse> AcceptProposalAsync(int clientProfileId, int proposalId, AcceptProposalRequest request);
     Task<PlanInstanceResponse[]> GetClientPlansAsync(int clientProfileId);
@@ -26,11 +27,71 @@ public interface IPlanService
 
 public class PlanService : IPlanService
 {
+    public const int MaxProposalPageSize = 200;
+
+    private const int MaxTemplateSaveAttempts = 2;
+    private const int MaxPlanWeeks = 52;
+    private const string SqliteProvider = "Microsoft.EntityFrameworkCore.Sqlite";
+
+    private record ProposalRow(
+        int Id,
+        string? TrainerName,
+        string? ClientAlias,
+        string ProposalName,
+        string? Message,
+        string Status,
+        DateTimeOffset ProposedAt,
+        DateTimeOffset? ExpiresAt,
+        DateTimeOffset? RespondedAt,
+        DateOnly? StartsOn,
+        string? CustomPlanJson
+    );
+
+    private record LatestProgress(int? SetsCompleted, int? RepsCompleted, int? HoldSecondsCompleted);
+
+    // Proposal reads project straight to the columns the response needs; the items come from the
+    // snapshot, so the template graph is never loaded. Null filters drop out of the generated SQL.
+    // Newest first by id, which follows ProposedAt and can be ordered server-side on SQLite too.
+    private static readonly Func<AppDbContext, int?, int?, int?, string?, int, int, IAsyncEnumerable<ProposalRow>> ProposalRows =
+        EF.CompileAsyncQuery((AppDbContext context, int? trainerProfileId, int? clientProfileId, int? proposalId, string? status, int skip, int take) =>
+            context.PlanProposals
+                .AsNoTracking()
+                .Where(pp => (trainerProfileId == null || pp.TrainerProfileId == trainerProfileId) &&
+                             (clientProfileId == null || pp.ClientProfileId == clientProfileId) &&
+                             (proposalId == null || pp.Id == proposalId) &&
+                             (status == null || pp.Status == status))
+                .OrderByDescending(pp => pp.Id)
+                .Skip(skip)
+                .Take(take)
+                .Select(pp => new ProposalRow(
+                    pp.Id,
+                    pp.TrainerProfile.FullName,
+                    pp.ClientProfile.Alias,
+                    pp.ProposalName,
+                    pp.Message,
+                    pp.Status,
+                    pp.ProposedAt,
+                    pp.ExpiresAt,
+                    pp.RespondedAt,
+                    pp.StartsOn,
+                    pp.CustomPlanJson)));
+
+    private static readonly Func<AppDbContext, int?, int?, string?, CancellationToken, Task<int>> ProposalCount =
+        EF.CompileAsyncQuery((AppDbContext context, int? trainerProfileId, int? clientProfileId, string? status, CancellationToken cancellationToken) =>
+            context.PlanProposals
+                .Count(pp => (trainerProfileId == null || pp.TrainerProfileId == trainerProfileId) &&
+                             (clientProfileId == null || pp.ClientProfileId == clientProfileId) &&
+                             (status == null || pp.Status == status)));
+
     private readonly AppDbContext _context;
+    private readonly IClientReadCache _cache;
+    private readonly ExerciseNameCache _exerciseNames;
 
-    public PlanService(AppDbContext context)
+    public PlanService(AppDbContext context, IClientReadCache cache, ExerciseNameCache exerciseNames)
     {
         _context = context;
+        _cache = cache;
+        _exerciseNames = exerciseNames;
     }
 
     public async Task<TemplateResponse[]> GetTrainerTemplatesAsync(int trainerProfileId)
@@ -47,127 +108,134 @@ public async Task<TemplateResponse[]> GetTrainerTemplatesAsync(int trainerProfil
         return templates.Select(MapTemplateToResponse).ToArray();
     }
 
-    public async Task<TemplateResponse> CreateTemplateAsync(int trainerProfileId, CreateTemplateRequest request)
+    /// <summary>
+    /// Cheap version of the trainer's template list, for ETags. Every template write stamps UpdatedAt, deletes
+    /// drop the row and exercises are never edited, so the ids and stamps cover everything the list returns.
+    /// </summary>
+    public async Task<string> GetTrainerTemplatesVersionAsync(int trainerProfileId)
     {
-        var template = new PlanTemplate
-        {
-            TrainerProfileId = trainerProfileId,
-            Name = request.Name,
-            Description = request.Description,
-            Category = request.Category,
-            DurationWeeks = request.DurationWeeks,
-            IsPublic = request.IsPublic,
-            CreatedAt = DateTimeOffset.UtcNow,
-            UpdatedAt = DateTimeOffset.UtcNow
-        };
+        var stamps = await _context.PlanTemplates
+            .AsNoTracking()
+            .Where(pt => pt.TrainerProfileId == trainerProfileId && !pt.IsDeleted)
+            .Select(pt => new { pt.Id, pt.UpdatedAt })
+            .ToListAsync();
 
-        _context.PlanTemplates.Add(template);
-        await _context.SaveChangesAsync();
+        return string.Join(',', stamps.OrderBy(s => s.Id).Select(s => $"{s.Id}:{s.UpdatedAt.UtcTicks}"));
+    }
 
-        // Add items
-        for (int i = 0; i < request.Items.Length; i++)
+    public async Task<TemplateResponse> CreateTemplateAsync(int trainerProfileId, CreateTemplateRequest request)
+    {
+        for (var attempt = 1; ; attempt++)
         {
-            var itemRequest = request.Items[i];
+            var template = new PlanTemplate
+            {
+                TrainerProfileId = trainerProfileId,
+                Name = request.Name,
+                Description = request.Description,
+                Category = request.Category,
+                DurationWeeks = request.DurationWeeks,
+                IsPublic = request.IsPublic,
+                CreatedAt = DateTimeOffset.UtcNow,
+                UpdatedAt = DateTimeOffset.UtcNow
+            };
 
-            // Find or create exercise
-            var exercise = await _context.Exercises
-                .FirstOrDefaultAsync(e => e.Name.ToLower() == itemRequest.ExerciseName.ToLower());
+            _context.PlanTemplates.Add(template);
+            var createdExercises = await AddTemplateItemsAsync(template, request.Items);
 
-            if (exercise == null)
+            try
             {
-                exercise = new Exercise
-                {
-                    Name = itemRequest.ExerciseName,
-                    Description = itemRequest.ExerciseDescription,
-                    Category = itemRequest.ExerciseCategory,
-                    DefaultSets = itemRequest.TargetSets,
-                    DefaultReps = itemRequest.TargetReps,
-                    DefaultHoldSeconds = itemRequest.HoldSeconds,
-                    CreatedAt = DateTimeOffset.UtcNow,
-                    UpdatedAt = DateTimeOffset.UtcNow
-                };
-                _context.Exercises.Add(exercise);
-                await _context.SaveChangesAsync();
+                await SaveTemplateAsync(createdExercises);
+                return await LoadTemplateResponseAsync(template.Id);
             }
-
-            var templateItem = new PlanTemplateItem
+            catch (DbUpdateException) when (createdExercises.Count > 0 && attempt < MaxTemplateSaveAttempts)
             {
-                PlanTemplateId = template.Id,
-                ExerciseId = exercise.Id,
-                OrderIndex = i,
-                Sets = itemRequest.TargetSets,
-                Reps = itemRequest.TargetReps,
-                HoldSeconds = itemRequest.HoldSeconds,
-                FrequencyPerWeek = itemRequest.FrequencyPerWeek,
-                DaysOfWeek = itemRequest.Days != null ? JsonSerializer.Serialize(itemRequest.Days) : null,
-                Notes = itemRequest.Notes,
-                CreatedAt = DateTimeOffset.UtcNow
-            };
-
-            _context.PlanTemplateItems.Add(templateItem);
+                // A concurrent request inserted one of the new exercises first; start over and pick up its row
+                _context.ChangeTracker.Clear();
+            }
         }
-
-        await _context.SaveChangesAsync();
-
-        // Reload with includes
-        var createdTemplate = await _context.PlanTemplates
-            .Include(pt => pt.PlanTemplateItems)
-            .ThenInclude(pti => pti.Exercise)
-            .FirstAsync(pt => pt.Id == template.Id);
-
-        return MapTemplateToResponse(createdTemplate);
     }
 
     public async Task<TemplateResponse> UpdateTemplateAsync(int trainerProfileId, int templateId, UpdateTemplateRequest request)
     {
-        var template = await _context.PlanTemplates
-            .Include(pt => pt.PlanTemplateItems)
-            .FirstOrDefaultAsync(pt => pt.Id == templateId && pt.TrainerProfileId == trainerProfileId && !pt.IsDeleted);
-
-        if (template == null)
-            throw new InvalidOperationException("Template not found");
-
-        // Update template
-        template.Name = request.Name;
-        template.Description = request.Description;
-        template.Category = request.Category;
-        template.DurationWeeks = request.DurationWeeks;
-        template.IsPublic = request.IsPublic;
-        template.UpdatedAt = DateTimeOffset.UtcNow;
+        for (var attempt = 1; ; attempt++)
+        {
+            var template = await _context.PlanTemplates
+                .Include(pt => pt.PlanTemplateItems)
+                .FirstOrDefaultAsync(pt => pt.Id == templateId && pt.TrainerProfileId == trainerProfileId && !pt.IsDeleted);
+
+            if (template == null)
+                throw new InvalidOperationException("Template not found");
+
+            // Update template
+            template.Name = request.Name;
+            template.Description = request.Description;
+            template.Category = request.Category;
+            template.DurationWeeks = request.DurationWeeks;
+            template.IsPublic = request.IsPublic;
+            template.UpdatedAt = DateTimeOffset.UtcNow;
+
+            // Replace existing items
+            _context.PlanTemplateItems.RemoveRange(template.PlanTemplateItems);
+            var createdExercises = await AddTemplateItemsAsync(template, request.Items);
+
+            try
+            {
+                await SaveTemplateAsync(createdExercises);
+                return await LoadTemplateResponseAsync(template.Id);
+            }
+            catch (DbUpdateException) when (createdExercises.Count > 0 && attempt < MaxTemplateSaveAttempts)
+            {
+                // A concurrent request inserted one of the new exercises first; start over and pick up its row
+                _context.ChangeTracker.Clear();
+            }
+        }
+    }
 
-        // Remove existing items
-        _context.PlanTemplateItems.RemoveRange(template.PlanTemplateItems);
+    /// <summary>
+    /// Stages the template's items, resolving every exercise name in one query (names already in the
+    /// exercise name cache are skipped) and staging any missing exercises for insert in the same save.
+    /// An exercise named more than once is created once, from the first item that names it.
+    /// </summary>
+    private async Task<Dictionary<string, Exercise>> AddTemplateItemsAsync(PlanTemplate template, TemplateItemRequest[] items)
+    {
+        var names = items.Select(item => Exercise.NormalizeName(item.ExerciseName)).ToArray();
+        var exerciseIds = new Dictionary<string, int>(StringComparer.Ordinal);
+        var uncached = new List<string>();
 
-        // Add new items
-        for (int i = 0; i < request.Items.Length; i++)
+        foreach (var name in names.Distinct())
         {
-            var itemRequest = request.Items[i];
+            if (_exerciseNames.TryGet(name, out var cachedId))
+            {
+                exerciseIds[name] = cachedId;
+            }
+            else
+            {
+                uncached.Add(name);
+            }
+        }
 
-            // Find or create exercise
-            var exercise = await _context.Exercises
-                .FirstOrDefaultAsync(e => e.Name.ToLower() == itemRequest.ExerciseName.ToLower());
+        if (uncached.Count > 0)
+        {
+            var found = await _context.Exercises
+                .Where(e => uncached.Contains(e.NormalizedName))
+                .Select(e => new { e.Id, e.NormalizedName })
+                .ToListAsync();
 
-            if (exercise == null)
+            foreach (var exercise in found)
             {
-                exercise = new Exercise
-                {
-                    Name = itemRequest.ExerciseName,
-                    Description = itemRequest.ExerciseDescription,
-                    Category = itemRequest.ExerciseCategory,
-                    DefaultSets = itemRequest.TargetSets,
-                    DefaultReps = itemRequest.TargetReps,
-                    DefaultHoldSeconds = itemRequest.HoldSeconds,
-                    CreatedAt = DateTimeOffset.UtcNow,
-                    UpdatedAt = DateTimeOffset.UtcNow
-                };
-                _context.Exercises.Add(exercise);
-                await _context.SaveChangesAsync();
+                exerciseIds[exercise.NormalizedName] = exercise.Id;
+                _exerciseNames.Set(exercise.NormalizedName, exercise.Id);
             }
+        }
+
+        var createdExercises = new Dictionary<string, Exercise>(StringComparer.Ordinal);
+        for (int i = 0; i < items.Length; i++)
+        {
+            var itemRequest = items[i];
 
             var templateItem = new PlanTemplateItem
             {
-                PlanTemplateId = template.Id,
-                ExerciseId = exercise.Id,
+                PlanTemplate = template,
                 OrderIndex = i,
                 Sets = itemRequest.TargetSets,
                 Reps = itemRequest.TargetReps,
@@ -178,18 +246,59 @@ public async Task<TemplateResponse> UpdateTemplateAsync(int trainerProfileId, in
                 CreatedAt = DateTimeOffset.UtcNow
             };
 
+            if (exerciseIds.TryGetValue(names[i], out var exerciseId))
+            {
+                templateItem.ExerciseId = exerciseId;
+            }
+            else
+            {
+                if (!createdExercises.TryGetValue(names[i], out var exercise))
+                {
+                    exercise = new Exercise
+                    {
+                        Name = itemRequest.ExerciseName.Trim(),
+                        Description = itemRequest.ExerciseDescription,
+                        Category = itemRequest.ExerciseCategory,
+                        DefaultSets = itemRequest.TargetSets,
+                        DefaultReps = itemRequest.TargetReps,
+                        DefaultHoldSeconds = itemRequest.HoldSeconds,
+                        CreatedAt = DateTimeOffset.UtcNow,
+                        UpdatedAt = DateTimeOffset.UtcNow
+                    };
+                    createdExercises[names[i]] = exercise;
+                }
+
+                templateItem.Exercise = exercise;
+            }
+
             _context.PlanTemplateItems.Add(templateItem);
         }
 
+        return createdExercises;
+    }
+
+    // One save for the template, its items and any new exercises
+    private async Task SaveTemplateAsync(Dictionary<string, Exercise> createdExercises)
+    {
+        _exerciseNames.Invalidate(createdExercises.Keys);
+
         await _context.SaveChangesAsync();
 
+        foreach (var (name, exercise) in createdExercises)
+        {
+            _exerciseNames.Set(name, exercise.Id);
+        }
+    }
+
+    private async Task<TemplateResponse> LoadTemplateResponseAsync(int templateId)
+    {
         // Reload with includes
-        var updatedTemplate = await _context.PlanTemplates
+        var template = await _context.PlanTemplates
             .Include(pt => pt.PlanTemplateItems)
             .ThenInclude(pti => pti.Exercise)
-            .FirstAsync(pt => pt.Id == template.Id);
+            .FirstAsync(pt => pt.Id == templateId);
 
-        return MapTemplateToResponse(updatedTemplate);
+        return MapTemplateToResponse(template);
     }
 
     public async Task<bool> DeleteTemplateAsync(int trainerProfileId, int templateId)
@@ -252,89 +361,81 @@ public async Task<ProposalResponse> CreateProposalAsync(int trainerProfileId, Cr
             ProposedAt = DateTimeOffset.UtcNow,
             ExpiresAt = DateTimeOffset.UtcNow.AddDays(30), // 30 day expiry
             StartsOn = startsOn,
-            CustomPlanJson = JsonSerializer.Serialize(template.PlanTemplateItems.Select(pti => new
-            {
-                ExerciseId = pti.ExerciseId,
-                ExerciseName = pti.Exercise.Name,
-                ExerciseDescription = pti.Exercise.Description,
-                OrderIndex = pti.OrderIndex,
-                Sets = pti.Sets,
-                Reps = pti.Reps,
-                HoldSeconds = pti.HoldSeconds,
-                FrequencyPerWeek = pti.FrequencyPerWeek,
-                DaysOfWeek = pti.DaysOfWeek,
-                Notes = pti.Notes
-            }).ToArray())
+            CustomPlanJson = ProposalSnapshot.Serialize(template.DurationWeeks, template.PlanTemplateItems.Select(pti => new ProposalSnapshotItem(
+                pti.ExerciseId,
+                pti.Exercise.Name,
+                pti.Exercise.Description,
+                pti.OrderIndex,
+                pti.Sets,
+                pti.Reps,
+                pti.HoldSeconds,
+                pti.FrequencyPerWeek,
+                pti.DaysOfWeek,
+                pti.Notes
+            )))
         };
 
         _context.PlanProposals.Add(proposal);
         await _context.SaveChangesAsync();
 
-        // Load full proposal for response
-        var createdProposal = await _context.PlanProposals
-            .Include(pp => pp.TrainerProfile)
-            .Include(pp => pp.ClientProfile)
-            .Include(pp => pp.PlanTemplate)
-            .ThenInclude(pt => pt!.PlanTemplateItems)
-            .ThenInclude(pti => pti.Exercise)
-            .FirstAsync(pp => pp.Id == proposal.Id);
-
-        return MapProposalToResponse(createdProposal);
+        return (await GetClientProposalAsync(clientProfile.Id, proposal.Id))!;
     }
 
-    public async Task<ProposalResponse[]> GetTrainerProposalsAsync(int trainerProfileId)
+    public Task<ProposalListResponse> GetTrainerProposalsAsync(
+        int trainerProfileId,
+        ProposalListQuery query,
+        CancellationToken cancellationToken = default)
     {
-        // Client-side evaluation for DateTimeOffset ordering (SQLite limitation)
-        var allProposals = await _context.PlanProposals
-            .Include(pp => pp.TrainerProfile)
-            .Include(pp => pp.ClientProfile)
-            .Include(pp => pp.PlanTemplate)
-            .ThenInclude(pt => pt!.PlanTemplateItems)
-            .ThenInclude(pti => pti.Exercise)
-            .Where(pp => pp.TrainerProfileId == trainerProfileId)
-            .ToListAsync();
-
-        var proposals = allProposals.OrderByDescending(pp => pp.ProposedAt).ToList();
-
-        return proposals.Select(MapProposalToResponse).ToArray();
+        return GetProposalPageAsync(trainerProfileId, null, query, cancellationToken);
     }
 
-    public async Task<ProposalResponse[]> GetClientProposalsAsync(int clientProfileId)
+    public Task<ProposalListResponse> GetClientProposalsAsync(
+        int clientProfileId,
+        ProposalListQuery query,
+        CancellationToken cancellationToken = default)
     {
-        // Client-side evaluation for DateTimeOffset ordering (SQLite limitation)
-        var allProposals = await _context.PlanProposals
-            .Include(pp => pp.TrainerProfile)
-            .Include(pp => pp.ClientProfile)
-            .Include(pp => pp.PlanTemplate)
-            .ThenInclude(pt => pt!.PlanTemplateItems)
-            .ThenInclude(pti => pti.Exercise)
-            .Where(pp => pp.ClientProfileId == clientProfileId)
-            .ToListAsync();
+        return GetProposalPageAsync(null, clientProfileId, query, cancellationToken);
+    }
 
-        var proposals = allProposals.OrderByDescending(pp => pp.ProposedAt).ToList();
+    public async Task<ProposalResponse?> GetClientProposalAsync(
+        int clientProfileId,
+        int proposalId,
+        CancellationToken cancellationToken = default)
+    {
+        await foreach (var row in ProposalRows(_context, null, clientProfileId, proposalId, null, 0, 1).WithCancellation(cancellationToken))
+        {
+            return MapProposalToResponse(row);
+        }
 
-        return proposals.Select(MapProposalToResponse).ToArray();
+        return null;
     }
 
-    public async Task<ProposalResponse?> GetClientProposalAsync(int clientProfileId, int proposalId)
+    private async Task<ProposalListResponse> GetProposalPageAsync(
+        int? trainerProfileId,
+        int? clientProfileId,
+        ProposalListQuery query,
+        CancellationToken cancellationToken)
     {
-        var proposal = await _context.PlanProposals
-            .Include(pp => pp.TrainerProfile)
-            .Include(pp => pp.ClientProfile)
-            .Include(pp => pp.PlanTemplate)
-            .ThenInclude(pt => pt!.PlanTemplateItems)
-            .ThenInclude(pti => pti.Exercise)
-            .FirstOrDefaultAsync(pp => pp.Id == proposalId && pp.ClientProfileId == clientProfileId);
+        var page = Math.Max(1, query.Page);
+        var pageSize = Math.Clamp(query.PageSize, 1, MaxProposalPageSize);
+        var status = string.IsNullOrWhiteSpace(query.Status) ? null : query.Status.Trim().ToLowerInvariant();
+
+        var totalCount = await ProposalCount(_context, trainerProfileId, clientProfileId, status, cancellationToken);
 
-        return proposal != null ? MapProposalToResponse(proposal) : null;
+        var proposals = new List<ProposalResponse>(Math.Min(pageSize, totalCount));
+        await foreach (var row in ProposalRows(_context, trainerProfileId, clientProfileId, null, status, (page - 1) * pageSize, pageSize)
+                           .WithCancellation(cancellationToken))
+        {
+            proposals.Add(MapProposalToResponse(row));
+        }
+
+        return new ProposalListResponse(proposals.ToArray(), page, pageSize, totalCount);
     }
 
     public async Task<AcceptProposalResponse> AcceptProposalAsync(int clientProfileId, int proposalId, AcceptProposalRequest request)
     {
         var proposal = await _context.PlanProposals
             .Include(pp => pp.PlanTemplate)
-            .ThenInclude(pt => pt!.PlanTemplateItems)
-            .ThenInclude(pti => pti.Exercise)
             .FirstOrDefaultAsync(pp => pp.Id == proposalId && pp.ClientProfileId == clientProfileId);
 
         if (proposal == null)
@@ -346,8 +447,8 @@ public async Task<AcceptProposalResponse> AcceptProposalAsync(int clientProfileI
         if (proposal.ExpiresAt.HasValue && proposal.ExpiresAt.Value < DateTimeOffset.UtcNow)
             throw new InvalidOperationException("Proposal has expired");
 
-        // Parse items from JSON snapshot
-        var proposalItems = JsonSerializer.Deserialize<dynamic[]>(proposal.CustomPlanJson ?? "[]")!;
+        var snapshot = ProposalSnapshot.Read(proposal.CustomPlanJson);
+        var proposalItems = snapshot.Items;
 
         // Determine which items to accept
         var itemsToAccept = request.AcceptAll == true
@@ -357,86 +458,90 @@ public async Task<AcceptProposalResponse> AcceptProposalAsync(int clientProfileI
         if (!itemsToAccept.Any())
             throw new InvalidOperationException("No items selected for acceptance");
 
-        // Create plan instance
+        var now = DateTimeOffset.UtcNow;
+        var startDate = proposal.StartsOn ?? GetNextMonday();
+        // Frozen with the items; snapshots from before the length was frozen fall back to the template
+        var durationWeeks = snapshot.DurationWeeks ?? proposal.PlanTemplate?.DurationWeeks;
+
         var planInstance = new PlanInstance
         {
             ClientProfileId = clientProfileId,
             PlanProposalId = proposalId,
             Name = proposal.ProposalName,
             Status = "active",
-            StartDate = proposal.StartsOn ?? GetNextMonday(),
-            PlannedEndDate = proposal.PlanTemplate?.DurationWeeks.HasValue == true
-                ? (proposal.StartsOn ?? GetNextMonday()).AddDays(proposal.PlanTemplate.DurationWeeks.Value * 7)
-                : null,
-            CreatedAt = DateTimeOffset.UtcNow,
-            UpdatedAt = DateTimeOffset.UtcNow
+            StartDate = startDate,
+            PlannedEndDate = durationWeeks.HasValue ? startDate.AddDays(durationWeeks.Value * 7) : null,
+            CreatedAt = now,
+            UpdatedAt = now
         };
 
-        _context.PlanInstances.Add(planInstance);
-        await _context.SaveChangesAsync();
-
-        // Create exercise instances and acceptance records
-        var acceptedCount = 0;
+        // Build every week of the plan in memory; open-ended plans get week 1, which the board repeats
+        var weeks = Math.Clamp(durationWeeks ?? 1, 1, MaxPlanWeeks);
+        var exerciseInstances = new List<ExerciseInstance>();
+        var acceptances = new List<PlanItemAcceptance>();
         for (int i = 0; i < itemsToAccept.Count; i++)
         {
             var item = itemsToAccept[i];
-            var itemJson = ((JsonElement)item);
-
-            var exerciseId = itemJson.GetProperty("ExerciseId").GetInt32();
-            var daysJson = itemJson.TryGetProperty("DaysOfWeek", out var daysElement) ? daysElement.GetString() : null;
-            var days = !string.IsNullOrEmpty(daysJson) ? JsonSerializer.Deserialize<string[]>(daysJson) : null;
+            var daysOfWeek = item.Days.Select(GetDayOfWeekNumber).ToArray();
 
-            if (days?.Any() == true)
+            for (int week = 1; week <= weeks; week++)
             {
-                // Create exercise instances for each scheduled day
-                foreach (var day in days)
+                foreach (var dayOfWeek in daysOfWeek)
                 {
-                    var dayOfWeek = GetDayOfWeekNumber(day);
-
                     var exerciseInstance = new ExerciseInstance
                     {
-                        PlanInstanceId = planInstance.Id,
-                        ExerciseId = exerciseId,
-                        WeekNumber = 1, // Start with week 1
+                        PlanInstance = planInstance,
+                        ExerciseId = item.ExerciseId,
+                        WeekNumber = week,
                         OrderIndex = i,
-                        TargetSets = itemJson.TryGetProperty("Sets", out var setsElement) && setsElement.ValueKind != JsonValueKind.Null ? setsElement.GetInt32() : null,
-                        TargetReps = itemJson.TryGetProperty("Reps", out var repsElement) && repsElement.ValueKind != JsonValueKind.Null ? repsElement.GetInt32() : null,
-                        TargetHoldSeconds = itemJson.TryGetProperty("HoldSeconds", out var holdElement) && holdElement.ValueKind != JsonValueKind.Null ? holdElement.GetInt32() : null,
-                        FrequencyPerWeek = itemJson.TryGetProperty("FrequencyPerWeek", out var freqElement) && freqElement.ValueKind != JsonValueKind.Null ? freqElement.GetInt32() : null,
+                        TargetSets = item.Sets,
+                        TargetReps = item.Reps,
+                        TargetHoldSeconds = item.HoldSeconds,
+                        FrequencyPerWeek = item.FrequencyPerWeek,
                         DayOfWeek = dayOfWeek,
                         Status = "planned",
-                        CreatedAt = DateTimeOffset.UtcNow,
-                        UpdatedAt = DateTimeOffset.UtcNow
+                        CreatedAt = now,
+                        UpdatedAt = now
                     };
+                    exerciseInstances.Add(exerciseInstance);
 
-                    _context.ExerciseInstances.Add(exerciseInstance);
-                    await _context.SaveChangesAsync();
-
-                    // Record acceptance
-                    var acceptance = new PlanItemAcceptance
+                    acceptances.Add(new PlanItemAcceptance
                     {
-                        PlanInstanceId = planInstance.Id,
-                        ExerciseInstanceId = exerciseInstance.Id,
+                        PlanInstance = planInstance,
+                        ExerciseInstance = exerciseInstance,
                         Accepted = true,
-                        AcceptedAt = DateTimeOffset.UtcNow
-                    };
-
-                    _context.PlanItemAcceptances.Add(acceptance);
-                    acceptedCount++;
+                        AcceptedAt = now
+                    });
                 }
             }
         }
 
-        // Update proposal status
         proposal.Status = "accepted";
-        proposal.RespondedAt = DateTimeOffset.UtcNow;
+        proposal.RespondedAt = now;
 
-        await _context.SaveChangesAsync();
+        // One SaveChanges inserts the plan, its instances and acceptances in batched commands
+        // inside a single transaction; keys flow through the navigations
+        _context.ChangeTracker.AutoDetectChangesEnabled = false;
+        try
+        {
+            _context.PlanInstances.Add(planInstance);
+            _context.ExerciseInstances.AddRange(exerciseInstances);
+            _context.PlanItemAcceptances.AddRange(acceptances);
+            _context.ChangeTracker.DetectChanges();
+            await _context.SaveChangesAsync();
+        }
+        finally
+        {
+            _context.ChangeTracker.AutoDetectChangesEnabled = true;
+        }
+
+        // New plan instance changes the client's board
+        _cache.InvalidateClient(clientProfileId);
 
         return new AcceptProposalResponse(
             "Proposal accepted successfully",
             planInstance.Id,
-            acceptedCount,
+            itemsToAccept.Count,
             proposalItems.Length
         );
     }
@@ -459,20 +564,67 @@ public async Task<BoardResponse> GetClientBoardAsync(int clientProfileId, DateOn
     {
         var weekEnd = weekStart.AddDays(6);
 
-        // Get exercise instances for this week
-        var exerciseInstances = await _context.ExerciseInstances
-            .Include(ei => ei.Exercise)
-            .Include(ei => ei.PlanInstance)
-            .Include(ei => ei.ProgressEvents)
-            .Where(ei => ei.PlanInstance.ClientProfileId == clientProfileId &&
-                        ei.PlanInstance.Status == "active")
+        // Resolve which plan week each active plan is in; plans that only define
+        // week 1 repeat it, and plans starting later show their first week
+        var activePlans = await _context.PlanInstances
+            .AsNoTracking()
+            .Where(pi => pi.ClientProfileId == clientProfileId && pi.Status == "active")
+            .Select(pi => new
+            {
+                pi.Id,
+                pi.StartDate,
+                LastWeek = pi.ExerciseInstances.Max(ei => (int?)ei.WeekNumber) ?? 0
+            })
             .ToListAsync();
 
-        // Group by day of week
-        var dayGroups = new Dictionary<int, List<ExerciseInstance>>();
-        for (int i = 0; i <= 6; i++)
+        var plansByWeek = activePlans
+            .Where(p => p.LastWeek > 0)
+            .GroupBy(p => GetPlanWeekNumber(p.StartDate, weekStart, p.LastWeek), p => p.Id);
+
+        var cards = new List<(int DayOfWeek, ExerciseCardResponse Card)>();
+        foreach (var group in plansByWeek)
+        {
+            var planIds = group.ToList();
+            var weekNumber = group.Key;
+
+            // Project straight into cards; the completed counts are filled in from the latest progress below
+            var rows = await (
+                from ei in _context.ExerciseInstances.AsNoTracking()
+                where planIds.Contains(ei.PlanInstanceId) && ei.WeekNumber == weekNumber
+                orderby ei.OrderIndex, ei.Id
+                select new
+                {
+                    ei.DayOfWeek,
+                    Card = new ExerciseCardResponse(
+                        ei.Id,
+                        ei.Exercise.Name,
+                        ei.Exercise.Description,
+                        ei.TargetSets,
+                        ei.TargetReps,
+                        ei.TargetHoldSeconds,
+                        ei.Status,
+                        null,
+                        null,
+                        null,
+                        ei.Notes
+                    )
+                }).ToListAsync();
+
+            cards.AddRange(rows.Select(r => (r.DayOfWeek, r.Card)));
+        }
+
+        var latestProgress = await GetLatestProgressAsync(cards.Select(c => c.Card.ExerciseInstanceId).ToList());
+        for (var i = 0; i < cards.Count; i++)
         {
-            dayGroups[i] = exerciseInstances.Where(ei => ei.DayOfWeek == i).ToList();
+            if (latestProgress.TryGetValue(cards[i].Card.ExerciseInstanceId, out var latest))
+            {
+                cards[i] = (cards[i].DayOfWeek, cards[i].Card with
+                {
+                    CompletedSets = latest.SetsCompleted,
+                    CompletedReps = latest.RepsCompleted,
+                    CompletedHoldSeconds = latest.HoldSecondsCompleted
+                });
+            }
         }
 
         // Create day responses
@@ -482,26 +634,7 @@ public async Task<BoardResponse> GetClientBoardAsync(int clientProfileId, DateOn
         for (int i = 0; i <= 6; i++)
         {
             var dayDate = weekStart.AddDays((i + 1) % 7); // Adjust for Monday start
-            var dayExercises = dayGroups[i];
-
-            var exercises = dayExercises.Select(ei =>
-            {
-                var latestProgress = ei.ProgressEvents.OrderByDescending(pe => pe.LoggedAt).FirstOrDefault();
-
-                return new ExerciseCardResponse(
-                    ei.Id,
-                    ei.Exercise.Name,
-                    ei.Exercise.Description,
-                    ei.TargetSets,
-                    ei.TargetReps,
-                    ei.TargetHoldSeconds,
-                    ei.Status,
-                    latestProgress?.SetsCompleted,
-                    latestProgress?.RepsCompleted,
-                    latestProgress?.HoldSecondsCompleted,
-                    ei.Notes
-                );
-            }).ToArray();
+            var exercises = cards.Where(c => c.DayOfWeek == i).Select(c => c.Card).ToArray();
 
             days.Add(new DayBoardResponse(
                 dayNames[i],
@@ -514,6 +647,56 @@ public async Task<BoardResponse> GetClientBoardAsync(int clientProfileId, DateOn
         return new BoardResponse(weekStart, weekEnd, days.ToArray());
     }
 
+    /// <summary>
+    /// The most recently logged progress per exercise instance, by LoggedAt and then Id like the
+    /// gamification streaks. Batch inserts can backdate events, so the highest id is not always the
+    /// latest. SQLite cannot order DateTimeOffset server-side, so there the latest is picked from a
+    /// narrow projection of the instances' events.
+    /// </summary>
+    private async Task<Dictionary<int, LatestProgress>> GetLatestProgressAsync(List<int> exerciseInstanceIds)
+    {
+        if (exerciseInstanceIds.Count == 0)
+        {
+            return new Dictionary<int, LatestProgress>();
+        }
+
+        if (_context.Database.ProviderName != SqliteProvider)
+        {
+            var rows = await (
+                from ei in _context.ExerciseInstances.AsNoTracking()
+                where exerciseInstanceIds.Contains(ei.Id)
+                let latest = ei.ProgressEvents
+                    .OrderByDescending(pe => pe.LoggedAt)
+                    .ThenByDescending(pe => pe.Id)
+                    .Select(pe => new LatestProgress(pe.SetsCompleted, pe.RepsCompleted, pe.HoldSecondsCompleted))
+                    .FirstOrDefault()
+                where latest != null
+                select new { ei.Id, Latest = latest }).ToListAsync();
+
+            return rows.ToDictionary(r => r.Id, r => r.Latest!);
+        }
+
+        var events = await _context.ProgressEvents
+            .AsNoTracking()
+            .Where(pe => exerciseInstanceIds.Contains(pe.ExerciseInstanceId))
+            .Select(pe => new { pe.ExerciseInstanceId, pe.Id, pe.LoggedAt, pe.SetsCompleted, pe.RepsCompleted, pe.HoldSecondsCompleted })
+            .ToListAsync();
+
+        return events
+            .GroupBy(pe => pe.ExerciseInstanceId)
+            .ToDictionary(
+                g => g.Key,
+                g => g.OrderByDescending(pe => pe.LoggedAt).ThenByDescending(pe => pe.Id)
+                    .Select(pe => new LatestProgress(pe.SetsCompleted, pe.RepsCompleted, pe.HoldSecondsCompleted))
+                    .First());
+    }
+
+    private static int GetPlanWeekNumber(DateOnly planStart, DateOnly weekStart, int lastWeek)
+    {
+        var weekNumber = (weekStart.DayNumber - planStart.DayNumber) / 7 + 1;
+        return Math.Clamp(weekNumber, 1, lastWeek);
+    }
+
     private static TemplateResponse MapTemplateToResponse(PlanTemplate template)
     {
         var items = template.PlanTemplateItems
@@ -551,36 +734,25 @@ private static TemplateResponse MapTemplateToResponse(PlanTemplate template)
         );
     }
 
-    private static ProposalResponse MapProposalToResponse(PlanProposal proposal)
+    private static ProposalResponse MapProposalToResponse(ProposalRow proposal)
     {
-        var items = Array.Empty<ProposalItemResponse>();
-
-        if (!string.IsNullOrEmpty(proposal.CustomPlanJson))
-        {
-            var proposalItems = JsonSerializer.Deserialize<dynamic[]>(proposal.CustomPlanJson)!;
-            items = proposalItems.Select(item =>
-            {
-                var itemJson = (JsonElement)item;
-                var daysJson = itemJson.TryGetProperty("DaysOfWeek", out var daysElement) ? daysElement.GetString() : null;
-                var days = !string.IsNullOrEmpty(daysJson) ? JsonSerializer.Deserialize<string[]>(daysJson) : null;
-
-                return new ProposalItemResponse(
-                    itemJson.GetProperty("ExerciseId").GetInt32(),
-                    itemJson.GetProperty("ExerciseName").GetString()!,
-                    itemJson.TryGetProperty("ExerciseDescription", out var descElement) ? descElement.GetString() : null,
-                    itemJson.TryGetProperty("Sets", out var setsElement) && setsElement.ValueKind != JsonValueKind.Null ? setsElement.GetInt32() : null,
-                    itemJson.TryGetProperty("Reps", out var repsElement) && repsElement.ValueKind != JsonValueKind.Null ? repsElement.GetInt32() : null,
-                    itemJson.TryGetProperty("HoldSeconds", out var holdElement) && holdElement.ValueKind != JsonValueKind.Null ? holdElement.GetInt32() : null,
-                    days,
-                    itemJson.TryGetProperty("Notes", out var notesElement) ? notesElement.GetString() : null
-                );
-            }).ToArray();
-        }
+        var items = ProposalSnapshot.Parse(proposal.CustomPlanJson)
+            .Select(item => new ProposalItemResponse(
+                item.ExerciseId,
+                item.ExerciseName,
+                item.ExerciseDescription,
+                item.Sets,
+                item.Reps,
+                item.HoldSeconds,
+                item.Days.Length > 0 ? item.Days : null,
+                item.Notes
+            ))
+            .ToArray();
 
         return new ProposalResponse(
             proposal.Id,
-            proposal.TrainerProfile.FullName ?? "Unknown Trainer",
-            proposal.ClientProfile.Alias ?? "Unknown",
+            proposal.TrainerName ?? "Unknown Trainer",
+            proposal.ClientAlias ?? "Unknown",
             proposal.ProposalName,
             proposal.Message,
             proposal.Status,
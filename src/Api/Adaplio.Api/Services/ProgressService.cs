@@ -11,6 +11,9 @@ public interface IProgressService
     Task<WeeklyAdherence[]> GetClientAdherenceAsync(int clientProfileId, int? weeks = null);
     Task<decimal> CalculateOverallAdherenceAsync(int clientProfileId);
     Task UpdateAdherenceWeekAsync(int clientProfileId, DateOnly weekStart);
+    Task ApplyProgressEventAsync(ProgressEvent progressEvent);
+    Task ApplyProgressEventsAsync(IReadOnlyList<ProgressEvent> progressEvents);
+    Task<int> RecomputeAdherenceWeeksAsync(DateOnly since, CancellationToken cancellationToken = default);
 }
 
 public class ProgressService : IProgressService
@@ -63,46 +66,95 @@ public async Task<decimal> CalculateOverallAdherenceAsync(int clientProfileId)
 
     public async Task UpdateAdherenceWeekAsync(int clientProfileId, DateOnly weekStart)
     {
-        var weekEnd = weekStart.AddDays(6);
-        var calendar = CultureInfo.CurrentCulture.Calendar;
-        var year = weekStart.Year;
-        var weekNumber = calendar.GetWeekOfYear(weekStart.ToDateTime(TimeOnly.MinValue),
-            CalendarWeekRule.FirstFourDayWeek, DayOfWeek.Monday);
+        await RecomputeWeekAsync(clientProfileId, weekStart);
+        await _context.SaveChangesAsync();
+    }
 
-        // Get all exercise instances for this week
-        var exerciseInstances = await _context.ExerciseInstances
-            .Include(ei => ei.PlanInstance)
-            .Where(ei => ei.PlanInstance.ClientProfileId == clientProfileId)
-            .ToListAsync();
+    public Task ApplyProgressEventAsync(ProgressEvent progressEvent)
+    {
+        return ApplyProgressEventsAsync(new[] { progressEvent });
+    }
 
-        // Filter by week number (since we don't have scheduled dates)
-        var targetWeekNumber = calendar.GetWeekOfYear(weekStart.ToDateTime(TimeOnly.MinValue),
-            CalendarWeekRule.FirstFourDayWeek, DayOfWeek.Monday);
-        exerciseInstances = exerciseInstances
-            .Where(ei => ei.WeekNumber == targetWeekNumber)
-            .ToList();
+    public async Task ApplyProgressEventsAsync(IReadOnlyList<ProgressEvent> progressEvents)
+    {
+        // Weeks materialized from scratch here already count every event in the list
+        var recomputedWeeks = new HashSet<(int ClientProfileId, int Year, int WeekNumber)>();
+
+        foreach (var progressEvent in progressEvents.OrderBy(pe => pe.Id))
+        {
+            var weekStart = GetWeekStart(DateOnly.FromDateTime(progressEvent.LoggedAt.Date));
+            var (year, weekNumber) = GetWeekKey(weekStart);
+            var key = (progressEvent.ClientProfileId, year, weekNumber);
+
+            if (recomputedWeeks.Contains(key))
+                continue;
 
-        var plannedCount = exerciseInstances.Count;
+            var adherenceWeek = await _context.AdherenceWeeks
+                .FirstOrDefaultAsync(aw => aw.ClientProfileId == progressEvent.ClientProfileId &&
+                                         aw.Year == year &&
+                                         aw.WeekNumber == weekNumber);
 
-        // Count completed exercises (including partial completions with hold factor)
-        var completedCount = 0m;
-        foreach (var ei in exerciseInstances)
+            // First event of the week materializes the row once
+            if (adherenceWeek == null)
+            {
+                await RecomputeWeekAsync(progressEvent.ClientProfileId, weekStart);
+                recomputedWeeks.Add(key);
+                continue;
+            }
+
+            if (!await IsFirstCompletionInWeekAsync(progressEvent, weekNumber))
+                continue;
+
+            adherenceWeek.TotalExercisesCompleted += 1;
+            adherenceWeek.AdherencePercentage = CalculatePercentage(
+                adherenceWeek.TotalExercisesCompleted, adherenceWeek.TotalExercisesPlanned);
+            adherenceWeek.UpdatedAt = DateTimeOffset.UtcNow;
+        }
+
+        await _context.SaveChangesAsync();
+    }
+
+    public async Task<int> RecomputeAdherenceWeeksAsync(DateOnly since, CancellationToken cancellationToken = default)
+    {
+        var weeks = await _context.AdherenceWeeks
+            .AsNoTracking()
+            .Where(aw => aw.WeekStartDate >= since)
+            .Select(aw => new { aw.ClientProfileId, aw.WeekStartDate })
+            .ToListAsync(cancellationToken);
+
+        var corrected = 0;
+        foreach (var week in weeks)
         {
-            var progressEvents = await _context.ProgressEvents
-                .Where(pe => pe.ExerciseInstanceId == ei.Id)
-                .ToListAsync();
+            cancellationToken.ThrowIfCancellationRequested();
 
-            if (progressEvents.Any())
+            if (await RecomputeWeekAsync(week.ClientProfileId, week.WeekStartDate))
             {
-                var hasCompletedEvent = progressEvents.Any(pe => pe.EventType == "exercise_completed");
-                if (hasCompletedEvent)
-                {
-                    completedCount += 1.0m;
-                }
+                corrected++;
             }
+
+            await _context.SaveChangesAsync(cancellationToken);
+            _context.ChangeTracker.Clear();
         }
 
-        var adherencePercentage = plannedCount > 0 ? Math.Round(completedCount / plannedCount * 100, 1) : 0;
+        return corrected;
+    }
+
+    /// <summary>
+    /// Recounts planned/completed for one week with two aggregate queries.
+    /// Returns true when the stored counters had drifted.
+    /// </summary>
+    private async Task<bool> RecomputeWeekAsync(int clientProfileId, DateOnly weekStart)
+    {
+        var (year, weekNumber) = GetWeekKey(weekStart);
+
+        // Filter by week number (since we don't have scheduled dates)
+        var weekInstances = _context.ExerciseInstances
+            .Where(ei => ei.PlanInstance.ClientProfileId == clientProfileId &&
+                         ei.WeekNumber == weekNumber);
+
+        var plannedCount = await weekInstances.CountAsync();
+        var completedCount = await weekInstances
+            .CountAsync(ei => ei.ProgressEvents.Any(pe => pe.EventType == "exercise_completed"));
 
         // Find or create adherence week record
         var adherenceWeek = await _context.AdherenceWeeks
@@ -110,6 +162,10 @@ public async Task UpdateAdherenceWeekAsync(int clientProfileId, DateOnly weekSta
                                      aw.Year == year &&
                                      aw.WeekNumber == weekNumber);
 
+        var drifted = adherenceWeek != null &&
+            (adherenceWeek.TotalExercisesPlanned != plannedCount ||
+             adherenceWeek.TotalExercisesCompleted != completedCount);
+
         if (adherenceWeek == null)
         {
             adherenceWeek = new AdherenceWeek
@@ -123,10 +179,55 @@ public async Task UpdateAdherenceWeekAsync(int clientProfileId, DateOnly weekSta
         }
 
         adherenceWeek.TotalExercisesPlanned = plannedCount;
-        adherenceWeek.TotalExercisesCompleted = (int)Math.Round(completedCount);
+        adherenceWeek.TotalExercisesCompleted = completedCount;
+        adherenceWeek.AdherencePercentage = CalculatePercentage(completedCount, plannedCount);
+        adherenceWeek.CalculatedAt = DateTimeOffset.UtcNow;
         adherenceWeek.UpdatedAt = DateTimeOffset.UtcNow;
-        adherenceWeek.AdherencePercentage = adherencePercentage;
 
-        await _context.SaveChangesAsync();
+        return drifted;
+    }
+
+    /// <summary>
+    /// Only the first completion of an instance scheduled in this week moves the counter.
+    /// </summary>
+    private async Task<bool> IsFirstCompletionInWeekAsync(ProgressEvent progressEvent, int weekNumber)
+    {
+        if (progressEvent.EventType != "exercise_completed")
+            return false;
+
+        var instanceWeekNumber = await _context.ExerciseInstances
+            .Where(ei => ei.Id == progressEvent.ExerciseInstanceId)
+            .Select(ei => (int?)ei.WeekNumber)
+            .FirstOrDefaultAsync();
+
+        if (instanceWeekNumber != weekNumber)
+            return false;
+
+        var completedEarlier = await _context.ProgressEvents
+            .AnyAsync(pe => pe.ExerciseInstanceId == progressEvent.ExerciseInstanceId &&
+                            pe.EventType == "exercise_completed" &&
+                            pe.Id < progressEvent.Id);
+
+        return !completedEarlier;
+    }
+
+    private static decimal CalculatePercentage(int completed, int planned)
+    {
+        return planned > 0 ? Math.Round((decimal)completed / planned * 100, 1) : 0;
+    }
+
+    private static (int Year, int WeekNumber) GetWeekKey(DateOnly weekStart)
+    {
+        var weekNumber = CultureInfo.CurrentCulture.Calendar.GetWeekOfYear(weekStart.ToDateTime(TimeOnly.MinValue),
+            CalendarWeekRule.FirstFourDayWeek, DayOfWeek.Monday);
+        return (weekStart.Year, weekNumber);
+    }
+
+    private static DateOnly GetWeekStart(DateOnly date)
+    {
+        var daysToSubtract = (int)date.DayOfWeek - (int)DayOfWeek.Monday;
+        if (daysToSubtract < 0)
+            daysToSubtract += 7;
+        return date.AddDays(-daysToSubtract);
     }
-}
\ No newline at end of file
+}
@@ -0,0 +1,172 @@
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Backing store for per-category request limits. The in-memory store serves a single instance;
+/// RedisRateLimitStore shares the counters so limits hold across replicas.
+/// </summary>
+public interface IRateLimitStore
+{
+    /// <summary>Counts one request against the key when the rule allows it</summary>
+    ValueTask<RateLimitDecision> TryAcquireAsync(RateLimitKey key, RateLimitRule rule, CancellationToken cancellationToken = default);
+}
+
+/// <summary>Category plus identifier (user id or IP); compared by value so lookups never build a combined string</summary>
+public readonly record struct RateLimitKey(string Category, string Identifier);
+
+/// <summary>At most MaxRequests per sliding Window; hitting the limit blocks the key for Lockout (or until the window frees a slot when zero)</summary>
+public sealed record RateLimitRule(int MaxRequests, TimeSpan Window, TimeSpan Lockout)
+{
+    /// <summary>
+    /// The rule for a category from RateLimiting:Rules:{category} (MaxRequests, WindowMinutes, LockoutMinutes);
+    /// any value not configured keeps the default
+    /// </summary>
+    public static RateLimitRule FromConfiguration(IConfiguration configuration, string category, RateLimitRule defaults)
+    {
+        var section = configuration.GetSection($"RateLimiting:Rules:{category}");
+        return new RateLimitRule(
+            section.GetValue("MaxRequests", defaults.MaxRequests),
+            TimeSpan.FromMinutes(section.GetValue("WindowMinutes", defaults.Window.TotalMinutes)),
+            TimeSpan.FromMinutes(section.GetValue("LockoutMinutes", defaults.Lockout.TotalMinutes)));
+    }
+}
+
+public readonly record struct RateLimitDecision(bool Allowed, TimeSpan RetryAfter)
+{
+    public static readonly RateLimitDecision Allow = new(true, TimeSpan.Zero);
+
+    public static RateLimitDecision Deny(TimeSpan retryAfter) => new(false, retryAfter);
+}
+
+/// <summary>
+/// Sliding-window limiter held in process memory. Keys are spread over lock-striped shards and
+/// each shard drops keys whose window and lockout have both passed, at most once per sweep interval,
+/// so idle users and IPs do not accumulate.
+/// </summary>
+public sealed class InMemoryRateLimitStore : IRateLimitStore
+{
+    private const int ShardCount = 16;
+    private static readonly TimeSpan SweepInterval = TimeSpan.FromMinutes(1);
+
+    private readonly Shard[] _shards;
+    private readonly TimeProvider _timeProvider;
+
+    public InMemoryRateLimitStore() : this(TimeProvider.System)
+    {
+    }
+
+    public InMemoryRateLimitStore(TimeProvider timeProvider)
+    {
+        _timeProvider = timeProvider;
+        _shards = new Shard[ShardCount];
+        for (var i = 0; i < ShardCount; i++)
+        {
+            _shards[i] = new Shard();
+        }
+    }
+
+    /// <summary>Keys currently held, including expired ones not yet swept</summary>
+    public int Count => _shards.Sum(shard =>
+    {
+        lock (shard)
+        {
+            return shard.Windows.Count;
+        }
+    });
+
+    public ValueTask<RateLimitDecision> TryAcquireAsync(RateLimitKey key, RateLimitRule rule, CancellationToken cancellationToken = default)
+    {
+        return ValueTask.FromResult(TryAcquire(key, rule));
+    }
+
+    public RateLimitDecision TryAcquire(RateLimitKey key, RateLimitRule rule)
+    {
+        var now = _timeProvider.GetUtcNow().UtcTicks;
+        var shard = _shards[(key.GetHashCode() & int.MaxValue) % ShardCount];
+
+        lock (shard)
+        {
+            shard.SweepIfDue(now);
+
+            if (!shard.Windows.TryGetValue(key, out var window) || window.Capacity != rule.MaxRequests)
+            {
+                window = new SlidingWindow(rule.MaxRequests);
+                shard.Windows[key] = window;
+            }
+
+            return window.TryAcquire(now, rule);
+        }
+    }
+
+    private sealed class Shard
+    {
+        public readonly Dictionary<RateLimitKey, SlidingWindow> Windows = new();
+        private long _nextSweep;
+
+        public void SweepIfDue(long now)
+        {
+            if (now < _nextSweep)
+            {
+                return;
+            }
+
+            _nextSweep = now + SweepInterval.Ticks;
+            foreach (var (key, window) in Windows)
+            {
+                if (window.ExpiresAt <= now)
+                {
+                    Windows.Remove(key);
+                }
+            }
+        }
+    }
+
+    /// <summary>Ring buffer of request timestamps (ticks) inside the window</summary>
+    private sealed class SlidingWindow
+    {
+        private readonly long[] _requests;
+        private int _head;
+        private int _count;
+        private long _lockoutUntil;
+
+        public SlidingWindow(int capacity)
+        {
+            _requests = new long[Math.Max(capacity, 1)];
+        }
+
+        public int Capacity => _requests.Length;
+
+        public long ExpiresAt { get; private set; }
+
+        public RateLimitDecision TryAcquire(long now, RateLimitRule rule)
+        {
+            if (now < _lockoutUntil)
+            {
+                return RateLimitDecision.Deny(TimeSpan.FromTicks(_lockoutUntil - now));
+            }
+
+            var cutoff = now - rule.Window.Ticks;
+            while (_count > 0 && _requests[_head] < cutoff)
+            {
+                _head = (_head + 1) % _requests.Length;
+                _count--;
+            }
+
+            if (_count >= rule.MaxRequests)
+            {
+                if (rule.Lockout > TimeSpan.Zero)
+                {
+                    _lockoutUntil = now + rule.Lockout.Ticks;
+                    ExpiresAt = Math.Max(ExpiresAt, _lockoutUntil);
+                    return RateLimitDecision.Deny(rule.Lockout);
+                }
+
+                return RateLimitDecision.Deny(TimeSpan.FromTicks(_requests[_head] - cutoff));
+            }
+
+            _requests[(_head + _count) % _requests.Length] = now;
+            _count++;
+            ExpiresAt = Math.Max(now + rule.Window.Ticks, _lockoutUntil);
+            return RateLimitDecision.Allow;
+        }
+    }
+}
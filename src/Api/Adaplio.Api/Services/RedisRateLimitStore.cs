@@ -0,0 +1,97 @@
+using StackExchange.Redis;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Sliding-window limiter shared by every API instance through Redis (or any server speaking its protocol).
+/// Each key is a sorted set of request timestamps plus a lockout key; one Lua script trims, checks and
+/// records atomically using the server clock, so replicas with drifting clocks still agree.
+/// </summary>
+public sealed class RedisRateLimitStore : IRateLimitStore
+{
+    private const string KeyPrefix = "ratelimit:";
+    private const string LockoutSuffix = ":lockout";
+
+    // KEYS[1] = request log, KEYS[2] = lockout; ARGV = window ms, max requests, lockout ms, unique member
+    private const string SlidingWindowScript = @"
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local lockout = tonumber(ARGV[3])
+
+local locked = redis.call('PTTL', KEYS[2])
+if locked > 0 then
+    return {0, locked}
+end
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', '(' .. (now - window))
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    if lockout > 0 then
+        redis.call('SET', KEYS[2], '1', 'PX', lockout)
+        return {0, lockout}
+    end
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return {0, tonumber(oldest[2]) + window - now}
+end
+
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, 0}";
+
+    private readonly IConnectionMultiplexer _redis;
+    private readonly ILogger<RedisRateLimitStore> _logger;
+    private readonly string _instanceId = Guid.NewGuid().ToString("N");
+    private long _sequence;
+
+    public RedisRateLimitStore(IConnectionMultiplexer redis, ILogger<RedisRateLimitStore> logger)
+    {
+        _redis = redis;
+        _logger = logger;
+    }
+
+    public async ValueTask<RateLimitDecision> TryAcquireAsync(RateLimitKey key, RateLimitRule rule, CancellationToken cancellationToken = default)
+    {
+        var requestLog = FormatKey(key);
+        var member = $"{_instanceId}:{Interlocked.Increment(ref _sequence)}";
+
+        try
+        {
+            var result = (RedisResult[]?)await _redis.GetDatabase().ScriptEvaluateAsync(
+                SlidingWindowScript,
+                new RedisKey[] { requestLog, requestLog + LockoutSuffix },
+                new RedisValue[] { (long)rule.Window.TotalMilliseconds, rule.MaxRequests, (long)rule.Lockout.TotalMilliseconds, member });
+
+            if (result == null || (int)result[0] == 1)
+            {
+                return RateLimitDecision.Allow;
+            }
+
+            return RateLimitDecision.Deny(TimeSpan.FromMilliseconds((long)result[1]));
+        }
+        catch (Exception ex) when (ex is RedisException or TimeoutException)
+        {
+            // Fail open: an unreachable limiter store must not take the API down with it
+            _logger.LogWarning(ex, "Rate limit store unavailable, allowing {Category} request", key.Category);
+            return RateLimitDecision.Allow;
+        }
+    }
+
+    /// <summary>"ratelimit:{category:identifier}" - the hash tag keeps both keys on one cluster slot</summary>
+    private static string FormatKey(RateLimitKey key)
+    {
+        var length = KeyPrefix.Length + key.Category.Length + key.Identifier.Length + 3;
+        return string.Create(length, key, static (span, k) =>
+        {
+            KeyPrefix.AsSpan().CopyTo(span);
+            var position = KeyPrefix.Length;
+            span[position++] = '{';
+            k.Category.AsSpan().CopyTo(span[position..]);
+            position += k.Category.Length;
+            span[position++] = ':';
+            k.Identifier.AsSpan().CopyTo(span[position..]);
+            position += k.Identifier.Length;
+            span[position] = '}';
+        });
+    }
+}
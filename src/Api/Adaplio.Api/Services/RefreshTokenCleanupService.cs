@@ -0,0 +1,64 @@
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Periodically deletes refresh tokens that expired or were revoked more than the retention period ago.
+/// Rotation revokes a row on every refresh, so without this the table only grows. Deletes run in bounded
+/// batches to keep each statement's locks short.
+/// </summary>
+public class RefreshTokenCleanupService : BackgroundService
+{
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly ILogger<RefreshTokenCleanupService> _logger;
+    private readonly TimeSpan _interval;
+    private readonly TimeSpan _retention;
+    private readonly int _batchSize;
+
+    public RefreshTokenCleanupService(
+        IServiceScopeFactory scopeFactory,
+        IConfiguration configuration,
+        ILogger<RefreshTokenCleanupService> logger)
+    {
+        _scopeFactory = scopeFactory;
+        _logger = logger;
+        _interval = TimeSpan.FromMinutes(configuration.GetValue("RefreshTokens:CleanupIntervalMinutes", 60));
+        _retention = TimeSpan.FromDays(configuration.GetValue("RefreshTokens:RetentionDays", 60));
+        _batchSize = Math.Max(1, configuration.GetValue("RefreshTokens:CleanupBatchSize", 1000));
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        using var timer = new PeriodicTimer(_interval);
+
+        while (await timer.WaitForNextTickAsync(stoppingToken))
+        {
+            try
+            {
+                using var scope = _scopeFactory.CreateScope();
+                var refreshTokenService = scope.ServiceProvider.GetRequiredService<IRefreshTokenService>();
+
+                var cutoff = DateTimeOffset.UtcNow - _retention;
+                var total = 0;
+                int deleted;
+                do
+                {
+                    deleted = await refreshTokenService.CleanupExpiredTokensAsync(cutoff, _batchSize, stoppingToken);
+                    total += deleted;
+                }
+                while (deleted == _batchSize && !stoppingToken.IsCancellationRequested);
+
+                if (total > 0)
+                {
+                    _logger.LogInformation("Refresh token cleanup deleted {Count} tokens older than {Cutoff}", total, cutoff);
+                }
+            }
+            catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+            {
+                break;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Refresh token cleanup failed");
+            }
+        }
+    }
+}
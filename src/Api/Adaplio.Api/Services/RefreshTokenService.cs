@@ -3,9 +3,12 @@
 using Adaplio.Api.Data;
 using Adaplio.Api.Domain;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Caching.Memory;
 
 namespace Adaplio.Api.Services;
 
+public record RefreshTokenRotation(string Token, int UserId);
+
 public interface IRefreshTokenService
 {
     /// <summary>
@@ -19,31 +22,46 @@ public interface IRefreshTokenService
     Task<int?> ValidateRefreshTokenAsync(string token);
 
     /// <summary>
-    /// Rotates a refresh token: invalidates the old one and generates a new one
+    /// Rotates a refresh token: invalidates the old one and generates a new one.
+    /// Of several concurrent rotations of the same token exactly one succeeds.
     /// </summary>
-    Task<string?> RotateRefreshTokenAsync(string oldToken, string? ipAddress, string? userAgent);
+    Task<RefreshTokenRotation?> RotateRefreshTokenAsync(string oldToken, string? ipAddress, string? userAgent);
 
     /// <summary>
-    /// Revokes all refresh tokens for a user (e.g., on logout or password change)
+    /// Revokes all refresh tokens for a user (e.g., on logout or password change),
+    /// along with every access token issued to them so far
     /// </summary>
     Task RevokeAllUserTokensAsync(int userId);
 
     /// <summary>
-    /// Clean up expired refresh tokens from the database
+    /// Deletes up to batchSize tokens that expired or were revoked before the cutoff
+    /// and returns how many were deleted
     /// </summary>
-    Task CleanupExpiredTokensAsync();
+    Task<int> CleanupExpiredTokensAsync(DateTimeOffset cutoff, int batchSize, CancellationToken cancellationToken = default);
 }
 
 public class RefreshTokenService : IRefreshTokenService
 {
     private readonly AppDbContext _context;
     private readonly ILogger<RefreshTokenService> _logger;
+    private readonly JwtValidationCache _validationCache;
+    private readonly IMemoryCache _deadTokenCache;
     private const int TokenExpiryDays = 30; // Long-lived refresh tokens
+    private const string SqliteProvider = "Microsoft.EntityFrameworkCore.Sqlite";
+
+    // Revoked hashes are remembered briefly so replays and lost rotation races skip the database
+    private static readonly TimeSpan DeadTokenCacheDuration = TimeSpan.FromMinutes(5);
 
-    public RefreshTokenService(AppDbContext context, ILogger<RefreshTokenService> logger)
+    public RefreshTokenService(
+        AppDbContext context,
+        ILogger<RefreshTokenService> logger,
+        JwtValidationCache validationCache,
+        IMemoryCache deadTokenCache)
     {
         _context = context;
         _logger = logger;
+        _validationCache = validationCache;
+        _deadTokenCache = deadTokenCache;
     }
 
     public async Task<string> GenerateRefreshTokenAsync(int userId, string? ipAddress, string? userAgent)
@@ -78,9 +96,14 @@ public async Task<string> GenerateRefreshTokenAsync(int userId, string? ipAddres
     public async Task<int?> ValidateRefreshTokenAsync(string token)
     {
         var tokenHash = ComputeTokenHash(token);
+        if (IsKnownDead(tokenHash))
+        {
+            return null;
+        }
 
         // Find the refresh token
         var refreshToken = await _context.RefreshTokens
+            .AsNoTracking()
             .FirstOrDefaultAsync(rt => rt.TokenHash == tokenHash);
 
         if (refreshToken == null)
@@ -93,37 +116,60 @@ public async Task<string> GenerateRefreshTokenAsync(int userId, string? ipAddres
         if (!refreshToken.IsValid)
         {
             _logger.LogWarning("Refresh token is expired or revoked for user {UserId}", refreshToken.UserId);
+            MarkDead(tokenHash);
             return null;
         }
 
         return refreshToken.UserId;
     }
 
-    public async Task<string?> RotateRefreshTokenAsync(string oldToken, string? ipAddress, string? userAgent)
+    public async Task<RefreshTokenRotation?> RotateRefreshTokenAsync(string oldToken, string? ipAddress, string? userAgent)
     {
         var tokenHash = ComputeTokenHash(oldToken);
+        if (IsKnownDead(tokenHash))
+        {
+            _logger.LogWarning("Cannot rotate recently revoked refresh token");
+            return null;
+        }
 
         // Find the old refresh token
         var oldRefreshToken = await _context.RefreshTokens
-            .FirstOrDefaultAsync(rt => rt.TokenHash == tokenHash);
+            .AsNoTracking()
+            .Where(rt => rt.TokenHash == tokenHash)
+            .Select(rt => new { rt.Id, rt.UserId, rt.ExpiresAt, rt.RevokedAt })
+            .FirstOrDefaultAsync();
 
-        if (oldRefreshToken == null || !oldRefreshToken.IsValid)
+        // Expiry never changes, so it is safe to check here rather than in the update (SQLite cannot compare DateTimeOffset)
+        if (oldRefreshToken == null || oldRefreshToken.RevokedAt != null || oldRefreshToken.ExpiresAt <= DateTimeOffset.UtcNow)
         {
             _logger.LogWarning("Cannot rotate invalid or missing refresh token");
+            if (oldRefreshToken != null)
+            {
+                MarkDead(tokenHash);
+            }
             return null;
         }
 
-        // Revoke the old token
-        oldRefreshToken.RevokedAt = DateTimeOffset.UtcNow;
+        // Revoke the old token in one conditional statement; concurrent rotations race on it and only one claims the row
+        var revokedAt = DateTimeOffset.UtcNow;
+        var claimed = await _context.RefreshTokens
+            .Where(rt => rt.Id == oldRefreshToken.Id && rt.RevokedAt == null)
+            .ExecuteUpdateAsync(setters => setters.SetProperty(rt => rt.RevokedAt, revokedAt));
+
+        MarkDead(tokenHash);
+
+        if (claimed == 0)
+        {
+            _logger.LogWarning("Refresh token for user {UserId} was already rotated by a concurrent request", oldRefreshToken.UserId);
+            return null;
+        }
 
         // Generate new token
         var newToken = await GenerateRefreshTokenAsync(oldRefreshToken.UserId, ipAddress, userAgent);
 
-        await _context.SaveChangesAsync();
-
         _logger.LogInformation("Rotated refresh token for user {UserId}", oldRefreshToken.UserId);
 
-        return newToken;
+        return new RefreshTokenRotation(newToken, oldRefreshToken.UserId);
     }
 
     public async Task RevokeAllUserTokensAsync(int userId)
@@ -135,30 +181,82 @@ public async Task RevokeAllUserTokensAsync(int userId)
         foreach (var token in userTokens)
         {
             token.RevokedAt = DateTimeOffset.UtcNow;
+            MarkDead(token.TokenHash);
         }
 
         await _context.SaveChangesAsync();
 
+        // Access tokens are self-contained; without this they would stay valid (and cached) until exp
+        _validationCache.RevokeUser(userId);
+
         _logger.LogInformation("Revoked all refresh tokens for user {UserId}", userId);
     }
 
-    public async Task CleanupExpiredTokensAsync()
+    public async Task<int> CleanupExpiredTokensAsync(DateTimeOffset cutoff, int batchSize, CancellationToken cancellationToken = default)
     {
-        var cutoffDate = DateTimeOffset.UtcNow.AddDays(-60); // Keep tokens for 60 days after expiry for audit purposes
+        var ids = await FindExpiredTokenIdsAsync(cutoff, batchSize, cancellationToken);
+        if (ids.Count == 0)
+        {
+            return 0;
+        }
 
-        var expiredTokens = await _context.RefreshTokens
-            .Where(rt => rt.ExpiresAt < cutoffDate)
-            .ToListAsync();
+        var deleted = await _context.RefreshTokens
+            .Where(rt => ids.Contains(rt.Id))
+            .ExecuteDeleteAsync(cancellationToken);
 
-        if (expiredTokens.Any())
+        _logger.LogInformation("Cleaned up {Count} expired or revoked refresh tokens", deleted);
+
+        return deleted;
+    }
+
+    private async Task<List<int>> FindExpiredTokenIdsAsync(DateTimeOffset cutoff, int batchSize, CancellationToken cancellationToken)
+    {
+        if (_context.Database.ProviderName != SqliteProvider)
         {
-            _context.RefreshTokens.RemoveRange(expiredTokens);
-            await _context.SaveChangesAsync();
+            return await _context.RefreshTokens
+                .Where(rt => rt.ExpiresAt < cutoff || rt.RevokedAt < cutoff)
+                .OrderBy(rt => rt.Id)
+                .Select(rt => rt.Id)
+                .Take(batchSize)
+                .ToListAsync(cancellationToken);
+        }
 
-            _logger.LogInformation("Cleaned up {Count} expired refresh tokens", expiredTokens.Count);
+        // SQLite cannot compare DateTimeOffset server-side; walk the key in pages of narrow rows instead
+        var ids = new List<int>();
+        var afterId = 0;
+        while (ids.Count < batchSize)
+        {
+            var rows = await _context.RefreshTokens
+                .Where(rt => rt.Id > afterId)
+                .OrderBy(rt => rt.Id)
+                .Take(batchSize)
+                .Select(rt => new { rt.Id, rt.ExpiresAt, rt.RevokedAt })
+                .ToListAsync(cancellationToken);
+
+            if (rows.Count == 0)
+            {
+                break;
+            }
+
+            ids.AddRange(rows.Where(r => r.ExpiresAt < cutoff || r.RevokedAt < cutoff).Select(r => r.Id));
+            afterId = rows[^1].Id;
         }
+
+        return ids.Take(batchSize).ToList();
+    }
+
+    private bool IsKnownDead(string tokenHash)
+    {
+        return _deadTokenCache.TryGetValue(DeadTokenKey(tokenHash), out _);
     }
 
+    private void MarkDead(string tokenHash)
+    {
+        _deadTokenCache.Set(DeadTokenKey(tokenHash), true, DeadTokenCacheDuration);
+    }
+
+    private static string DeadTokenKey(string tokenHash) => $"refresh-token:dead:{tokenHash}";
+
     /// <summary>
     /// Computes SHA256 hash of a token for secure storage
     /// </summary>
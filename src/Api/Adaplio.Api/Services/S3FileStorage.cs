@@ -0,0 +1,72 @@
+using System.Net;
+using Amazon.S3;
+using Amazon.S3.Model;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Stores uploads in an S3-compatible bucket (AWS S3, MinIO, R2). Downloads are redirected to
+/// short-lived presigned GET URLs so the object store serves Range and ETag requests itself.
+/// </summary>
+public class S3FileStorage : IFileStorage
+{
+    private readonly IAmazonS3 _s3;
+    private readonly string _bucket;
+    private readonly TimeSpan _downloadUrlLifetime;
+
+    public S3FileStorage(IAmazonS3 s3, IConfiguration configuration)
+    {
+        _s3 = s3;
+        _bucket = configuration["Upload:S3:Bucket"] ?? "adaplio-uploads";
+        _downloadUrlLifetime = TimeSpan.FromMinutes(configuration.GetValue("Upload:S3:DownloadUrlMinutes", 15));
+    }
+
+    public async Task SaveAsync(string key, string stagedPath, string contentType, CancellationToken cancellationToken = default)
+    {
+        await _s3.PutObjectAsync(new PutObjectRequest
+        {
+            BucketName = _bucket,
+            Key = key,
+            FilePath = stagedPath,
+            ContentType = contentType
+        }, cancellationToken);
+
+        File.Delete(stagedPath);
+    }
+
+    public async Task<StoredFile?> GetAsync(string key, CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            var metadata = await _s3.GetObjectMetadataAsync(_bucket, key, cancellationToken);
+            var downloadUrl = _s3.GetPreSignedURL(new GetPreSignedUrlRequest
+            {
+                BucketName = _bucket,
+                Key = key,
+                Verb = HttpVerb.GET,
+                Expires = DateTime.UtcNow.Add(_downloadUrlLifetime)
+            });
+
+            return new StoredFile(
+                key,
+                metadata.ContentLength,
+                new DateTimeOffset(metadata.LastModified.ToUniversalTime()),
+                metadata.ETag,
+                RedirectUrl: downloadUrl);
+        }
+        catch (AmazonS3Exception ex) when (ex.StatusCode == HttpStatusCode.NotFound)
+        {
+            return null;
+        }
+    }
+
+    public async Task<bool> DeleteAsync(string key, CancellationToken cancellationToken = default)
+    {
+        // S3 deletes are idempotent and do not report whether the key existed
+        if (await GetAsync(key, cancellationToken) == null)
+            return false;
+
+        await _s3.DeleteObjectAsync(_bucket, key, cancellationToken);
+        return true;
+    }
+}
@@ -1,8 +1,6 @@
+using System.Net.Http.Headers;
 using System.Text;
 using System.Text.Json;
-using Twilio;
-using Twilio.Rest.Api.V2010.Account;
-using Twilio.Types;
 
 namespace Adaplio.Api.Services;
 
@@ -19,98 +17,112 @@ public SMSService(HttpClient httpClient, IConfiguration configuration, ILogger<S
         _logger = logger;
     }
 
-    public async Task<bool> SendInviteLinkAsync(string phoneNumber, string inviteToken, string? trainerName = null)
+    public string? Provider
     {
-        var baseUrl = _configuration["App:BaseUrl"] ?? "https://localhost:5001";
-        var inviteLink = $"{baseUrl}/?invite={inviteToken}";
-
-        var trainerText = !string.IsNullOrEmpty(trainerName) ? $" from {trainerName}" : "";
-        var message = $"You've been invited{trainerText} to start your PT plan on Adaplio! Click here to get started: {inviteLink}";
-
-        return await SendMessageAsync(phoneNumber, message);
-    }
-
-    public async Task<bool> SendMessageAsync(string phoneNumber, string message)
-    {
-        try
+        get
         {
             // Check if we're in development mode
             if (_configuration["Environment"] == "Development")
             {
-                _logger.LogInformation("SMS Service (Development Mode): Would send to {PhoneNumber}: {Message}", phoneNumber, message);
-                return true;
+                return "development";
             }
 
             // For production, integrate with actual SMS service (Twilio, AWS SNS, etc.)
             var smsProvider = _configuration["SMS:Provider"] ?? _configuration["SMS_PROVIDER"];
 
             // Default to Twilio if environment variables are present
-            if (string.IsNullOrEmpty(smsProvider))
+            if (string.IsNullOrEmpty(smsProvider) && !string.IsNullOrEmpty(_configuration["TWILIO_ACCOUNT_SID"]))
             {
-                var twilioSid = _configuration["TWILIO_ACCOUNT_SID"];
-                if (!string.IsNullOrEmpty(twilioSid))
-                {
-                    smsProvider = "twilio";
-                }
+                smsProvider = "twilio";
             }
 
-            switch (smsProvider?.ToLower())
+            return smsProvider?.ToLower() switch
             {
-                case "twilio":
-                    return await SendViaTwilio(phoneNumber, message);
-                case "aws":
-                    return await SendViaAWS(phoneNumber, message);
-                default:
-                    _logger.LogWarning("No SMS provider configured. Message not sent to {PhoneNumber}", phoneNumber);
-                    return false;
-            }
+                "twilio" => "twilio",
+                "aws" => "aws",
+                _ => null
+            };
         }
-        catch (Exception ex)
+    }
+
+    public string BuildInviteMessage(string inviteToken, string? trainerName = null)
+    {
+        var baseUrl = _configuration["App:BaseUrl"] ?? "https://localhost:5001";
+        var inviteLink = $"{baseUrl}/?invite={inviteToken}";
+
+        var trainerText = !string.IsNullOrEmpty(trainerName) ? $" from {trainerName}" : "";
+        return $"You've been invited{trainerText} to start your PT plan on Adaplio! Click here to get started: {inviteLink}";
+    }
+
+    public async Task DeliverAsync(string phoneNumber, string message, CancellationToken cancellationToken = default)
+    {
+        switch (Provider)
         {
-            _logger.LogError(ex, "Failed to send SMS to {PhoneNumber}", phoneNumber);
-            return false;
+            case "development":
+                _logger.LogInformation("SMS Service (Development Mode): Would send to {PhoneNumber}: {Message}", phoneNumber, message);
+                break;
+            case "twilio":
+                await SendViaTwilio(phoneNumber, message, cancellationToken);
+                break;
+            case "aws":
+                await SendViaAWS(phoneNumber, message);
+                break;
+            default:
+                throw new InvalidOperationException("No SMS provider configured");
         }
     }
 
-    private async Task<bool> SendViaTwilio(string phoneNumber, string message)
+    private async Task SendViaTwilio(string phoneNumber, string message, CancellationToken cancellationToken)
     {
-        try
+        var accountSid = _configuration["Twilio:AccountSid"] ?? _configuration["TWILIO_ACCOUNT_SID"];
+        var authToken = _configuration["Twilio:AuthToken"] ?? _configuration["TWILIO_AUTH_TOKEN"];
+        var fromNumber = _configuration["Twilio:PhoneNumber"] ?? _configuration["TWILIO_PHONE_NUMBER"];
+
+        if (string.IsNullOrEmpty(accountSid) || string.IsNullOrEmpty(authToken) || string.IsNullOrEmpty(fromNumber))
         {
-            var accountSid = _configuration["Twilio:AccountSid"] ?? _configuration["TWILIO_ACCOUNT_SID"];
-            var authToken = _configuration["Twilio:AuthToken"] ?? _configuration["TWILIO_AUTH_TOKEN"];
-            var fromNumber = _configuration["Twilio:PhoneNumber"] ?? _configuration["TWILIO_PHONE_NUMBER"];
+            throw new InvalidOperationException(
+                "Twilio configuration missing. Check TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, and TWILIO_PHONE_NUMBER");
+        }
 
-            if (string.IsNullOrEmpty(accountSid) || string.IsNullOrEmpty(authToken) || string.IsNullOrEmpty(fromNumber))
+        // Twilio's Messages REST resource, called directly so Twilio:BaseUrl can point at a local stand-in
+        var baseUrl = (_configuration["Twilio:BaseUrl"] ?? "https://api.twilio.com").TrimEnd('/');
+        using var request = new HttpRequestMessage(HttpMethod.Post, $"{baseUrl}/2010-04-01/Accounts/{accountSid}/Messages.json")
+        {
+            Content = new FormUrlEncodedContent(new Dictionary<string, string>
             {
-                _logger.LogError("Twilio configuration missing. Check TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, and TWILIO_PHONE_NUMBER");
-                return false;
-            }
-
-            TwilioClient.Init(accountSid, authToken);
+                ["To"] = phoneNumber,
+                ["From"] = fromNumber,
+                ["Body"] = message
+            })
+        };
+        request.Headers.Authorization = new AuthenticationHeaderValue(
+            "Basic", Convert.ToBase64String(Encoding.ASCII.GetBytes($"{accountSid}:{authToken}")));
+
+        using var response = await _httpClient.SendAsync(request, cancellationToken);
+        var content = await response.Content.ReadAsStringAsync(cancellationToken);
+
+        if (!response.IsSuccessStatusCode)
+        {
+            _logger.LogError("Failed to send SMS via Twilio. Status: {StatusCode}, Error: {Error}", response.StatusCode, content);
+            throw new InvalidOperationException($"Failed to send SMS: {(int)response.StatusCode} {content}");
+        }
 
-            var messageResource = await MessageResource.CreateAsync(
-                body: message,
-                from: new PhoneNumber(fromNumber),
-                to: new PhoneNumber(phoneNumber)
-            );
+        using var json = JsonDocument.Parse(content);
+        var sid = json.RootElement.TryGetProperty("sid", out var sidElement) ? sidElement.GetString() : null;
+        var status = json.RootElement.TryGetProperty("status", out var statusElement) ? statusElement.GetString() : null;
 
-            _logger.LogInformation("SMS sent successfully via Twilio. SID: {MessageSid}, Status: {Status}",
-                messageResource.Sid, messageResource.Status);
+        _logger.LogInformation("SMS sent successfully via Twilio. SID: {MessageSid}, Status: {Status}", sid, status);
 
-            return messageResource.Status != MessageResource.StatusEnum.Failed
-                && messageResource.Status != MessageResource.StatusEnum.Undelivered;
-        }
-        catch (Exception ex)
+        if (status is "failed" or "undelivered")
         {
-            _logger.LogError(ex, "Failed to send SMS via Twilio to {PhoneNumber}", phoneNumber);
-            return false;
+            throw new InvalidOperationException($"Twilio reported message {sid} as {status}");
         }
     }
 
-    private async Task<bool> SendViaAWS(string phoneNumber, string message)
+    private Task SendViaAWS(string phoneNumber, string message)
     {
         // Placeholder for AWS SNS integration
         _logger.LogInformation("Would send via AWS SNS to {PhoneNumber}: {Message}", phoneNumber, message);
-        return true;
+        return Task.CompletedTask;
     }
 }
\ No newline at end of file
@@ -0,0 +1,108 @@
+using System.Buffers;
+using System.Threading.Channels;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>Bounded prefix of a request or response body in a pooled buffer, owned by whoever holds it</summary>
+public readonly record struct AuditCapture(byte[]? Buffer, int Length, long TotalBytes)
+{
+    public static readonly AuditCapture Empty = new(null, 0, 0);
+
+    public bool Truncated => TotalBytes > Length;
+
+    public ReadOnlySpan<byte> Span => Buffer.AsSpan(0, Length);
+
+    public void Return()
+    {
+        if (Buffer != null)
+        {
+            ArrayPool<byte>.Shared.Return(Buffer);
+        }
+    }
+}
+
+/// <summary>Everything the audit log needs, copied off the HttpContext before the request completes</summary>
+public sealed class SecurityAuditRecord
+{
+    public DateTimeOffset Timestamp { get; init; }
+    public string Method { get; init; } = "";
+    public string? Path { get; init; }
+    public string? QueryString { get; init; }
+    public string? UserAgent { get; init; }
+    public string? IpAddress { get; init; }
+    public string? UserId { get; init; }
+    public string? UserEmail { get; init; }
+    public string? UserType { get; init; }
+    public bool IsAuthenticated { get; init; }
+    public int StatusCode { get; init; }
+    public long ElapsedMs { get; init; }
+    public string? ContentType { get; init; }
+    public string? AcceptLanguage { get; init; }
+    public string? Referer { get; init; }
+    public string EventType { get; init; } = "";
+    public AuditCapture RequestBody { get; init; } = AuditCapture.Empty;
+    public AuditCapture ResponseBody { get; init; } = AuditCapture.Empty;
+}
+
+public record SecurityAuditStats(
+    long Enqueued,
+    long Dropped,
+    long Written,
+    int Pending,
+    int Capacity
+);
+
+/// <summary>
+/// Hand-off between SecurityAuditMiddleware and SecurityAuditWriter. Enqueueing never blocks:
+/// when the writer falls behind by SecurityAudit:QueueCapacity records, new records are dropped and counted.
+/// </summary>
+public sealed class SecurityAuditQueue
+{
+    private readonly Channel<SecurityAuditRecord> _channel;
+    private readonly int _capacity;
+
+    private long _enqueued;
+    private long _dropped;
+    private long _written;
+
+    public SecurityAuditQueue(IConfiguration configuration)
+    {
+        _capacity = configuration.GetValue("SecurityAudit:QueueCapacity", 10000);
+        _channel = Channel.CreateBounded<SecurityAuditRecord>(new BoundedChannelOptions(_capacity)
+        {
+            SingleReader = true,
+            FullMode = BoundedChannelFullMode.Wait // TryWrite fails instead of waiting, so drops can be counted
+        });
+    }
+
+    public ChannelReader<SecurityAuditRecord> Reader => _channel.Reader;
+
+    public bool TryEnqueue(SecurityAuditRecord record)
+    {
+        if (_channel.Writer.TryWrite(record))
+        {
+            Interlocked.Increment(ref _enqueued);
+            return true;
+        }
+
+        Interlocked.Increment(ref _dropped);
+        record.RequestBody.Return();
+        record.ResponseBody.Return();
+        return false;
+    }
+
+    public void MarkWritten(int count)
+    {
+        Interlocked.Add(ref _written, count);
+    }
+
+    public SecurityAuditStats GetStats()
+    {
+        return new SecurityAuditStats(
+            Interlocked.Read(ref _enqueued),
+            Interlocked.Read(ref _dropped),
+            Interlocked.Read(ref _written),
+            _channel.Reader.Count,
+            _capacity);
+    }
+}
@@ -0,0 +1,174 @@
+using System.Text.Json;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Drains SecurityAuditQueue in batches: redacts the captured bodies, writes the audit log entry and
+/// forwards the event to security monitoring, all off the request path. Records still queued at
+/// shutdown are written before the service stops.
+/// </summary>
+public class SecurityAuditWriter : BackgroundService
+{
+    private readonly SecurityAuditQueue _queue;
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly ILogger<SecurityAuditWriter> _logger;
+    private readonly int _batchSize;
+
+    public SecurityAuditWriter(
+        SecurityAuditQueue queue,
+        IServiceScopeFactory scopeFactory,
+        IConfiguration configuration,
+        ILogger<SecurityAuditWriter> logger)
+    {
+        _queue = queue;
+        _scopeFactory = scopeFactory;
+        _logger = logger;
+        _batchSize = Math.Max(1, configuration.GetValue("SecurityAudit:BatchSize", 100));
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        var batch = new List<SecurityAuditRecord>(_batchSize);
+
+        try
+        {
+            while (await _queue.Reader.WaitToReadAsync(stoppingToken))
+            {
+                await WriteAvailableAsync(batch);
+            }
+        }
+        catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+        {
+            // Shutting down: flush whatever is already queued
+            await WriteAvailableAsync(batch);
+        }
+    }
+
+    private async Task WriteAvailableAsync(List<SecurityAuditRecord> batch)
+    {
+        while (true)
+        {
+            while (batch.Count < _batchSize && _queue.Reader.TryRead(out var record))
+            {
+                batch.Add(record);
+            }
+
+            if (batch.Count == 0)
+            {
+                return;
+            }
+
+            await WriteBatchAsync(batch);
+            _queue.MarkWritten(batch.Count);
+            batch.Clear();
+        }
+    }
+
+    private async Task WriteBatchAsync(List<SecurityAuditRecord> batch)
+    {
+        // One scope per batch rather than per request
+        using var scope = _scopeFactory.CreateScope();
+        var securityMonitoring = scope.ServiceProvider.GetRequiredService<ISecurityMonitoringService>();
+
+        foreach (var record in batch)
+        {
+            try
+            {
+                LogSecurityAudit(record);
+
+                await securityMonitoring.LogSecurityEventAsync(
+                    record.EventType,
+                    record.UserId,
+                    record.IpAddress,
+                    new {
+                        path = record.Path,
+                        method = record.Method,
+                        statusCode = record.StatusCode,
+                        elapsedMs = record.ElapsedMs
+                    }
+                );
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Failed to write security audit record for {Method} {Path}", record.Method, record.Path);
+            }
+            finally
+            {
+                record.RequestBody.Return();
+                record.ResponseBody.Return();
+            }
+        }
+    }
+
+    private void LogSecurityAudit(SecurityAuditRecord record)
+    {
+        var auditData = new
+        {
+            // Request details
+            timestamp = record.Timestamp,
+            method = record.Method,
+            path = record.Path,
+            queryString = record.QueryString,
+            userAgent = record.UserAgent,
+            ipAddress = record.IpAddress,
+
+            // User details
+            userId = record.UserId,
+            userEmail = record.UserEmail,
+            userType = record.UserType,
+            isAuthenticated = record.IsAuthenticated,
+
+            // Response details
+            statusCode = record.StatusCode,
+            elapsedMs = record.ElapsedMs,
+
+            // Request/Response body prefixes (redacted)
+            requestBody = AuditBodyRedactor.Redact(record.RequestBody),
+            responseBody = AuditBodyRedactor.Redact(record.ResponseBody),
+
+            // Security indicators
+            isSuccessful = record.StatusCode < 400,
+            isSensitiveEndpoint = true,
+
+            // Additional headers
+            contentType = record.ContentType,
+            acceptLanguage = record.AcceptLanguage,
+            referer = record.Referer
+        };
+
+        // Different log levels based on outcome
+        if (record.StatusCode >= 400)
+        {
+            _logger.LogWarning("Security Audit - Failed Request: {AuditData}", JsonSerializer.Serialize(auditData));
+        }
+        else if (IsHighRiskOperation(record.Path, record.Method))
+        {
+            _logger.LogWarning("Security Audit - High Risk Operation: {AuditData}", JsonSerializer.Serialize(auditData));
+        }
+        else
+        {
+            _logger.LogInformation("Security Audit - Request: {AuditData}", JsonSerializer.Serialize(auditData));
+        }
+    }
+
+    private static bool IsHighRiskOperation(string? path, string method)
+    {
+        var pathValue = path?.ToLower() ?? "";
+
+        // High-risk operations that warrant special attention
+        var highRiskPatterns = new[]
+        {
+            "/auth/login",
+            "/auth/register",
+            "/api/me/profile",
+            "/api/upload",
+            "/api/trainer/grants",
+            "/api/invites/accept",
+            "/api/consent",
+            "/api/privacy"
+        };
+
+        return highRiskPatterns.Any(pattern => pathValue.Contains(pattern)) ||
+               (method == "DELETE" && pathValue.StartsWith("/api/"));
+    }
+}
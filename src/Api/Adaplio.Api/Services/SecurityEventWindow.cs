@@ -0,0 +1,319 @@
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// 24 hours of security events pre-aggregated into a ring of per-minute buckets.
+/// Each bucket keeps counters by category and event type, top-K sketches by IP and user,
+/// and HyperLogLog sketches for distinct users/IPs, so memory is fixed no matter how much
+/// traffic arrives and every query touches at most one bucket per minute of its period.
+/// </summary>
+public sealed class SecurityEventWindow
+{
+    public const int WindowMinutes = 24 * 60;
+
+    private const int TopK = 32;
+    private const int MaxEventTypesPerMinute = 32;
+    private const int MaxUserSetsPerMinute = 16;
+    private const string OtherEventType = "other";
+
+    private readonly MinuteBucket?[] _buckets = new MinuteBucket?[WindowMinutes];
+    private readonly object _lock = new();
+
+    public void Record(SecurityEvent securityEvent)
+    {
+        var minute = ToMinute(securityEvent.Timestamp);
+        var ip = string.IsNullOrEmpty(securityEvent.IpAddress) ? null : securityEvent.IpAddress;
+        var userId = string.IsNullOrEmpty(securityEvent.UserId) ? null : securityEvent.UserId;
+        var eventType = securityEvent.EventType;
+
+        lock (_lock)
+        {
+            var bucket = GetBucketForWrite(minute);
+            if (bucket == null)
+            {
+                return; // Older than the window
+            }
+
+            bucket.Total++;
+
+            // Event types come from callers (including the log-event endpoint), so cap the distinct keys
+            if (bucket.ByType.Count >= MaxEventTypesPerMinute && !bucket.ByType.ContainsKey(eventType))
+            {
+                eventType = OtherEventType;
+            }
+            bucket.ByType[eventType] = bucket.ByType.GetValueOrDefault(eventType) + 1;
+
+            if (IsFailedAuth(securityEvent.EventType))
+            {
+                bucket.FailedAuth++;
+                if (ip != null)
+                {
+                    bucket.FailedAuthByIp.Add(ip);
+                }
+            }
+
+            if (securityEvent.EventType.Contains("rate_limit"))
+            {
+                bucket.RateLimit++;
+            }
+
+            if (securityEvent.EventType.Contains("suspicious"))
+            {
+                bucket.Suspicious++;
+            }
+
+            if (userId != null && IsUnauthorized(securityEvent.EventType))
+            {
+                bucket.UnauthorizedByUser.Add(userId);
+            }
+
+            if (ip != null)
+            {
+                bucket.RequestsByIp.Add(ip);
+                bucket.Ips.Add(ip);
+            }
+
+            if (userId != null)
+            {
+                bucket.Users.Add(userId);
+            }
+
+            if (ip != null && userId != null)
+            {
+                AddUserForIp(bucket, ip, userId);
+            }
+        }
+    }
+
+    public SecurityMetrics GetMetrics(TimeSpan period, DateTimeOffset now)
+    {
+        var metrics = new SecurityMetrics { Period = period };
+        var users = new HyperLogLog();
+        var ips = new HyperLogLog();
+        var requestsByIp = new Dictionary<string, long>();
+
+        lock (_lock)
+        {
+            foreach (var bucket in BucketsInPeriod(period, now))
+            {
+                metrics.TotalEvents += (int)bucket.Total;
+                metrics.FailedAuthAttempts += (int)bucket.FailedAuth;
+                metrics.RateLimitViolations += (int)bucket.RateLimit;
+                metrics.SuspiciousActivities += (int)bucket.Suspicious;
+
+                foreach (var (eventType, count) in bucket.ByType)
+                {
+                    metrics.EventsByType[eventType] = metrics.EventsByType.GetValueOrDefault(eventType) + (int)count;
+                }
+
+                Accumulate(requestsByIp, bucket.RequestsByIp);
+                users.Merge(bucket.Users);
+                ips.Merge(bucket.Ips);
+            }
+        }
+
+        metrics.UniqueUsers = users.Estimate();
+        metrics.UniqueIpAddresses = ips.Estimate();
+        metrics.TopIpAddresses = requestsByIp
+            .OrderByDescending(kv => kv.Value)
+            .Take(10)
+            .ToDictionary(kv => kv.Key, kv => (int)kv.Value);
+
+        return metrics;
+    }
+
+    /// <summary>Failed auth attempts from one IP within the period</summary>
+    public long CountFailedAuth(string ipAddress, TimeSpan period, DateTimeOffset now)
+    {
+        lock (_lock)
+        {
+            return BucketsInPeriod(period, now).Sum(b => b.FailedAuthByIp.GuaranteedCount(ipAddress));
+        }
+    }
+
+    /// <summary>Failed auth attempts per IP within the period (heavy hitters only)</summary>
+    public Dictionary<string, long> FailedAuthByIp(TimeSpan period, DateTimeOffset now)
+    {
+        var counts = new Dictionary<string, long>();
+        lock (_lock)
+        {
+            foreach (var bucket in BucketsInPeriod(period, now))
+            {
+                Accumulate(counts, bucket.FailedAuthByIp);
+            }
+        }
+        return counts;
+    }
+
+    /// <summary>Unauthorized/forbidden events per user within the period (heavy hitters only)</summary>
+    public Dictionary<string, long> UnauthorizedByUser(TimeSpan period, DateTimeOffset now)
+    {
+        var counts = new Dictionary<string, long>();
+        lock (_lock)
+        {
+            foreach (var bucket in BucketsInPeriod(period, now))
+            {
+                Accumulate(counts, bucket.UnauthorizedByUser);
+            }
+        }
+        return counts;
+    }
+
+    /// <summary>Busiest single minute per IP over the current and previous minute</summary>
+    public Dictionary<string, long> PeakRequestsPerMinuteByIp(DateTimeOffset now)
+    {
+        var peaks = new Dictionary<string, long>();
+        lock (_lock)
+        {
+            foreach (var bucket in BucketsInPeriod(TimeSpan.FromMinutes(2), now))
+            {
+                foreach (var (ip, count) in bucket.RequestsByIp.GuaranteedCounts())
+                {
+                    peaks[ip] = Math.Max(peaks.GetValueOrDefault(ip), count);
+                }
+            }
+        }
+        return peaks;
+    }
+
+    /// <summary>Estimated distinct users per IP within the period, for IPs carrying the most user traffic</summary>
+    public Dictionary<string, int> DistinctUsersByIp(TimeSpan period, DateTimeOffset now)
+    {
+        var merged = new Dictionary<string, HyperLogLog>();
+        lock (_lock)
+        {
+            foreach (var bucket in BucketsInPeriod(period, now))
+            {
+                foreach (var (ip, users) in bucket.UsersByIp)
+                {
+                    if (!merged.TryGetValue(ip, out var sketch))
+                    {
+                        sketch = new HyperLogLog(MinuteBucket.UserSetPrecision);
+                        merged[ip] = sketch;
+                    }
+                    sketch.Merge(users);
+                }
+            }
+        }
+        return merged.ToDictionary(kv => kv.Key, kv => kv.Value.Estimate());
+    }
+
+    private static void AddUserForIp(MinuteBucket bucket, string ip, string userId)
+    {
+        var evicted = bucket.UserEventsByIp.Add(ip);
+
+        if (!bucket.UsersByIp.TryGetValue(ip, out var users))
+        {
+            // Reuse the evicted IP's sketch so the bucket never allocates more than MaxUserSetsPerMinute
+            if (evicted != null && bucket.UsersByIp.Remove(evicted, out var reused))
+            {
+                reused.Clear();
+                users = reused;
+            }
+            else
+            {
+                users = new HyperLogLog(MinuteBucket.UserSetPrecision);
+            }
+            bucket.UsersByIp[ip] = users;
+        }
+
+        users.Add(userId);
+    }
+
+    private static void Accumulate(Dictionary<string, long> totals, TopKSketch sketch)
+    {
+        foreach (var (key, count) in sketch.GuaranteedCounts())
+        {
+            totals[key] = totals.GetValueOrDefault(key) + count;
+        }
+    }
+
+    private MinuteBucket? GetBucketForWrite(long minute)
+    {
+        var index = (int)(minute % WindowMinutes);
+        var bucket = _buckets[index];
+
+        if (bucket == null)
+        {
+            bucket = new MinuteBucket();
+            bucket.Reset(minute);
+            _buckets[index] = bucket;
+        }
+        else if (bucket.Minute < minute)
+        {
+            bucket.Reset(minute); // Slot last used a full window ago
+        }
+        else if (bucket.Minute > minute)
+        {
+            return null;
+        }
+
+        return bucket;
+    }
+
+    private IEnumerable<MinuteBucket> BucketsInPeriod(TimeSpan period, DateTimeOffset now)
+    {
+        var minutes = Math.Clamp((int)Math.Ceiling(period.TotalMinutes), 1, WindowMinutes);
+        var current = ToMinute(now);
+
+        for (var minute = current - minutes + 1; minute <= current; minute++)
+        {
+            var bucket = _buckets[(int)(minute % WindowMinutes)];
+            if (bucket != null && bucket.Minute == minute)
+            {
+                yield return bucket;
+            }
+        }
+    }
+
+    private static long ToMinute(DateTimeOffset timestamp)
+    {
+        return timestamp.ToUnixTimeSeconds() / 60;
+    }
+
+    private static bool IsFailedAuth(string eventType)
+    {
+        return eventType.Contains("auth_failed") || eventType.Contains("login_failed");
+    }
+
+    private static bool IsUnauthorized(string eventType)
+    {
+        return eventType.Contains("unauthorized") || eventType.Contains("forbidden");
+    }
+
+    private sealed class MinuteBucket
+    {
+        public const int UserSetPrecision = 6;
+
+        public long Minute;
+        public long Total;
+        public long FailedAuth;
+        public long RateLimit;
+        public long Suspicious;
+
+        public readonly Dictionary<string, long> ByType = new();
+        public readonly TopKSketch RequestsByIp = new(TopK);
+        public readonly TopKSketch FailedAuthByIp = new(TopK);
+        public readonly TopKSketch UnauthorizedByUser = new(TopK);
+        public readonly TopKSketch UserEventsByIp = new(MaxUserSetsPerMinute);
+        public readonly Dictionary<string, HyperLogLog> UsersByIp = new();
+        public readonly HyperLogLog Users = new();
+        public readonly HyperLogLog Ips = new();
+
+        public void Reset(long minute)
+        {
+            Minute = minute;
+            Total = 0;
+            FailedAuth = 0;
+            RateLimit = 0;
+            Suspicious = 0;
+            ByType.Clear();
+            RequestsByIp.Clear();
+            FailedAuthByIp.Clear();
+            UnauthorizedByUser.Clear();
+            UserEventsByIp.Clear();
+            UsersByIp.Clear();
+            Users.Clear();
+            Ips.Clear();
+        }
+    }
+}
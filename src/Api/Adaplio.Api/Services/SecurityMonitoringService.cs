@@ -14,7 +14,7 @@ public interface ISecurityMonitoringService
 public class SecurityMonitoringService : ISecurityMonitoringService
 {
     private readonly ILogger<SecurityMonitoringService> _logger;
-    private static readonly ConcurrentQueue<SecurityEvent> _events = new();
+    private readonly SecurityEventWindow _window;
     private static readonly ConcurrentDictionary<string, SecurityAlert> _activeAlerts = new();
 
     // Threat detection thresholds
@@ -22,9 +22,10 @@ public class SecurityMonitoringService : ISecurityMonitoringService
     private const int RapidRequestThreshold = 100; // per IP per minute
     private const int UniqueUserThreshold = 50;  // unique users per IP per hour
 
-    public SecurityMonitoringService(ILogger<SecurityMonitoringService> logger)
+    public SecurityMonitoringService(ILogger<SecurityMonitoringService> logger, SecurityEventWindow window)
     {
         _logger = logger;
+        _window = window;
     }
 
     public async Task LogSecurityEventAsync(string eventType, string? userId, string? ipAddress, object? additionalData = null)
@@ -39,10 +40,8 @@ public async Task LogSecurityEventAsync(string eventType, string? userId, string
             AdditionalData = additionalData != null ? JsonSerializer.Serialize(additionalData) : null
         };
 
-        _events.Enqueue(securityEvent);
-
-        // Cleanup old events (keep 24 hours)
-        await CleanupOldEventsAsync();
+        // Pre-aggregated per-minute buckets; old minutes are overwritten in place
+        _window.Record(securityEvent);
 
         // Log to structured logging
         _logger.LogInformation("Security Event: {EventType} from {IpAddress} for user {UserId} - {AdditionalData}",
@@ -52,36 +51,9 @@ public async Task LogSecurityEventAsync(string eventType, string? userId, string
         await CheckForImmediateThreatsAsync(securityEvent);
     }
 
-    public async Task<SecurityMetrics> GetSecurityMetricsAsync(TimeSpan period)
+    public Task<SecurityMetrics> GetSecurityMetricsAsync(TimeSpan period)
     {
-        var cutoff = DateTimeOffset.UtcNow - period;
-        var recentEvents = GetEventsAfter(cutoff).ToList();
-
-        var metrics = new SecurityMetrics
-        {
-            Period = period,
-            TotalEvents = recentEvents.Count,
-            FailedAuthAttempts = recentEvents.Count(e => e.EventType.Contains("auth_failed")),
-            RateLimitViolations = recentEvents.Count(e => e.EventType.Contains("rate_limit")),
-            SuspiciousActivities = recentEvents.Count(e => e.EventType.Contains("suspicious")),
-            UniqueIpAddresses = recentEvents.Where(e => !string.IsNullOrEmpty(e.IpAddress))
-                                          .Select(e => e.IpAddress)
-                                          .Distinct()
-                                          .Count(),
-            UniqueUsers = recentEvents.Where(e => !string.IsNullOrEmpty(e.UserId))
-                                    .Select(e => e.UserId)
-                                    .Distinct()
-                                    .Count(),
-            TopIpAddresses = recentEvents.Where(e => !string.IsNullOrEmpty(e.IpAddress))
-                                       .GroupBy(e => e.IpAddress)
-                                       .OrderByDescending(g => g.Count())
-                                       .Take(10)
-                                       .ToDictionary(g => g.Key!, g => g.Count()),
-            EventsByType = recentEvents.GroupBy(e => e.EventType)
-                                     .ToDictionary(g => g.Key, g => g.Count())
-        };
-
-        return metrics;
+        return Task.FromResult(_window.GetMetrics(period, DateTimeOffset.UtcNow));
     }
 
     public async Task<List<SecurityAlert>> GetActiveAlertsAsync()
@@ -101,75 +73,63 @@ public async Task<List<SecurityAlert>> GetActiveAlertsAsync()
 
     public async Task CheckForThreatsAsync()
     {
-        var oneHourAgo = DateTimeOffset.UtcNow.AddHours(-1);
-        var oneMinuteAgo = DateTimeOffset.UtcNow.AddMinutes(-1);
-        var recentEvents = GetEventsAfter(oneHourAgo).ToList();
+        var now = DateTimeOffset.UtcNow;
+        var oneHour = TimeSpan.FromHours(1);
 
         // Check for brute force attacks (failed auth attempts)
-        var failedAuthByIp = recentEvents
-            .Where(e => e.EventType.Contains("auth_failed") || e.EventType.Contains("login_failed"))
-            .Where(e => !string.IsNullOrEmpty(e.IpAddress))
-            .GroupBy(e => e.IpAddress)
-            .Where(g => g.Count() >= FailedAuthThreshold);
-
-        foreach (var group in failedAuthByIp)
+        foreach (var (ipAddress, attempts) in _window.FailedAuthByIp(oneHour, now))
         {
-            await CreateSecurityAlert(
-                "brute_force_attack",
-                SecuritySeverity.High,
-                $"Potential brute force attack from IP {group.Key}: {group.Count()} failed auth attempts in 1 hour",
-                new { ipAddress = group.Key, attemptCount = group.Count() }
-            );
+            if (attempts >= FailedAuthThreshold)
+            {
+                await CreateSecurityAlert(
+                    "brute_force_attack",
+                    SecuritySeverity.High,
+                    $"Potential brute force attack from IP {ipAddress}: {attempts} failed auth attempts in 1 hour",
+                    new { ipAddress, attemptCount = attempts }
+                );
+            }
         }
 
         // Check for rapid requests (potential DDoS or scraping)
-        var rapidRequestsByIp = recentEvents
-            .Where(e => e.Timestamp >= oneMinuteAgo)
-            .Where(e => !string.IsNullOrEmpty(e.IpAddress))
-            .GroupBy(e => e.IpAddress)
-            .Where(g => g.Count() >= RapidRequestThreshold);
-
-        foreach (var group in rapidRequestsByIp)
+        foreach (var (ipAddress, requests) in _window.PeakRequestsPerMinuteByIp(now))
         {
-            await CreateSecurityAlert(
-                "rapid_requests",
-                SecuritySeverity.Medium,
-                $"Rapid requests from IP {group.Key}: {group.Count()} requests in 1 minute",
-                new { ipAddress = group.Key, requestCount = group.Count() }
-            );
+            if (requests >= RapidRequestThreshold)
+            {
+                await CreateSecurityAlert(
+                    "rapid_requests",
+                    SecuritySeverity.Medium,
+                    $"Rapid requests from IP {ipAddress}: {requests} requests in 1 minute",
+                    new { ipAddress, requestCount = requests }
+                );
+            }
         }
 
         // Check for account sharing (multiple users from same IP)
-        var usersByIp = recentEvents
-            .Where(e => !string.IsNullOrEmpty(e.IpAddress) && !string.IsNullOrEmpty(e.UserId))
-            .GroupBy(e => e.IpAddress)
-            .Where(g => g.Select(e => e.UserId).Distinct().Count() >= UniqueUserThreshold);
-
-        foreach (var group in usersByIp)
+        foreach (var (ipAddress, uniqueUsers) in _window.DistinctUsersByIp(oneHour, now))
         {
-            var uniqueUsers = group.Select(e => e.UserId).Distinct().Count();
-            await CreateSecurityAlert(
-                "potential_account_sharing",
-                SecuritySeverity.Medium,
-                $"Multiple users from IP {group.Key}: {uniqueUsers} unique users in 1 hour",
-                new { ipAddress = group.Key, uniqueUserCount = uniqueUsers }
-            );
+            if (uniqueUsers >= UniqueUserThreshold)
+            {
+                await CreateSecurityAlert(
+                    "potential_account_sharing",
+                    SecuritySeverity.Medium,
+                    $"Multiple users from IP {ipAddress}: {uniqueUsers} unique users in 1 hour",
+                    new { ipAddress, uniqueUserCount = uniqueUsers }
+                );
+            }
         }
 
         // Check for privilege escalation attempts
-        var privilegeEvents = recentEvents
-            .Where(e => e.EventType.Contains("unauthorized") || e.EventType.Contains("forbidden"))
-            .GroupBy(e => e.UserId)
-            .Where(g => !string.IsNullOrEmpty(g.Key) && g.Count() >= 5);
-
-        foreach (var group in privilegeEvents)
+        foreach (var (userId, attempts) in _window.UnauthorizedByUser(oneHour, now))
         {
-            await CreateSecurityAlert(
-                "privilege_escalation_attempt",
-                SecuritySeverity.High,
-                $"Multiple unauthorized access attempts by user {group.Key}: {group.Count()} attempts",
-                new { userId = group.Key, attemptCount = group.Count() }
-            );
+            if (attempts >= 5)
+            {
+                await CreateSecurityAlert(
+                    "privilege_escalation_attempt",
+                    SecuritySeverity.High,
+                    $"Multiple unauthorized access attempts by user {userId}: {attempts} attempts",
+                    new { userId, attemptCount = attempts }
+                );
+            }
         }
     }
 
@@ -180,8 +140,7 @@ private async Task CheckForImmediateThreatsAsync(SecurityEvent securityEvent)
         // Multiple failed auths from same IP in short time
         if (securityEvent.EventType.Contains("auth_failed") && !string.IsNullOrEmpty(securityEvent.IpAddress))
         {
-            var recentFailures = GetEventsAfter(DateTimeOffset.UtcNow.AddMinutes(-5))
-                .Count(e => e.EventType.Contains("auth_failed") && e.IpAddress == securityEvent.IpAddress);
+            var recentFailures = _window.CountFailedAuth(securityEvent.IpAddress, TimeSpan.FromMinutes(5), DateTimeOffset.UtcNow);
 
             if (recentFailures >= 5)
             {
@@ -240,31 +199,6 @@ private async Task CreateSecurityAlert(string alertType, SecuritySeverity severi
         _logger.LogWarning("Security Alert Created: {AlertType} - {Message} - {AdditionalData}",
             alertType, message, alert.AdditionalData);
     }
-
-    private IEnumerable<SecurityEvent> GetEventsAfter(DateTimeOffset cutoff)
-    {
-        return _events.Where(e => e.Timestamp >= cutoff);
-    }
-
-    private async Task CleanupOldEventsAsync()
-    {
-        var cutoff = DateTimeOffset.UtcNow.AddHours(-24);
-        var eventsToKeep = new Queue<SecurityEvent>();
-
-        while (_events.TryDequeue(out var evt))
-        {
-            if (evt.Timestamp >= cutoff)
-            {
-                eventsToKeep.Enqueue(evt);
-            }
-        }
-
-        // Put back the events we want to keep
-        foreach (var evt in eventsToKeep)
-        {
-            _events.Enqueue(evt);
-        }
-    }
 }
 
 public class SecurityEvent
@@ -0,0 +1,165 @@
+using System.Numerics;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// Distinct-count estimator with fixed memory (2^precision one-byte registers).
+/// Standard error is about 1.04 / sqrt(2^precision): 6.5% at precision 8, 13% at precision 6.
+/// </summary>
+public sealed class HyperLogLog
+{
+    private readonly int _precision;
+    private readonly byte[] _registers;
+
+    public HyperLogLog(int precision = 8)
+    {
+        if (precision is < 4 or > 16)
+        {
+            throw new ArgumentOutOfRangeException(nameof(precision), "Precision must be between 4 and 16");
+        }
+
+        _precision = precision;
+        _registers = new byte[1 << precision];
+    }
+
+    public void Add(string value)
+    {
+        var hash = StableHash(value);
+        var index = (int)(hash >> (64 - _precision));
+        // Sentinel bit keeps the rank bounded when the remaining bits are all zero
+        var remaining = (hash << _precision) | (1UL << (_precision - 1));
+        var rank = (byte)(BitOperations.LeadingZeroCount(remaining) + 1);
+
+        if (rank > _registers[index])
+        {
+            _registers[index] = rank;
+        }
+    }
+
+    public void Merge(HyperLogLog other)
+    {
+        if (other._precision != _precision)
+        {
+            throw new ArgumentException("Cannot merge sketches with different precision", nameof(other));
+        }
+
+        for (var i = 0; i < _registers.Length; i++)
+        {
+            if (other._registers[i] > _registers[i])
+            {
+                _registers[i] = other._registers[i];
+            }
+        }
+    }
+
+    public int Estimate()
+    {
+        var m = _registers.Length;
+        var sum = 0.0;
+        var zeros = 0;
+
+        foreach (var register in _registers)
+        {
+            sum += Math.Pow(2, -register);
+            if (register == 0)
+            {
+                zeros++;
+            }
+        }
+
+        var alpha = m switch
+        {
+            16 => 0.673,
+            32 => 0.697,
+            64 => 0.709,
+            _ => 0.7213 / (1 + 1.079 / m)
+        };
+        var estimate = alpha * m * m / sum;
+
+        // Small-range correction: linear counting is more accurate while registers are still empty
+        if (estimate <= 2.5 * m && zeros > 0)
+        {
+            estimate = m * Math.Log((double)m / zeros);
+        }
+
+        return (int)Math.Round(estimate);
+    }
+
+    public void Clear()
+    {
+        Array.Clear(_registers);
+    }
+
+    // string.GetHashCode is randomized per process; FNV-1a plus a 64-bit finalizer is stable and well mixed
+    private static ulong StableHash(string value)
+    {
+        var hash = 14695981039346656037UL;
+        foreach (var c in value)
+        {
+            hash = (hash ^ c) * 1099511628211UL;
+        }
+
+        hash ^= hash >> 33;
+        hash *= 0xff51afd7ed558ccdUL;
+        hash ^= hash >> 33;
+        hash *= 0xc4ceb9fe1a85ec53UL;
+        hash ^= hash >> 33;
+        return hash;
+    }
+}
+
+/// <summary>
+/// Space-Saving top-K counter: tracks at most <c>capacity</c> keys. Any key seen more than
+/// total / capacity times is guaranteed to be tracked; Count may overstate by at most Error.
+/// </summary>
+public sealed class TopKSketch
+{
+    private readonly int _capacity;
+    private readonly Dictionary<string, (long Count, long Error)> _counters;
+
+    public TopKSketch(int capacity = 32)
+    {
+        _capacity = capacity;
+        _counters = new Dictionary<string, (long Count, long Error)>(capacity);
+    }
+
+    public int TrackedCount => _counters.Count;
+
+    /// <summary>Counts one occurrence of key; returns the key evicted to make room, if any</summary>
+    public string? Add(string key, long increment = 1)
+    {
+        if (_counters.TryGetValue(key, out var counter))
+        {
+            _counters[key] = (counter.Count + increment, counter.Error);
+            return null;
+        }
+
+        if (_counters.Count < _capacity)
+        {
+            _counters[key] = (increment, 0);
+            return null;
+        }
+
+        // Replace the smallest counter; the newcomer inherits its count as error
+        var evicted = _counters.MinBy(kv => kv.Value.Count);
+        _counters.Remove(evicted.Key);
+        _counters[key] = (evicted.Value.Count + increment, evicted.Value.Count);
+        return evicted.Key;
+    }
+
+    /// <summary>Lower bound on the key's count (0 when not tracked)</summary>
+    public long GuaranteedCount(string key)
+    {
+        return _counters.TryGetValue(key, out var counter) ? counter.Count - counter.Error : 0;
+    }
+
+    public IEnumerable<KeyValuePair<string, long>> GuaranteedCounts()
+    {
+        return _counters.Select(kv => new KeyValuePair<string, long>(kv.Key, kv.Value.Count - kv.Value.Error));
+    }
+
+    public void Clear()
+    {
+        _counters.Clear();
+    }
+}
@@ -0,0 +1,217 @@
+using System.Linq.Expressions;
+using Adaplio.Api.Data;
+using Adaplio.Api.Domain;
+using Adaplio.Api.Plans;
+using Microsoft.EntityFrameworkCore;
+
+namespace Adaplio.Api.Services;
+
+public interface ITrainerRosterService
+{
+    Task<TrainerClientsResponse> GetClientsAsync(int trainerProfileId, TrainerRosterQuery query, CancellationToken cancellationToken = default);
+    Task<TrainerDashboardResponse> GetDashboardAsync(int trainerProfileId, TrainerRosterQuery query, CancellationToken cancellationToken = default);
+}
+
+/// <summary>
+/// The trainer's client roster. Consent filtering, search, sorting and paging all run in the database,
+/// and only the returned columns are projected, so the cost tracks the page size rather than the
+/// trainer's grant history. The dashboard reads the same page with the adherence and gamification
+/// columns joined in, replacing one adherence and one gamification request per client.
+/// </summary>
+public class TrainerRosterService : ITrainerRosterService
+{
+    public const int MaxPageSize = 200;
+
+    private const string SqliteProvider = "Microsoft.EntityFrameworkCore.Sqlite";
+
+    private readonly AppDbContext _context;
+
+    public TrainerRosterService(AppDbContext context)
+    {
+        _context = context;
+    }
+
+    public async Task<TrainerClientsResponse> GetClientsAsync(
+        int trainerProfileId,
+        TrainerRosterQuery query,
+        CancellationToken cancellationToken = default)
+    {
+        var page = Math.Max(1, query.Page);
+        var pageSize = Math.Clamp(query.PageSize, 1, MaxPageSize);
+        var weekStart = GetWeekStart(DateOnly.FromDateTime(DateTime.UtcNow));
+
+        var grants = await ActiveGrantsAsync(trainerProfileId, cancellationToken);
+        var clients = FilterClients(grants, query.Search);
+
+        var totalCount = await clients.CountAsync(cancellationToken);
+
+        var pageQuery = ApplySort(clients, query.Sort, weekStart)
+            .Skip((page - 1) * pageSize)
+            .Take(pageSize);
+
+        var rows = query.IncludeSummary
+            ? await pageQuery
+                .Select(cp => new ClientRow(
+                    cp.Id,
+                    cp.Alias,
+                    cp.User.Email,
+                    cp.CreatedAt,
+                    new TrainerClientSummary(
+                        cp.Gamification != null ? cp.Gamification.LastActivityDate : null,
+                        cp.AdherenceWeeks
+                            .Where(aw => aw.WeekStartDate == weekStart)
+                            .Select(aw => (decimal?)aw.AdherencePercentage)
+                            .FirstOrDefault() ?? 0,
+                        cp.Gamification != null ? cp.Gamification.CurrentStreak : 0)))
+                .ToListAsync(cancellationToken)
+            : await pageQuery
+                .Select(cp => new ClientRow(cp.Id, cp.Alias, cp.User.Email, cp.CreatedAt, null))
+                .ToListAsync(cancellationToken);
+
+        // Scopes for the page only, in one round trip
+        var clientIds = rows.Select(r => r.Id).ToList();
+        var scopes = (await grants
+                .Where(cg => clientIds.Contains(cg.ClientProfileId))
+                .Select(cg => new { cg.ClientProfileId, cg.Scope })
+                .ToListAsync(cancellationToken))
+            .ToLookup(g => g.ClientProfileId, g => g.Scope);
+
+        var results = rows
+            .Select(r => new TrainerClientResponse(r.Id, r.Alias, r.Email, r.CreatedAt, scopes[r.Id].ToList(), r.Summary))
+            .ToArray();
+
+        return new TrainerClientsResponse(results, page, pageSize, totalCount);
+    }
+
+    public async Task<TrainerDashboardResponse> GetDashboardAsync(
+        int trainerProfileId,
+        TrainerRosterQuery query,
+        CancellationToken cancellationToken = default)
+    {
+        var page = Math.Max(1, query.Page);
+        var pageSize = Math.Clamp(query.PageSize, 1, MaxPageSize);
+        var weekStart = GetWeekStart(DateOnly.FromDateTime(DateTime.UtcNow));
+
+        // Same consent rule as the per-client adherence and gamification endpoints
+        var grants = (await ActiveGrantsAsync(trainerProfileId, cancellationToken))
+            .Where(cg => cg.Scope == "view_summary");
+        var clients = FilterClients(grants, query.Search);
+
+        var totalCount = await clients.CountAsync(cancellationToken);
+
+        var rows = await ApplySort(clients, query.Sort, weekStart)
+            .Skip((page - 1) * pageSize)
+            .Take(pageSize)
+            .Select(cp => new
+            {
+                cp.Id,
+                cp.Alias,
+                LastActivityDate = cp.Gamification != null ? cp.Gamification.LastActivityDate : null,
+                CurrentWeekAdherence = cp.AdherenceWeeks
+                    .Where(aw => aw.WeekStartDate == weekStart)
+                    .Select(aw => (decimal?)aw.AdherencePercentage)
+                    .FirstOrDefault(),
+                // Integer sums: SQLite cannot aggregate the decimal percentage column
+                Completed = cp.AdherenceWeeks.Sum(aw => (int?)aw.TotalExercisesCompleted) ?? 0,
+                Planned = cp.AdherenceWeeks.Sum(aw => (int?)aw.TotalExercisesPlanned) ?? 0,
+                CurrentStreak = cp.Gamification != null ? cp.Gamification.CurrentStreak : 0,
+                TotalXp = cp.Gamification != null ? cp.Gamification.TotalXp : 0
+            })
+            .ToListAsync(cancellationToken);
+
+        var results = rows
+            .Select(r => new TrainerDashboardClient(
+                r.Id,
+                r.Alias,
+                r.LastActivityDate,
+                r.CurrentWeekAdherence ?? 0,
+                // Same rounding as ProgressService.CalculateOverallAdherenceAsync
+                r.Planned > 0 ? Math.Round((decimal)r.Completed / r.Planned * 100, 1) : 0,
+                r.CurrentStreak,
+                Domain.Gamification.LevelForXp(r.TotalXp),
+                r.TotalXp))
+            .ToArray();
+
+        return new TrainerDashboardResponse(results, page, pageSize, totalCount);
+    }
+
+    private IQueryable<ClientProfile> FilterClients(IQueryable<ConsentGrant> grants, string? search)
+    {
+        var clients = _context.ClientProfiles
+            .AsNoTracking()
+            .Where(cp => grants.Any(cg => cg.ClientProfileId == cp.Id));
+
+        if (!string.IsNullOrWhiteSpace(search))
+        {
+            var term = search.Trim().ToLower();
+            clients = clients.Where(cp =>
+                (cp.Alias != null && cp.Alias.ToLower().Contains(term)) ||
+                cp.User.Email.ToLower().Contains(term));
+        }
+
+        return clients;
+    }
+
+    /// <summary>
+    /// Unrevoked, unexpired grants given to the trainer. SQLite cannot compare DateTimeOffset
+    /// server-side, so there the expired grant ids are found from a narrow id/expiry projection
+    /// of the grants that expire at all and excluded in the database query.
+    /// </summary>
+    private async Task<IQueryable<ConsentGrant>> ActiveGrantsAsync(int trainerProfileId, CancellationToken cancellationToken)
+    {
+        var now = DateTimeOffset.UtcNow;
+        var grants = _context.ConsentGrants
+            .Where(cg => cg.TrainerProfileId == trainerProfileId && cg.RevokedAt == null);
+
+        if (_context.Database.ProviderName != SqliteProvider)
+        {
+            return grants.Where(cg => cg.ExpiresAt == null || cg.ExpiresAt > now);
+        }
+
+        var expiring = await grants
+            .Where(cg => cg.ExpiresAt != null)
+            .Select(cg => new { cg.Id, cg.ExpiresAt })
+            .ToListAsync(cancellationToken);
+
+        var expiredIds = expiring.Where(g => g.ExpiresAt <= now).Select(g => g.Id).ToList();
+        return expiredIds.Count == 0 ? grants : grants.Where(cg => !expiredIds.Contains(cg.Id));
+    }
+
+    private static IQueryable<ClientProfile> ApplySort(IQueryable<ClientProfile> clients, string? sort, DateOnly weekStart)
+    {
+        var descending = sort?.StartsWith('-') == true;
+        var key = (descending ? sort![1..] : sort)?.ToLowerInvariant();
+
+        return key switch
+        {
+            null or "" or "alias" => OrderBy(clients, cp => cp.Alias, descending),
+            "lastactivity" => OrderBy(clients, cp => cp.Gamification != null ? cp.Gamification.LastActivityDate : null, descending),
+            "streak" => OrderBy(clients, cp => cp.Gamification != null ? cp.Gamification.CurrentStreak : 0, descending),
+            // Ratio of stored integer counts: SQLite cannot order by the decimal percentage column
+            "adherence" => OrderBy(clients, cp => cp.AdherenceWeeks
+                .Where(aw => aw.WeekStartDate == weekStart)
+                .Select(aw => aw.TotalExercisesPlanned == 0 ? 0.0 : (double)aw.TotalExercisesCompleted / aw.TotalExercisesPlanned)
+                .FirstOrDefault(), descending),
+            _ => throw new ArgumentException($"Unknown sort '{sort}'. Use alias, lastActivity, streak or adherence.")
+        };
+    }
+
+    private static IQueryable<ClientProfile> OrderBy<TKey>(
+        IQueryable<ClientProfile> clients,
+        Expression<Func<ClientProfile, TKey>> key,
+        bool descending)
+    {
+        // Id tiebreaker keeps page boundaries stable
+        return (descending ? clients.OrderByDescending(key) : clients.OrderBy(key)).ThenBy(cp => cp.Id);
+    }
+
+    private static DateOnly GetWeekStart(DateOnly date)
+    {
+        var daysToSubtract = (int)date.DayOfWeek - (int)DayOfWeek.Monday;
+        if (daysToSubtract < 0)
+            daysToSubtract += 7;
+        return date.AddDays(-daysToSubtract);
+    }
+
+    private record ClientRow(int Id, string? Alias, string Email, DateTimeOffset CreatedAt, TrainerClientSummary? Summary);
+}
@@ -1,29 +1,43 @@
+using System.Buffers;
+using System.Globalization;
 using System.Security.Cryptography;
 using System.Text;
 
 namespace Adaplio.Api.Services;
 
+/// <summary>
+/// Presigned, resumable uploads. Chunks stream straight to a staging file with the SHA-256 computed on
+/// the way through; a finished upload is handed to the configured IFileStorage backend in one piece.
+/// </summary>
 public class UploadService : IUploadService
 {
     private readonly IConfiguration _configuration;
     private readonly ILogger<UploadService> _logger;
+    private readonly IFileStorage _storage;
+    private readonly UploadSessionStore _sessions;
+    private readonly long _maxBytes;
+    private readonly string _stagingPath;
 
-    // For demo purposes, we'll use local file storage
-    // In production, this would integrate with Azure Blob Storage, AWS S3, or similar
-    private const string LocalStoragePath = "uploads";
     private const int UrlExpirationMinutes = 60;
-
-    public UploadService(IConfiguration configuration, ILogger<UploadService> logger)
+    private const long DefaultMaxBytes = 2 * 1024 * 1024; // 2MB limit
+    private const int CopyBufferSize = 81920;
+
+    public UploadService(
+        IConfiguration configuration,
+        ILogger<UploadService> logger,
+        IFileStorage storage,
+        UploadSessionStore sessions)
     {
         _configuration = configuration;
         _logger = logger;
-
-        // Ensure uploads directory exists
-        var uploadPath = Path.Combine(Directory.GetCurrentDirectory(), LocalStoragePath);
-        if (!Directory.Exists(uploadPath))
-        {
-            Directory.CreateDirectory(uploadPath);
-        }
+        _storage = storage;
+        _sessions = sessions;
+        _maxBytes = long.TryParse(configuration["Upload:MaxBytes"], out var maxBytes) ? maxBytes : DefaultMaxBytes;
+
+        // Staging sits next to local storage so completing an upload is a rename
+        _stagingPath = Path.Combine(Directory.GetCurrentDirectory(),
+            configuration["Upload:StagingPath"] ?? Path.Combine(configuration["Upload:LocalPath"] ?? "uploads", ".staging"));
+        Directory.CreateDirectory(_stagingPath);
     }
 
     public async Task<PresignedUploadResult> GeneratePresignedUploadUrlAsync(
@@ -54,7 +68,7 @@ public UploadService(IConfiguration configuration, ILogger<UploadService> logger
             var uploadToken = GenerateUploadToken(uploadKey, DateTime.UtcNow.AddMinutes(UrlExpirationMinutes));
             var baseUrl = GetBaseUrl();
 
-            var uploadUrl = $"{baseUrl}/api/uploads/upload?key={Uri.EscapeDataString(uploadKey)}&token={uploadToken}";
+            var uploadUrl = $"{baseUrl}/api/uploads/upload?key={Uri.EscapeDataString(uploadKey)}&token={Uri.EscapeDataString(uploadToken)}";
             var publicUrl = $"{baseUrl}/api/uploads/files/{Uri.EscapeDataString(uploadKey)}";
 
             _logger.LogInformation("Generated presigned upload URL for {UploadType}: {UploadKey}", uploadType, uploadKey);
@@ -81,29 +95,22 @@ public async Task<bool> ValidateUploadedFileAsync(string publicUrl)
     {
         try
         {
-            // Extract the file key from the public URL
-            var uri = new Uri(publicUrl);
-            var segments = uri.Segments;
-            if (segments.Length < 4 || segments[^3] != "files/")
+            var uploadKey = GetUploadKey(publicUrl);
+            if (uploadKey == null)
                 return false;
 
-            var uploadKey = Uri.UnescapeDataString(segments[^1]);
-            var filePath = Path.Combine(Directory.GetCurrentDirectory(), LocalStoragePath, uploadKey);
-
-            var exists = File.Exists(filePath);
+            var file = await _storage.GetAsync(uploadKey);
+            if (file == null)
+                return false;
 
-            if (exists)
+            // Additional validation: check file size
+            if (file.Length > _maxBytes)
             {
-                // Additional validation: check file size and type
-                var fileInfo = new FileInfo(filePath);
-                if (fileInfo.Length > 2 * 1024 * 1024) // 2MB limit
-                {
-                    _logger.LogWarning("Uploaded file {UploadKey} exceeds size limit: {Size} bytes", uploadKey, fileInfo.Length);
-                    return false;
-                }
+                _logger.LogWarning("Uploaded file {UploadKey} exceeds size limit: {Size} bytes", uploadKey, file.Length);
+                return false;
             }
 
-            return exists;
+            return true;
         }
         catch (Exception ex)
         {
@@ -116,18 +123,12 @@ public async Task<bool> DeleteFileAsync(string publicUrl)
     {
         try
         {
-            // Extract the file key from the public URL
-            var uri = new Uri(publicUrl);
-            var segments = uri.Segments;
-            if (segments.Length < 4 || segments[^3] != "files/")
+            var uploadKey = GetUploadKey(publicUrl);
+            if (uploadKey == null)
                 return false;
 
-            var uploadKey = Uri.UnescapeDataString(segments[^1]);
-            var filePath = Path.Combine(Directory.GetCurrentDirectory(), LocalStoragePath, uploadKey);
-
-            if (File.Exists(filePath))
+            if (await _storage.DeleteAsync(uploadKey))
             {
-                File.Delete(filePath);
                 _logger.LogInformation("Deleted file: {UploadKey}", uploadKey);
                 return true;
             }
@@ -141,6 +142,238 @@ public async Task<bool> DeleteFileAsync(string publicUrl)
         }
     }
 
+    public Task<StoredFile?> GetFileAsync(string uploadKey, CancellationToken cancellationToken = default)
+    {
+        return _storage.GetAsync(uploadKey, cancellationToken);
+    }
+
+    public async Task<UploadChunkResult> AppendChunkAsync(
+        string uploadKey,
+        string token,
+        Stream content,
+        long offset,
+        long? totalBytes,
+        string? expectedSha256 = null,
+        CancellationToken cancellationToken = default)
+    {
+        if (!ValidateUploadToken(token, uploadKey))
+        {
+            _logger.LogWarning("Invalid upload token for key: {UploadKey}", uploadKey);
+            return new UploadChunkResult(UploadChunkStatus.InvalidToken, 0);
+        }
+
+        if (totalBytes > _maxBytes)
+        {
+            _logger.LogWarning("File too large: {Size} bytes for key: {UploadKey}", totalBytes, uploadKey);
+            return new UploadChunkResult(UploadChunkStatus.TooLarge, 0, totalBytes);
+        }
+
+        var session = await AcquireSessionAsync(uploadKey, cancellationToken);
+        try
+        {
+            // Offset 0 always (re)starts the upload; any other offset must continue where staging left off
+            if (offset == 0 && session.ReceivedBytes > 0)
+            {
+                session.Reset();
+            }
+
+            if (offset != session.ReceivedBytes ||
+                (totalBytes != null && session.TotalBytes != null && totalBytes != session.TotalBytes))
+            {
+                return new UploadChunkResult(UploadChunkStatus.OffsetMismatch, session.ReceivedBytes, session.TotalBytes);
+            }
+
+            session.TotalBytes = totalBytes ?? session.TotalBytes;
+
+            if (!await WriteChunkAsync(session, content, session.TotalBytes ?? _maxBytes, cancellationToken))
+            {
+                _logger.LogWarning("File too large: more than {Limit} bytes for key: {UploadKey}", session.TotalBytes ?? _maxBytes, uploadKey);
+                DiscardSession(uploadKey, session);
+                return new UploadChunkResult(UploadChunkStatus.TooLarge, 0, totalBytes);
+            }
+
+            // A request without a declared total carries the rest of the file
+            if (totalBytes != null && session.ReceivedBytes < totalBytes)
+            {
+                return new UploadChunkResult(UploadChunkStatus.InProgress, session.ReceivedBytes, session.TotalBytes);
+            }
+
+            var received = session.ReceivedBytes;
+            var sha256 = Convert.ToHexString(session.Hash.GetHashAndReset()).ToLowerInvariant();
+
+            if (expectedSha256 != null && !string.Equals(sha256, expectedSha256, StringComparison.OrdinalIgnoreCase))
+            {
+                _logger.LogWarning("Checksum mismatch for key: {UploadKey}", uploadKey);
+                DiscardSession(uploadKey, session);
+                return new UploadChunkResult(UploadChunkStatus.ChecksumMismatch, 0, totalBytes, sha256);
+            }
+
+            try
+            {
+                await _storage.SaveAsync(uploadKey, session.StagingPath, GetContentType(uploadKey), cancellationToken);
+            }
+            finally
+            {
+                DiscardSession(uploadKey, session);
+            }
+
+            _logger.LogInformation("Successfully uploaded file: {UploadKey} ({Size} bytes)", uploadKey, received);
+            return new UploadChunkResult(UploadChunkStatus.Completed, received, received, sha256);
+        }
+        finally
+        {
+            session.Lock.Release();
+        }
+    }
+
+    public async Task<UploadChunkResult> GetUploadStatusAsync(string uploadKey, string token, CancellationToken cancellationToken = default)
+    {
+        if (!ValidateUploadToken(token, uploadKey))
+            return new UploadChunkResult(UploadChunkStatus.InvalidToken, 0);
+
+        var session = _sessions.Find(uploadKey);
+        if (session != null)
+            return new UploadChunkResult(UploadChunkStatus.InProgress, session.ReceivedBytes, session.TotalBytes);
+
+        var file = await _storage.GetAsync(uploadKey, cancellationToken);
+        if (file != null)
+            return new UploadChunkResult(UploadChunkStatus.Completed, file.Length, file.Length);
+
+        // A staged file without a session was left behind by a restart; the next chunk rehashes it
+        var staged = new FileInfo(GetStagingPath(uploadKey));
+        return new UploadChunkResult(UploadChunkStatus.InProgress, staged.Exists ? staged.Length : 0);
+    }
+
+    private async Task<UploadSession> AcquireSessionAsync(string uploadKey, CancellationToken cancellationToken)
+    {
+        while (true)
+        {
+            var session = _sessions.GetOrStart(uploadKey, GetStagingPath(uploadKey));
+            await session.Lock.WaitAsync(cancellationToken);
+
+            if (session.Closed)
+            {
+                // Completed or discarded while we waited; start a fresh session
+                session.Lock.Release();
+                continue;
+            }
+
+            try
+            {
+                if (!session.Initialized)
+                {
+                    await RehashStagedFileAsync(session, cancellationToken);
+                    session.Initialized = true;
+                }
+            }
+            catch
+            {
+                session.Lock.Release();
+                throw;
+            }
+
+            return session;
+        }
+    }
+
+    private static async Task RehashStagedFileAsync(UploadSession session, CancellationToken cancellationToken)
+    {
+        if (!File.Exists(session.StagingPath))
+            return;
+
+        await using var staged = new FileStream(session.StagingPath, FileMode.Open, FileAccess.Read, FileShare.None,
+            CopyBufferSize, FileOptions.Asynchronous | FileOptions.SequentialScan);
+        var buffer = ArrayPool<byte>.Shared.Rent(CopyBufferSize);
+        try
+        {
+            int read;
+            while ((read = await staged.ReadAsync(buffer.AsMemory(0, CopyBufferSize), cancellationToken)) > 0)
+            {
+                session.Hash.AppendData(buffer, 0, read);
+                session.ReceivedBytes += read;
+            }
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+
+    /// <summary>
+    /// Streams the chunk to the staged file at the session offset, hashing as it goes. Returns false
+    /// as soon as the upload would exceed the limit, without reading the rest of the body.
+    /// </summary>
+    private static async Task<bool> WriteChunkAsync(UploadSession session, Stream content, long limit, CancellationToken cancellationToken)
+    {
+        // Unbuffered: every chunk goes straight from the pooled buffer to the file
+        await using var staged = new FileStream(session.StagingPath, FileMode.OpenOrCreate, FileAccess.Write, FileShare.None,
+            bufferSize: 0, FileOptions.Asynchronous);
+
+        // Drop anything past the acknowledged offset, e.g. bytes from a write that failed midway
+        if (staged.Length != session.ReceivedBytes)
+        {
+            staged.SetLength(session.ReceivedBytes);
+        }
+        staged.Position = session.ReceivedBytes;
+
+        var buffer = ArrayPool<byte>.Shared.Rent(CopyBufferSize);
+        try
+        {
+            int read;
+            while ((read = await content.ReadAsync(buffer.AsMemory(0, CopyBufferSize), cancellationToken)) > 0)
+            {
+                if (session.ReceivedBytes + read > limit)
+                    return false;
+
+                // Back-pressure: the next read waits for this write, so a slow disk slows the socket instead of filling memory
+                await staged.WriteAsync(buffer.AsMemory(0, read), cancellationToken);
+                session.Hash.AppendData(buffer, 0, read);
+                session.ReceivedBytes += read;
+            }
+
+            return true;
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+
+    private void DiscardSession(string uploadKey, UploadSession session)
+    {
+        _sessions.Remove(uploadKey, session);
+        File.Delete(session.StagingPath);
+    }
+
+    private string GetStagingPath(string uploadKey)
+    {
+        var name = Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(uploadKey)));
+        return Path.Combine(_stagingPath, $"{name}.part");
+    }
+
+    private static string? GetUploadKey(string publicUrl)
+    {
+        if (!Uri.TryCreate(publicUrl, UriKind.Absolute, out var uri))
+            return null;
+
+        const string filesPrefix = "/api/uploads/files/";
+        var path = uri.AbsolutePath;
+        if (!path.StartsWith(filesPrefix, StringComparison.Ordinal))
+            return null;
+
+        return Uri.UnescapeDataString(path[filesPrefix.Length..]);
+    }
+
+    private static string GetContentType(string uploadKey)
+    {
+        return Path.GetExtension(uploadKey).ToLower() switch
+        {
+            ".png" => "image/png",
+            ".webp" => "image/webp",
+            _ => "image/jpeg"
+        };
+    }
+
     private bool IsValidContentType(string contentType)
     {
         var allowedTypes = new[]
@@ -189,12 +422,13 @@ private bool ValidateUploadToken(string token, string uploadKey)
             var payload = Encoding.UTF8.GetString(Convert.FromBase64String(parts[0]));
             var expectedToken = parts[1];
 
-            var payloadParts = payload.Split(':');
-            if (payloadParts.Length != 2)
+            // The expiry is round-trip formatted and contains colons; the key never does
+            var separator = payload.IndexOf(':');
+            if (separator <= 0)
                 return false;
 
-            var tokenUploadKey = payloadParts[0];
-            var expiresAt = DateTime.Parse(payloadParts[1]);
+            var tokenUploadKey = payload[..separator];
+            var expiresAt = DateTime.Parse(payload[(separator + 1)..], CultureInfo.InvariantCulture, DateTimeStyles.RoundtripKind);
 
             if (tokenUploadKey != uploadKey || DateTime.UtcNow > expiresAt)
                 return false;
@@ -203,9 +437,8 @@ private bool ValidateUploadToken(string token, string uploadKey)
             var secret = _configuration["Upload:Secret"] ?? "default-upload-secret-key";
             using var hmac = new HMACSHA256(Encoding.UTF8.GetBytes(secret));
             var hash = hmac.ComputeHash(Encoding.UTF8.GetBytes(payload));
-            var computedToken = Convert.ToBase64String(hash);
 
-            return computedToken == expectedToken;
+            return CryptographicOperations.FixedTimeEquals(hash, Convert.FromBase64String(expectedToken));
         }
         catch
         {
@@ -220,45 +453,4 @@ private string GetBaseUrl()
         var host = _configuration["Upload:Host"] ?? "localhost:5000";
         return $"{scheme}://{host}";
     }
-
-    // Method to handle the actual file upload (called by the upload endpoint)
-    public async Task<bool> HandleFileUploadAsync(string uploadKey, string token, Stream fileStream, string contentType)
-    {
-        try
-        {
-            // Validate token
-            if (!ValidateUploadToken(token, uploadKey))
-            {
-                _logger.LogWarning("Invalid upload token for key: {UploadKey}", uploadKey);
-                return false;
-            }
-
-            // Validate file size
-            if (fileStream.Length > 2 * 1024 * 1024) // 2MB limit
-            {
-                _logger.LogWarning("File too large: {Size} bytes for key: {UploadKey}", fileStream.Length, uploadKey);
-                return false;
-            }
-
-            // Create directory structure
-            var filePath = Path.Combine(Directory.GetCurrentDirectory(), LocalStoragePath, uploadKey);
-            var directory = Path.GetDirectoryName(filePath);
-            if (!Directory.Exists(directory))
-            {
-                Directory.CreateDirectory(directory!);
-            }
-
-            // Save file
-            using var fileStreamWriter = new FileStream(filePath, FileMode.Create);
-            await fileStream.CopyToAsync(fileStreamWriter);
-
-            _logger.LogInformation("Successfully uploaded file: {UploadKey}", uploadKey);
-            return true;
-        }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex, "Failed to handle file upload for key: {UploadKey}", uploadKey);
-            return false;
-        }
-    }
 }
\ No newline at end of file
@@ -0,0 +1,113 @@
+using System.Collections.Concurrent;
+using System.Security.Cryptography;
+
+namespace Adaplio.Api.Services;
+
+/// <summary>
+/// In-flight resumable uploads, keyed by upload key. Each session tracks the bytes staged so far and
+/// the running SHA-256 of those bytes, so the checksum is ready the moment the last chunk lands.
+/// Sessions idle longer than the upload token lifetime are dropped together with their staged file.
+/// </summary>
+public class UploadSessionStore
+{
+    private static readonly TimeSpan SweepInterval = TimeSpan.FromMinutes(5);
+
+    private readonly ConcurrentDictionary<string, UploadSession> _sessions = new(StringComparer.Ordinal);
+    private readonly TimeProvider _timeProvider;
+    private readonly TimeSpan _idleTimeout;
+    private long _nextSweepTicks;
+
+    public UploadSessionStore() : this(TimeProvider.System, TimeSpan.FromHours(2))
+    {
+    }
+
+    public UploadSessionStore(TimeProvider timeProvider, TimeSpan idleTimeout)
+    {
+        _timeProvider = timeProvider;
+        _idleTimeout = idleTimeout;
+    }
+
+    public int Count => _sessions.Count;
+
+    public UploadSession GetOrStart(string uploadKey, string stagingPath)
+    {
+        SweepIfDue();
+
+        var session = _sessions.GetOrAdd(uploadKey, _ => new UploadSession(stagingPath));
+        session.LastActivity = _timeProvider.GetUtcNow();
+        return session;
+    }
+
+    public UploadSession? Find(string uploadKey)
+    {
+        return _sessions.TryGetValue(uploadKey, out var session) ? session : null;
+    }
+
+    public void Remove(string uploadKey, UploadSession session)
+    {
+        _sessions.TryRemove(new KeyValuePair<string, UploadSession>(uploadKey, session));
+        session.Closed = true;
+        session.Hash.Dispose();
+    }
+
+    private void SweepIfDue()
+    {
+        var now = _timeProvider.GetUtcNow();
+        var due = Interlocked.Read(ref _nextSweepTicks);
+        if (now.UtcTicks < due || Interlocked.CompareExchange(ref _nextSweepTicks, (now + SweepInterval).UtcTicks, due) != due)
+        {
+            return;
+        }
+
+        foreach (var (key, session) in _sessions)
+        {
+            // Skip sessions with a chunk in flight; they are clearly not abandoned
+            if (now - session.LastActivity < _idleTimeout || !session.Lock.Wait(0))
+            {
+                continue;
+            }
+
+            try
+            {
+                Remove(key, session);
+                File.Delete(session.StagingPath);
+            }
+            finally
+            {
+                session.Lock.Release();
+            }
+        }
+    }
+}
+
+/// <summary>
+/// State of one resumable upload. Callers hold Lock while appending so chunks apply in order.
+/// </summary>
+public class UploadSession
+{
+    public UploadSession(string stagingPath)
+    {
+        StagingPath = stagingPath;
+    }
+
+    public string StagingPath { get; }
+    public SemaphoreSlim Lock { get; } = new(1, 1);
+    public IncrementalHash Hash { get; private set; } = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+
+    /// <summary>Set once the session is removed; a caller that was waiting on Lock must start over</summary>
+    public bool Closed { get; set; }
+
+    /// <summary>False until the staged file has been checked, e.g. after a restart left one behind</summary>
+    public bool Initialized { get; set; }
+    public long ReceivedBytes { get; set; }
+    public long? TotalBytes { get; set; }
+    public DateTimeOffset LastActivity { get; set; }
+
+    public void Reset()
+    {
+        Hash.Dispose();
+        Hash = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+        ReceivedBytes = 0;
+        TotalBytes = null;
+    }
+}
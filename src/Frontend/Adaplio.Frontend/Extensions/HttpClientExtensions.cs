@@ -7,9 +7,9 @@ namespace Adaplio.Frontend.Extensions;
 
 public static class HttpClientExtensions
 {
-    private static readonly JsonSerializerOptions DefaultJsonOptions = new()
+    // Web defaults (camelCase, case-insensitive reads) so pages can swap ReadFromJsonAsync for these helpers
+    private static readonly JsonSerializerOptions DefaultJsonOptions = new(JsonSerializerDefaults.Web)
     {
-        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
         WriteIndented = false
     };
 
@@ -43,6 +43,42 @@ public static async Task<ApiResponse<T>> GetApiAsync<T>(this HttpClient httpClie
         }
     }
 
+    /// <summary>
+    /// GET with If-None-Match from the cache; a 304 Not Modified is answered from the stored body
+    /// </summary>
+    public static async Task<ApiResponse<T>> GetApiAsync<T>(this HttpClient httpClient, string requestUri, ConditionalRequestCache cache, CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            using var request = new HttpRequestMessage(HttpMethod.Get, requestUri);
+            var cached = cache.Get(requestUri);
+            if (cached != null && EntityTagHeaderValue.TryParse(cached.ETag, out var etag))
+            {
+                request.Headers.IfNoneMatch.Add(etag);
+            }
+
+            var response = await httpClient.SendAsync(request, cancellationToken);
+
+            if (response.StatusCode == System.Net.HttpStatusCode.NotModified && cached != null)
+            {
+                var data = JsonSerializer.Deserialize<T>(cached.Content, DefaultJsonOptions);
+                return ApiResponse<T>.FromNotModified(data);
+            }
+
+            if (response.IsSuccessStatusCode && response.Headers.ETag != null)
+            {
+                var content = await response.Content.ReadAsStringAsync(cancellationToken);
+                cache.Set(requestUri, response.Headers.ETag.ToString(), content);
+            }
+
+            return await ProcessApiResponse<T>(response);
+        }
+        catch (Exception ex)
+        {
+            return ApiResponse<T>.FromError($"Request failed: {ex.Message}");
+        }
+    }
+
     public static async Task<ApiResponse<T>> PostApiAsync<T>(this HttpClient httpClient, string requestUri, object? value = null, CancellationToken cancellationToken = default)
     {
         try
@@ -241,6 +277,9 @@ public class ApiResponse<T> : ApiResponse
 {
     public T? Data { get; init; }
 
+    // True when the server answered 304 and Data came from the conditional request cache
+    public bool NotModified { get; init; }
+
     private ApiResponse(bool isSuccess, T? data = default, string? errorMessage = null, int? statusCode = null)
         : base(isSuccess, errorMessage, statusCode)
     {
@@ -248,5 +287,6 @@ private ApiResponse(bool isSuccess, T? data = default, string? errorMessage = nu
     }
 
     public static ApiResponse<T> FromSuccess(T? data) => new(true, data);
+    public static ApiResponse<T> FromNotModified(T? data) => new(true, data) { NotModified = true };
     public static new ApiResponse<T> FromError(string errorMessage, int? statusCode = null) => new(false, default, errorMessage, statusCode);
 }
\ No newline at end of file
@@ -0,0 +1,51 @@
+using Adaplio.Frontend.Services;
+
+namespace Adaplio.Frontend.Extensions;
+
+public static class PagedRequestExtensions
+{
+    // Largest pageSize the trainer roster and dashboard endpoints accept
+    public const int MaxPageSize = 200;
+
+    /// <summary>
+    /// GET every page of a list endpoint that takes page/pageSize and reports totalCount.
+    /// NotModified is only set when every page came back 304.
+    /// </summary>
+    public static async Task<ApiResponse<List<TItem>>> GetAllPagesAsync<TPage, TItem>(
+        this IAuthenticatedHttpClient httpClient,
+        string requestUri,
+        Func<TPage, IReadOnlyCollection<TItem>?> items,
+        Func<TPage, int> totalCount,
+        int pageSize = MaxPageSize,
+        CancellationToken cancellationToken = default)
+    {
+        var all = new List<TItem>();
+        var notModified = true;
+        var separator = requestUri.Contains('?') ? '&' : '?';
+
+        for (var page = 1; ; page++)
+        {
+            var response = await httpClient.GetAsync<TPage>($"{requestUri}{separator}page={page}&pageSize={pageSize}", cancellationToken);
+            if (!response.IsSuccess)
+            {
+                return ApiResponse<List<TItem>>.FromError(response.ErrorMessage ?? "Request failed", response.StatusCode);
+            }
+
+            notModified &= response.NotModified;
+
+            var pageItems = response.Data == null ? null : items(response.Data);
+            if (pageItems == null || pageItems.Count == 0)
+            {
+                break;
+            }
+
+            all.AddRange(pageItems);
+            if (all.Count >= totalCount(response.Data!))
+            {
+                break;
+            }
+        }
+
+        return notModified ? ApiResponse<List<TItem>>.FromNotModified(all) : ApiResponse<List<TItem>>.FromSuccess(all);
+    }
+}
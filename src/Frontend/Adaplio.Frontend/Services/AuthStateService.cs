@@ -10,14 +10,16 @@ public class AuthStateService
 {
     private readonly HttpClient _httpClient;
     private readonly ILocalStorageService _localStorage;
+    private readonly ConditionalRequestCache _conditionalCache;
     private UserInfo? _currentUser;
     private bool _isInitialized = false;
     private string? _authToken;
 
-    public AuthStateService(HttpClient httpClient, ILocalStorageService localStorage)
+    public AuthStateService(HttpClient httpClient, ILocalStorageService localStorage, ConditionalRequestCache conditionalCache)
     {
         _httpClient = httpClient;
         _localStorage = localStorage;
+        _conditionalCache = conditionalCache;
     }
 
     public event Action? OnAuthStateChanged;
@@ -110,6 +112,7 @@ public async Task LogoutAsync()
             await _localStorage.RemoveItemAsync("auth_token");
             _authToken = null;
             _httpClient.ClearBearerToken();
+            _conditionalCache.Clear(); // Don't keep the previous user's responses in memory
             _currentUser = null;
             _isInitialized = true;
             NotifyAuthStateChanged();
@@ -20,20 +20,23 @@ public class AuthenticatedHttpClient : IAuthenticatedHttpClient
     private readonly HttpClient _httpClient;
     private readonly ILocalStorageService _localStorage;
     private readonly ILogger<AuthenticatedHttpClient> _logger;
+    private readonly ConditionalRequestCache _conditionalCache;
     private readonly SemaphoreSlim _refreshSemaphore = new(1, 1);
     private bool _isRefreshing = false;
 
-    public AuthenticatedHttpClient(HttpClient httpClient, ILocalStorageService localStorage, ILogger<AuthenticatedHttpClient> logger)
+    public AuthenticatedHttpClient(HttpClient httpClient, ILocalStorageService localStorage, ILogger<AuthenticatedHttpClient> logger, ConditionalRequestCache conditionalCache)
     {
         _httpClient = httpClient;
         _localStorage = localStorage;
         _logger = logger;
+        _conditionalCache = conditionalCache;
     }
 
     public async Task<ApiResponse<T>> GetAsync<T>(string requestUri, CancellationToken cancellationToken = default)
     {
         await EnsureAuthenticatedAsync();
-        return await _httpClient.GetApiAsync<T>(requestUri, cancellationToken);
+        // Conditional request: unchanged resources come back as an empty 304
+        return await _httpClient.GetApiAsync<T>(requestUri, _conditionalCache, cancellationToken);
     }
 
     public async Task<ApiResponse> GetAsync(string requestUri, CancellationToken cancellationToken = default)
@@ -198,6 +201,7 @@ public static class AuthenticatedHttpClientExtensions
 {
     public static IServiceCollection AddAuthenticatedHttpClient(this IServiceCollection services)
     {
+        services.AddSingleton<ConditionalRequestCache>();
         services.AddScoped<IAuthenticatedHttpClient, AuthenticatedHttpClient>();
         return services;
     }
@@ -0,0 +1,37 @@
+using System.Collections.Concurrent;
+
+namespace Adaplio.Frontend.Services;
+
+/// <summary>
+/// Last ETag and body seen per GET request URI, so repeat requests can be sent with
+/// If-None-Match and a 304 Not Modified answered from the stored body.
+/// </summary>
+public class ConditionalRequestCache
+{
+    private const int MaxEntries = 100;
+
+    private readonly ConcurrentDictionary<string, CachedResponse> _responses = new();
+
+    public CachedResponse? Get(string requestUri)
+    {
+        return _responses.TryGetValue(requestUri, out var cached) ? cached : null;
+    }
+
+    public void Set(string requestUri, string etag, string content)
+    {
+        // Board URIs include the week, so keep the map from growing without bound
+        if (_responses.Count >= MaxEntries && !_responses.ContainsKey(requestUri))
+        {
+            _responses.Clear();
+        }
+
+        _responses[requestUri] = new CachedResponse(etag, content);
+    }
+
+    public void Clear()
+    {
+        _responses.Clear();
+    }
+}
+
+public record CachedResponse(string ETag, string Content);
@@ -0,0 +1,186 @@
+"""
+Adaplio API - Shared HTTP client for runtime tests
+Keep-alive connection pooling, per-role bearer tokens and per-call latency tracking
+"""
+
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_BASE_URL = os.environ.get("API_TEST_URL", "http://localhost:8080")
+DEFAULT_POOL_SIZE = int(os.environ.get("ADAPLIO_POOL_SIZE", "10"))
+DEFAULT_TIMEOUT = float(os.environ.get("ADAPLIO_TIMEOUT", "30"))
+DEFAULT_RETRIES = int(os.environ.get("ADAPLIO_RETRIES", "0"))
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile (0-100) of values using linear interpolation"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * (pct / 100.0)
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def route_label(method, url):
+    """Collapse a concrete request into a route label, e.g. 'GET /api/client/proposals/{id}'"""
+    path = re.sub(r"^https?://[^/]+", "", url).split("?", 1)[0] or "/"
+    return f"{method.upper()} {_NUMERIC_SEGMENT.sub('/{id}', path)}"
+
+
+class ApiClient:
+    """
+    Thin wrapper around a pooled requests.Session.
+
+    Paths may be relative ("/api/client/board") or absolute URLs. Passing role="client"
+    injects the bearer token registered with set_token("client", ...) unless the caller
+    already supplied an Authorization header.
+    """
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, pool_connections=DEFAULT_POOL_SIZE,
+                 pool_maxsize=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 max_retries=DEFAULT_RETRIES):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.tokens = {}
+        self.latencies = defaultdict(list)
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              max_retries=max_retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    # ------------------------------------------------------------------
+    # Tokens
+    # ------------------------------------------------------------------
+
+    def set_token(self, role, token):
+        """Register the bearer token used for requests made with role=<role>"""
+        if token:
+            self.tokens[role] = token
+        else:
+            self.tokens.pop(role, None)
+
+    def auth_headers(self, role):
+        token = self.tokens.get(role)
+        return {"Authorization": f"Bearer {token}"} if token else {}
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def url(self, path):
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method, path, role=None, **kwargs):
+        url = self.url(path)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if role:
+            for name, value in self.auth_headers(role).items():
+                headers.setdefault(name, value)
+        kwargs.setdefault("timeout", self.timeout)
+
+        start = time.perf_counter()
+        try:
+            return self.session.request(method, url, headers=headers, **kwargs)
+        finally:
+            self.record(route_label(method, url), time.perf_counter() - start)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def options(self, path, **kwargs):
+        return self.request("OPTIONS", path, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Latency reporting
+    # ------------------------------------------------------------------
+
+    def record(self, label, seconds):
+        with self._lock:
+            self.latencies[label].append(seconds)
+
+    def reset_latencies(self):
+        with self._lock:
+            self.latencies.clear()
+
+    def latency_summary(self):
+        """Return {route: {count, mean_ms, p50_ms, p95_ms, max_ms}}"""
+        with self._lock:
+            snapshot = {label: list(samples) for label, samples in self.latencies.items()}
+
+        summary = {}
+        for label, samples in snapshot.items():
+            ms = [s * 1000 for s in samples]
+            summary[label] = {
+                "count": len(ms),
+                "mean_ms": sum(ms) / len(ms),
+                "p50_ms": percentile(ms, 50),
+                "p95_ms": percentile(ms, 95),
+                "max_ms": max(ms),
+            }
+        return summary
+
+    def print_latency_report(self):
+        summary = self.latency_summary()
+        if not summary:
+            return
+
+        print("\n" + "=" * 80)
+        print("  PER-CALL LATENCY")
+        print("=" * 80)
+        print(f"{'Route':<52} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+        for label in sorted(summary):
+            s = summary[label]
+            print(f"{label[:52]:<52} {s['count']:>5} {s['p50_ms']:>9.1f} "
+                  f"{s['p95_ms']:>9.1f} {s['max_ms']:>9.1f}")
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_client(base_url=None):
+    """Return the process-wide shared client, creating it on first use"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = ApiClient(base_url or DEFAULT_BASE_URL)
+        return _default_client
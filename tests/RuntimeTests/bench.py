@@ -0,0 +1,190 @@
+"""
+Adaplio API - Benchmark harness
+Warm-up + timed iterations, latency histograms, JSON baselines and p95 regression gating
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+from adaplio_client import percentile
+
+# Upper bucket edges in milliseconds; the last bucket is open-ended
+HISTOGRAM_EDGES_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+DEFAULT_THRESHOLD = float(os.environ.get("ADAPLIO_BENCH_THRESHOLD", "0.20"))
+DEFAULT_MIN_DELTA_MS = float(os.environ.get("ADAPLIO_BENCH_MIN_DELTA_MS", "2.0"))
+
+
+def histogram(samples_ms):
+    buckets = {f"<={edge}": 0 for edge in HISTOGRAM_EDGES_MS}
+    buckets[f">{HISTOGRAM_EDGES_MS[-1]}"] = 0
+    for value in samples_ms:
+        for edge in HISTOGRAM_EDGES_MS:
+            if value <= edge:
+                buckets[f"<={edge}"] += 1
+                break
+        else:
+            buckets[f">{HISTOGRAM_EDGES_MS[-1]}"] += 1
+    return buckets
+
+
+def summarize(samples_ms, errors=0, **extra):
+    if not samples_ms:
+        return {"count": 0, "errors": errors, **extra}
+    return {
+        "count": len(samples_ms),
+        "errors": errors,
+        "mean_ms": round(sum(samples_ms) / len(samples_ms), 3),
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "max_ms": round(max(samples_ms), 3),
+        "histogram": histogram(samples_ms),
+        **extra,
+    }
+
+
+def measure(call, iterations, warmup=5, expected=(200,)):
+    """
+    Run `call()` warmup times untimed, then `iterations` times timed.
+    `call` returns a requests.Response; non-expected statuses count as errors.
+    Returns (samples_ms, errors, last_response).
+    """
+    for _ in range(warmup):
+        call()
+
+    samples = []
+    errors = 0
+    response = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = call()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if response.status_code in expected:
+            samples.append(elapsed_ms)
+        else:
+            errors += 1
+    return samples, errors, response
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path, results, **metadata):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    document = {
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        **metadata,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+    print(f"\nBaseline written to {path}")
+
+
+def find_regressions(results, baseline, threshold=DEFAULT_THRESHOLD, min_delta_ms=DEFAULT_MIN_DELTA_MS,
+                     metric="p95_ms"):
+    """
+    Compare `metric` (p95 by default) of each result against the baseline.
+    A regression is value > baseline * (1 + threshold) AND at least min_delta_ms slower,
+    so sub-millisecond jitter on fast endpoints does not fail the gate.
+    """
+    regressions = []
+    previous = (baseline or {}).get("results", {})
+    for name, current in results.items():
+        before = previous.get(name)
+        if not before or metric not in before or metric not in current:
+            continue
+        limit = before[metric] * (1 + threshold)
+        if current[metric] > limit and current[metric] - before[metric] >= min_delta_ms:
+            regressions.append((name, before[metric], current[metric]))
+    return regressions
+
+
+def print_results(results, baseline=None, title="BENCHMARK RESULTS"):
+    previous = (baseline or {}).get("results", {})
+
+    print("\n" + "=" * 100)
+    print(f"  {title}")
+    print("=" * 100)
+    print(f"{'Benchmark':<44} {'n':>5} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'base p95':>9} {'delta':>7}")
+
+    for name, r in results.items():
+        if not r.get("count"):
+            print(f"{name[:44]:<44} {0:>5} {r.get('errors', 0):>4}   (no successful samples)")
+            continue
+        before = previous.get(name, {}).get("p95_ms")
+        base = f"{before:>9.1f}" if before else f"{'-':>9}"
+        delta = f"{(r['p95_ms'] / before - 1) * 100:>+6.0f}%" if before else f"{'':>7}"
+        print(f"{name[:44]:<44} {r['count']:>5} {r['errors']:>4} {r['p50_ms']:>9.1f} "
+              f"{r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {base} {delta}")
+
+
+def find_failures(results):
+    """Results that cannot be compared: some calls failed (429s, 5xx) or none succeeded"""
+    return [(name, r.get("errors", 0), r.get("count", 0)) for name, r in results.items()
+            if r.get("errors") or not r.get("count")]
+
+
+def gate(results, baseline, threshold=DEFAULT_THRESHOLD, min_delta_ms=DEFAULT_MIN_DELTA_MS, metric="p95_ms"):
+    """
+    Print failed results and regressions against the baseline and return True when the run passes.
+    Any result with errors or without a successful sample fails the run, baseline or not.
+    """
+    failures = find_failures(results)
+    if failures:
+        print(f"\n[FAIL] {len(failures)} benchmark(s) had failed or no successful requests:")
+        for name, errors, count in failures:
+            print(f"  {name}: {errors} errors, {count} successful")
+
+    if baseline is None:
+        print("\n[INFO] No baseline found - run with --save-baseline to record one")
+        return not failures
+
+    label = metric.replace("_ms", "")
+    regressions = find_regressions(results, baseline, threshold, min_delta_ms, metric)
+    if not regressions:
+        print(f"\n[PASS] No {label} regressions beyond {threshold:.0%} of baseline")
+        return not failures
+
+    print(f"\n[FAIL] {len(regressions)} {label} regression(s) beyond {threshold:.0%} of baseline:")
+    for name, before, after in regressions:
+        print(f"  {name}: {before:.1f}ms -> {after:.1f}ms ({(after / before - 1) * 100:+.0f}%)")
+    return False
+
+
+def check_growth(results, max_growth, min_delta_ms=DEFAULT_MIN_DELTA_MS, size_key="historySize"):
+    """
+    Scalability gate for results recorded at increasing data sizes (in insertion order).
+    Passes when p95 at the largest size is within max_growth x the smallest,
+    or the absolute increase is under min_delta_ms.
+    """
+    measured = [r for r in results.values() if r.get("count")]
+    if len(measured) < 2:
+        return True
+
+    first, last = measured[0], measured[-1]
+    growth = last["p95_ms"] / first["p95_ms"] if first["p95_ms"] else 0
+    flat = growth <= max_growth or last["p95_ms"] - first["p95_ms"] < min_delta_ms
+    status = "[PASS]" if flat else "[FAIL]"
+    print(f"\n{status} p95 {first['p95_ms']:.1f}ms -> {last['p95_ms']:.1f}ms "
+          f"({first.get(size_key)} -> {last.get(size_key)} {size_key}, x{growth:.2f}, limit x{max_growth:.2f})")
+    return flat
+
+
+def add_gate_arguments(parser, default_baseline):
+    parser.add_argument("--baseline", default=default_baseline, help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed p95 regression as a fraction (0.20 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="ignore p95 regressions smaller than this many ms")
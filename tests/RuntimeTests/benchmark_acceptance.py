@@ -0,0 +1,113 @@
+"""
+Adaplio API - Proposal Acceptance Benchmark
+Times POST /api/client/proposals/{id}/accept against plan size. Each size is a template with N daily items
+running for W weeks, so acceptance creates N x 7 x W exercise instances plus one acceptance row each.
+Proposals are created untimed before each size, so only the acceptance itself is measured. The whole plan
+is written in one save, so latency should grow far less than linearly with the number of instances.
+
+Usage:
+    python benchmark_acceptance.py --sizes 2x1,5x4,10x12 --iterations 10
+    python benchmark_acceptance.py --save-baseline
+"""
+
+import argparse
+import os
+import sys
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "acceptance.json")
+PROPOSALS_PATH = "/api/trainer/proposals"
+
+
+def parse_size(size):
+    items, weeks = size.lower().split("x")
+    return int(items), int(weeks)
+
+
+def daily_items(count):
+    return [{"exerciseName": f"Acceptance Exercise {i}", "targetSets": 3, "targetReps": 10, "holdSeconds": 0,
+             "frequencyPerWeek": 7, "days": fixtures.DAYS} for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio proposal acceptance benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--sizes", default="2x1,5x4,10x12",
+                        help="comma-separated ITEMSxWEEKS plan sizes; every item is scheduled daily")
+    parser.add_argument("--iterations", type=int, default=10,
+                        help="acceptances per size (sizes x (iterations + warmup) must stay under the per-user limit of 100/min)")
+    parser.add_argument("--warmup", type=int, default=2)
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO PROPOSAL ACCEPTANCE BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    results = {}
+    passed = True
+    with ApiClient(args.base_url) as api:
+        print("\nRegistering trainer and client...")
+        fixtures.register_trainer(api)
+        client = fixtures.register_client(api)
+        fixtures.link_client(api)
+
+        for items, weeks in sizes:
+            instances = items * 7 * weeks
+            template = fixtures.create_template(api, name=f"Acceptance {items}x{weeks}",
+                                                items=daily_items(items), duration_weeks=weeks)
+
+            print(f"  {items} items x {weeks} weeks ({instances} instances): "
+                  f"creating {args.iterations + args.warmup} proposals...")
+            proposal_ids = iter([
+                fixtures.expect(api.post(PROPOSALS_PATH, role="trainer", headers=fixtures.unique_ip_headers(), json={
+                    "clientAlias": client["alias"],
+                    "templateId": template["id"],
+                    "message": "Acceptance benchmark"
+                }), "Proposal creation", expected=(200, 201))["id"]
+                for _ in range(args.iterations + args.warmup)
+            ])
+            mismatches = []
+
+            def accept():
+                response = api.post(f"/api/client/proposals/{next(proposal_ids)}/accept", role="client",
+                                    headers=fixtures.unique_ip_headers(), json={"acceptAll": True})
+                if response.status_code == 200 and response.json()["acceptedItems"] != items:
+                    mismatches.append(response.json()["planInstanceId"])
+                return response
+
+            samples, errors, _ = bench.measure(accept, args.iterations, args.warmup)
+            results[f"accept proposal ({items} items x {weeks} weeks)"] = bench.summarize(
+                samples, errors, items=items, weeks=weeks, instances=instances)
+            if mismatches:
+                print(f"[FAIL] {len(mismatches)} acceptances of {items}x{weeks} reported the wrong item count")
+                passed = False
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "PROPOSAL ACCEPTANCE")
+
+    smallest, largest = list(results.values())[0], list(results.values())[-1]
+    if smallest.get("count") and largest.get("count"):
+        print(f"\n{largest['instances']} vs {smallest['instances']} instances: "
+              f"p50 {largest['p50_ms'] / smallest['p50_ms']:.1f}x "
+              f"for {largest['instances'] / smallest['instances']:.0f}x the instances")
+
+    if any(r["errors"] for r in results.values()):
+        print("[FAIL] Some acceptances failed")
+        passed = False
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, sizes=args.sizes,
+                            iterations=args.iterations)
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms) and passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,98 @@
+"""
+Adaplio API - Adherence Logging Scalability Benchmark
+Grows one client's plan history in steps and times single progress logs at each step.
+Adherence is updated by delta, so POST /api/client/progress latency should stay flat
+as the number of exercise instances and progress events grows.
+
+Usage:
+    python benchmark_adherence.py --steps 5 --plans-per-step 4
+    python benchmark_adherence.py --max-growth 1.5      # fail if p95 grows more than 50%
+"""
+
+import argparse
+import os
+import sys
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "adherence.json")
+
+# Ten daily exercises -> 70 exercise instances per accepted plan
+HISTORY_ITEMS = [
+    {"exerciseName": f"Adherence Bench {n}", "targetSets": 3, "targetReps": 10, "holdSeconds": 0,
+     "frequencyPerWeek": 7, "days": fixtures.DAYS}
+    for n in range(10)
+]
+BATCH_SIZE = 100
+
+
+def grow_history(api, template_id, client_alias, plans):
+    """Accept `plans` more proposals and complete every new exercise instance via the batch endpoint"""
+    known = {card["exerciseInstanceId"] for card in fixtures.board_cards(api)}
+    for _ in range(plans):
+        fixtures.propose_and_accept(api, client_alias, template_id)
+
+    new_cards = [card for card in fixtures.board_cards(api) if card["exerciseInstanceId"] not in known]
+    events = [fixtures.progress_payload(card) for card in new_cards]
+    for start in range(0, len(events), BATCH_SIZE):
+        fixtures.expect(api.post("/api/client/progress/batch", role="client",
+                                 json={"events": events[start:start + BATCH_SIZE]}), "History batch")
+    return len(new_cards)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio adherence logging scalability benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--steps", type=int, default=5, help="history growth steps")
+    parser.add_argument("--plans-per-step", type=int, default=4, help="plans accepted per step (70 instances each)")
+    parser.add_argument("--iterations", type=int, default=30, help="timed progress logs per step")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--max-growth", type=float, default=1.5,
+                        help="max allowed p95 ratio between the largest and smallest history")
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO ADHERENCE LOGGING BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    results = {}
+    with ApiClient(args.base_url) as api:
+        print("\nSetting up trainer, client and active plan...")
+        context = fixtures.setup_active_plan(api)
+        template = fixtures.create_template(api, name="Adherence History Plan", items=HISTORY_ITEMS)
+
+        history = len(fixtures.board_cards(api))
+        for step in range(args.steps + 1):
+            if step > 0:
+                history += grow_history(api, template["id"], context["client_alias"], args.plans_per_step)
+
+            card = fixtures.board_cards(api)[0]
+            payload = fixtures.progress_payload(card, eventType="set_completed")
+            samples, errors, _ = bench.measure(
+                lambda: api.post("/api/client/progress", role="client", json=payload),
+                args.iterations, args.warmup)
+
+            name = f"POST /api/client/progress @ {history} instances"
+            results[name] = bench.summarize(samples, errors, historyInstances=history)
+            print(f"  step {step}: {history} instances, p95 {results[name].get('p95_ms', 0):.1f}ms")
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "PROGRESS LOGGING VS HISTORY SIZE")
+
+    flat = bench.check_growth(results, args.max_growth, args.min_delta_ms, size_key="historyInstances")
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, iterations=args.iterations,
+                            plansPerStep=args.plans_per_step)
+        return flat
+
+    # History sizes are part of the names, so baseline comparison only matches identical step settings
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms) and flat
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,120 @@
+"""
+Adaplio API - Security Audit Overhead Benchmark
+Times POST /auth/trainer/login, which SecurityAuditMiddleware always audits, under concurrent load:
+failed logins with small and large bodies, plus successful logins. Gates on p99 against a baseline,
+so record the baseline on the build before an audit change and compare the build after it.
+When the API exposes /api/dev/diagnostics/audit, also checks the audit queue drained without drops.
+
+Usage:
+    python benchmark_audit.py --save-baseline      # on the "before" build
+    python benchmark_audit.py                      # on the "after" build, compares p99
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "audit.json")
+STATS_PATH = "/api/dev/diagnostics/audit"
+PASSWORD = "SecurePass123!"
+
+def timed_login(api, payload):
+    start = time.perf_counter()
+    response = api.post("/auth/trainer/login", headers=fixtures.unique_ip_headers(), json=payload)
+    return (time.perf_counter() - start) * 1000, response.status_code
+
+
+def run_scenario(api, pool, payload, expected, iterations, warmup):
+    list(pool.map(lambda _: timed_login(api, payload), range(warmup)))
+    outcomes = list(pool.map(lambda _: timed_login(api, payload), range(iterations)))
+    samples = [ms for ms, status in outcomes if status in expected]
+    return bench.summarize(samples, len(outcomes) - len(samples), bodyBytes=len(json.dumps(payload)))
+
+
+def wait_for_drain(api, timeout_s=10):
+    """Returns the audit queue stats once nothing is pending, or None when the endpoint is absent"""
+    deadline = time.time() + timeout_s
+    while True:
+        response = api.get(STATS_PATH)
+        if response.status_code == 404:
+            return None
+        stats = fixtures.expect(response, "Audit stats")
+        if stats["pending"] == 0 or time.time() > deadline:
+            return stats
+        time.sleep(0.2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio security audit overhead benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--iterations", type=int, default=400)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--large-body-kb", type=int, default=64, help="padding in the large failed-login body")
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO SECURITY AUDIT OVERHEAD BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    results = {}
+    passed = True
+    with ApiClient(args.base_url, pool_connections=args.concurrency, pool_maxsize=args.concurrency) as api:
+        print("\nRegistering trainer...")
+        email = fixtures.unique_email("audit")
+        fixtures.register_trainer(api, email=email, password=PASSWORD)
+
+        scenarios = [
+            ("POST /auth/trainer/login failed", {"email": email, "password": "WrongPassword123!"}, (400,)),
+            (f"POST /auth/trainer/login failed {args.large_body_kb}KB",
+             {"email": email, "password": "WrongPassword123!", "notes": "x" * (args.large_body_kb * 1024)}, (400,)),
+            ("POST /auth/trainer/login success", {"email": email, "password": PASSWORD}, (200,)),
+        ]
+
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            for name, payload, expected in scenarios:
+                print(f"  {name}: {args.iterations} calls at concurrency {args.concurrency}...")
+                results[name] = run_scenario(api, pool, payload, expected, args.iterations, args.warmup)
+
+        stats = wait_for_drain(api)
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "LOGIN LATENCY WITH SECURITY AUDITING")
+
+    previous = (baseline or {}).get("results", {})
+    if previous:
+        print(f"\n{'Scenario':<44} {'base p99':>9} {'p99':>9} {'delta':>7}")
+        for name, r in results.items():
+            before = previous.get(name, {}).get("p99_ms")
+            if before and r.get("count"):
+                print(f"{name[:44]:<44} {before:>9.1f} {r['p99_ms']:>9.1f} {(r['p99_ms'] / before - 1) * 100:>+6.0f}%")
+
+    if stats is None:
+        print("\n[INFO] Audit queue diagnostics not available on this build")
+    else:
+        print(f"\nAudit queue: {stats['enqueued']} enqueued, {stats['written']} written, "
+              f"{stats['dropped']} dropped, {stats['pending']} pending (capacity {stats['capacity']})")
+        if stats["dropped"] or stats["pending"]:
+            print("[FAIL] Audit records were dropped or the writer did not drain the queue")
+            passed = False
+        else:
+            print("[PASS] Audit writer kept up with the load")
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, iterations=args.iterations,
+                            concurrency=args.concurrency)
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms, metric="p99_ms") and passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
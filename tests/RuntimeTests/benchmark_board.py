@@ -0,0 +1,92 @@
+"""
+Adaplio API - Client Board Benchmark
+Times GET /api/client/board and records its payload size while the client's progress
+history grows. The board only reads the latest progress event per card, so latency
+and payload should stay flat no matter how many events have been logged.
+
+Usage:
+    python benchmark_board.py --steps 5 --events-per-step 400
+    python benchmark_board.py --save-baseline
+"""
+
+import argparse
+import os
+import sys
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "board.json")
+BATCH_SIZE = 100
+
+
+def log_history(api, cards, events):
+    """Log `events` progress events round-robin over the board's cards via the batch endpoint"""
+    payloads = [fixtures.progress_payload(cards[i % len(cards)], eventType="set_completed")
+                for i in range(events)]
+    for start in range(0, len(payloads), BATCH_SIZE):
+        fixtures.expect(api.post("/api/client/progress/batch", role="client",
+                                 json={"events": payloads[start:start + BATCH_SIZE]}), "History batch")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio client board benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--steps", type=int, default=5, help="history growth steps")
+    parser.add_argument("--events-per-step", type=int, default=400)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--max-growth", type=float, default=1.5,
+                        help="max allowed p95 ratio between the largest and smallest history")
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO CLIENT BOARD BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    results = {}
+    with ApiClient(args.base_url) as api:
+        print("\nSetting up trainer, client and active plan...")
+        fixtures.setup_active_plan(api)
+        cards = fixtures.board_cards(api)
+
+        # One event per card first, so every measured board carries the same completed fields
+        log_history(api, cards, len(cards))
+        events = len(cards)
+        for step in range(args.steps + 1):
+            if step > 0:
+                log_history(api, cards, args.events_per_step)
+                events += args.events_per_step
+
+            samples, errors, response = bench.measure(
+                lambda: api.get("/api/client/board", role="client"), args.iterations, args.warmup)
+
+            name = f"GET /api/client/board @ {events} events"
+            payload_bytes = len(response.content) if response is not None else 0
+            results[name] = bench.summarize(samples, errors, historyEvents=events, payloadBytes=payload_bytes)
+            print(f"  step {step}: {events} events, p95 {results[name].get('p95_ms', 0):.1f}ms, "
+                  f"{payload_bytes} bytes")
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "CLIENT BOARD VS PROGRESS HISTORY")
+
+    flat = bench.check_growth(results, args.max_growth, args.min_delta_ms, size_key="historyEvents")
+
+    sizes = [r["payloadBytes"] for r in results.values()]
+    same_payload = len(set(sizes)) <= 1
+    print(f"{'[PASS]' if same_payload else '[FAIL]'} Payload size independent of history: "
+          f"{min(sizes)}-{max(sizes)} bytes")
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, iterations=args.iterations,
+                            eventsPerStep=args.events_per_step)
+        return flat and same_payload
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms) and flat and same_payload
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
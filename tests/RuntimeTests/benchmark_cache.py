@@ -0,0 +1,92 @@
+"""
+Adaplio API - Client Read Cache Benchmark
+Replays a read-heavy dashboard workload (board + gamification) with an occasional progress
+write, then reads the server's hit/miss counters from /api/dev/diagnostics/cache.
+Fails when the hit rate is below --min-hit-rate or a read after a write returns stale data.
+
+Usage:
+    python benchmark_cache.py --reads 200 --write-every 20
+"""
+
+import argparse
+import sys
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+STATS_PATH = "/api/dev/diagnostics/cache"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio client read cache benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--reads", type=int, default=200, help="dashboard loads (board + gamification each)")
+    parser.add_argument("--write-every", type=int, default=20, help="log one progress event every N loads")
+    parser.add_argument("--min-hit-rate", type=float, default=0.8)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO CLIENT READ CACHE BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    with ApiClient(args.base_url) as api:
+        print("\nSetting up trainer, client and active plan...")
+        fixtures.setup_active_plan(api)
+        cards = fixtures.board_cards(api)
+
+        fixtures.expect(api.post(f"{STATS_PATH}/reset"), "Cache stats reset")
+
+        board_ms, gamification_ms = [], []
+        stale_reads = 0
+        writes = 0
+        for i in range(args.reads):
+            if i and i % args.write_every == 0:
+                before = fixtures.expect(api.get("/api/client/gamification", role="client"), "Gamification")
+                card = cards[writes % len(cards)]
+                fixtures.expect(api.post("/api/client/progress", role="client",
+                                         json=fixtures.progress_payload(card)), "Progress log")
+                writes += 1
+                after = fixtures.expect(api.get("/api/client/gamification", role="client"), "Gamification")
+                if after["xpTotal"] <= before["xpTotal"]:
+                    stale_reads += 1
+
+            samples, _, _ = bench.measure(lambda: api.get("/api/client/board", role="client"), 1, 0)
+            board_ms.extend(samples)
+            samples, _, _ = bench.measure(lambda: api.get("/api/client/gamification", role="client"), 1, 0)
+            gamification_ms.extend(samples)
+
+        stats = fixtures.expect(api.get(STATS_PATH), "Cache stats")
+
+    results = {
+        "GET /api/client/board (cached)": bench.summarize(board_ms),
+        "GET /api/client/gamification (cached)": bench.summarize(gamification_ms),
+    }
+    bench.print_results(results, None, "CLIENT READ CACHE")
+
+    print(f"\nServer cache: {stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['invalidations']} invalidations, {stats['evictions']} evictions, "
+          f"{stats['entries']} entries (max {stats['maxEntries']})")
+
+    passed = True
+    if not stats["enabled"]:
+        print("[FAIL] ClientCache:Enabled is false on the server")
+        passed = False
+    elif stats["hitRate"] >= args.min_hit_rate:
+        print(f"[PASS] Hit rate {stats['hitRate']:.1%} >= {args.min_hit_rate:.0%} with {writes} writes")
+    else:
+        print(f"[FAIL] Hit rate {stats['hitRate']:.1%} < {args.min_hit_rate:.0%} with {writes} writes")
+        passed = False
+
+    if stale_reads:
+        print(f"[FAIL] {stale_reads}/{writes} reads after a write returned stale XP")
+        passed = False
+    else:
+        print(f"[PASS] Every read after a write saw fresh XP ({writes} writes)")
+
+    return passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
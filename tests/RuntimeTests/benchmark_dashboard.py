@@ -0,0 +1,178 @@
+"""
+Adaplio API - Trainer Dashboard Benchmark
+Seeds one trainer with many clients, then times a full dashboard load two ways:
+the per-client fan-out the trainer UI used (roster + adherence + gamification for every client)
+and the single batched GET /api/trainer/dashboard. Both must report the same numbers per client.
+
+Usage:
+    python benchmark_dashboard.py --clients 200 --iterations 10
+    python benchmark_dashboard.py --save-baseline      # record the batched/fan-out latencies
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "dashboard.json")
+SEED_PATH = "/api/dev/seed/bulk"
+SEED_PASSWORD = "BulkSeed123!"
+
+
+def seed_trainer(api, seed, clients, weeks):
+    """One trainer with `clients` linked clients and `weeks` of history; returns the trainer email"""
+    result = fixtures.expect(api.post(SEED_PATH, json={
+        "seed": seed,
+        "trainers": 1,
+        "clientsPerTrainer": clients,
+        "weeks": weeks,
+    }), "Bulk seed")
+    return result["sampleTrainerEmail"]
+
+
+def get(api, path):
+    return api.get(path, role="trainer", headers=fixtures.unique_ip_headers())
+
+
+def load_fan_out(api, pool, page_size):
+    """Roster, then adherence and gamification per client as TrainerDashboard.razor did"""
+    roster = get(api, f"/api/trainer/clients?pageSize={page_size}")
+    if roster.status_code != 200:
+        return [roster], {}
+    aliases = [c["alias"] for c in roster.json()["clients"]]
+    paths = [f"/api/trainer/clients/{alias}/{kind}" for alias in aliases for kind in ("adherence", "gamification")]
+    responses = [roster] + list(pool.map(lambda path: get(api, path), paths))
+
+    rows = {}
+    for response in responses[1:]:
+        if response.status_code == 200:
+            data = response.json()
+            rows.setdefault(data["clientAlias"], {}).update(data)
+    return responses, rows
+
+
+def load_batched(api, page_size):
+    response = get(api, f"/api/trainer/dashboard?pageSize={page_size}")
+    if response.status_code != 200:
+        return [response], {}
+    return [response], {c["alias"]: c for c in response.json()["clients"]}
+
+
+def time_loads(load, iterations, warmup):
+    for _ in range(warmup):
+        load()
+
+    samples, errors, statuses, rows = [], 0, {}, {}
+    for _ in range(iterations):
+        start = time.perf_counter()
+        responses, rows = load()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        failed = [r.status_code for r in responses if r.status_code != 200]
+        for status in failed:
+            statuses[status] = statuses.get(status, 0) + 1
+        if failed:
+            errors += 1
+        else:
+            samples.append(elapsed_ms)
+    return samples, errors, statuses, rows, len(responses)
+
+
+def compare(fan_out_rows, batched_rows):
+    """Aliases whose batched values differ from the per-client endpoints"""
+    mismatched = []
+    for alias, expected in fan_out_rows.items():
+        actual = batched_rows.get(alias)
+        if actual is None or (
+                actual["level"] != expected["level"]
+                or actual["totalXp"] != expected["xpTotal"]
+                or actual["currentStreak"] != expected["currentStreakDays"]
+                or actual["currentWeekAdherence"] != expected["currentWeekAdherence"]
+                or actual["overallAdherence"] != expected["overallAdherence"]):
+            mismatched.append(alias)
+    return mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio trainer dashboard benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--seed", type=int, default=int(time.time()) % 1_000_000,
+                        help="bulk seed; defaults to a fresh one per run")
+    parser.add_argument("--clients", type=int, default=200, help="clients linked to the trainer (max 200)")
+    parser.add_argument("--weeks", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=6,
+                        help="parallel fan-out requests (browsers open ~6 connections per host)")
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO TRAINER DASHBOARD BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    with ApiClient(args.base_url, pool_connections=args.concurrency, pool_maxsize=args.concurrency) as api:
+        print(f"\nSeeding trainer with {args.clients} clients (seed {args.seed})...")
+        email = seed_trainer(api, args.seed, args.clients, args.weeks)
+        login = fixtures.expect(api.post("/auth/trainer/login", headers=fixtures.unique_ip_headers(),
+                                         json={"email": email, "password": SEED_PASSWORD}), "Trainer login")
+        api.set_token("trainer", login["token"])
+
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            print(f"  Fan-out: {args.iterations} dashboard loads at concurrency {args.concurrency}...")
+            fan_samples, fan_errors, fan_statuses, fan_rows, fan_requests = time_loads(
+                lambda: load_fan_out(api, pool, args.clients), args.iterations, args.warmup)
+
+        print(f"  Batched: {args.iterations} dashboard loads...")
+        batch_samples, batch_errors, batch_statuses, batch_rows, batch_requests = time_loads(
+            lambda: load_batched(api, args.clients), args.iterations, args.warmup)
+
+    results = {
+        f"fan-out dashboard ({args.clients} clients)":
+            bench.summarize(fan_samples, fan_errors, requestsPerLoad=fan_requests),
+        f"GET /api/trainer/dashboard ({args.clients} clients)":
+            bench.summarize(batch_samples, batch_errors, requestsPerLoad=batch_requests),
+    }
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "TRAINER DASHBOARD LOAD")
+
+    passed = True
+    for name, statuses in (("Fan-out", fan_statuses), ("Batched", batch_statuses)):
+        if statuses:
+            print(f"\n[WARN] {name} non-200 responses: {statuses}")
+            if 429 in statuses:
+                print("       Raise the rule named in the X-Rate-Limit-Category response header under RateLimiting:Rules "
+                      "(appsettings.Development.json already raises global_ip)")
+
+    fan_out, batched = results.values()
+    if fan_out.get("count") and batched.get("count"):
+        print(f"\nRequests per load: {fan_requests} -> {batch_requests}; "
+              f"p95 {fan_out['p95_ms']:.1f}ms -> {batched['p95_ms']:.1f}ms "
+              f"(x{fan_out['p95_ms'] / batched['p95_ms']:.1f} faster)")
+
+    if not batch_samples:
+        print("[FAIL] The batched dashboard never loaded")
+        passed = False
+    elif fan_rows:
+        mismatched = compare(fan_rows, batch_rows)
+        if mismatched:
+            print(f"[FAIL] {len(mismatched)} client(s) differ from the per-client endpoints, e.g. {mismatched[:5]}")
+            passed = False
+        else:
+            print(f"[PASS] Batched values match the per-client endpoints for {len(fan_rows)} clients")
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, clients=args.clients,
+                            iterations=args.iterations, concurrency=args.concurrency)
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms) and passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,95 @@
+"""
+Adaplio API - Per-Endpoint Latency Benchmarks
+Warms up and times each read endpoint the frontend calls, stores JSON baselines and
+fails when p95 regresses beyond a threshold against the saved baseline.
+
+Usage:
+    python benchmark_endpoints.py --save-baseline          # record baseline
+    python benchmark_endpoints.py --threshold 0.25         # gate against it
+"""
+
+import argparse
+import os
+import sys
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "endpoints.json")
+
+# (role, path) - the endpoints from test_api_endpoints_reachable plus the rest of the dashboard reads
+ENDPOINTS = [
+    (None, "/health"),
+    ("client", "/auth/me"),
+    ("client", "/api/me/profile"),
+    ("client", "/api/client/board"),
+    ("client", "/api/client/gamification"),
+    ("client", "/api/client/progress/week"),
+    ("client", "/api/client/progress/summary"),
+    ("client", "/api/client/proposals"),
+    ("client", "/api/client/plans"),
+    ("trainer", "/auth/me"),
+    ("trainer", "/api/trainer/clients"),
+    ("trainer", "/api/trainer/clients?includeSummary=true&sort=-lastActivity"),
+    ("trainer", "/api/trainer/dashboard"),
+    ("trainer", "/api/trainer/templates"),
+    ("trainer", "/api/trainer/proposals"),
+    ("trainer", "/api/trainer/clients/{alias}/adherence"),
+    ("trainer", "/api/trainer/clients/{alias}/gamification"),
+]
+
+
+def run_benchmarks(api, context, iterations, warmup):
+    results = {}
+    for role, path in ENDPOINTS:
+        name = f"GET {path}" + (f" ({role})" if role else "")
+        url = path.format(alias=context["client_alias"])
+        print(f"  {name} ...")
+        # A fresh IP per call keeps the ~1k requests under the per-IP limits, which would otherwise answer 429
+        samples, errors, _ = bench.measure(
+            lambda: api.get(url, role=role, headers=fixtures.unique_ip_headers()), iterations, warmup)
+        results[name] = bench.summarize(samples, errors)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio per-endpoint latency benchmarks")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--progress-events", type=int, default=10,
+                        help="progress events logged before timing so reads hit real data")
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO ENDPOINT BENCHMARKS")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    with ApiClient(args.base_url) as api:
+        print("\nSetting up trainer, client and active plan...")
+        context = fixtures.setup_active_plan(api)
+        for card in fixtures.board_cards(api)[:args.progress_events]:
+            api.post("/api/client/progress", role="client", json=fixtures.progress_payload(card))
+
+        print(f"\nTiming {len(ENDPOINTS)} endpoints ({args.warmup} warm-up + {args.iterations} timed each)")
+        results = run_benchmarks(api, context, args.iterations, args.warmup)
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "ENDPOINT LATENCY")
+
+    if args.save_baseline:
+        if bench.find_failures(results):
+            print("\n[FAIL] Not saving a baseline from a run with failed requests")
+            return False
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url,
+                            iterations=args.iterations, warmup=args.warmup)
+        return True
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
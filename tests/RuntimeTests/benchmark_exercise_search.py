@@ -0,0 +1,130 @@
+"""
+Adaplio API - Exercise Search Benchmark
+Grows the exercise library to each target size (10k and 100k by default) through the Development-only
+POST /api/dev/seed/exercises, then times GET /api/exercises for type-ahead shapes: a short and a longer
+name prefix, a word in the middle of the name, a typo that only trigram matching finds, a category
+filter and a browse page reached through a cursor. Prints the index build time from
+/api/dev/diagnostics/exercises for each size.
+
+Usage:
+    python benchmark_exercise_search.py --sizes 10000,100000 --iterations 12
+    python benchmark_exercise_search.py --save-baseline
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "exercise_search.json")
+SEARCH_PATH = "/api/exercises"
+SEED_PATH = "/api/dev/seed/exercises"
+STATS_PATH = "/api/dev/diagnostics/exercises"
+
+# Names follow ExerciseLibrarySeeder: "<Modifier> [<Side>] <Movement> S<seed>-<n>"
+QUERIES = [
+    ("prefix 'ban'", {"q": "ban"}),
+    ("prefix 'banded single'", {"q": "banded single"}),
+    ("word 'hamstring'", {"q": "hamstring"}),
+    ("typo 'hamstrng curl'", {"q": "hamstrng curl"}),
+    ("category 'balance'", {"q": "tandem", "category": "balance"}),
+]
+
+
+def grow_library(api, target):
+    total = fixtures.expect(api.get(STATS_PATH), "Search index stats")["libraryCount"]
+    if total < target:
+        result = fixtures.expect(api.post(SEED_PATH, json={
+            "seed": int(time.time() * 1000) % 1_000_000_000,
+            "count": target - total,
+        }), "Exercise seed")
+        print(f"  seeded {result['created']} exercises in {result['elapsedMs']}ms")
+        total = result["totalExercises"]
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio exercise search benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--sizes", default="10000,100000", help="comma-separated library sizes, ascending")
+    parser.add_argument("--iterations", type=int, default=12,
+                        help="requests per query (queries x (iterations + warmup) must stay under the per-user limit of 100/min)")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--limit", type=int, default=20)
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO EXERCISE SEARCH BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    results = {}
+    builds = {}
+    passed = True
+    with ApiClient(args.base_url) as api:
+        for size in sizes:
+            print(f"\nGrowing the library to {size:,} exercises...")
+            total = grow_library(api, size)
+
+            # A fresh trainer per size keeps each size under the per-user rate limit
+            role = f"trainer-{size}"
+            fixtures.register_trainer(api, role=role)
+
+            # First search after the seed rebuilds the index
+            fixtures.expect(api.get(SEARCH_PATH, role=role, params={"q": "ban"}), "Index build")
+            stats = fixtures.expect(api.get(STATS_PATH), "Search index stats")["index"]
+            builds[size] = stats
+            print(f"  index: {stats['exercises']:,} exercises, {stats['trigrams']:,} trigrams, "
+                  f"built in {stats['lastBuildMs']}ms")
+
+            for label, params in QUERIES:
+                params = {**params, "limit": args.limit}
+                empty = []
+
+                def search():
+                    response = api.get(SEARCH_PATH, role=role, params=params, headers=fixtures.unique_ip_headers())
+                    if response.status_code == 200 and not response.json()["exercises"]:
+                        empty.append(label)
+                    return response
+
+                samples, errors, _ = bench.measure(search, args.iterations, args.warmup)
+                results[f"{label} @ {size:,}"] = bench.summarize(samples, errors, libraryCount=total)
+                if empty:
+                    print(f"[FAIL] {label} returned no exercises at {size:,}")
+                    passed = False
+
+            first = fixtures.expect(api.get(SEARCH_PATH, role=role, params={"limit": args.limit}), "Browse page 1")
+            cursor = first["nextCursor"]
+            samples, errors, _ = bench.measure(
+                lambda: api.get(SEARCH_PATH, role=role, params={"limit": args.limit, "cursor": cursor},
+                                headers=fixtures.unique_ip_headers()),
+                args.iterations, args.warmup)
+            results[f"browse page 2 @ {size:,}"] = bench.summarize(samples, errors, libraryCount=total)
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "EXERCISE SEARCH")
+
+    print(f"\n{'Library':>10} {'trigrams':>10} {'build ms':>9}")
+    for size, stats in builds.items():
+        print(f"{stats['exercises']:>10,} {stats['trigrams']:>10,} {stats['lastBuildMs']:>9}")
+
+    if any(r["errors"] for r in results.values()):
+        print("[FAIL] Some searches failed")
+        passed = False
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, sizes=sizes,
+                            iterations=args.iterations, limit=args.limit)
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms) and passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,84 @@
+"""
+Adaplio API - JWT Validation Microbenchmark
+Asks the Development-only POST /api/dev/diagnostics/jwt/benchmark to validate one token in-process
+with per-call TokenValidationParameters (the old JwtService), with parameters built once, and through
+the validated-token cache, and compares validations/sec. Then times an authenticated endpoint over HTTP
+with one token and reads the shared cache's hit rate from /api/dev/diagnostics/jwt.
+
+Usage:
+    python benchmark_jwt.py --validations 20000
+    python benchmark_jwt.py --save-baseline
+"""
+
+import argparse
+import os
+import sys
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "jwt.json")
+BENCHMARK_PATH = "/api/dev/diagnostics/jwt/benchmark"
+STATS_PATH = "/api/dev/diagnostics/jwt"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio JWT validation microbenchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--validations", type=int, default=20000, help="in-process validations per strategy")
+    parser.add_argument("--iterations", type=int, default=80,
+                        help="authenticated HTTP requests")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--min-speedup", type=float, default=2.0,
+                        help="required cached vs per-call-parameters validations/sec ratio")
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO JWT VALIDATION MICROBENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    passed = True
+    with ApiClient(args.base_url) as api:
+        print(f"\nValidating one token {args.validations} times per strategy in-process...")
+        micro = fixtures.expect(api.post(BENCHMARK_PATH, params={"iterations": args.validations}),
+                                "JWT microbenchmark")
+
+        print("Registering trainer and timing GET /auth/me with one token...")
+        fixtures.register_trainer(api)
+        samples, errors, _ = bench.measure(
+            lambda: api.get("/auth/me", role="trainer", headers=fixtures.unique_ip_headers()),
+            args.iterations, args.warmup)
+        stats = fixtures.expect(api.get(STATS_PATH), "JWT cache stats")
+
+    per_call = micro["perCallParametersPerSec"]
+    print(f"\n{'Strategy':<32} {'validations/s':>14} {'speedup':>8}")
+    for label, key in (("per-call parameters (old)", "perCallParametersPerSec"),
+                       ("precomputed parameters", "precomputedParametersPerSec"),
+                       ("validated-token cache", "cachedPerSec")):
+        print(f"{label:<32} {micro[key]:>14,.0f} {micro[key] / per_call:>7.1f}x")
+
+    speedup = micro["cachedPerSec"] / per_call
+    if speedup < args.min_speedup:
+        print(f"[FAIL] Cached validation is only {speedup:.1f}x the old path (need {args.min_speedup:.1f}x)")
+        passed = False
+    else:
+        print(f"[PASS] Cached validation is {speedup:.1f}x the old path")
+
+    results = {"GET /auth/me (trainer, one token)": bench.summarize(samples, errors)}
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "AUTHENTICATED REQUEST LATENCY")
+    print(f"\nShared validation cache: {stats['hits']} hits, {stats['misses']} misses, "
+          f"hit rate {stats['hitRate']:.1%}, {stats['entries']}/{stats['maxEntries']} entries")
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, iterations=args.iterations,
+                            microbenchmark=micro)
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms) and passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,132 @@
+"""
+Adaplio API - Login Storm Benchmark
+Seeds a cohort of trainers, then fires POST /auth/trainer/login at increasing concurrency levels and
+reports throughput, latency and shed requests per level. Each level logs in a fresh slice of the cohort,
+so every attempt pays for a full BCrypt verify; a final level repeats the first slice to show the
+verified-credential fast path. Requests shed by the hashing pool must be 503s carrying Retry-After.
+
+Usage:
+    python benchmark_login_storm.py --levels 1,8,32,64 --logins-per-level 100
+    python benchmark_login_storm.py --save-baseline
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "login_storm.json")
+SEED_PATH = "/api/dev/seed/bulk"
+STATS_PATH = "/api/dev/diagnostics/password-hashing"
+SEED_PASSWORD = "BulkSeed123!"
+
+
+def trainer_email(seed, trainer):
+    # Mirrors BulkSeeder.TrainerEmail for batch 0
+    return f"bulk-s{seed}-b0-t{trainer}@bulk.adaplio.local"
+
+
+def seed_cohort(api, seed, trainers):
+    fixtures.expect(api.post(SEED_PATH, json={
+        "seed": seed,
+        "trainers": trainers,
+        "clientsPerTrainer": 0,
+        "weeks": 1,
+    }), "Bulk seed", expected=(200, 409))
+    return [trainer_email(seed, t) for t in range(trainers)]
+
+
+def login(api, email):
+    start = time.perf_counter()
+    response = api.post("/auth/trainer/login", headers=fixtures.unique_ip_headers(),
+                        json={"email": email, "password": SEED_PASSWORD})
+    return (time.perf_counter() - start) * 1000, response.status_code, response.headers.get("Retry-After")
+
+
+def run_level(api, emails, concurrency):
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        outcomes = list(pool.map(lambda email: login(api, email), emails))
+        elapsed = time.perf_counter() - start
+
+    samples = [ms for ms, status, _ in outcomes if status == 200]
+    shed = [retry_after for _, status, retry_after in outcomes if status == 503]
+    other = len(outcomes) - len(samples) - len(shed)
+    summary = bench.summarize(samples, other, concurrency=concurrency, shed=len(shed),
+                              throughputPerSec=round(len(samples) / elapsed, 1) if elapsed else 0)
+    return summary, shed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio login storm benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--seed", type=int, default=int(time.time()) % 1_000_000,
+                        help="bulk seed; defaults to a fresh one per run")
+    parser.add_argument("--levels", default="1,8,32,64", help="comma-separated concurrency levels")
+    parser.add_argument("--logins-per-level", type=int, default=100)
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.levels.split(",")]
+    trainers = len(levels) * args.logins_per_level
+    if trainers > 500:
+        parser.error("levels x logins-per-level must be at most 500 (one bulk seed batch)")
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO LOGIN STORM BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    results = {}
+    passed = True
+    with ApiClient(args.base_url, pool_connections=max(levels), pool_maxsize=max(levels)) as api:
+        print(f"\nSeeding {trainers} trainers (seed {args.seed})...")
+        cohort = seed_cohort(api, args.seed, trainers)
+
+        runs = [(f"login storm c={level}", level, cohort[i * args.logins_per_level:(i + 1) * args.logins_per_level])
+                for i, level in enumerate(levels)]
+        runs.append((f"login storm c={levels[-1]} repeat", levels[-1], cohort[:args.logins_per_level]))
+
+        for name, concurrency, emails in runs:
+            print(f"  {name}: {len(emails)} logins...")
+            results[name], shed = run_level(api, emails, concurrency)
+            if any(not retry_after for retry_after in shed):
+                print(f"[FAIL] {name}: 503 without Retry-After")
+                passed = False
+
+        stats_response = api.get(STATS_PATH)
+        stats = stats_response.json() if stats_response.status_code == 200 else None
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "LOGIN STORM")
+
+    print(f"\n{'Level':<34} {'logins/s':>9} {'shed':>6} {'errors':>7}")
+    for name, r in results.items():
+        print(f"{name:<34} {r.get('throughputPerSec', 0):>9.1f} {r['shed']:>6} {r['errors']:>7}")
+        if r["errors"]:
+            passed = False
+
+    if stats is None:
+        print("\n[INFO] Password hashing diagnostics not available on this build")
+    else:
+        print(f"\nHashing pool: {stats['workers']} workers, {stats['completed']} completed, "
+              f"{stats['rejected']} shed, {stats['upgraded']} upgraded, {stats['fastPathHits']} fast-path hits, "
+              f"avg {stats['averageWorkMs']}ms per hash")
+
+    if not passed:
+        print("[FAIL] Logins failed with something other than 200 or a 503 with Retry-After")
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, levels=levels,
+                            loginsPerLevel=args.logins_per_level)
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms, metric="p99_ms") and passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,145 @@
+"""
+Adaplio API - Proposal Listing Benchmark
+Bulk-seeds a trainer with one proposal per client, logs in as that trainer and times pages of
+GET /api/trainer/proposals at several page sizes, then walks every page to check that paging returns each
+proposal exactly once. Then builds a client with a few dozen proposals through the API and times
+GET /api/client/proposals, unfiltered and filtered to pending. Reports response size next to latency,
+since listings used to return every proposal with the template graph loaded.
+
+Usage:
+    python benchmark_proposals.py --clients 200 --page-sizes 20,200 --iterations 20
+    python benchmark_proposals.py --save-baseline
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "proposals.json")
+SEED_PATH = "/api/dev/seed/bulk"
+SEED_PASSWORD = "BulkSeed123!"
+TRAINER_PROPOSALS_PATH = "/api/trainer/proposals"
+CLIENT_PROPOSALS_PATH = "/api/client/proposals"
+
+
+def trainer_email(seed):
+    # Mirrors BulkSeeder.TrainerEmail for batch 0, trainer 0
+    return f"bulk-s{seed}-b0-t0@bulk.adaplio.local"
+
+
+def time_listing(api, role, path, params, iterations, warmup):
+    sizes = []
+
+    def call():
+        response = api.get(path, role=role, params=params, headers=fixtures.unique_ip_headers())
+        sizes.append(len(response.content))
+        return response
+
+    samples, errors, last = bench.measure(call, iterations, warmup)
+    body = last.json() if last is not None and last.status_code == 200 else {}
+    return bench.summarize(samples, errors, returned=len(body.get("proposals", [])),
+                           totalCount=body.get("totalCount"), avgBytes=round(sum(sizes) / len(sizes)) if sizes else 0)
+
+
+def walk_pages(api, role, path, page_size):
+    seen = []
+    page = 1
+    while True:
+        body = fixtures.expect(api.get(path, role=role, params={"page": page, "pageSize": page_size},
+                                       headers=fixtures.unique_ip_headers()), f"Proposal page {page}")
+        seen.extend(p["id"] for p in body["proposals"])
+        if page * body["pageSize"] >= body["totalCount"]:
+            return seen, body["totalCount"]
+        page += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio proposal listing benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--seed", type=int, default=int(time.time()) % 1_000_000,
+                        help="bulk seed; defaults to a fresh one per run")
+    parser.add_argument("--clients", type=int, default=200, help="seeded clients, one proposal each (max 200)")
+    parser.add_argument("--client-proposals", type=int, default=30, help="proposals sent to the API-built client")
+    parser.add_argument("--page-sizes", default="20,200", help="comma-separated trainer page sizes")
+    parser.add_argument("--iterations", type=int, default=20,
+                        help="requests per listing (listings x (iterations + warmup) must stay under the per-user limit of 100/min)")
+    parser.add_argument("--warmup", type=int, default=3)
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    page_sizes = [int(size) for size in args.page_sizes.split(",")]
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO PROPOSAL LISTING BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    results = {}
+    passed = True
+    with ApiClient(args.base_url) as api:
+        print(f"\nSeeding one trainer with {args.clients} proposals (seed {args.seed})...")
+        fixtures.expect(api.post(SEED_PATH, json={
+            "seed": args.seed,
+            "trainers": 1,
+            "clientsPerTrainer": args.clients,
+            "weeks": 1,
+        }), "Bulk seed", expected=(200, 409))
+        login = fixtures.expect(api.post("/auth/trainer/login", headers=fixtures.unique_ip_headers(),
+                                         json={"email": trainer_email(args.seed), "password": SEED_PASSWORD}),
+                                "Seeded trainer login")
+        api.set_token("seeded", login["token"])
+
+        for page_size in page_sizes:
+            print(f"  trainer listing, page 1 of {page_size}...")
+            results[f"trainer proposals (page 1, size {page_size})"] = time_listing(
+                api, "seeded", TRAINER_PROPOSALS_PATH, {"page": 1, "pageSize": page_size},
+                args.iterations, args.warmup)
+
+        print("  walking every trainer page...")
+        seen, total = walk_pages(api, "seeded", TRAINER_PROPOSALS_PATH, min(page_sizes))
+        if len(seen) != total or len(set(seen)) != total:
+            print(f"[FAIL] Paging returned {len(seen)} proposals ({len(set(seen))} distinct) of {total}")
+            passed = False
+
+        print(f"\nBuilding a client with {args.client_proposals} proposals...")
+        fixtures.register_trainer(api)
+        client = fixtures.register_client(api)
+        fixtures.link_client(api)
+        template = fixtures.create_template(api)
+        for _ in range(args.client_proposals):
+            fixtures.expect(api.post(TRAINER_PROPOSALS_PATH, role="trainer", headers=fixtures.unique_ip_headers(), json={
+                "clientAlias": client["alias"],
+                "templateId": template["id"],
+                "message": "Listing benchmark"
+            }), "Proposal creation", expected=(200, 201))
+
+        for label, params in (("client proposals (page 1)", {"page": 1}),
+                              ("client proposals (pending)", {"status": "pending"})):
+            print(f"  {label}...")
+            results[label] = time_listing(api, "client", CLIENT_PROPOSALS_PATH, params, args.iterations, args.warmup)
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "PROPOSAL LISTINGS")
+
+    print(f"\n{'Listing':<42} {'returned':>8} {'total':>6} {'avg bytes':>10}")
+    for name, r in results.items():
+        print(f"{name:<42} {r['returned']:>8} {r['totalCount'] or 0:>6} {r['avgBytes']:>10,}")
+
+    if any(r["errors"] for r in results.values()):
+        print("[FAIL] Some listings failed")
+        passed = False
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, clients=args.clients,
+                            pageSizes=page_sizes, iterations=args.iterations)
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms) and passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,106 @@
+"""
+Adaplio API - Template Creation Benchmark
+Times POST /api/trainer/templates with 5, 50 and 200 items. Half of each template's exercises come from a
+shared library that earlier requests have already created (served by the exercise name cache after the first
+request), the other half are new names, so every request also creates exercises. Exercise names are resolved
+in one query and the template, its items and new exercises are written in one save, so latency should grow
+far less than linearly with the item count.
+
+Usage:
+    python benchmark_templates.py --sizes 5,50,200 --iterations 15
+    python benchmark_templates.py --save-baseline
+"""
+
+import argparse
+import os
+import sys
+import uuid
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "templates.json")
+TEMPLATES_PATH = "/api/trainer/templates"
+
+
+def template_items(size, run_id, request_number, new_ratio):
+    new_count = int(size * new_ratio)
+    items = []
+    for i in range(size):
+        if i < new_count:
+            name = f"Bench {run_id} r{request_number} e{i}"
+        else:
+            # Vary the case so matching has to go through the normalized name
+            name = f"Benchmark Library Exercise {i}" if i % 2 else f"benchmark library exercise {i}".upper()
+        items.append({"exerciseName": name, "targetSets": 3, "targetReps": 10, "holdSeconds": 0,
+                      "frequencyPerWeek": 3, "days": ["Monday", "Wednesday", "Friday"]})
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio template creation benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--sizes", default="5,50,200", help="comma-separated item counts")
+    parser.add_argument("--iterations", type=int, default=15,
+                        help="templates per size (sizes x (iterations + warmup) must stay under the per-user limit of 100/min)")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--new-ratio", type=float, default=0.5, help="share of each template's exercises that are new")
+    bench.add_gate_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    run_id = uuid.uuid4().hex[:8]
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO TEMPLATE CREATION BENCHMARK")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    results = {}
+    passed = True
+    with ApiClient(args.base_url) as api:
+        print("\nRegistering trainer...")
+        fixtures.register_trainer(api)
+
+        for size in sizes:
+            counter = iter(range(1_000_000))
+            mismatches = []
+
+            def create():
+                request_number = next(counter)
+                items = template_items(size, run_id, request_number, args.new_ratio)
+                response = api.post(TEMPLATES_PATH, role="trainer", headers=fixtures.unique_ip_headers(), json=
+                                    fixtures.template_payload(name=f"Bench {size} #{request_number}", items=items))
+                if response.status_code in (200, 201) and len(response.json()["items"]) != size:
+                    mismatches.append(request_number)
+                return response
+
+            print(f"  {size} items: {args.iterations} templates...")
+            samples, errors, _ = bench.measure(create, args.iterations, args.warmup, expected=(200, 201))
+            results[f"create template ({size} items)"] = bench.summarize(samples, errors, items=size)
+            if mismatches:
+                print(f"[FAIL] {len(mismatches)} templates with {size} items came back with the wrong item count")
+                passed = False
+
+    baseline = bench.load_baseline(args.baseline)
+    bench.print_results(results, baseline, "TEMPLATE CREATION")
+
+    smallest, largest = results[f"create template ({sizes[0]} items)"], results[f"create template ({sizes[-1]} items)"]
+    if smallest.get("count") and largest.get("count"):
+        print(f"\n{sizes[-1]} vs {sizes[0]} items: p50 {largest['p50_ms'] / smallest['p50_ms']:.1f}x "
+              f"for {sizes[-1] / sizes[0]:.0f}x the items")
+
+    if any(r["errors"] for r in results.values()):
+        print("[FAIL] Some template creations failed")
+        passed = False
+
+    if args.save_baseline:
+        bench.save_baseline(args.baseline, results, baseUrl=args.base_url, sizes=sizes,
+                            iterations=args.iterations, newRatio=args.new_ratio)
+
+    return bench.gate(results, baseline, args.threshold, args.min_delta_ms) and passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
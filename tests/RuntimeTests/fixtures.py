@@ -0,0 +1,140 @@
+"""
+Adaplio API - Shared runtime test fixtures
+Builds trainers, clients, consent and active plans through the public API
+"""
+
+import itertools
+import random
+import string
+import time
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+_ips = itertools.count()
+
+
+class FixtureError(Exception):
+    pass
+
+
+def unique_email(prefix="bench"):
+    suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    return f"{prefix}_{int(time.time())}_{suffix}@test.com"
+
+
+def unique_ip_headers():
+    """Fresh client IP per call so the per-IP rate limits measure nothing but the path under test"""
+    index = next(_ips)
+    ip = f"100.{64 + index // 62500 % 64}.{index // 250 % 250}.{index % 250 + 1}"
+    return {"X-Forwarded-For": ip, "X-Real-IP": ip}
+
+
+def expect(response, step, expected=(200,)):
+    if response.status_code not in expected:
+        raise FixtureError(f"{step} failed: {response.status_code} {response.text[:200]}")
+    return response.json() if response.content else None
+
+
+def register_trainer(api, role="trainer", email=None, password="SecurePass123!"):
+    """Register a trainer and store its token on the client under `role`"""
+    data = expect(api.post("/auth/trainer/register", json={
+        "email": email or unique_email("trainer"),
+        "password": password,
+        "fullName": "Benchmark Trainer",
+        "practiceName": "Benchmark PT"
+    }), "Trainer registration")
+    api.set_token(role, data["token"])
+    return data
+
+
+def register_client(api, role="client", email=None):
+    """
+    Register a client through the magic link flow.
+    Requires a Development API so the code can be read from /auth/dev/magic-link.
+    """
+    email = email or unique_email("client")
+    expect(api.post("/auth/client/magic-link", json={"email": email}), "Magic link request")
+    link = expect(api.get("/auth/dev/magic-link", params={"email": email}), "Magic link lookup")
+    data = expect(api.post("/auth/client/verify", json={"code": link["code"]}), "Magic link verify")
+    api.set_token(role, data["token"])
+    return data
+
+
+def link_client(api, trainer_role="trainer", client_role="client"):
+    """Trainer issues a grant code and the client accepts it"""
+    grant = expect(api.post("/api/trainer/grants", role=trainer_role,
+                            json={"expirationHours": 72}), "Grant creation")
+    expect(api.post("/api/client/grants/accept", role=client_role,
+                    json={"grantCode": grant["grantCode"]}), "Grant acceptance")
+    return grant["grantCode"]
+
+
+def template_payload(name="Benchmark Plan", items=None, duration_weeks=4):
+    return {
+        "name": name,
+        "description": "Runtime benchmark plan",
+        "category": "strength",
+        "durationWeeks": duration_weeks,
+        "isPublic": False,
+        "items": items or [
+            {"exerciseName": "Knee Flexion", "targetSets": 3, "targetReps": 10, "holdSeconds": 0,
+             "frequencyPerWeek": 7, "days": DAYS},
+            {"exerciseName": "Hip Extension", "targetSets": 3, "targetReps": 12, "holdSeconds": 30,
+             "frequencyPerWeek": 3, "days": ["Monday", "Wednesday", "Friday"]},
+        ]
+    }
+
+
+def create_template(api, role="trainer", **kwargs):
+    return expect(api.post("/api/trainer/templates", role=role, json=template_payload(**kwargs)),
+                  "Template creation", expected=(200, 201))
+
+
+def propose_and_accept(api, client_alias, template_id, trainer_role="trainer", client_role="client"):
+    proposal = expect(api.post("/api/trainer/proposals", role=trainer_role, json={
+        "clientAlias": client_alias,
+        "templateId": template_id,
+        "message": "Runtime benchmark plan"
+    }), "Proposal creation", expected=(200, 201))
+    accepted = expect(api.post(f"/api/client/proposals/{proposal['id']}/accept", role=client_role,
+                               json={"acceptAll": True}), "Proposal acceptance")
+    return proposal["id"], accepted["planInstanceId"]
+
+
+def board_cards(api, role="client"):
+    board = expect(api.get("/api/client/board", role=role), "Board load")
+    return [card for day in board.get("days", []) for card in day.get("exercises", [])]
+
+
+def progress_payload(card, **overrides):
+    payload = {
+        "exerciseInstanceId": card["exerciseInstanceId"],
+        "eventType": "exercise_completed",
+        "setsCompleted": card.get("targetSets") or 1,
+        "repsCompleted": card.get("targetReps") or 1,
+        "holdSecondsCompleted": card.get("holdSeconds") or 0,
+        "painLevel": 2,
+        "difficultyRating": 4
+    }
+    payload.update(overrides)
+    return payload
+
+
+def setup_active_plan(api, trainer_role="trainer", client_role="client"):
+    """
+    Trainer + client with consent and an accepted plan.
+    Returns a dict with the identifiers later steps need; tokens are registered on `api`.
+    """
+    register_trainer(api, role=trainer_role)
+    client = register_client(api, role=client_role)
+    link_client(api, trainer_role, client_role)
+    template = create_template(api, role=trainer_role)
+    proposal_id, plan_instance_id = propose_and_accept(api, client["alias"], template["id"],
+                                                       trainer_role, client_role)
+    return {
+        "client_alias": client["alias"],
+        "template_id": template["id"],
+        "proposal_id": proposal_id,
+        "plan_instance_id": plan_instance_id,
+    }
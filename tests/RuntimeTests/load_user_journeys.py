@@ -0,0 +1,276 @@
+"""
+Adaplio API - Concurrent User Journey Load Generator
+Replays the trainer/client journeys from test_user_journeys.py with many virtual users at once
+
+Each virtual trainer registers and creates a template. Each virtual client is assigned to a
+trainer and runs: grant -> magic link -> verify -> accept grant -> proposal -> accept proposal
+-> board -> log progress. Per-step throughput and p50/p95/p99 latency are reported at the end.
+
+The API must run in Development (for GET /auth/dev/magic-link). Each virtual user sends from its own
+client IP, so the per-IP limits see one device per user, as they would in production.
+
+Usage:
+    python load_user_journeys.py --trainers 20 --clients 200 --ramp-up 30 --think-time 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import string
+import time
+from collections import defaultdict
+
+import aiohttp
+
+from adaplio_client import DEFAULT_BASE_URL, percentile
+import fixtures
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+class StepStats:
+    """Collects latency samples and failures per journey step"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.failures = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.journeys_completed = 0
+        self.journeys_failed = 0
+
+    def record(self, step, seconds, status, ok):
+        self.samples[step].append(seconds)
+        self.statuses[step][status] += 1
+        if not ok:
+            self.failures[step] += 1
+
+    def print_report(self, wall_seconds):
+        total_requests = sum(len(s) for s in self.samples.values())
+
+        print("\n" + "=" * 96)
+        print("  LOAD TEST RESULTS")
+        print("=" * 96)
+        print(f"Wall time:          {wall_seconds:.1f}s")
+        print(f"Requests:           {total_requests} ({total_requests / wall_seconds:.1f} req/s)")
+        print(f"Journeys completed: {self.journeys_completed} "
+              f"({self.journeys_completed / wall_seconds:.2f}/s), failed: {self.journeys_failed}")
+        print()
+        print(f"{'Step':<24} {'n':>6} {'fail':>6} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+              f"{'p99 ms':>9} {'max ms':>9}")
+
+        for step in self.samples:
+            ms = [s * 1000 for s in self.samples[step]]
+            print(f"{step:<24} {len(ms):>6} {self.failures[step]:>6} "
+                  f"{len(ms) / wall_seconds:>8.1f} {percentile(ms, 50):>9.1f} "
+                  f"{percentile(ms, 95):>9.1f} {percentile(ms, 99):>9.1f} {max(ms):>9.1f}")
+
+        errors = {step: dict(codes) for step, codes in self.statuses.items()
+                  if any(code != 200 for code in codes)}
+        if errors:
+            print("\nNon-200 responses by step:")
+            for step, codes in errors.items():
+                print(f"  {step}: {codes}")
+
+
+class StepFailed(Exception):
+    pass
+
+
+class VirtualUser:
+    def __init__(self, session, base_url, stats, think_time):
+        self.session = session
+        self.base_url = base_url
+        self.stats = stats
+        self.think_time = think_time
+        self.token = None
+        self.ip_headers = fixtures.unique_ip_headers()
+
+    async def think(self):
+        if self.think_time > 0:
+            await asyncio.sleep(random.expovariate(1.0 / self.think_time))
+
+    async def call(self, step, method, path, json=None, params=None, expected=(200,)):
+        headers = dict(self.ip_headers)
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        start = time.perf_counter()
+        status = "error"
+        try:
+            async with self.session.request(method, f"{self.base_url}{path}", json=json,
+                                            params=params, headers=headers) as response:
+                status = response.status
+                body = await response.json(content_type=None) if status in expected else None
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            body = None
+        finally:
+            ok = status in expected
+            self.stats.record(step, time.perf_counter() - start, status, ok)
+
+        if not ok:
+            raise StepFailed(f"{step} -> {status}")
+        return body
+
+
+def unique_email(prefix):
+    suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    return f"{prefix}_{int(time.time())}_{suffix}@loadtest.com"
+
+
+async def run_trainer(user, index, ready):
+    """Register a trainer and create the template its clients will be offered"""
+    try:
+        data = await user.call("trainer_register", "POST", "/auth/trainer/register", json={
+            "email": unique_email("load_trainer"),
+            "password": "LoadTestPass123!",
+            "fullName": f"Load Trainer {index}",
+            "practiceName": "Load Test PT"
+        })
+        user.token = data["token"]
+        await user.think()
+
+        template = await user.call("trainer_create_template", "POST", "/api/trainer/templates", json={
+            "name": f"Load Plan {index}",
+            "description": "Concurrent journey load test plan",
+            "category": "recovery",
+            "durationWeeks": 4,
+            "isPublic": False,
+            "items": [
+                {"exerciseName": "Quad Sets", "targetSets": 3, "targetReps": 15, "holdSeconds": 5,
+                 "frequencyPerWeek": 7, "days": DAYS},
+                {"exerciseName": "Heel Slides", "targetSets": 2, "targetReps": 10,
+                 "frequencyPerWeek": 7, "days": DAYS},
+            ]
+        })
+        ready.set_result((user, template["id"]))
+    except Exception as e:
+        ready.set_exception(e)
+
+
+async def run_client(user, trainer_ready, progress_logs):
+    """Full client journey against an already-registered trainer"""
+    try:
+        trainer, template_id = await trainer_ready
+    except Exception:
+        user.stats.journeys_failed += 1
+        return
+
+    try:
+        grant = await trainer.call("trainer_create_grant", "POST", "/api/trainer/grants",
+                                   json={"expirationHours": 72})
+        await user.think()
+
+        email = unique_email("load_client")
+        await user.call("client_magic_link", "POST", "/auth/client/magic-link", json={"email": email})
+        link = await user.call("dev_magic_link_lookup", "GET", "/auth/dev/magic-link",
+                               params={"email": email})
+        await user.think()
+
+        verified = await user.call("client_verify", "POST", "/auth/client/verify",
+                                   json={"code": link["code"]})
+        user.token = verified["token"]
+        alias = verified["alias"]
+        await user.think()
+
+        await user.call("client_accept_grant", "POST", "/api/client/grants/accept",
+                        json={"grantCode": grant["grantCode"]})
+        await user.think()
+
+        proposal = await trainer.call("trainer_create_proposal", "POST", "/api/trainer/proposals", json={
+            "clientAlias": alias,
+            "templateId": template_id,
+            "message": "Load test plan"
+        })
+        await user.think()
+
+        await user.call("client_accept_proposal", "POST",
+                        f"/api/client/proposals/{proposal['id']}/accept", json={"acceptAll": True})
+        await user.think()
+
+        board = await user.call("client_board", "GET", "/api/client/board")
+        cards = [card for day in board.get("days", []) for card in day.get("exercises", [])]
+
+        for card in cards[:progress_logs]:
+            await user.think()
+            await user.call("client_log_progress", "POST", "/api/client/progress", json={
+                "exerciseInstanceId": card["exerciseInstanceId"],
+                "eventType": "exercise_completed",
+                "setsCompleted": card.get("targetSets") or 1,
+                "repsCompleted": card.get("targetReps") or 1,
+                "holdSecondsCompleted": card.get("holdSeconds") or 0,
+                "painLevel": 2,
+                "difficultyRating": 4
+            })
+
+        await user.call("client_gamification", "GET", "/api/client/gamification")
+        user.stats.journeys_completed += 1
+    except StepFailed:
+        user.stats.journeys_failed += 1
+
+
+async def delayed(delay, coro):
+    await asyncio.sleep(delay)
+    await coro
+
+
+async def run_load(args):
+    stats = StepStats()
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    connector = aiohttp.TCPConnector(limit=args.connections)
+    loop = asyncio.get_running_loop()
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        trainer_futures = [loop.create_future() for _ in range(args.trainers)]
+        total_users = args.trainers + args.clients
+        tasks = []
+
+        for i, ready in enumerate(trainer_futures):
+            user = VirtualUser(session, args.base_url, stats, args.think_time)
+            delay = args.ramp_up * i / total_users
+            tasks.append(asyncio.create_task(delayed(delay, run_trainer(user, i, ready))))
+
+        for i in range(args.clients):
+            user = VirtualUser(session, args.base_url, stats, args.think_time)
+            ready = trainer_futures[i % args.trainers]
+            delay = args.ramp_up * (args.trainers + i) / total_users
+            tasks.append(asyncio.create_task(delayed(delay, run_client(user, ready, args.progress_logs))))
+
+        start = time.perf_counter()
+        await asyncio.gather(*tasks)
+        wall = time.perf_counter() - start
+
+    stats.print_report(wall)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent Adaplio user journey load generator")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--trainers", type=int, default=10, help="virtual trainers (N)")
+    parser.add_argument("--clients", type=int, default=50, help="virtual clients (M), round-robin over trainers")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="seconds over which users start")
+    parser.add_argument("--think-time", type=float, default=0.5, help="mean pause between steps (s)")
+    parser.add_argument("--progress-logs", type=int, default=3, help="exercises each client completes")
+    parser.add_argument("--connections", type=int, default=100, help="max open connections")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout (s)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.trainers < 1:
+        parser.error("--trainers must be at least 1")
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO CONCURRENT USER JOURNEYS")
+    print("=" * 60)
+    print(f"Target:      {args.base_url}")
+    print(f"Users:       {args.trainers} trainers, {args.clients} clients")
+    print(f"Ramp-up:     {args.ramp_up}s, think time ~{args.think_time}s")
+
+    stats = asyncio.run(run_load(args))
+    return stats.journeys_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,127 @@
+"""
+Adaplio API - Bulk population seeder
+Builds thousands of trainers/clients with accepted plans and weeks of progress history
+through the Development-only /api/dev/seed/bulk endpoint, in parallel deterministic batches.
+
+The same --seed always produces the same emails, aliases and completion pattern, so load
+tests and benchmarks can target a known population. Re-running skips batches that exist.
+
+Usage:
+    python seed_population.py --seed 42 --trainers 200 --clients-per-trainer 25 --weeks 8
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+
+SEED_PATH = "/api/dev/seed/bulk"
+TOTAL_KEYS = ("trainers", "clients", "planInstances", "exerciseInstances", "progressEvents")
+
+
+def plan_batches(trainers, batch_trainers):
+    """Split the trainer count into (batch, trainer_count) pairs; numbering is stable for a given size"""
+    batches = []
+    batch = 0
+    remaining = trainers
+    while remaining > 0:
+        size = min(batch_trainers, remaining)
+        batches.append((batch, size))
+        remaining -= size
+        batch += 1
+    return batches
+
+
+def seed_batch(api, args, batch, trainers):
+    payload = {
+        "seed": args.seed,
+        "batch": batch,
+        "trainers": trainers,
+        "clientsPerTrainer": args.clients_per_trainer,
+        "weeks": args.weeks,
+        "completionRate": args.completion_rate,
+    }
+
+    for attempt in range(args.retries + 1):
+        response = api.post(SEED_PATH, json=payload)
+        if response.status_code == 200:
+            return "seeded", response.json()
+        if response.status_code == 409:
+            return "skipped", None
+        # SQLite serialises writers - back off and retry when parallel batches collide
+        retryable = response.status_code >= 500 or response.status_code == 429
+        if not retryable or attempt == args.retries:
+            return "failed", f"{response.status_code} {response.text[:200]}"
+        time.sleep(0.5 * (2 ** attempt))
+
+    return "failed", "retries exhausted"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a deterministic Adaplio population")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--trainers", type=int, default=100)
+    parser.add_argument("--clients-per-trainer", type=int, default=10)
+    parser.add_argument("--weeks", type=int, default=4)
+    parser.add_argument("--completion-rate", type=float, default=0.7)
+    parser.add_argument("--batch-trainers", type=int, default=10, help="trainers per request")
+    parser.add_argument("--workers", type=int, default=4, help="batches seeded in parallel")
+    parser.add_argument("--retries", type=int, default=3)
+    args = parser.parse_args()
+
+    batches = plan_batches(args.trainers, args.batch_trainers)
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO BULK POPULATION SEEDER")
+    print("=" * 60)
+    print(f"API: {args.base_url}")
+    print(f"Seed {args.seed}: {args.trainers} trainers x {args.clients_per_trainer} clients, "
+          f"{args.weeks} weeks, {len(batches)} batches on {args.workers} workers")
+
+    totals = dict.fromkeys(TOTAL_KEYS, 0)
+    seeded = skipped = failed = 0
+    sample = None
+    start = time.perf_counter()
+
+    with ApiClient(args.base_url, pool_maxsize=max(args.workers, 1)) as api:
+        with ThreadPoolExecutor(max_workers=max(args.workers, 1)) as pool:
+            futures = {pool.submit(seed_batch, api, args, batch, size): batch for batch, size in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                status, result = future.result()
+                if status == "seeded":
+                    seeded += 1
+                    for key in TOTAL_KEYS:
+                        totals[key] += result.get(key, 0)
+                    sample = sample or result
+                    print(f"[PASS] batch {batch}: {result['clients']} clients, "
+                          f"{result['progressEvents']} events in {result['elapsedMs']}ms")
+                elif status == "skipped":
+                    skipped += 1
+                    print(f"[SKIP] batch {batch}: already seeded")
+                else:
+                    failed += 1
+                    print(f"[FAIL] batch {batch}: {result}")
+
+    elapsed = time.perf_counter() - start
+    rows = sum(totals.values())
+
+    print("\n" + "=" * 60)
+    print("  SUMMARY")
+    print("=" * 60)
+    print(f"Batches: {seeded} seeded, {skipped} skipped, {failed} failed")
+    for key in TOTAL_KEYS:
+        print(f"  {key:<18} {totals[key]:>10}")
+    print(f"Elapsed: {elapsed:.2f}s ({rows / elapsed if elapsed else 0:.0f} core rows/s)")
+    if sample:
+        print(f"\nSample trainer: {sample['sampleTrainerEmail']} (password: BulkSeed123!)")
+        print(f"Sample client:  {sample['sampleClientEmail']} (alias {sample['sampleClientAlias']})")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -3,11 +3,12 @@ Quick setup script for data integrity tests
 Creates trainer, client, consent grant, template, proposal, and plan
 """
 
-import requests
+from adaplio_client import get_client
 import json
 import time
 
 BASE_URL = "http://localhost:8080"
+api = get_client(BASE_URL)
 
 def main():
     # Step 1: Register Trainer
@@ -15,7 +16,7 @@ def main():
     trainer_email = f"integ_trainer_{timestamp}@test.com"
 
     print("Step 1: Registering trainer...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/trainer/register",
         json={
             "email": trainer_email,
@@ -35,7 +36,7 @@ def main():
 
     # Step 2: Create grant code
     print("\nStep 2: Creating grant code...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/trainer/grants",
         headers={"Authorization": f"Bearer {trainer_token}"},
         json={"expirationHours": 72}
@@ -53,7 +54,7 @@ def main():
     client_email = f"integ_client_{timestamp}@test.com"
 
     print("\nStep 3: Sending magic link to client...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/client/magic-link",
         json={"phoneOrEmail": client_email}
     )
@@ -67,7 +68,7 @@ def main():
     print("\nStep 4: Verifying client with code...")
     # The code is printed in logs, but let's try common dev codes
     for code in ["123456", "000000"]:
-        response = requests.post(
+        response = api.post(
             f"{BASE_URL}/auth/client/verify",
             json={"phoneOrEmail": client_email, "token": code}
         )
@@ -87,7 +88,7 @@ def main():
 
     # Step 5: Client accepts grant
     print("\nStep 5: Client accepting grant...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/client/grants/accept",
         headers={"Authorization": f"Bearer {client_token}"},
         json={"grantCode": grant_code}
@@ -101,7 +102,7 @@ def main():
 
     # Step 6: Create template
     print("\nStep 6: Creating plan template...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/trainer/templates",
         headers={"Authorization": f"Bearer {trainer_token}"},
         json={
@@ -142,7 +143,7 @@ def main():
 
     # Step 7: Create proposal
     print("\nStep 7: Creating plan proposal...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/trainer/proposals",
         headers={"Authorization": f"Bearer {trainer_token}"},
         json={
@@ -164,7 +165,7 @@ def main():
 
     # Step 8: Client accepts proposal
     print("\nStep 8: Client accepting proposal...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/client/proposals/{proposal_id}/accept",
         headers={"Authorization": f"Bearer {client_token}"},
         json={"acceptAll": True}
@@ -179,7 +180,7 @@ def main():
 
     # Step 9: Verify exercises are available
     print("\nStep 9: Loading exercise board...")
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/board",
         headers={"Authorization": f"Bearer {client_token}"}
     )
@@ -202,6 +203,7 @@ def main():
 
 if __name__ == "__main__":
     trainer_token, client_token = main()
+    api.print_latency_report()
 
     if trainer_token and client_token:
         # Write tokens to file
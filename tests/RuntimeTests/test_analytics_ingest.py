@@ -0,0 +1,127 @@
+"""
+Adaplio API - Analytics Ingestion Load Test
+Posts batches to POST /api/analytics/events/batch at a target event rate (10k events/sec by default) for a
+fixed duration, tagging every event of the run with one event name. Then waits for the background writer
+to drain the queue and checks through /api/dev/diagnostics/analytics that every accepted event was stored.
+Batches refused with 503 + Retry-After are back-pressure, not loss; they only appear when the load exceeds
+the pipeline's capacity and are reported separately.
+
+Usage:
+    python test_analytics_ingest.py --events-per-sec 10000 --duration 10 --batch-size 200
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+BATCH_PATH = "/api/analytics/events/batch"
+STATS_PATH = "/api/dev/diagnostics/analytics"
+
+
+def batch_payload(event_name, start, size):
+    now = datetime.now(timezone.utc).isoformat()
+    return [{
+        "event": event_name,
+        "method": "load_test",
+        "timestamp": now,
+        "properties": {"sequence": start + i, "page": f"/page/{(start + i) % 20}"},
+    } for i in range(size)]
+
+
+def send_batch(api, event_name, index, batch_size, scheduled_at):
+    delay = scheduled_at - time.perf_counter()
+    if delay > 0:
+        time.sleep(delay)
+
+    start = time.perf_counter()
+    response = api.post(BATCH_PATH, headers=fixtures.unique_ip_headers(),
+                        json=batch_payload(event_name, index * batch_size, batch_size))
+    return (time.perf_counter() - start) * 1000, response.status_code, response.headers.get("Retry-After")
+
+
+def wait_for_drain(api, event_name, accepted, timeout):
+    deadline = time.time() + timeout
+    while True:
+        stats = fixtures.expect(api.get(STATS_PATH, params={"eventName": event_name}), "Analytics diagnostics")
+        if (stats["pipeline"]["pending"] == 0 and stats["storedCount"] >= accepted) or time.time() > deadline:
+            return stats
+        time.sleep(0.5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio analytics ingestion load test")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--events-per-sec", type=int, default=10000)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of sustained load")
+    parser.add_argument("--batch-size", type=int, default=200, help="events per request (server max 500)")
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--drain-timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    requests_per_sec = args.events_per_sec / args.batch_size
+    total_requests = max(1, int(requests_per_sec * args.duration))
+    event_name = f"loadtest.{uuid.uuid4().hex[:12]}"
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO ANALYTICS INGESTION LOAD TEST")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+    print(f"Target: {args.events_per_sec} events/s as {requests_per_sec:.0f} requests/s of {args.batch_size} "
+          f"for {args.duration:.0f}s ({total_requests * args.batch_size} events, name {event_name})")
+
+    passed = True
+    with ApiClient(args.base_url, pool_connections=args.workers, pool_maxsize=args.workers) as api:
+        before = fixtures.expect(api.get(STATS_PATH), "Analytics diagnostics")["pipeline"]
+
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            start = time.perf_counter()
+            futures = [pool.submit(send_batch, api, event_name, i, args.batch_size, start + i / requests_per_sec)
+                       for i in range(total_requests)]
+            outcomes = [future.result() for future in futures]
+            elapsed = time.perf_counter() - start
+
+        accepted_batches = [ms for ms, status, _ in outcomes if status == 202]
+        shed = [retry_after for _, status, retry_after in outcomes if status == 503]
+        errors = len(outcomes) - len(accepted_batches) - len(shed)
+        accepted = len(accepted_batches) * args.batch_size
+
+        print(f"\nSent {len(outcomes)} batches in {elapsed:.1f}s "
+              f"({len(outcomes) * args.batch_size / elapsed:,.0f} events/s offered); waiting for the writer to drain...")
+        stats = wait_for_drain(api, event_name, accepted, args.drain_timeout)
+
+    pipeline = stats["pipeline"]
+    results = {"POST /api/analytics/events/batch": bench.summarize(
+        accepted_batches, errors, shed=len(shed), eventsPerSec=round(accepted / elapsed, 1) if elapsed else 0)}
+    bench.print_results(results, title="ANALYTICS INGESTION")
+
+    dropped = pipeline["dropped"] - before["dropped"]
+    print(f"\nAccepted {accepted} events, {len(shed) * args.batch_size} refused by back-pressure, "
+          f"{stats['storedCount']} stored, {dropped} dropped by the writer, "
+          f"{pipeline['flushes'] - before['flushes']} flushes")
+
+    if errors:
+        print(f"[FAIL] {errors} batches failed with something other than 202 or 503")
+        passed = False
+    if any(not retry_after for retry_after in shed):
+        print("[FAIL] 503 without Retry-After")
+        passed = False
+    if shed:
+        print(f"[INFO] {len(shed)} batches were shed: the offered load exceeded pipeline capacity")
+    if stats["storedCount"] != accepted or dropped:
+        print(f"[FAIL] Lost events: {accepted} accepted but {stats['storedCount']} stored")
+        passed = False
+    else:
+        print("[PASS] Every accepted event was stored")
+
+    return passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
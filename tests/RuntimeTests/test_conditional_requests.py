@@ -0,0 +1,109 @@
+"""
+Adaplio API - Conditional Request (ETag) Tests
+For each read-heavy GET endpoint: the first response carries an ETag, a repeat with
+If-None-Match returns an empty 304, and after a write the same tag gets a fresh 200.
+Finishes by polling the board and reporting the bytes saved versus full downloads.
+
+Usage:
+    python test_conditional_requests.py --polls 50
+"""
+
+import argparse
+import sys
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import fixtures
+
+
+def check_endpoint(api, path, role, mutate):
+    """Returns True when the endpoint honours If-None-Match before and after `mutate`"""
+    first = api.get(path, role=role)
+    etag = first.headers.get("ETag")
+    if first.status_code != 200 or not etag:
+        print(f"[FAIL] {path}: expected 200 with an ETag, got {first.status_code} (ETag={etag})")
+        return False
+
+    repeat = api.get(path, role=role, headers={"If-None-Match": etag})
+    if repeat.status_code != 304 or repeat.content:
+        print(f"[FAIL] {path}: unchanged resource returned {repeat.status_code} "
+              f"with {len(repeat.content)} bytes")
+        return False
+
+    mutate()
+
+    changed = api.get(path, role=role, headers={"If-None-Match": etag})
+    new_etag = changed.headers.get("ETag")
+    if changed.status_code != 200 or new_etag == etag:
+        print(f"[FAIL] {path}: changed resource returned {changed.status_code} (ETag {etag} -> {new_etag})")
+        return False
+
+    print(f"[PASS] {path}: 304 while unchanged ({len(first.content)} bytes saved), 200 after a write")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio conditional request tests")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--polls", type=int, default=50, help="conditional board polls for the bandwidth report")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO CONDITIONAL REQUEST TESTS")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    with ApiClient(args.base_url) as api:
+        print("\nSetting up trainer, client and active plan...")
+        context = fixtures.setup_active_plan(api)
+        cards = fixtures.board_cards(api)
+
+        def log_progress():
+            fixtures.expect(api.post("/api/client/progress", role="client",
+                                     json=fixtures.progress_payload(cards[0])), "Progress log")
+
+        def create_template():
+            fixtures.create_template(api, name="Conditional Request Plan")
+
+        def create_proposal():
+            fixtures.expect(api.post("/api/trainer/proposals", role="trainer", json={
+                "clientAlias": context["client_alias"],
+                "templateId": context["template_id"],
+                "message": "Conditional request proposal"
+            }), "Proposal creation", expected=(200, 201))
+
+        def link_second_client():
+            fixtures.register_client(api, role="client2")
+            fixtures.link_client(api, "trainer", "client2")
+
+        checks = [
+            ("/api/client/board", "client", log_progress),
+            ("/api/trainer/templates", "trainer", create_template),
+            ("/api/trainer/proposals", "trainer", create_proposal),
+            ("/api/client/proposals", "client", create_proposal),
+            ("/api/trainer/clients", "trainer", link_second_client),
+        ]
+        passed = all([check_endpoint(api, path, role, mutate) for path, role, mutate in checks])
+
+        # Polling an unchanged board: only headers cross the wire
+        full = api.get("/api/client/board", role="client")
+        etag = full.headers.get("ETag")
+        polled_bytes = 0
+        not_modified = 0
+        for _ in range(args.polls):
+            response = api.get("/api/client/board", role="client", headers={"If-None-Match": etag})
+            polled_bytes += len(response.content)
+            not_modified += response.status_code == 304
+
+        print(f"\nBoard polling: {not_modified}/{args.polls} polls answered 304, "
+              f"{polled_bytes} body bytes vs {len(full.content) * args.polls} for full downloads")
+        if not_modified != args.polls:
+            print("[FAIL] Unchanged board polls should all return 304")
+            passed = False
+
+        api.print_latency_report()
+
+    return passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -3,7 +3,7 @@ Adaplio API - Data Integrity Tests
 Tests calculation accuracy for XP, levels, adherence, streaks, and aggregations
 """
 
-import requests
+from adaplio_client import get_client
 import json
 import time
 import random
@@ -11,6 +11,7 @@ import string
 from datetime import datetime, timedelta
 
 BASE_URL = "http://localhost:8080"
+api = get_client(BASE_URL)
 
 #Global tokens - will be set during setup
 CLIENT_TOKEN = None
@@ -49,7 +50,7 @@ def setup_test_environment():
     trainer_email = generate_unique_email()
     print(f"\n1. Registering trainer: {trainer_email}")
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/trainer/register",
         json={
             "email": trainer_email,
@@ -68,7 +69,7 @@ def setup_test_environment():
 
     # Step 2: Create grant code
     print("\n2. Creating grant code...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/trainer/grants",
         headers={"Authorization": f"Bearer {TRAINER_TOKEN}"},
         json={"expirationHours": 72}
@@ -86,7 +87,7 @@ def setup_test_environment():
     client_email = generate_unique_email()
     print(f"\n3. Registering client: {client_email}")
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/client/magic-link",
         json={"phoneOrEmail": client_email}
     )
@@ -110,7 +111,7 @@ def setup_test_environment():
     print(f"\n4. Verifying client...")
     verified = False
     for code in ["123456", "000000", "111111", "999999"]:
-        response = requests.post(
+        response = api.post(
             f"{BASE_URL}/auth/client/verify",
             json={"phoneOrEmail": client_email, "token": code}
         )
@@ -134,7 +135,7 @@ def setup_test_environment():
 
     # Step 5: Client accepts grant
     print(f"\n5. Establishing consent...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/client/grants/accept",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"},
         json={"grantCode": grant_code}
@@ -148,7 +149,7 @@ def setup_test_environment():
 
     # Step 6: Create template
     print(f"\n6. Creating plan template...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/trainer/templates",
         headers={"Authorization": f"Bearer {TRAINER_TOKEN}"},
         json={
@@ -188,7 +189,7 @@ def setup_test_environment():
 
     # Step 7: Create proposal
     print(f"\n7. Creating plan proposal...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/trainer/proposals",
         headers={"Authorization": f"Bearer {TRAINER_TOKEN}"},
         json={
@@ -209,7 +210,7 @@ def setup_test_environment():
 
     # Step 8: Client accepts proposal
     print(f"\n8. Client accepting proposal...")
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/client/proposals/{proposal_id}/accept",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"},
         json={"acceptAll": True}
@@ -242,7 +243,7 @@ def test_xp_calculations():
     total_tests = 0
 
     # Get initial gamification state
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/gamification",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -260,7 +261,7 @@ def test_xp_calculations():
     print(f"  Total XP: {initial_xp}")
 
     # Get exercise to complete
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/board",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -300,7 +301,7 @@ def test_xp_calculations():
         "notes": "XP calculation test"
     }
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/client/progress",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"},
         json=progress_data
@@ -311,7 +312,7 @@ def test_xp_calculations():
         return
 
     # Get updated gamification state
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/gamification",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -342,7 +343,7 @@ def test_xp_calculations():
 
     # Test 2: Verify XP awards are logged
     total_tests += 1
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/progress/week",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -371,7 +372,7 @@ def test_level_progression():
     total_tests = 0
 
     # Get current gamification state
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/gamification",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -454,7 +455,7 @@ def test_adherence_calculations():
     total_tests = 0
 
     # Get progress summary
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/progress/summary",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -507,7 +508,7 @@ def test_adherence_calculations():
 
     # Test 3: Get weekly adherence details
     total_tests += 1
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/progress/week",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -537,7 +538,7 @@ def test_streak_calculations():
     total_tests = 0
 
     # Get gamification state
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/gamification",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -574,7 +575,7 @@ def test_streak_calculations():
     total_tests += 1
 
     # Get exercise to complete
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/board",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -599,14 +600,14 @@ def test_streak_calculations():
                 "notes": "Streak test"
             }
 
-            response = requests.post(
+            response = api.post(
                 f"{BASE_URL}/api/client/progress",
                 headers={"Authorization": f"Bearer {CLIENT_TOKEN}"},
                 json=progress_data
             )
 
             # Get updated streak
-            response = requests.get(
+            response = api.get(
                 f"{BASE_URL}/api/client/gamification",
                 headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
             )
@@ -651,7 +652,7 @@ def test_weekly_aggregations():
     total_tests = 0
 
     # Get weekly progress data
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/progress/week",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -751,7 +752,7 @@ def test_progress_event_integrity():
     total_tests = 0
 
     # Get exercise board
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/board",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -794,7 +795,7 @@ def test_progress_event_integrity():
         "notes": "Data integrity test"
     }
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/client/progress",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"},
         json=progress_data
@@ -817,7 +818,7 @@ def test_progress_event_integrity():
 
     # Test 3: Verify progress appears in weekly summary
     total_tests += 1
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/progress/week",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -834,7 +835,7 @@ def test_progress_event_integrity():
 
     # Test 4: Verify progress summary updated
     total_tests += 1
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/progress/summary",
         headers={"Authorization": f"Bearer {CLIENT_TOKEN}"}
     )
@@ -854,6 +855,113 @@ def test_progress_event_integrity():
     print(f"\n{tests_passed}/{total_tests} progress event integrity tests passed")
     return tests_passed, total_tests
 
+# ============================================================================
+# Test Suite 7: Batch Progress Logging
+# ============================================================================
+
+def test_batch_progress_logging():
+    """
+    Test the batch progress endpoint used for offline sync
+    Expected: One request logs every event, XP matches the per-item results
+    """
+    print_section("TEST SUITE 7: Batch Progress Logging")
+
+    tests_passed = 0
+    total_tests = 0
+    headers = {"Authorization": f"Bearer {CLIENT_TOKEN}"}
+
+    response = api.get(f"{BASE_URL}/api/client/board", headers=headers)
+    if response.status_code != 200:
+        print_test("Load exercise board", False, f"Status: {response.status_code}")
+        return 0, 0
+
+    cards = [card for day in response.json().get('days', []) for card in day.get('exercises', [])]
+    if not cards:
+        print_test("Load exercises for batch test", False, "No exercises on board")
+        return 0, 0
+
+    response = api.get(f"{BASE_URL}/api/client/gamification", headers=headers)
+    xp_before = response.json().get('xpTotal', 0) if response.status_code == 200 else 0
+
+    # A week of offline logs, oldest first
+    now = datetime.utcnow()
+    events = []
+    for offset, card in enumerate(cards[:7]):
+        events.append({
+            "exerciseInstanceId": card['exerciseInstanceId'],
+            "eventType": "exercise_completed",
+            "setsCompleted": card.get('targetSets') or 1,
+            "repsCompleted": card.get('targetReps') or 1,
+            "holdSecondsCompleted": card.get('holdSeconds') or 0,
+            "painLevel": 2,
+            "difficultyRating": 4,
+            "notes": "Batch sync test",
+            "loggedAt": (now - timedelta(days=len(cards[:7]) - 1 - offset)).isoformat() + "Z"
+        })
+
+    # Test 1: Batch is accepted in one round trip
+    total_tests += 1
+    response = api.post(f"{BASE_URL}/api/client/progress/batch", headers=headers, json={"events": events})
+
+    if response.status_code != 200:
+        print_test("Log progress batch", False, f"Status: {response.status_code}")
+        return tests_passed, total_tests
+
+    result = response.json()
+    tests_passed += 1
+    print_test("Log progress batch", True, f"{result.get('loggedCount')} events logged")
+
+    # Test 2: One result per event, in request order
+    total_tests += 1
+    items = result.get('results', [])
+    if [item.get('index') for item in items] == list(range(len(events))):
+        tests_passed += 1
+        print_test("Batch returns per-item results in order", True)
+    else:
+        print_test("Batch returns per-item results in order", False, f"{len(items)} results for {len(events)} events")
+
+    # Test 3: Total XP equals the sum of per-item celebrations
+    total_tests += 1
+    item_xp = sum((item.get('celebration') or {}).get('xpAwarded', 0) for item in items)
+    if item_xp == result.get('totalXpAwarded') and item_xp == 25 * len(events):
+        tests_passed += 1
+        print_test("Batch XP matches per-item awards", True, f"{item_xp} XP")
+    else:
+        print_test("Batch XP matches per-item awards", False,
+                   f"items={item_xp}, total={result.get('totalXpAwarded')}, expected={25 * len(events)}")
+
+    # Test 4: Gamification total moved by exactly the awarded XP
+    total_tests += 1
+    response = api.get(f"{BASE_URL}/api/client/gamification", headers=headers)
+    xp_after = response.json().get('xpTotal', 0) if response.status_code == 200 else 0
+    if xp_after - xp_before == result.get('totalXpAwarded'):
+        tests_passed += 1
+        print_test("Gamification total reflects batch", True, f"{xp_before} -> {xp_after}")
+    else:
+        print_test("Gamification total reflects batch", False, f"{xp_before} -> {xp_after}")
+
+    # Test 5: An inaccessible exercise rejects the whole batch
+    total_tests += 1
+    bad_events = [dict(events[0], exerciseInstanceId=999999999)]
+    response = api.post(f"{BASE_URL}/api/client/progress/batch", headers=headers, json={"events": bad_events})
+    if response.status_code == 404:
+        tests_passed += 1
+        print_test("Batch with foreign exercise is rejected", True)
+    else:
+        print_test("Batch with foreign exercise is rejected", False, f"Status: {response.status_code}")
+
+    # Test 6: Empty batch is a validation error
+    total_tests += 1
+    response = api.post(f"{BASE_URL}/api/client/progress/batch", headers=headers, json={"events": []})
+    if response.status_code == 400:
+        tests_passed += 1
+        print_test("Empty batch is rejected", True)
+    else:
+        print_test("Empty batch is rejected", False, f"Status: {response.status_code}")
+
+    print(f"\n{tests_passed}/{total_tests} batch progress tests passed")
+    return tests_passed, total_tests
+
 # ============================================================================
 # Main Test Runner
 # ============================================================================
@@ -886,7 +994,8 @@ def run_all_integrity_tests():
         ("Adherence Percentages", test_adherence_calculations),
         ("Streak Calculations", test_streak_calculations),
         ("Weekly Aggregations", test_weekly_aggregations),
-        ("Progress Event Integrity", test_progress_event_integrity)
+        ("Progress Event Integrity", test_progress_event_integrity),
+        ("Batch Progress Logging", test_batch_progress_logging)
     ]
 
     results = []
@@ -928,3 +1037,4 @@ def run_all_integrity_tests():
 
 if __name__ == "__main__":
     run_all_integrity_tests()
+    api.print_latency_report()
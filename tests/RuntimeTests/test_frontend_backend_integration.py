@@ -4,12 +4,13 @@ Verifies that all frontend pages can successfully communicate with backend API
 Tests that the workflows tested in backend are accessible from frontend
 """
 
-import requests
+from adaplio_client import get_client
 import json
 import time
 
 FRONTEND_URL = "http://localhost:5000"
 API_URL = "http://localhost:8080"
+api = get_client(API_URL)
 
 def print_section(title):
     print(f"\n{'='*80}")
@@ -37,7 +38,7 @@ def test_frontend_backend_connectivity():
     total_tests += 1
     print("\n1. Testing frontend is running...")
     try:
-        response = requests.get(f"{FRONTEND_URL}/", timeout=5)
+        response = api.get(f"{FRONTEND_URL}/", timeout=5)
         if response.status_code == 200:
             tests_passed += 1
             print_test("Frontend accessible", True, f"{FRONTEND_URL}")
@@ -51,7 +52,7 @@ def test_frontend_backend_connectivity():
     total_tests += 1
     print("\n2. Testing backend API is running...")
     try:
-        response = requests.get(f"{API_URL}/health", timeout=5)
+        response = api.get(f"{API_URL}/health", timeout=5)
         if response.status_code == 200:
             tests_passed += 1
             print_test("Backend API accessible", True, f"{API_URL}")
@@ -67,7 +68,7 @@ def test_frontend_backend_connectivity():
     try:
         # Make a request with Origin header (simulating frontend)
         headers = {"Origin": FRONTEND_URL}
-        response = requests.options(f"{API_URL}/health", headers=headers, timeout=5)
+        response = api.options(f"{API_URL}/health", headers=headers, timeout=5)
 
         # Check for CORS headers
         cors_header = response.headers.get("Access-Control-Allow-Origin")
@@ -161,7 +162,7 @@ def test_workflow_pages_exist():
         for route, description in workflow['pages']:
             url = f"{FRONTEND_URL}{route}"
             try:
-                response = requests.get(url, timeout=5, allow_redirects=False)
+                response = api.get(url, timeout=5, allow_redirects=False)
 
                 if response.status_code == 200:
                     print(f"  [OK] {description} - {route}")
@@ -223,9 +224,9 @@ def test_api_endpoints_reachable():
 
         try:
             if method == "GET":
-                response = requests.get(url, timeout=5)
+                response = api.get(url, timeout=5)
             elif method == "POST":
-                response = requests.post(url, json={}, timeout=5)
+                response = api.post(url, json={}, timeout=5)
 
             # For endpoints requiring auth, 401 is expected and OK
             # For health check, 200 is expected
@@ -300,11 +301,11 @@ def test_page_api_mappings():
 
         try:
             # Check page exists
-            page_response = requests.get(page_url, timeout=5, allow_redirects=False)
+            page_response = api.get(page_url, timeout=5, allow_redirects=False)
             page_exists = page_response.status_code == 200
 
             # Check API endpoint exists
-            api_response = requests.get(api_url, timeout=5)
+            api_response = api.get(api_url, timeout=5)
             # Any status except 404 means endpoint exists
             api_exists = api_response.status_code != 404
 
@@ -384,3 +385,4 @@ def run_all_integration_tests():
 
 if __name__ == "__main__":
     run_all_integration_tests()
+    api.print_latency_report()
@@ -4,12 +4,14 @@ Tests all frontend pages are accessible and routes work correctly
 """
 
 import requests
+from adaplio_client import get_client
 from bs4 import BeautifulSoup
 import time
 
 # Frontend configuration
 FRONTEND_URL = "http://localhost:5000"  # Default Blazor dev port
 API_URL = "http://localhost:8080"
+api = get_client(API_URL)
 
 def print_section(title):
     print(f"\n{'='*80}")
@@ -100,7 +102,7 @@ def test_route_accessibility():
             url = f"{FRONTEND_URL}{route}"
 
             try:
-                response = requests.get(url, allow_redirects=False, timeout=10)
+                response = api.get(url, allow_redirects=False, timeout=10)
                 status = response.status_code
 
                 if status == 200:
@@ -146,7 +148,7 @@ def test_blazor_app_loads():
 
     try:
         print(f"\n1. Testing if Blazor app loads at {url}...")
-        response = requests.get(url, timeout=10)
+        response = api.get(url, timeout=10)
 
         print_test("Home page loads", response.status_code, 200)
 
@@ -175,7 +177,7 @@ def test_blazor_app_loads():
             for file_path in framework_files:
                 file_url = f"{FRONTEND_URL}{file_path}"
                 try:
-                    file_response = requests.get(file_url, timeout=5)
+                    file_response = api.get(file_url, timeout=5)
                     print_test(f"Framework file: {file_path}", file_response.status_code, 200)
                 except:
                     print(f"[FAIL] Cannot access {file_path}")
@@ -201,7 +203,7 @@ def test_api_configuration():
 
     try:
         print(f"\n1. Checking API configuration...")
-        response = requests.get(url, timeout=5)
+        response = api.get(url, timeout=5)
 
         if response.status_code == 200:
             config = response.json()
@@ -261,7 +263,7 @@ def test_navigation_flow():
         for route, step_name in flow['steps']:
             url = f"{FRONTEND_URL}{route}"
             try:
-                response = requests.get(url, timeout=5, allow_redirects=False)
+                response = api.get(url, timeout=5, allow_redirects=False)
                 print_test(f"  {step_name}", response.status_code)
             except:
                 print(f"[ERROR] Cannot access {step_name}")
@@ -319,3 +321,4 @@ def run_all_frontend_tests():
 
 if __name__ == "__main__":
     run_all_frontend_tests()
+    api.print_latency_report()
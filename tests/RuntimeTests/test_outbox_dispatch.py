@@ -0,0 +1,242 @@
+"""
+Adaplio API - Outbox Dispatch
+Runs a local stand-in for the email and SMS providers (Resend's POST /emails and Twilio's Messages resource)
+and times POST /auth/client/magic-link while the stand-in answers at once, then while it takes
+--provider-delay seconds per email. The magic link and its email are saved together and OutboxDispatcher
+sends the email afterwards, so request latency must not follow the provider's. Also checks the stand-in
+received every email, never more than --max-concurrency at a time, and that emails it refuses once (503)
+are retried until delivered.
+
+The API must run in Development with Resend pointed at the stand-in:
+    Resend__ApiKey=stand-in Resend__BaseUrl=http://localhost:5199 dotnet run
+
+Usage:
+    python test_outbox_dispatch.py --provider-port 5199 --requests 20 --provider-delay 2
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL, percentile
+import bench
+import fixtures
+
+MAGIC_LINK_PATH = "/auth/client/magic-link"
+STATS_PATH = "/api/dev/diagnostics/outbox"
+
+
+class ProviderStandIn(ThreadingHTTPServer):
+    """
+    Accepts messages like Resend and Twilio after `delay` seconds. While `refuse_first` is set, the first
+    attempt for each recipient gets 503 so the dispatcher has to retry it.
+    """
+    daemon_threads = True
+
+    def __init__(self, port):
+        super().__init__(("0.0.0.0", port), StandInHandler)
+        self.lock = threading.Lock()
+        self.delay = 0.0
+        self.refuse_first = False
+        self.attempts = Counter()
+        self.delivered = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def receive(self, recipient):
+        with self.lock:
+            self.attempts[recipient] += 1
+            refuse = self.refuse_first and self.attempts[recipient] == 1
+            delay = self.delay
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(delay)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+                if not refuse:
+                    self.delivered.setdefault(recipient, time.time())
+        return not refuse
+
+    def configure(self, delay=0.0, refuse_first=False):
+        with self.lock:
+            self.delay = delay
+            self.refuse_first = refuse_first
+            self.max_in_flight = self.in_flight
+
+    def missing(self, recipients):
+        with self.lock:
+            return [r for r in recipients if r not in self.delivered]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.rstrip("/").endswith("/emails"):
+            recipient = json.loads(body)["to"][0]
+        elif self.path.endswith("/Messages.json"):
+            recipient = parse_qs(body.decode())["To"][0]
+        else:
+            self.reply(404, {"message": f"stand-in has no {self.path}"})
+            return
+
+        if self.server.receive(recipient):
+            self.reply(200, {"id": str(uuid.uuid4()), "sid": f"SM{uuid.uuid4().hex}", "status": "queued"})
+        else:
+            self.reply(503, {"message": "stand-in refused the first attempt"})
+
+    def reply(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def request_magic_links(api, count, warmup=0):
+    """Times `count` magic link requests; returns (samples_ms, errors, {email: request finished at})"""
+    emails = (fixtures.unique_email("outbox") for _ in itertools.count())
+    sent = {}
+
+    def call():
+        email = next(emails)
+        response = api.post(MAGIC_LINK_PATH, json={"email": email}, headers=fixtures.unique_ip_headers())
+        sent[email] = time.time()
+        return response
+
+    samples, errors, _ = bench.measure(call, count, warmup)
+    return samples, errors, sent
+
+
+def wait_for_delivery(stand_in, recipients, timeout):
+    deadline = time.time() + timeout
+    missing = stand_in.missing(recipients)
+    while missing and time.time() < deadline:
+        time.sleep(0.2)
+        missing = stand_in.missing(recipients)
+    return missing
+
+
+def delivery_lag_ms(stand_in, sent):
+    with stand_in.lock:
+        return [(stand_in.delivered[email] - at) * 1000 for email, at in sent.items() if email in stand_in.delivered]
+
+
+def outbox_counts(api):
+    counts = Counter()
+    for row in fixtures.expect(api.get(STATS_PATH), "Outbox diagnostics")["counts"]:
+        counts[(row["provider"], row["status"])] += row["count"]
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio outbox dispatch test")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--provider-port", type=int, default=5199, help="port the API's Resend:BaseUrl points at")
+    parser.add_argument("--requests", type=int, default=20, help="magic links per phase")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--provider-delay", type=float, default=2.0, help="seconds the slow provider takes per email")
+    parser.add_argument("--retry-requests", type=int, default=5, help="magic links whose first send is refused")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="Outbox:Concurrency:resend on the API")
+    parser.add_argument("--max-delta-ms", type=float, default=100.0,
+                        help="how much magic link p95 may rise while the provider is slow")
+    parser.add_argument("--delivery-timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO OUTBOX DISPATCH TEST")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+    print(f"Provider stand-in on port {args.provider_port}")
+
+    stand_in = ProviderStandIn(args.provider_port)
+    threading.Thread(target=stand_in.serve_forever, daemon=True).start()
+
+    results = {}
+    lags = {}
+    passed = True
+    try:
+        with ApiClient(args.base_url) as api:
+            before = outbox_counts(api)
+
+            phases = [("provider instant", 0.0), (f"provider {args.provider_delay:g}s", args.provider_delay)]
+            for label, delay in phases:
+                print(f"\nMagic links with the {label}...")
+                stand_in.configure(delay=delay)
+                samples, errors, sent = request_magic_links(api, args.requests, args.warmup)
+                missing = wait_for_delivery(stand_in, list(sent), args.delivery_timeout)
+                results[f"POST {MAGIC_LINK_PATH} ({label})"] = bench.summarize(samples, errors)
+                lags[label] = delivery_lag_ms(stand_in, sent)
+                print(f"  delivered {len(sent) - len(missing)}/{len(sent)}, "
+                      f"at most {stand_in.max_in_flight} sends in flight")
+
+                if len(missing) == len(sent):
+                    print("[FAIL] The stand-in received nothing; is the API running with "
+                          f"Resend__ApiKey set and Resend__BaseUrl=http://localhost:{args.provider_port}?")
+                    return False
+                if missing:
+                    print(f"[FAIL] {len(missing)} emails never reached the provider")
+                    passed = False
+                if stand_in.max_in_flight > args.max_concurrency:
+                    print(f"[FAIL] {stand_in.max_in_flight} concurrent sends, limit is {args.max_concurrency}")
+                    passed = False
+
+            print("\nMagic links whose first send is refused...")
+            stand_in.configure(refuse_first=True)
+            _, retry_errors, retry_sent = request_magic_links(api, args.retry_requests)
+            missing = wait_for_delivery(stand_in, list(retry_sent), args.delivery_timeout)
+            attempts = [stand_in.attempts[email] for email in retry_sent]
+            print(f"  delivered {len(retry_sent) - len(missing)}/{len(retry_sent)} after {sum(attempts)} attempts")
+            lags["first send refused"] = delivery_lag_ms(stand_in, retry_sent)
+
+            if retry_errors or missing or any(count < 2 for count in attempts):
+                print("[FAIL] Refused emails were not retried until delivered")
+                passed = False
+
+            after = outbox_counts(api)
+    finally:
+        stand_in.shutdown()
+
+    bench.print_results(results, title="MAGIC LINK LATENCY")
+
+    print(f"\n{'Delivery lag':<24} {'p50 ms':>9} {'p95 ms':>9}")
+    for label, values in lags.items():
+        if values:
+            print(f"{label:<24} {percentile(values, 50):>9.0f} {percentile(values, 95):>9.0f}")
+
+    sent_count = after[("resend", "sent")] - before[("resend", "sent")]
+    failed_count = after[("resend", "failed")] - before[("resend", "failed")]
+    print(f"\nOutbox: {sent_count} resend messages sent during the run, {failed_count} given up on")
+
+    fast, slow = results.values()
+    if any(r["errors"] for r in results.values()):
+        print("[FAIL] Some magic link requests failed")
+        passed = False
+    elif slow["p95_ms"] - fast["p95_ms"] > args.max_delta_ms:
+        print(f"[FAIL] Magic link p95 rose {slow['p95_ms'] - fast['p95_ms']:.0f}ms with a "
+              f"{args.provider_delay * 1000:.0f}ms provider")
+        passed = False
+    else:
+        print(f"[PASS] Magic link p95 {fast['p95_ms']:.0f}ms vs {slow['p95_ms']:.0f}ms with a "
+              f"{args.provider_delay * 1000:.0f}ms provider")
+    if failed_count:
+        print(f"[FAIL] {failed_count} emails were given up on")
+        passed = False
+
+    return passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,126 @@
+"""
+Adaplio API - Rate Limits Across Instances
+Sends concurrent requests split evenly over two API instances and checks the global_ip limit in
+SecurityRateLimitingMiddleware holds for the pair, not per instance. Both instances must share
+the rate limit store (RATE_LIMIT_REDIS pointing at the same Redis, e.g. the docker-compose one);
+with the in-memory store each instance grants the full limit and the checks fail.
+
+Each request carries a unique X-Real-IP so the per-instance AspNetCoreRateLimit rules do not
+interfere, and a fixed X-Forwarded-For that SecurityRateLimitingMiddleware keys on.
+
+The per-user rules are not checked: the middleware runs before authentication, so it never sees a user.
+
+Development raises global_ip (appsettings.Development.json), so start the instances with the production
+limit or pass the configured one with --global-ip-limit.
+
+Usage:
+    export RateLimiting__Rules__global_ip__MaxRequests=500
+    RATE_LIMIT_REDIS=localhost:6379 ASPNETCORE_URLS=http://localhost:8080 dotnet run
+    RATE_LIMIT_REDIS=localhost:6379 ASPNETCORE_URLS=http://localhost:8081 dotnet run
+    python test_rate_limit_cluster.py --instance-a http://localhost:8080 --instance-b http://localhost:8081
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+
+# Production default of RateLimiting:Rules:global_ip in appsettings.json: 500 requests per minute per IP
+GLOBAL_IP_LIMIT = 500
+
+_real_ips = itertools.count()
+
+
+def unique_real_ip():
+    index = next(_real_ips)
+    return f"100.{64 + index // 62500 % 64}.{index // 250 % 250}.{index % 250 + 1}"
+
+
+def burst(clients, path, forwarded_ip, total, workers):
+    """
+    Sends `total` requests round-robin over `clients`.
+    Returns (accepted per instance, rejected by category, rejected without category)
+    """
+    def call(index):
+        instance = index % len(clients)
+        response = clients[instance].get(path, headers={
+            "X-Forwarded-For": forwarded_ip,
+            "X-Real-IP": unique_real_ip()
+        })
+        return instance, response
+
+    accepted = Counter()
+    rejected = Counter()
+    uncategorized = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for instance, response in pool.map(call, range(total)):
+            if response.status_code != 429:
+                accepted[instance] += 1
+            elif response.headers.get("X-Rate-Limit-Category"):
+                rejected[response.headers["X-Rate-Limit-Category"]] += 1
+            else:
+                uncategorized += 1
+    return accepted, rejected, uncategorized
+
+
+def check_limit(name, category, limit, accepted, rejected, uncategorized):
+    total_accepted = sum(accepted.values())
+    per_instance = ", ".join(f"instance {'AB'[i]}: {accepted[i]}" for i in sorted(accepted))
+    print(f"  {name}: {total_accepted} accepted ({per_instance}), "
+          f"rejected {dict(rejected)}, {uncategorized} rejected by the per-instance IP limiter")
+
+    passed = True
+    if total_accepted != limit:
+        print(f"[FAIL] {name}: expected exactly {limit} accepted across both instances, got {total_accepted}")
+        passed = False
+    if set(rejected) - {category}:
+        print(f"[FAIL] {name}: unexpected rejection categories {sorted(rejected)}")
+        passed = False
+    if uncategorized:
+        print(f"[FAIL] {name}: {uncategorized} requests hit AspNetCoreRateLimit instead of {category}")
+        passed = False
+    if len(accepted) < 2:
+        print(f"[FAIL] {name}: only one instance accepted requests")
+        passed = False
+    if passed:
+        print(f"[PASS] {name}: {category} limit of {limit} held across instances")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio rate limits across two API instances")
+    parser.add_argument("--instance-a", default=DEFAULT_BASE_URL)
+    parser.add_argument("--instance-b", default=os.environ.get("API_TEST_URL_B", "http://localhost:8081"))
+    parser.add_argument("--overshoot", type=float, default=1.5, help="requests sent as a multiple of the limit")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--global-ip-limit", type=int, default=GLOBAL_IP_LIMIT,
+                        help="RateLimiting:Rules:global_ip:MaxRequests on the instances")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO RATE LIMITS ACROSS INSTANCES")
+    print("=" * 60)
+    print(f"Instance A: {args.instance_a}")
+    print(f"Instance B: {args.instance_b}")
+
+    run = random.randint(0, 255)
+    passed = True
+
+    with ApiClient(args.instance_a, pool_connections=args.workers, pool_maxsize=args.workers) as api_a, \
+            ApiClient(args.instance_b, pool_connections=args.workers, pool_maxsize=args.workers) as api_b:
+        clients = [api_a, api_b]
+
+        print(f"\nAnonymous burst from one IP (global_ip, {args.global_ip_limit}/min)...")
+        results = burst(clients, "/", f"198.18.{run}.1", int(args.global_ip_limit * args.overshoot), args.workers)
+        passed &= check_limit("Anonymous IP", "global_ip", args.global_ip_limit, *results)
+
+    return passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,141 @@
+"""
+Adaplio API - Refresh Token Rotation Race Test
+Logs in a cohort of seeded trainers, then for several rounds has every session fire a burst of concurrent
+POST /auth/refresh calls that all present the same refresh token. Rotation is one conditional update, so
+exactly one call per burst may win (200) and every other must get 401; the winner's token carries the session
+into the next round. Finally replays every spent token (all must be rejected) and checks each session's last
+access token still authenticates.
+
+Usage:
+    python test_refresh_race.py --sessions 20 --racers 8 --rounds 5
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+SEED_PATH = "/api/dev/seed/bulk"
+SEED_PASSWORD = "BulkSeed123!"
+
+
+def trainer_email(seed, trainer):
+    # Mirrors BulkSeeder.TrainerEmail for batch 0
+    return f"bulk-s{seed}-b0-t{trainer}@bulk.adaplio.local"
+
+
+def login(api, email):
+    data = fixtures.expect(api.post("/auth/trainer/login", headers=fixtures.unique_ip_headers(),
+                                    json={"email": email, "password": SEED_PASSWORD}), "Trainer login")
+    return data["refreshToken"]
+
+
+def refresh(api, refresh_token):
+    # The API reads the token from its cookie, which it sets Secure; send it explicitly so plain http works.
+    # Cookie values are URL-encoded by ASP.NET Core, so encode to match.
+    start = time.perf_counter()
+    response = api.post("/auth/refresh", headers=fixtures.unique_ip_headers(),
+                        cookies={"refresh_token": quote(refresh_token, safe="")})
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    data = response.json() if response.status_code == 200 else None
+    return elapsed_ms, response.status_code, data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio refresh token rotation race test")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--seed", type=int, default=int(time.time()) % 1_000_000,
+                        help="bulk seed; defaults to a fresh one per run")
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent sessions (seeded trainers)")
+    parser.add_argument("--racers", type=int, default=8, help="concurrent refreshes per session per round")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.sessions > 500:
+        parser.error("--sessions must be at most 500 (one bulk seed batch)")
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO REFRESH TOKEN ROTATION RACE TEST")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    workers = args.sessions * args.racers
+    passed = True
+    samples = []
+    errors = 0
+    spent = []
+
+    with ApiClient(args.base_url, pool_connections=workers, pool_maxsize=workers) as api:
+        print(f"\nSeeding and logging in {args.sessions} trainers (seed {args.seed})...")
+        fixtures.expect(api.post(SEED_PATH, json={
+            "seed": args.seed,
+            "trainers": args.sessions,
+            "clientsPerTrainer": 0,
+            "weeks": 1,
+        }), "Bulk seed", expected=(200, 409))
+        with ThreadPoolExecutor(max_workers=min(args.sessions, 16)) as pool:
+            tokens = list(pool.map(lambda t: login(api, trainer_email(args.seed, t)), range(args.sessions)))
+        access_tokens = [None] * args.sessions
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for round_number in range(1, args.rounds + 1):
+                bursts = [[pool.submit(refresh, api, token) for _ in range(args.racers)] for token in tokens]
+
+                double_rotations = lost_sessions = 0
+                for session, futures in enumerate(bursts):
+                    outcomes = [future.result() for future in futures]
+                    winners = [data for _, status, data in outcomes if status == 200]
+                    rejected = sum(1 for _, status, _ in outcomes if status == 401)
+                    errors += len(outcomes) - len(winners) - rejected
+                    samples.extend(ms for ms, status, _ in outcomes if status == 200)
+
+                    spent.append(tokens[session])
+                    if len(winners) > 1:
+                        double_rotations += 1
+                    if not winners:
+                        lost_sessions += 1
+                        continue
+                    tokens[session] = winners[0]["refreshToken"]
+                    access_tokens[session] = winners[0]["token"]
+
+                status = "OK" if double_rotations == 0 and lost_sessions == 0 else "FAIL"
+                print(f"  round {round_number}: {args.sessions} sessions x {args.racers} racers - "
+                      f"{double_rotations} double rotations, {lost_sessions} sessions without a winner [{status}]")
+                if status == "FAIL":
+                    passed = False
+
+            print(f"\nReplaying {len(spent)} spent refresh tokens...")
+            replays = list(pool.map(lambda token: refresh(api, token)[1], spent))
+            accepted_replays = sum(1 for status in replays if status == 200)
+            if accepted_replays:
+                print(f"[FAIL] {accepted_replays} spent refresh tokens were accepted again")
+                passed = False
+            else:
+                print("[PASS] Every spent refresh token was rejected")
+
+            live = [token for token in access_tokens if token]
+            me_statuses = list(pool.map(lambda token: api.get("/auth/me", headers={
+                **fixtures.unique_ip_headers(), "Authorization": f"Bearer {token}"}).status_code, live))
+            if live and all(status == 200 for status in me_statuses):
+                print(f"[PASS] All {len(live)} rotated access tokens authenticate")
+            else:
+                print(f"[FAIL] {sum(1 for status in me_statuses if status != 200)} rotated access tokens were rejected")
+                passed = False
+
+    results = {"POST /auth/refresh (winning rotations)": bench.summarize(samples, errors)}
+    bench.print_results(results, title="REFRESH ROTATION")
+    if errors:
+        print(f"[FAIL] {errors} refreshes failed with something other than 200 or 401")
+        passed = False
+
+    print("\n" + ("[PASS] No double rotations" if passed else "[FAIL] Refresh rotation race test failed"))
+    return passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -3,13 +3,14 @@ Adaplio API - Test Remaining Endpoints
 Tests the untested endpoints: auth/refresh, weekly-board, auth/role, onboarding, sms, token
 """
 
-import requests
+from adaplio_client import get_client
 import json
 import time
 import random
 import string
 
 BASE_URL = "http://localhost:8080"
+api = get_client(BASE_URL)
 
 def print_section(title):
     print(f"\n{'='*80}")
@@ -41,7 +42,7 @@ def test_token_refresh():
     email = generate_unique_email()
     print(f"\n1. Registering trainer: {email}")
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/trainer/register",
         json={
             "email": email,
@@ -73,7 +74,7 @@ def test_token_refresh():
     # Set refresh token as cookie
     cookies = {"refresh_token": refresh_token}
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/refresh",
         cookies=cookies
     )
@@ -91,7 +92,7 @@ def test_token_refresh():
         # Step 3: Verify new access token works
         print(f"\n3. Verifying new access token works...")
 
-        response = requests.get(
+        response = api.get(
             f"{BASE_URL}/auth/me",
             headers={"Authorization": f"Bearer {new_access_token}"}
         )
@@ -118,7 +119,7 @@ def test_weekly_board():
 
     # Register trainer
     trainer_email = generate_unique_email()
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/trainer/register",
         json={"email": trainer_email, "password": "SecurePass123!", "fullName": "Board Test"}
     )
@@ -131,7 +132,7 @@ def test_weekly_board():
     print_test("Setup trainer", 200, 200)
 
     # Create grant
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/trainer/grants",
         headers={"Authorization": f"Bearer {trainer_token}"},
         json={"expirationHours": 72}
@@ -145,7 +146,7 @@ def test_weekly_board():
 
     # Register client
     client_email = generate_unique_email()
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/client/magic-link",
         json={"phoneOrEmail": client_email}
     )
@@ -155,7 +156,7 @@ def test_weekly_board():
     # Verify client with common codes
     client_token = None
     for code in ["123456", "000000", "111111"]:
-        response = requests.post(
+        response = api.post(
             f"{BASE_URL}/auth/client/verify",
             json={"phoneOrEmail": client_email, "token": code}
         )
@@ -170,7 +171,7 @@ def test_weekly_board():
     print_test("Setup client", 200, 200)
 
     # Accept grant
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/client/grants/accept",
         headers={"Authorization": f"Bearer {client_token}"},
         json={"grantCode": grant_code}
@@ -181,7 +182,7 @@ def test_weekly_board():
     # Step 2: Test weekly-board endpoint
     print(f"\n2. Testing GET /api/client/weekly-board...")
 
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/api/client/weekly-board",
         headers={"Authorization": f"Bearer {client_token}"}
     )
@@ -209,7 +210,7 @@ def test_set_role():
     print(f"\n1. Creating user...")
 
     email = generate_unique_email()
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/trainer/register",
         json={
             "email": email,
@@ -226,7 +227,7 @@ def test_set_role():
     print_test("Register user", 200, 200)
 
     # Check current role
-    response = requests.get(
+    response = api.get(
         f"{BASE_URL}/auth/me",
         headers={"Authorization": f"Bearer {token}"}
     )
@@ -238,7 +239,7 @@ def test_set_role():
     # Step 2: Attempt to change role
     print(f"\n2. Attempting to set role to 'client'...")
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/role",
         headers={"Authorization": f"Bearer {token}"},
         json={"role": "client"}
@@ -248,7 +249,7 @@ def test_set_role():
 
     if response.status_code == 200:
         # Verify role changed
-        response = requests.get(
+        response = api.get(
             f"{BASE_URL}/auth/me",
             headers={"Authorization": f"Bearer {token}"}
         )
@@ -278,7 +279,7 @@ def test_onboarding():
     print(f"\n1. Registering client...")
 
     trainer_email = generate_unique_email()
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/trainer/register",
         json={"email": trainer_email, "password": "SecurePass123!", "fullName": "Onboarding Test"}
     )
@@ -300,7 +301,7 @@ def test_onboarding():
         "goals": "Improve flexibility and strength"
     }
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/client/onboarding",
         headers={"Authorization": f"Bearer {token}"},
         json=preferences
@@ -312,7 +313,7 @@ def test_onboarding():
         print(f"      Preferences saved successfully")
 
         # Verify preferences were saved
-        response = requests.get(
+        response = api.get(
             f"{BASE_URL}/api/me/profile",
             headers={"Authorization": f"Bearer {token}"}
         )
@@ -338,7 +339,7 @@ def test_sms_invite():
     print(f"\n1. Registering trainer...")
 
     email = generate_unique_email()
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/trainer/register",
         json={"email": email, "password": "SecurePass123!", "fullName": "SMS Test Trainer"}
     )
@@ -353,7 +354,7 @@ def test_sms_invite():
     # Step 2: Send SMS invite
     print(f"\n2. Sending SMS invite...")
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/invites/sms",
         headers={"Authorization": f"Bearer {token}"},
         json={
@@ -387,7 +388,7 @@ def test_invite_token():
     print(f"\n1. Registering trainer...")
 
     email = generate_unique_email()
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/auth/trainer/register",
         json={"email": email, "password": "SecurePass123!", "fullName": "Token Test Trainer"}
     )
@@ -402,7 +403,7 @@ def test_invite_token():
     # Step 2: Create invite token
     print(f"\n2. Creating invite token...")
 
-    response = requests.post(
+    response = api.post(
         f"{BASE_URL}/api/invites/token",
         headers={"Authorization": f"Bearer {token}"},
         json={"expiresInHours": 72}
@@ -479,3 +480,4 @@ def run_all_tests():
 
 if __name__ == "__main__":
     run_all_tests()
+    api.print_latency_report()
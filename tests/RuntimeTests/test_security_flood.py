@@ -0,0 +1,116 @@
+"""
+Adaplio API - Security Monitoring Flood Test
+Floods POST /auth/trainer/login with failed logins from many spoofed IPs (X-Forwarded-For /
+X-Real-IP), in waves, and times the logins in each wave. Security events are pre-aggregated per
+minute, so login latency should not grow with the number of events already recorded. Finishes
+with a focused burst from one IP and checks the brute force alert still fires.
+
+Usage:
+    python test_security_flood.py --waves 5 --ips-per-wave 200 --workers 16
+"""
+
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from adaplio_client import ApiClient, DEFAULT_BASE_URL
+import bench
+import fixtures
+
+ATTACKER_ATTEMPTS = 6  # Immediate brute force alert fires at 5 failures in 5 minutes
+
+
+def spoofed_headers(ip):
+    return {"X-Forwarded-For": ip, "X-Real-IP": ip}
+
+
+def failed_login(api, ip):
+    start = time.perf_counter()
+    response = api.post("/auth/trainer/login", headers=spoofed_headers(ip), json={
+        "email": f"flood_{ip.replace('.', '_')}@test.com",
+        "password": "WrongPassword123!"
+    })
+    return (time.perf_counter() - start) * 1000, response.status_code
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaplio security monitoring flood test")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--waves", type=int, default=5)
+    parser.add_argument("--ips-per-wave", type=int, default=200)
+    parser.add_argument("--attempts-per-ip", type=int, default=3, help="stay under the per-IP auth rate limit")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--max-growth", type=float, default=1.5,
+                        help="max allowed login p95 ratio between the last and first wave")
+    parser.add_argument("--min-delta-ms", type=float, default=bench.DEFAULT_MIN_DELTA_MS)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("  ADAPLIO SECURITY MONITORING FLOOD TEST")
+    print("=" * 60)
+    print(f"Testing API at: {args.base_url}")
+
+    started_at = datetime.now(timezone.utc)
+    run = random.randint(0, 255)
+    results = {}
+    passed = True
+
+    with ApiClient(args.base_url, pool_connections=args.workers, pool_maxsize=args.workers) as api:
+        print("\nRegistering trainer to read alerts and metrics...")
+        fixtures.register_trainer(api)
+
+        events = 0
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            for wave in range(args.waves):
+                first = wave * args.ips_per_wave
+                ips = [f"10.{run}.{index // 250 % 256}.{index % 250 + 1}"
+                       for index in range(first, first + args.ips_per_wave)]
+                calls = [ip for ip in ips for _ in range(args.attempts_per_ip)]
+                outcomes = list(pool.map(lambda ip: failed_login(api, ip), calls))
+
+                samples = [ms for ms, status in outcomes if status in (400, 401)]
+                errors = len(outcomes) - len(samples)
+                events += len(outcomes)
+                name = f"POST /auth/trainer/login wave {wave} @ {events} events"
+                results[name] = bench.summarize(samples, errors, eventsLogged=events)
+                print(f"  wave {wave}: {len(outcomes)} failed logins, "
+                      f"p95 {results[name].get('p95_ms', 0):.1f}ms, {errors} unexpected statuses")
+
+        attacker_ip = f"203.0.113.{run}"
+        print(f"\nBurst of {ATTACKER_ATTEMPTS} failed logins from {attacker_ip}...")
+        for _ in range(ATTACKER_ATTEMPTS):
+            failed_login(api, attacker_ip)
+
+        alerts = fixtures.expect(api.get("/api/security/alerts", role="trainer"), "Alerts")["data"]["alerts"]
+        metrics = fixtures.expect(api.get("/api/security/metrics", role="trainer", params={"hours": 1}),
+                                  "Metrics")["data"]
+
+    bench.print_results(results, None, "LOGIN LATENCY VS RECORDED SECURITY EVENTS")
+    passed &= bench.check_growth(results, args.max_growth, args.min_delta_ms, size_key="eventsLogged")
+
+    fresh = [a for a in alerts
+             if a["alertType"] == "immediate_brute_force"
+             and datetime.fromisoformat(a["timestamp"].replace("Z", "+00:00")) >= started_at]
+    if fresh:
+        print(f"[PASS] Brute force alert fired after the flood: {fresh[0]['message']}")
+    else:
+        print(f"[FAIL] No immediate_brute_force alert since {started_at.isoformat()} "
+              f"({len(alerts)} active alerts: {sorted({a['alertType'] for a in alerts})})")
+        passed = False
+
+    print(f"\nServer metrics (last hour): {metrics['totalEvents']} events, "
+          f"{metrics['failedAuthAttempts']} failed auth, ~{metrics['uniqueIpAddresses']} unique IPs")
+    if metrics["failedAuthAttempts"] >= events:
+        print(f"[PASS] All {events} flood attempts counted as failed auth")
+    else:
+        print(f"[FAIL] Expected at least {events} failed auth events, metrics report {metrics['failedAuthAttempts']}")
+        passed = False
+
+    return passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -1,4 +1,4 @@
-import requests
+from adaplio_client import get_client
 import json
 import time
 from datetime import datetime, timedelta
@@ -6,6 +6,7 @@ import random
 import string
 
 BASE_URL = "http://localhost:8080"
+api = get_client(BASE_URL)
 
 def print_section(title):
     print("\n" + "="*60)
@@ -50,7 +51,7 @@ def journey_1_client_first_exercise():
         trainer_email = generate_unique_email()
         trainer_password = "SecurePass123!"
 
-        response = requests.post(f"{BASE_URL}/auth/trainer/register", json={
+        response = api.post(f"{BASE_URL}/auth/trainer/register", json={
             "email": trainer_email,
             "password": trainer_password,
             "fullName": "Dr. Journey Tester",
@@ -69,9 +70,9 @@ def journey_1_client_first_exercise():
         print_detail(f"Trainer: {trainer_email}")
 
         # Create grant code
-        response = requests.post(f"{BASE_URL}/api/trainer/grants",
-                               headers={"Authorization": f"Bearer {trainer_token}"},
-                               json={"expirationHours": 72})
+        response = api.post(f"{BASE_URL}/api/trainer/grants",
+                          headers={"Authorization": f"Bearer {trainer_token}"},
+                          json={"expirationHours": 72})
 
         if response.status_code != 200:
             print_step(1, "Grant code creation", False)
@@ -89,8 +90,8 @@ def journey_1_client_first_exercise():
         print_step(2, "New client requests magic link")
 
         client_email = generate_unique_email()
-        response = requests.post(f"{BASE_URL}/auth/client/magic-link",
-                               json={"email": client_email})
+        response = api.post(f"{BASE_URL}/auth/client/magic-link",
+                          json={"email": client_email})
 
         if response.status_code != 200:
             print_step(2, "Magic link request", False)
@@ -123,9 +124,9 @@ def journey_1_client_first_exercise():
         # STEP 4: Client accepts trainer's grant code
         print_step(4, "Client accepts trainer invitation")
 
-        response = requests.post(f"{BASE_URL}/api/client/grants/accept",
-                               headers={"Authorization": f"Bearer {client_token}"},
-                               json={"grantCode": grant_code})
+        response = api.post(f"{BASE_URL}/api/client/grants/accept",
+                          headers={"Authorization": f"Bearer {client_token}"},
+                          json={"grantCode": grant_code})
 
         if response.status_code != 200:
             print_step(4, "Grant acceptance", False)
@@ -174,9 +175,9 @@ def journey_1_client_first_exercise():
             ]
         }
 
-        response = requests.post(f"{BASE_URL}/api/trainer/templates",
-                               headers={"Authorization": f"Bearer {trainer_token}"},
-                               json=template_data)
+        response = api.post(f"{BASE_URL}/api/trainer/templates",
+                          headers={"Authorization": f"Bearer {trainer_token}"},
+                          json=template_data)
 
         if response.status_code not in [200, 201]:
             print_step(5, "Template creation", False)
@@ -202,9 +203,9 @@ def journey_1_client_first_exercise():
             "message": "Here's your personalized recovery plan. Let's start gentle!"
         }
 
-        response = requests.post(f"{BASE_URL}/api/trainer/proposals",
-                               headers={"Authorization": f"Bearer {trainer_token}"},
-                               json=proposal_data)
+        response = api.post(f"{BASE_URL}/api/trainer/proposals",
+                          headers={"Authorization": f"Bearer {trainer_token}"},
+                          json=proposal_data)
 
         if response.status_code not in [200, 201]:
             print_step(6, "Plan proposal", False)
@@ -222,8 +223,8 @@ def journey_1_client_first_exercise():
         # STEP 7: Client views proposals
         print_step(7, "Client checks their proposals")
 
-        response = requests.get(f"{BASE_URL}/api/client/proposals",
-                              headers={"Authorization": f"Bearer {client_token}"})
+        response = api.get(f"{BASE_URL}/api/client/proposals",
+                         headers={"Authorization": f"Bearer {client_token}"})
 
         if response.status_code != 200:
             print_step(7, "View proposals", False)
@@ -238,9 +239,9 @@ def journey_1_client_first_exercise():
         # STEP 8: Client accepts the proposal
         print_step(8, "Client accepts the plan")
 
-        response = requests.post(f"{BASE_URL}/api/client/proposals/{proposal_id}/accept",
-                               headers={"Authorization": f"Bearer {client_token}"},
-                               json={"acceptAll": True})
+        response = api.post(f"{BASE_URL}/api/client/proposals/{proposal_id}/accept",
+                          headers={"Authorization": f"Bearer {client_token}"},
+                          json={"acceptAll": True})
 
         if response.status_code != 200:
             print_step(8, "Accept proposal", False)
@@ -259,8 +260,8 @@ def journey_1_client_first_exercise():
         # STEP 9: Client views their exercise board
         print_step(9, "Client opens their exercise board")
 
-        response = requests.get(f"{BASE_URL}/api/client/board",
-                              headers={"Authorization": f"Bearer {client_token}"})
+        response = api.get(f"{BASE_URL}/api/client/board",
+                         headers={"Authorization": f"Bearer {client_token}"})
 
         if response.status_code != 200:
             print_step(9, "View board", False)
@@ -300,9 +301,9 @@ def journey_1_client_first_exercise():
             "notes": "Felt great! Ready for more."
         }
 
-        response = requests.post(f"{BASE_URL}/api/client/progress",
-                               headers={"Authorization": f"Bearer {client_token}"},
-                               json=progress_data)
+        response = api.post(f"{BASE_URL}/api/client/progress",
+                          headers={"Authorization": f"Bearer {client_token}"},
+                          json=progress_data)
 
         if response.status_code != 200:
             print_step(10, "Log exercise completion", False)
@@ -325,8 +326,8 @@ def journey_1_client_first_exercise():
         # STEP 11: Check updated gamification stats
         print_step(11, "Check updated progress and gamification")
 
-        response = requests.get(f"{BASE_URL}/api/client/gamification",
-                              headers={"Authorization": f"Bearer {client_token}"})
+        response = api.get(f"{BASE_URL}/api/client/gamification",
+                         headers={"Authorization": f"Bearer {client_token}"})
 
         if response.status_code != 200:
             print_step(11, "View gamification", False)
@@ -344,8 +345,8 @@ def journey_1_client_first_exercise():
         # STEP 12: Trainer checks client's progress
         print_step(12, "Trainer checks client's progress")
 
-        response = requests.get(f"{BASE_URL}/api/trainer/clients/C-VQ3O/adherence",
-                              headers={"Authorization": f"Bearer {trainer_token}"})
+        response = api.get(f"{BASE_URL}/api/trainer/clients/C-VQ3O/adherence",
+                         headers={"Authorization": f"Bearer {trainer_token}"})
 
         if response.status_code != 200:
             print_step(12, "View client adherence", False)
@@ -391,7 +392,7 @@ def journey_2_trainer_manages_multiple_clients():
         print_step(1, "Trainer creates account")
 
         trainer_email = generate_unique_email()
-        response = requests.post(f"{BASE_URL}/auth/trainer/register", json={
+        response = api.post(f"{BASE_URL}/auth/trainer/register", json={
             "email": trainer_email,
             "password": "TrainerPass123!",
             "fullName": "Dr. Multi Client",
@@ -431,9 +432,9 @@ def journey_2_trainer_manages_multiple_clients():
             ]
         }
 
-        response = requests.post(f"{BASE_URL}/api/trainer/templates",
-                               headers={"Authorization": f"Bearer {trainer_token}"},
-                               json=template_data)
+        response = api.post(f"{BASE_URL}/api/trainer/templates",
+                          headers={"Authorization": f"Bearer {trainer_token}"},
+                          json=template_data)
 
         if response.status_code not in [200, 201]:
             print_step(2, "Template creation", False)
@@ -450,9 +451,9 @@ def journey_2_trainer_manages_multiple_clients():
 
         grant_codes = []
         for i in range(3):
-            response = requests.post(f"{BASE_URL}/api/trainer/grants",
-                                   headers={"Authorization": f"Bearer {trainer_token}"},
-                                   json={"expirationHours": 72})
+            response = api.post(f"{BASE_URL}/api/trainer/grants",
+                              headers={"Authorization": f"Bearer {trainer_token}"},
+                              json={"expirationHours": 72})
 
             if response.status_code == 200:
                 grant_codes.append(response.json()['grantCode'])
@@ -470,8 +471,8 @@ def journey_2_trainer_manages_multiple_clients():
         # STEP 4: Check trainer's client list (should be empty initially)
         print_step(4, "Check trainer's client list")
 
-        response = requests.get(f"{BASE_URL}/api/trainer/clients",
-                              headers={"Authorization": f"Bearer {trainer_token}"})
+        response = api.get(f"{BASE_URL}/api/trainer/clients",
+                         headers={"Authorization": f"Bearer {trainer_token}"})
 
         if response.status_code != 200:
             print_step(4, "Get client list", False)
@@ -522,8 +523,8 @@ def journey_3_week_long_progress():
         # STEP 1: Get current gamification status
         print_step(1, "Check starting stats")
 
-        response = requests.get(f"{BASE_URL}/api/client/gamification",
-                              headers={"Authorization": f"Bearer {client_token}"})
+        response = api.get(f"{BASE_URL}/api/client/gamification",
+                         headers={"Authorization": f"Bearer {client_token}"})
 
         if response.status_code != 200:
             print_step(1, "Get gamification", False)
@@ -540,8 +541,8 @@ def journey_3_week_long_progress():
         # STEP 2: Get board and find exercises
         print_step(2, "Load exercise board")
 
-        response = requests.get(f"{BASE_URL}/api/client/board",
-                              headers={"Authorization": f"Bearer {client_token}"})
+        response = api.get(f"{BASE_URL}/api/client/board",
+                         headers={"Authorization": f"Bearer {client_token}"})
 
         if response.status_code != 200:
             print_step(2, "Get board", False)
@@ -586,9 +587,9 @@ def journey_3_week_long_progress():
                 "notes": f"Day {i} completed!"
             }
 
-            response = requests.post(f"{BASE_URL}/api/client/progress",
-                                   headers={"Authorization": f"Bearer {client_token}"},
-                                   json=progress_data)
+            response = api.post(f"{BASE_URL}/api/client/progress",
+                              headers={"Authorization": f"Bearer {client_token}"},
+                              json=progress_data)
 
             if response.status_code == 200:
                 result = response.json()
@@ -612,8 +613,8 @@ def journey_3_week_long_progress():
         # STEP 4: Check final stats
         print_step(4, "Check final stats after week")
 
-        response = requests.get(f"{BASE_URL}/api/client/gamification",
-                              headers={"Authorization": f"Bearer {client_token}"})
+        response = api.get(f"{BASE_URL}/api/client/gamification",
+                         headers={"Authorization": f"Bearer {client_token}"})
 
         if response.status_code != 200:
             print_step(4, "Get final stats", False)
@@ -642,8 +643,8 @@ def journey_3_week_long_progress():
         # STEP 5: Check weekly progress report
         print_step(5, "View weekly progress report")
 
-        response = requests.get(f"{BASE_URL}/api/client/progress/week",
-                              headers={"Authorization": f"Bearer {client_token}"})
+        response = api.get(f"{BASE_URL}/api/client/progress/week",
+                         headers={"Authorization": f"Bearer {client_token}"})
 
         if response.status_code != 200:
             print_step(5, "Get weekly report", False)
@@ -722,4 +723,5 @@ def main():
 
 if __name__ == "__main__":
     success = main()
+    api.print_latency_report()
     exit(0 if success else 1)